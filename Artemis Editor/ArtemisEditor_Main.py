@@ -1,4 +1,5 @@
 import sys
+import time
 import pygame
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QStatusBar, QDockWidget, QFileDialog, QMessageBox
@@ -14,6 +15,8 @@ from Artemis_Modules.artemis_level_properties import LevelPropertiesWidget # Add
 from Artemis_Modules.artemis_tool_palette import ToolPaletteWidget, TOOL_SELECT, TOOL_ERASER # Import new palette
 from Artemis_Modules.artemis_background_palette import BackgroundPalette # Import Background Palette
 from Artemis_Modules.artemis_sprite_palette import SpritePalette # Import Sprite Palette
+from Artemis_Modules.artemis_thumbnail_cache import get_thumbnail_cache
+from Artemis_Modules.artemis_autosave import AutosaveManager
 # Import core and file handler
 from Artemis_Modules.artemis_core import ArtemisCore # Import the class
 from Artemis_Modules.artemis_file_handler import save_pmf, load_pmf
@@ -44,6 +47,7 @@ class ArtemisEditorWindow(QMainWindow):
         # --- Core Logic ---
         # Instantiate the core logic AFTER the main window exists
         self.core_logic = ArtemisCore(self)
+        self.autosave = AutosaveManager(self.core_logic) # Started after offering recovery
 
         # --- Pygame Initialization (Basic) ---
         # No longer needed here, core logic doesn't directly depend on it yet
@@ -90,6 +94,11 @@ class ArtemisEditorWindow(QMainWindow):
         self.show() # Ensure window is shown before initial update
         self.update_ui_for_level_state() # Call directly after showing
 
+        # Offer to restore work from a session that didn't close cleanly, then start autosaving
+        self.offer_recovery()
+        self.autosave.autosaved.connect(lambda count: self.statusBar().showMessage("Autosaved", 2000))
+        self.autosave.start()
+
         # Apply stylesheet to normalize menu bar item appearance and hover
         self.menuBar().setStyleSheet("""
             QMenuBar::item {
@@ -142,10 +151,29 @@ class ArtemisEditorWindow(QMainWindow):
         file_menu.addSeparator()
         file_menu.addAction("Exit", self.close)
 
-        # Edit Menu (Placeholder)
+        # Edit Menu
         edit_menu = menu_bar.addMenu("&Edit")
-        edit_menu.addAction("Undo", self.edit_undo)
-        edit_menu.addAction("Redo", self.edit_redo)
+        self.undo_action = edit_menu.addAction("Undo", self.edit_undo)
+        self.undo_action.setShortcut("Ctrl+Z")
+        self.redo_action = edit_menu.addAction("Redo", self.edit_redo)
+        self.redo_action.setShortcut("Ctrl+Y")
+        edit_menu.addSeparator()
+        select_all_action = edit_menu.addAction("Select All", self.level_view.select_all)
+        select_all_action.setShortcut("Ctrl+A")
+
+        # --- Multi-Selection Transforms (each applied as one undo step) ---
+        align_menu = edit_menu.addMenu("Align")
+        for text, edge in [("Left Edges", 'left'), ("Right Edges", 'right'),
+                           ("Top Edges", 'top'), ("Bottom Edges", 'bottom'),
+                           ("Horizontal Centers", 'center_x'), ("Vertical Centers", 'center_y')]:
+            action = QAction(text, self)
+            action.triggered.connect(lambda checked=False, e=edge: self.level_view.align_selection(e))
+            align_menu.addAction(action)
+        scale_menu = edit_menu.addMenu("Scale")
+        for text, factor in [("Enlarge 10%", 1.1), ("Shrink 10%", 1 / 1.1), ("Double", 2.0), ("Halve", 0.5)]:
+            action = QAction(text, self)
+            action.triggered.connect(lambda checked=False, f=factor: self.level_view.scale_selection(f))
+            scale_menu.addAction(action)
 
         # View Menu (Renamed from Window)
         view_menu = menu_bar.addMenu("&View") # Renamed menu
@@ -165,6 +193,30 @@ class ArtemisEditorWindow(QMainWindow):
         self.grid_snap_action.triggered.connect(self.toggle_grid_snapping)
         view_menu.addAction(self.grid_snap_action) # Add to view_menu
 
+        # --- Object Snapping Toggle ---
+        self.object_snap_action = QAction("Snap to Objects", self)
+        self.object_snap_action.setCheckable(True)
+        self.object_snap_action.setChecked(self.level_view.object_snap_enabled)
+        self.object_snap_action.triggered.connect(self.level_view.toggle_object_snap)
+        view_menu.addAction(self.object_snap_action)
+
+        # --- Animated Background Preview Toggle ---
+        # Off by default so the idle editor only redraws when something changes
+        self.animate_background_action = QAction("Animate Background Preview", self)
+        self.animate_background_action.setCheckable(True)
+        self.animate_background_action.setChecked(self.level_view.animate_background)
+        self.animate_background_action.triggered.connect(self.level_view.set_background_animation)
+        view_menu.addAction(self.animate_background_action)
+
+        # --- Play Preview Toggle ---
+        # Runs the level as a live AI match in the view, rebuilt after every edit
+        self.play_preview_action = QAction("Play Preview", self)
+        self.play_preview_action.setCheckable(True)
+        self.play_preview_action.setShortcut("F5")
+        self.play_preview_action.triggered.connect(self.level_view.set_play_preview)
+        self.level_view.play_preview.runningChanged.connect(self.play_preview_action.setChecked) # Unchecks if the preview fails
+        view_menu.addAction(self.play_preview_action)
+
         # --- Mock Scoreboard Toggle Removed ---
 
         # Help Menu (Placeholder)
@@ -278,8 +330,8 @@ class ArtemisEditorWindow(QMainWindow):
         # self.tool_bar.saveActionTriggered.connect(self.file_save) # Removed
 
         # Level View -> Property Editor (Object Selection)
-        # Assuming LevelViewWidget emits objectSelected(obj_id or None)
-        self.level_view.objectSelected.connect(self.property_editor.update_display)
+        # LevelViewWidget emits selectionChanged(frozenset of selected IDs)
+        self.level_view.selectionChanged.connect(self.property_editor.update_selection)
 
         # Level View -> Main Window (Modification Status)
         # Assuming LevelViewWidget emits levelModified(bool)
@@ -293,6 +345,9 @@ class ArtemisEditorWindow(QMainWindow):
         self.core_logic.levelLoaded.connect(self.update_background_palette_selection) # Specific update for background palette
         self.core_logic.levelPropertiesChanged.connect(self.update_background_palette_selection) # Update palette if props change
  
+        # Core Logic -> Edit Menu (Undo/Redo availability)
+        self.core_logic.historyChanged.connect(self.update_undo_actions)
+
         # Sprite Palette -> Main Window (Sprite Selection - Placeholder Handler)
         self.sprite_palette.spriteSelected.connect(self.on_sprite_selected)
  
@@ -526,8 +581,8 @@ class ArtemisEditorWindow(QMainWindow):
         else:
             print(f"Saving to existing file: {target_path}")
 
-        # Get data from core logic
-        level_data = self.core_logic.get_level_data_for_saving()
+        # Get data from core logic (shared, not copied; save_pmf writes a normalized copy)
+        level_data = self.core_logic.snapshot()
 
         if level_data:
             if save_pmf(target_path, level_data):
@@ -558,14 +613,56 @@ class ArtemisEditorWindow(QMainWindow):
         self._perform_save(save_as=True)
 
     def edit_undo(self):
-        self.statusBar().showMessage("Action: Edit -> Undo (Not Implemented)", 2000)
         print("Action: Edit -> Undo")
-        # TODO: self.core_logic.undo() -> update UI
+        label = self.core_logic.undo()
+        if label:
+            # The property editor follows object changes through core_logic.objectsChanged
+            self.level_properties_widget.update_display()
+            self.update_window_title()
+            self.statusBar().showMessage(f"Undo: {label}", 2000)
+        else:
+            self.statusBar().showMessage("Nothing to undo", 2000)
 
     def edit_redo(self):
-        self.statusBar().showMessage("Action: Edit -> Redo (Not Implemented)", 2000)
         print("Action: Edit -> Redo")
-        # TODO: self.core_logic.redo() -> update UI
+        label = self.core_logic.redo()
+        if label:
+            # The property editor follows object changes through core_logic.objectsChanged
+            self.level_properties_widget.update_display()
+            self.update_window_title()
+            self.statusBar().showMessage(f"Redo: {label}", 2000)
+        else:
+            self.statusBar().showMessage("Nothing to redo", 2000)
+
+    def update_undo_actions(self):
+        """Updates the Undo/Redo menu entries from the core's history."""
+        undo_label = self.core_logic.history.undo_label()
+        redo_label = self.core_logic.history.redo_label()
+        self.undo_action.setEnabled(undo_label is not None)
+        self.undo_action.setText(f"Undo {undo_label}" if undo_label else "Undo")
+        self.redo_action.setEnabled(redo_label is not None)
+        self.redo_action.setText(f"Redo {redo_label}" if redo_label else "Redo")
+
+    def offer_recovery(self):
+        """Asks whether to restore the level from a recovery file left by a crash."""
+        record = self.autosave.load_recovery()
+        if record is None:
+            return
+        source_path = record.get('source_path')
+        saved_at = time.strftime("%Y-%m-%d %H:%M", time.localtime(record.get('saved_at', 0)))
+        level_label = os.path.basename(source_path) if source_path else "an unsaved level"
+        reply = QMessageBox.question(self, "Recover Unsaved Work",
+                                     f"Artemis didn't close normally. Recover the autosaved changes to {level_label} from {saved_at}?",
+                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                                     QMessageBox.StandardButton.Yes)
+        if reply != QMessageBox.StandardButton.Yes:
+            self.autosave.discard()
+            return
+        self.core_logic.load_level(record['level'], source_path)
+        self.core_logic.unsaved_changes = True # Not in the level file yet
+        self.autosave.mark_dirty() # Keep the recovery file until the level is saved
+        self.update_ui_for_level_state()
+        self.statusBar().showMessage("Recovered autosaved level", 5000)
 
     def help_about(self):
         self.statusBar().showMessage("Action: Help -> About (Not Implemented)", 2000)
@@ -610,6 +707,7 @@ class ArtemisEditorWindow(QMainWindow):
         self.level_view.set_active_tool(None)
         # Update background palette selection
         self.update_background_palette_selection()
+        self.update_undo_actions()
         # Clear sprite palette selection visually (doesn't affect object data)
         self.sprite_palette.set_selected_sprite(None)
 
@@ -646,6 +744,10 @@ class ArtemisEditorWindow(QMainWindow):
             save_editor_layout(self, self.layout_settings_path) # Call the manager function
             # --- End Save Layout ---
 
+            get_thumbnail_cache().shutdown() # Stop decoding and save the thumbnail index
+            self.autosave.shutdown() # Closing normally; the recovery file is no longer needed
+            self.level_view.play_preview.stop()
+
             print("Shutting down Pygame...")
             pygame.quit()
             print("Artemis Editor closing.")
@@ -0,0 +1,142 @@
+"""
+Artemis Editor - Autosave Module
+
+This module periodically writes the level being edited to a recovery file
+while it has unsaved changes, and reads it back after a crash. Snapshots
+share the core's object dicts (which are never modified in place), so taking
+one costs a list copy; serializing and writing happen on a worker thread,
+with an atomic rename so a crash mid-write never leaves a truncated file.
+"""
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+# Serialization helpers and the PMF schema are shared with the game
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from Ping.Modules.Core.Ping_Persistence import atomic_write_text, dumps_compact
+from Ping.Modules.Core.Ping_PMF import migrate_pmf, validate_pmf
+
+print("Artemis Modules/artemis_autosave.py loaded")
+
+RECOVERY_DIR = os.path.join(os.path.dirname(__file__), "..", "Artemis_Data", "recovery")
+RECOVERY_FILENAME = "autosave.json"
+AUTOSAVE_INTERVAL_MS = 30 * 1000
+
+
+class AutosaveManager(QObject):
+    """
+    Writes a recovery copy of the level on a timer when it changed since the
+    last autosave. The recovery file is removed once the level is saved, a
+    different level is opened, or the editor closes normally, so a file left
+    behind at startup means the previous session didn't end cleanly.
+    """
+    autosaved = pyqtSignal(int) # Number of objects written (emitted from the worker thread)
+
+    def __init__(self, core_logic, recovery_dir=RECOVERY_DIR, interval_ms=AUTOSAVE_INTERVAL_MS):
+        super().__init__()
+        self.core_logic = core_logic
+        self.recovery_path = os.path.join(os.path.normpath(recovery_dir), RECOVERY_FILENAME)
+        # One worker keeps writes and removals in the order they were requested
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artemis-autosave")
+        self._pending = None # Future of the write in progress
+        self._revision = 0 # Bumped on every edit
+        self._saved_revision = 0 # Revision in the recovery file (or of the clean level)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.autosave_now)
+
+    def start(self):
+        """
+        Starts tracking edits and autosaving. Call after any recovery file was
+        offered, since loading a level removes it.
+        """
+        self.core_logic.objectsChanged.connect(self.mark_dirty)
+        self.core_logic.levelPropertiesChanged.connect(self.mark_dirty)
+        self.core_logic.levelLoaded.connect(self.discard)
+        self.core_logic.levelModifiedStateChanged.connect(self._on_modified_state_changed)
+        self._timer.start()
+
+    def mark_dirty(self, *args):
+        self._revision += 1
+
+    def _on_modified_state_changed(self, modified):
+        if not modified:
+            self.discard() # Saved; the level file is now the newest copy
+
+    # --- Writing ---
+    def autosave_now(self):
+        """Snapshots the level and queues it for writing if it changed. Returns True if queued."""
+        if self._revision == self._saved_revision or not self.core_logic.unsaved_changes:
+            return False
+        if self._pending is not None and not self._pending.done():
+            return False # Still writing the previous snapshot; try again next tick
+        record = {
+            'saved_at': time.time(),
+            'source_path': self.core_logic.current_level_path,
+            'level': self.core_logic.snapshot(),
+        }
+        self._saved_revision = self._revision
+        self._pending = self._executor.submit(self._write, record)
+        return True
+
+    def _write(self, record):
+        """Worker thread: serializes the snapshot and swaps it in atomically."""
+        start = time.perf_counter()
+        try:
+            atomic_write_text(self.recovery_path, dumps_compact(record))
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: Autosave failed: {e}")
+            self._saved_revision = -1 # Retry on the next tick
+            return
+        object_count = len(record['level']['objects'])
+        print(f"Autosaved {object_count} objects to {self.recovery_path} in {(time.perf_counter() - start) * 1000:.1f} ms")
+        self.autosaved.emit(object_count)
+
+    def discard(self):
+        """Forgets pending changes and removes the recovery file (after any write in progress)."""
+        self._saved_revision = self._revision
+        self._executor.submit(self._remove_recovery_file)
+
+    def _remove_recovery_file(self):
+        try:
+            os.remove(self.recovery_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Warning: Could not remove recovery file '{self.recovery_path}': {e}")
+
+    # --- Recovery ---
+    def load_recovery(self):
+        """
+        Reads the recovery file left by a session that didn't close cleanly.
+        Returns {'saved_at', 'source_path', 'level'} or None if there is nothing usable.
+        """
+        try:
+            with open(self.recovery_path, 'r') as f:
+                record = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read recovery file '{self.recovery_path}': {e}")
+            return None
+        level = record.get('level') if isinstance(record, dict) else None
+        if not isinstance(level, dict):
+            print(f"Warning: Recovery file '{self.recovery_path}' has no level data.")
+            return None
+        migrate_pmf(level)
+        errors, _ = validate_pmf(level)
+        if errors:
+            print(f"Warning: Recovery file '{self.recovery_path}' is not a valid level: {errors}")
+            return None
+        return record
+
+    def shutdown(self):
+        """Stops autosaving and removes the recovery file (the editor is closing normally)."""
+        self._timer.stop()
+        self.discard()
+        self._executor.shutdown(wait=True)
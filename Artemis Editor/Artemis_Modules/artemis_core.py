@@ -6,11 +6,41 @@ different parts of the editor, and manages the application state,
 including the currently loaded level data and properties.
 """
 import copy # For deep copying properties
+from contextlib import contextmanager
+from types import MappingProxyType # Read-only views of stored objects
 from PyQt6.QtCore import QObject, pyqtSignal # Import QObject and pyqtSignal
+from .artemis_history import (UndoHistory, AddObjectCommand, DeleteObjectCommand,
+                              UpdateObjectCommand, UpdateObjectsCommand, LevelPropertiesCommand)
+from .artemis_spatial_index import get_object_rect
 
 # Placeholder for future core classes and functions
 print("Artemis Modules/artemis_core.py loaded")
 
+ALIGN_EDGES = ('left', 'right', 'top', 'bottom', 'center_x', 'center_y') # Accepted by align_objects()
+
+class _DrawOrderView:
+    """Read-only view of the core's objects in draw order, walking its linked draw order."""
+
+    def __init__(self, core):
+        self._core = core
+
+    def __len__(self):
+        return len(self._core._objects)
+
+    def __iter__(self):
+        core = self._core
+        obj_id = core._bottom_id
+        while obj_id is not None:
+            yield core._objects[obj_id]
+            obj_id = core._above[obj_id]
+
+    def __reversed__(self):
+        core = self._core
+        obj_id = core._top_id
+        while obj_id is not None:
+            yield core._objects[obj_id]
+            obj_id = core._below[obj_id]
+
 class ArtemisCore(QObject): # Inherit from QObject
     """
     Main application core logic class. Manages level data, properties,
@@ -23,15 +53,33 @@ class ArtemisCore(QObject): # Inherit from QObject
     layoutRestored = pyqtSignal() # Emitted by main window AFTER restoreState succeeds
     objectSelectionChanged = pyqtSignal(object) # Emitted by LevelView, maybe relayed? (TBD)
     objectUpdated = pyqtSignal(int) # Emitted when an object's properties are updated (passes obj_id)
-    # TODO: Signals for objectAdded, objectDeleted
+    objectAdded = pyqtSignal(int) # Emitted when an object is placed or restored by undo/redo (passes obj_id)
+    objectDeleted = pyqtSignal(int) # Emitted when an object is removed (passes obj_id)
+    # Emitted once per edit with the frozenset of object IDs it added, changed or removed.
+    # Multi-object edits and undo/redo of them are coalesced into a single emission.
+    objectsChanged = pyqtSignal(object)
+    historyChanged = pyqtSignal() # Emitted when undo/redo availability may have changed
 
     def __init__(self, main_window):
         super().__init__() # Initialize QObject base class
         self.main_window = main_window
-        self.level_objects = [] # List to store placed objects {id, type, properties}
+        # Placed objects {id, type, properties} keyed by ID.
+        # Stored objects are never modified in place: updates replace the dict
+        # (copy-on-write), so views handed out earlier remain consistent snapshots.
+        self._objects = {}
+        # Draw order as a doubly linked list of IDs (bottom first, top drawn last),
+        # so deleting an object and restoring it at its old position are both O(1).
+        self._below = {} # obj_id -> ID of the object directly beneath it (None = bottom)
+        self._above = {} # obj_id -> ID of the object directly above it (None = top)
+        self._bottom_id = None
+        self._top_id = None
+        self._next_id = 3 # IDs 1 and 2 are reserved for the default paddles
         self.level_properties = self._get_default_level_properties()
         self.current_level_path = None # Track the path of the loaded level
         self._unsaved_changes = False # Use property setter now
+        self.history = UndoHistory() # Undo/redo of edits as small delta commands
+        self._change_depth = 0 # > 0 while objectsChanged notifications are being coalesced
+        self._changed_ids = set() # Objects changed since the outermost coalescing began
         print("ArtemisCore initialized")
 
     # --- Unsaved Changes Property ---
@@ -45,6 +93,44 @@ class ArtemisCore(QObject): # Inherit from QObject
             self._unsaved_changes = value
             self.levelModifiedStateChanged.emit(value) # Emit signal on change
 
+    # --- Object Store ---
+    @property
+    def level_objects(self):
+        """Live read-only view of all objects in draw order (supports len, iteration and reversed)."""
+        return _DrawOrderView(self)
+
+    def _set_objects(self, objects):
+        """Replaces all objects, assigning fresh IDs to objects with a missing or duplicate ID."""
+        self._objects = {}
+        self._below, self._above = {}, {}
+        self._bottom_id = self._top_id = None
+        self._next_id = 3
+        unassigned = []
+        for obj in objects:
+            obj_id = obj.get('id')
+            if isinstance(obj_id, int) and obj_id not in self._objects:
+                self._add_on_top(obj)
+                self._next_id = max(self._next_id, obj_id + 1)
+            else:
+                unassigned.append(obj)
+        for obj in unassigned:
+            print(f"Warning: Object with missing or duplicate ID {obj.get('id')!r} given new ID {self._next_id}.")
+            obj['id'] = self._next_id
+            self._add_on_top(obj)
+            self._next_id += 1
+
+    def get_object_count(self):
+        """Returns the number of objects in the level."""
+        return len(self._objects)
+
+    def get_topmost_object_id(self):
+        """Returns the ID of the object drawn last (on top), or None if there are none."""
+        return self._top_id
+
+    def get_neighbor_ids(self, obj_id):
+        """Returns the IDs (below, above) of the objects drawn directly beneath and over an object (None at the ends)."""
+        return self._below[obj_id], self._above[obj_id]
+
     def _get_default_level_properties(self):
         """Returns a dictionary with the default level properties."""
         return {
@@ -67,30 +153,24 @@ class ArtemisCore(QObject): # Inherit from QObject
     def load_level(self, level_data, file_path):
         """Loads level data, including objects and properties."""
         # Clear existing data
-        self.level_objects = level_data.get("objects", [])
+        self._set_objects(level_data.get("objects", []))
         # Load properties, falling back to defaults if missing
         loaded_props = level_data.get("properties", {})
         self.level_properties = self._get_default_level_properties() # Start with defaults
         self.level_properties.update(loaded_props) # Override with loaded values
 
-        # --- Compatibility: Handle old 'dimensions' key ---
-        if 'dimensions' in loaded_props and isinstance(loaded_props['dimensions'], (list, tuple)) and len(loaded_props['dimensions']) == 2:
-            if 'width' not in loaded_props: # Prioritize explicit width/height
-                self.level_properties['width'] = loaded_props['dimensions'][0]
-            if 'height' not in loaded_props:
-                self.level_properties['height'] = loaded_props['dimensions'][1]
-            # We don't need to explicitly remove 'dimensions' as it won't be saved again
-            print("Migrated 'dimensions' property to 'width' and 'height'.")
-        # --- End Compatibility ---
+        # Older field names (e.g. 'dimensions') are migrated by load_pmf
 
         self.current_level_path = file_path
         self.unsaved_changes = False # Reset flag (setter emits signal)
+        self.history.clear()
+        self.historyChanged.emit()
         print(f"Level loaded from {file_path}")
         self.levelLoaded.emit() # Emit signal AFTER data is loaded
 
     def new_level(self, width=800, height=450): # Add width and height parameters
         """Resets the editor state for a new, empty level with specified dimensions."""
-        self.level_objects = [] # Clear existing objects first
+        self._set_objects([]) # Clear existing objects first
         self.level_properties = self._get_default_level_properties()
         # Set the dimensions and name directly in the properties
         self.level_properties['width'] = width
@@ -110,7 +190,7 @@ class ArtemisCore(QObject): # Inherit from QObject
         left_y = (height - paddle_h) // 2
         left_paddle = {
             "id": 1, # Assign fixed IDs for default paddles
-            "type": "paddle_spawn_left", # Use specific type
+            "type": "paddle_spawn",
             "is_left": True,
             "x": left_x,
             "y": left_y,
@@ -119,14 +199,14 @@ class ArtemisCore(QObject): # Inherit from QObject
             "speed": paddle_speed
             # Add other relevant default properties if needed
         }
-        self.level_objects.append(left_paddle)
+        self._add_on_top(left_paddle)
 
         # Right Paddle Spawn
         right_x = width - offset_x - paddle_w
         right_y = (height - paddle_h) // 2
         right_paddle = {
             "id": 2, # Assign fixed IDs for default paddles
-            "type": "paddle_spawn_right", # Use specific type
+            "type": "paddle_spawn",
             "is_left": False,
             "x": right_x,
             "y": right_y,
@@ -135,9 +215,11 @@ class ArtemisCore(QObject): # Inherit from QObject
             "speed": paddle_speed
             # Add other relevant default properties if needed
         }
-        self.level_objects.append(right_paddle)
+        self._add_on_top(right_paddle)
         # --- End Default Paddle Spawns ---
 
+        self.history.clear()
+        self.historyChanged.emit()
         print(f"New level created ({width}x{height}) with default paddles.")
         self.levelLoaded.emit() # Emit signal AFTER data is set
 
@@ -145,13 +227,26 @@ class ArtemisCore(QObject): # Inherit from QObject
         """Returns the current level data structured for saving."""
         return {
             "properties": copy.deepcopy(self.level_properties),
-            "objects": copy.deepcopy(self.level_objects)
+            "objects": copy.deepcopy(list(self.level_objects))
             # Add metadata like editor version later if needed
         }
+
+    def snapshot(self):
+        """
+        Returns the level data structured for saving without deep-copying it.
+        Object dicts are replaced rather than modified (copy-on-write), so the
+        snapshot stays unchanged by later edits and can be serialized on another
+        thread. Callers must not modify it.
+        """
+        return {
+            "properties": dict(self.level_properties),
+            "objects": list(self.level_objects)
+        }
     def update_level_properties(self, new_props):
         """Updates multiple level properties from a dictionary."""
         changed = False
         dimensions_changed = False
+        before, after = {}, {} # Changed values, for undo
         valid_keys = self._get_default_level_properties().keys() # Get valid keys
 
         for key, value in new_props.items():
@@ -174,13 +269,17 @@ class ArtemisCore(QObject): # Inherit from QObject
                 continue
 
             if self.level_properties.get(key) != value:
+                if key not in before:
+                    before[key] = self.level_properties.get(key)
                 self.level_properties[key] = value
+                after[key] = value
                 changed = True
                 if key in ['width', 'height']:
                     dimensions_changed = True
                 print(f"Level property '{key}' updated to: {value}")
 
         if changed:
+            self._record(LevelPropertiesCommand(before, after))
             self.unsaved_changes = True # Setter emits signal
             # Emit general property change signal
             self.levelPropertiesChanged.emit()
@@ -200,6 +299,7 @@ class ArtemisCore(QObject): # Inherit from QObject
         # If kept, it should also emit levelPropertiesChanged
         if key in self.level_properties:
             if self.level_properties[key] != value:
+                self._record(LevelPropertiesCommand({key: self.level_properties[key]}, {key: value}))
                 self.level_properties[key] = value
                 self.unsaved_changes = True # Setter emits signal
                 print(f"Level property '{key}' updated to: {value}")
@@ -214,65 +314,301 @@ class ArtemisCore(QObject): # Inherit from QObject
     def add_object(self, obj_data):
         """Adds a new object to the level."""
         # Assign a unique ID, ensuring it doesn't clash with default paddles (1, 2)
-        # Start checking from ID 3 upwards
-        existing_ids = {obj.get('id', 0) for obj in self.level_objects}
-        new_id = 3
-        while new_id in existing_ids:
-            new_id += 1
+        new_id = self._next_id
+        self._next_id += 1
 
         obj_data['id'] = new_id
-        self.level_objects.append(obj_data)
+        self._add_on_top(obj_data)
+        self._record(AddObjectCommand(obj_data))
         self.unsaved_changes = True # Setter emits signal
         print(f"Added object: {obj_data}")
-        # TODO: Add objectAdded signal? For now, LevelView redraws on timer
+        self.objectAdded.emit(new_id)
+        self._notify_changed(new_id)
 
     def update_object_properties(self, obj_id, new_properties):
         """Updates the properties of a specific object."""
-        # ++ DEBUG LOGGING ++
-        print(f"DEBUG Core: Attempting update for ID {obj_id} with properties: {new_properties}")
-        updated = False # Track if any change was actually made
-
-        for obj in self.level_objects:
-            if obj.get('id') == obj_id:
-                original_obj_repr = repr(obj) # Capture state before modification
-                # Only update keys present in new_properties
-                for key, value in new_properties.items():
-                     if key != 'id': # Don't overwrite ID
-                        # Compare before potentially updating
-                        if obj.get(key) != value:
-                            print(f"DEBUG Core: Changing '{key}' from '{obj.get(key)}' to '{value}' for ID {obj_id}")
-                            obj[key] = value
-                            updated = True # Mark that a change happened
-
-                if updated:
-                    self.unsaved_changes = True # Setter emits signal
-                    print(f"DEBUG Core: Update applied for ID {obj_id}. New props: {new_properties}. Final object state snippet: {repr(obj)[:100]}...")
-                    self.objectUpdated.emit(obj_id) # Emit signal that this object changed
-                    return True # Return True as update happened
-                else:
-                    print(f"DEBUG Core: No changes applied for ID {obj_id} with new_properties {new_properties}. Object remained: {original_obj_repr}")
-                    return False # Indicate no changes were made
-
-        print(f"Warning Core: Could not find object with ID {obj_id} to update.")
-        return False
+        obj = self._objects.get(obj_id)
+        if obj is None:
+            print(f"Warning Core: Could not find object with ID {obj_id} to update.")
+            return False
+
+        # Only update keys present in new_properties, and only if they differ
+        changes = {key: value for key, value in new_properties.items()
+                   if key != 'id' and obj.get(key) != value} # Don't overwrite ID
+        if not changes:
+            return False # Indicate no changes were made
+
+        # Copy-on-write: replace the stored dict instead of modifying it
+        updated_obj = dict(obj)
+        updated_obj.update(changes)
+        self._objects[obj_id] = updated_obj
+        self._record(UpdateObjectCommand(obj_id, obj, updated_obj, changes.keys()))
+
+        self.unsaved_changes = True # Setter emits signal
+        self.objectUpdated.emit(obj_id) # Emit signal that this object changed
+        self._notify_changed(obj_id)
+        return True
+
+    def update_objects(self, updates, label=None):
+        """
+        Applies {obj_id: {key: value}} to several objects as one undo step.
+        objectsChanged is emitted once for the whole edit. Returns the IDs that changed.
+        """
+        changes = {}
+        changed_keys = set()
+        with self._coalesced_changes():
+            for obj_id, new_properties in updates.items():
+                obj = self._objects.get(obj_id)
+                if obj is None:
+                    print(f"Warning Core: Could not find object with ID {obj_id} to update.")
+                    continue
+                diff = {key: value for key, value in new_properties.items()
+                        if key != 'id' and obj.get(key) != value}
+                if not diff:
+                    continue
+                updated_obj = dict(obj) # Copy-on-write, as in update_object_properties
+                updated_obj.update(diff)
+                self._objects[obj_id] = updated_obj
+                changes[obj_id] = (obj, updated_obj)
+                changed_keys.update(diff)
+                self.objectUpdated.emit(obj_id)
+                self._notify_changed(obj_id)
+            if changes:
+                self._record(UpdateObjectsCommand(changes, changed_keys, label))
+                # Only steps within a batch (a mouse drag) merge; separate edits stay separate undo steps
+                self.history.seal()
+                self.unsaved_changes = True # Setter emits signal
+        return list(changes)
+
+    def move_objects(self, obj_ids, dx, dy, label="Move"):
+        """Moves several objects by the same offset as one edit. Returns the IDs that changed."""
+        updates = {}
+        for obj_id in obj_ids:
+            obj = self._objects.get(obj_id)
+            if obj is not None and obj.get('x') is not None and obj.get('y') is not None:
+                updates[obj_id] = {'x': obj['x'] + dx, 'y': obj['y'] + dy}
+        return self.update_objects(updates, label)
+
+    def align_objects(self, obj_ids, edge):
+        """
+        Lines up several objects with the bounds of the whole group as one edit.
+        edge is 'left', 'right', 'top', 'bottom', 'center_x' or 'center_y'.
+        Returns the IDs that changed.
+        """
+        if edge not in ALIGN_EDGES:
+            print(f"Warning Core: Unknown alignment '{edge}'.")
+            return []
+        rects = self._get_object_rects(obj_ids)
+        if len(rects) < 2:
+            return []
+        lefts = [left for left, _, _, _ in rects.values()]
+        tops = [top for _, top, _, _ in rects.values()]
+        rights = [left + w for left, _, w, _ in rects.values()]
+        bottoms = [top + h for _, top, _, h in rects.values()]
+        updates = {}
+        for obj_id, (left, top, w, h) in rects.items():
+            obj = self._objects[obj_id]
+            if edge == 'left':
+                updates[obj_id] = {'x': obj['x'] + min(lefts) - left}
+            elif edge == 'right':
+                updates[obj_id] = {'x': obj['x'] + max(rights) - (left + w)}
+            elif edge == 'center_x':
+                updates[obj_id] = {'x': obj['x'] + round((min(lefts) + max(rights)) / 2 - (left + w / 2))}
+            elif edge == 'top':
+                updates[obj_id] = {'y': obj['y'] + min(tops) - top}
+            elif edge == 'bottom':
+                updates[obj_id] = {'y': obj['y'] + max(bottoms) - (top + h)}
+            else: # center_y
+                updates[obj_id] = {'y': obj['y'] + round((min(tops) + max(bottoms)) / 2 - (top + h / 2))}
+        return self.update_objects(updates, "Align")
+
+    def scale_objects(self, obj_ids, factor):
+        """
+        Scales the sizes of several objects and their distances from the group's
+        center as one edit. Returns the IDs that changed.
+        """
+        rects = self._get_object_rects(obj_ids)
+        if not rects or factor <= 0:
+            return []
+        center_x = (min(left for left, _, _, _ in rects.values())
+                    + max(left + w for left, _, w, _ in rects.values())) / 2
+        center_y = (min(top for _, top, _, _ in rects.values())
+                    + max(top + h for _, top, _, h in rects.values())) / 2
+        updates = {}
+        for obj_id in rects:
+            obj = self._objects[obj_id]
+            props = {'x': round(center_x + (obj['x'] - center_x) * factor),
+                     'y': round(center_y + (obj['y'] - center_y) * factor)}
+            for key in ('width', 'height', 'size', 'radius'):
+                if isinstance(obj.get(key), (int, float)):
+                    props[key] = max(1, round(obj[key] * factor))
+            updates[obj_id] = props
+        return self.update_objects(updates, "Scale")
+
+    def _get_object_rects(self, obj_ids):
+        """Returns {obj_id: (left, top, width, height)} for the given objects that have a position."""
+        rects = {}
+        for obj_id in obj_ids:
+            obj = self._objects.get(obj_id)
+            rect = get_object_rect(obj) if obj is not None else None
+            if rect is not None:
+                rects[obj_id] = rect
+        return rects
 
     def delete_object(self, obj_id):
         """Deletes an object from the level."""
-        initial_count = len(self.level_objects)
-        self.level_objects = [obj for obj in self.level_objects if obj.get('id') != obj_id]
-        if len(self.level_objects) < initial_count:
+        obj = self._objects.get(obj_id)
+        if obj is not None:
+            self._record(DeleteObjectCommand(obj, self._unlink(obj_id)))
             self.unsaved_changes = True # Setter emits signal
             print(f"Deleted object ID {obj_id}")
-            # TODO: Add objectDeleted signal?
+            self.objectDeleted.emit(obj_id)
+            self._notify_changed(obj_id)
             return True
         print(f"Warning: Could not find object with ID {obj_id} to delete.")
         return False
 
     def get_object_by_id(self, obj_id):
-        """Retrieves a specific object by its ID."""
-        for obj in self.level_objects:
-            if obj.get('id') == obj_id:
-                return copy.deepcopy(obj) # Return a copy
-        return None
-
-    # Add methods here later for coordinating editor functions like selection, undo/redo etc.
\ No newline at end of file
+        """
+        Retrieves a specific object by its ID as a read-only view, or None.
+        Use dict(view) or copy.deepcopy(dict(view)) if a modifiable copy is needed.
+        """
+        try:
+            obj = self._objects.get(obj_id)
+        except TypeError: # Unhashable "ID" (e.g. object data passed instead of an ID)
+            return None
+        return MappingProxyType(obj) if obj is not None else None
+
+    # --- Undo / Redo ---
+    def _record(self, command):
+        """Adds an applied edit to the undo history."""
+        self.history.push(command)
+        self.historyChanged.emit()
+
+    def begin_batch(self, label="Edit"):
+        """Starts grouping edits into a single undo step (e.g. at the start of a mouse drag)."""
+        self.history.begin_batch(label)
+
+    def end_batch(self):
+        """Finishes the undo step started with begin_batch()."""
+        self.history.end_batch()
+        self.historyChanged.emit()
+
+    def undo(self):
+        """Undoes the last edit. Returns its label, or None if there was nothing to undo."""
+        with self._coalesced_changes():
+            command = self.history.undo(self)
+        return self._after_history_step(command)
+
+    def redo(self):
+        """Redoes the last undone edit. Returns its label, or None if there was nothing to redo."""
+        with self._coalesced_changes():
+            command = self.history.redo(self)
+        return self._after_history_step(command)
+
+    def _after_history_step(self, command):
+        if command is None:
+            return None
+        self.unsaved_changes = True # Setter emits signal
+        self.historyChanged.emit()
+        print(f"History: applied '{command.label}'")
+        return command.label
+
+    def can_undo(self):
+        return self.history.can_undo()
+
+    def can_redo(self):
+        return self.history.can_redo()
+
+    # --- Change Notification ---
+    @contextmanager
+    def _coalesced_changes(self):
+        """Collects objectsChanged notifications until the outermost block ends, then emits one."""
+        self._change_depth += 1
+        try:
+            yield
+        finally:
+            self._change_depth -= 1
+            if self._change_depth == 0 and self._changed_ids:
+                changed_ids = frozenset(self._changed_ids)
+                self._changed_ids.clear()
+                self.objectsChanged.emit(changed_ids)
+
+    def _notify_changed(self, obj_id):
+        """Reports a changed object through objectsChanged (deferred while coalescing)."""
+        if self._change_depth:
+            self._changed_ids.add(obj_id)
+        else:
+            self.objectsChanged.emit(frozenset((obj_id,)))
+
+    # Primitives used by history commands. They don't record history themselves.
+    def _add_on_top(self, obj):
+        """Stores an object and links it at the top of the draw order (no signals)."""
+        obj_id = obj['id']
+        self._objects[obj_id] = obj
+        self._below[obj_id] = self._top_id
+        self._above[obj_id] = None
+        if self._top_id is None:
+            self._bottom_id = obj_id
+        else:
+            self._above[self._top_id] = obj_id
+        self._top_id = obj_id
+
+    def _add_above(self, obj, below_id):
+        """Stores an object and links it directly above below_id (None = at the bottom)."""
+        if below_id == self._top_id:
+            self._add_on_top(obj)
+            return
+        obj_id = obj['id']
+        above_id = self._bottom_id if below_id is None else self._above[below_id]
+        self._objects[obj_id] = obj
+        self._below[obj_id] = below_id
+        self._above[obj_id] = above_id
+        self._below[above_id] = obj_id
+        if below_id is None:
+            self._bottom_id = obj_id
+        else:
+            self._above[below_id] = obj_id
+
+    def _unlink(self, obj_id):
+        """Removes an object from the store and the draw order. Returns the ID that was beneath it."""
+        del self._objects[obj_id]
+        below_id = self._below.pop(obj_id)
+        above_id = self._above.pop(obj_id)
+        if below_id is None:
+            self._bottom_id = above_id
+        else:
+            self._above[below_id] = above_id
+        if above_id is None:
+            self._top_id = below_id
+        else:
+            self._below[above_id] = below_id
+        return below_id
+
+    def _insert_object(self, obj, below_id=None, on_top=True):
+        """Inserts an object on top, or directly above below_id (None = at the bottom) if on_top is False."""
+        obj_id = obj['id']
+        if on_top:
+            self._add_on_top(obj)
+        else:
+            self._add_above(obj, below_id)
+        self._next_id = max(self._next_id, obj_id + 1)
+        self.objectAdded.emit(obj_id)
+        self._notify_changed(obj_id)
+
+    def _remove_object(self, obj_id):
+        if obj_id in self._objects:
+            self._unlink(obj_id)
+            self.objectDeleted.emit(obj_id)
+            self._notify_changed(obj_id)
+
+    def _replace_object(self, obj_id, obj):
+        self._objects[obj_id] = obj
+        self.objectUpdated.emit(obj_id)
+        self._notify_changed(obj_id)
+
+    def _set_level_values(self, values):
+        self.level_properties.update(values)
+        self.levelPropertiesChanged.emit()
+
+    # Add methods here later for coordinating editor functions like selection etc.
\ No newline at end of file
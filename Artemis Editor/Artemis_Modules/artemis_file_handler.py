@@ -6,6 +6,11 @@ in the .PMF (Ping Map File) format, which is based on JSON.
 """
 import json
 import os # Need os to ensure directory exists
+import sys
+
+# The PMF schema is shared with the game's level compiler
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from Ping.Modules.Core.Ping_PMF import migrate_pmf, validate_pmf, normalize_pmf, dumps_pmf
 
 # Placeholder for future file handling functions
 # print("Artemis Modules/artemis_file_handler.py loaded (placeholder)") # Removed placeholder print
@@ -30,6 +35,18 @@ def load_pmf(filepath):
              else:
                   print("Warning: 'objects' or 'sprites' key found but is not a list. Skipping merge.")
 
+        # --- Bring older files up to the current schema and validate ---
+        for change in migrate_pmf(data):
+            print(f"Migrated {filepath}: {change}")
+        errors, warnings = validate_pmf(data)
+        for warning in warnings:
+            print(f"Warning: {filepath}: {warning}")
+        if errors:
+            print(f"Error: Invalid level file {filepath}:")
+            for error in errors:
+                print(f"  {error}")
+            return None
+
         return data
     except FileNotFoundError:
         print(f"Error: File not found - {filepath}")
@@ -54,8 +71,8 @@ def save_pmf(filepath, level_data):
             print(f"Created directory: {target_dir}")
 
         # --- Separate sprites from objects before saving ---
-        import copy # Need copy for deepcopy
-        save_data = copy.deepcopy(level_data) # Work on a copy
+        # Only top-level keys are reassigned here; normalize_pmf copies everything nested
+        save_data = dict(level_data)
         sprites = []
         other_objects = []
 
@@ -77,9 +94,9 @@ def save_pmf(filepath, level_data):
                  save_data['objects'] = []
 
 
-        # Write the potentially modified level data as JSON
+        # Write the potentially modified level data as JSON, in the schema's field order
         with open(filepath, 'w') as f:
-            json.dump(save_data, f, indent=4) # Use indent for readability
+            f.write(dumps_pmf(normalize_pmf(save_data))) # Indented for readability
         print(f"Level data successfully saved to {filepath} (Sprites separated: {'yes' if sprites else 'no'})")
         return True
     except IOError as e:
@@ -0,0 +1,309 @@
+"""
+Artemis Editor - History Module
+
+This module contains the undo/redo history used by ArtemisCore. Every edit
+is recorded as a small command holding only what changed. Object updates
+keep references to the before/after object dicts, which the core never
+modifies in place, so no level snapshots or deep copies are needed.
+"""
+import sys
+import time
+from collections import deque
+
+print("Artemis Modules/artemis_history.py loaded")
+
+# Consecutive edits of the same keys closer together than this are merged
+# into one undo step (e.g. typing a value into a property field).
+MERGE_WINDOW_SECONDS = 1.0
+
+
+def estimate_size(value, _depth=0):
+    """Rough memory footprint of a value in bytes (follows containers a few levels deep)."""
+    size = sys.getsizeof(value)
+    if _depth >= 3:
+        return size
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(estimate_size(v, _depth + 1) for v in value)
+    return size
+
+
+class Command:
+    """Base class for an undoable edit. Subclasses apply themselves through ArtemisCore's private primitives."""
+    label = "Edit"
+
+    def undo(self, core):
+        raise NotImplementedError
+
+    def redo(self, core):
+        raise NotImplementedError
+
+    def merge(self, other):
+        """Absorbs a following command into this one if possible. Returns True if merged."""
+        return False
+
+    def size(self):
+        """Approximate number of bytes this command keeps alive."""
+        return sys.getsizeof(self)
+
+
+class AddObjectCommand(Command):
+    """An object placed in the level."""
+    label = "Add Object"
+
+    def __init__(self, obj):
+        self.obj = obj
+        self._size = estimate_size(obj)
+
+    def undo(self, core):
+        core._remove_object(self.obj['id'])
+
+    def redo(self, core):
+        core._insert_object(self.obj)
+
+    def size(self):
+        return self._size
+
+
+class DeleteObjectCommand(Command):
+    """An object removed from the level (undo puts it back at the same draw order position)."""
+    label = "Delete Object"
+
+    def __init__(self, obj, below_id):
+        self.obj = obj
+        self.below_id = below_id # ID of the object drawn directly beneath it, None = at the bottom
+        self._size = estimate_size(obj)
+
+    def undo(self, core):
+        core._insert_object(self.obj, self.below_id, on_top=False)
+
+    def redo(self, core):
+        core._remove_object(self.obj['id'])
+
+    def size(self):
+        return self._size
+
+
+class UpdateObjectCommand(Command):
+    """Changed properties of one object, stored as the object dicts before and after the change."""
+
+    def __init__(self, obj_id, before, after, keys):
+        self.obj_id = obj_id
+        self.before = before
+        self.after = after
+        self.keys = frozenset(keys)
+        self.time = time.monotonic()
+        self.label = "Move" if self.keys <= {'x', 'y'} else "Change Properties"
+
+    def undo(self, core):
+        core._replace_object(self.obj_id, self.before)
+
+    def redo(self, core):
+        core._replace_object(self.obj_id, self.after)
+
+    def merge(self, other):
+        if (isinstance(other, UpdateObjectCommand) and other.obj_id == self.obj_id
+                and other.keys == self.keys and other.time - self.time <= MERGE_WINDOW_SECONDS):
+            self.after = other.after
+            self.time = other.time
+            return True
+        return False
+
+    def size(self):
+        # The before/after dicts share their values; only the changed values are unique
+        return sys.getsizeof(self) + 2 * sys.getsizeof(self.after) + sum(
+            estimate_size(self.before.get(key)) + estimate_size(self.after.get(key)) for key in self.keys)
+
+
+class UpdateObjectsCommand(Command):
+    """Changed properties of several objects as one edit (e.g. moving or aligning a multi-selection)."""
+
+    def __init__(self, changes, keys, label=None):
+        self.changes = changes # obj_id -> (before, after) object dicts
+        self.keys = frozenset(keys)
+        self.time = time.monotonic()
+        self.label = label or ("Move" if self.keys <= {'x', 'y'} else "Change Properties")
+
+    def undo(self, core):
+        for obj_id, (before, _) in self.changes.items():
+            core._replace_object(obj_id, before)
+
+    def redo(self, core):
+        for obj_id, (_, after) in self.changes.items():
+            core._replace_object(obj_id, after)
+
+    def merge(self, other):
+        # Successive steps of a group drag keep the first "before" and the last "after"
+        if (isinstance(other, UpdateObjectsCommand) and other.label == self.label
+                and other.keys == self.keys and other.changes.keys() == self.changes.keys()
+                and other.time - self.time <= MERGE_WINDOW_SECONDS):
+            self.changes = {obj_id: (before, other.changes[obj_id][1])
+                            for obj_id, (before, _) in self.changes.items()}
+            self.time = other.time
+            return True
+        return False
+
+    def size(self):
+        return sys.getsizeof(self) + sys.getsizeof(self.changes) + sum(
+            2 * sys.getsizeof(after) + sum(estimate_size(before.get(key)) + estimate_size(after.get(key))
+                                           for key in self.keys)
+            for before, after in self.changes.values())
+
+
+class LevelPropertiesCommand(Command):
+    """Changed level properties, stored as {key: value} before and after."""
+    label = "Change Level Properties"
+
+    def __init__(self, before, after):
+        self.before = before
+        self.after = after
+        self.time = time.monotonic()
+
+    def undo(self, core):
+        core._set_level_values(self.before)
+
+    def redo(self, core):
+        core._set_level_values(self.after)
+
+    def merge(self, other):
+        if (isinstance(other, LevelPropertiesCommand) and other.after.keys() == self.after.keys()
+                and other.time - self.time <= MERGE_WINDOW_SECONDS):
+            self.after = other.after
+            self.time = other.time
+            return True
+        return False
+
+    def size(self):
+        return sys.getsizeof(self) + estimate_size(self.before) + estimate_size(self.after)
+
+
+class BatchCommand(Command):
+    """Several commands undone and redone as one step (e.g. a whole mouse drag)."""
+
+    def __init__(self, label="Edit"):
+        self.label = label
+        self.commands = []
+        self._size = sys.getsizeof(self)
+
+    def add(self, command):
+        """Adds a command, merging it into the previous one where possible."""
+        if self.commands and self.commands[-1].merge(command):
+            return
+        self.commands.append(command)
+
+    def undo(self, core):
+        for command in reversed(self.commands):
+            command.undo(core)
+
+    def redo(self, core):
+        for command in self.commands:
+            command.redo(core)
+
+    def size(self):
+        return self._size + sum(command.size() for command in self.commands)
+
+
+class UndoHistory:
+    """
+    Undo/redo stacks bounded by entry count and approximate memory.
+    The oldest entries are dropped first when either limit is exceeded.
+    """
+
+    def __init__(self, max_entries=200, max_bytes=8 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._undo = deque() # (command, size) pairs, newest last
+        self._redo = []
+        self._bytes = 0
+        self._batch = None
+        self._sealed = True # True when the newest entry must not absorb further edits
+
+    def push(self, command):
+        """Records a command that has already been applied."""
+        self._redo.clear()
+        if self._batch is not None:
+            self._batch.add(command)
+            return
+        if not self._sealed and self._undo:
+            last, last_size = self._undo[-1]
+            if last.merge(command):
+                new_size = last.size()
+                self._bytes += new_size - last_size
+                self._undo[-1] = (last, new_size)
+                return
+        self._append(command)
+        self._sealed = False
+
+    def _append(self, command):
+        size = command.size()
+        self._undo.append((command, size))
+        self._bytes += size
+        # Always keep the newest entry, even if it alone exceeds the byte limit
+        while len(self._undo) > 1 and (len(self._undo) > self.max_entries or self._bytes > self.max_bytes):
+            _, dropped_size = self._undo.popleft()
+            self._bytes -= dropped_size
+
+    def begin_batch(self, label="Edit"):
+        """Groups all commands pushed until end_batch() into one undo step."""
+        if self._batch is not None:
+            self.end_batch()
+        self._batch = BatchCommand(label)
+
+    def end_batch(self):
+        """Closes the current batch. Empty batches are discarded."""
+        batch, self._batch = self._batch, None
+        if batch is not None and batch.commands:
+            self._append(batch.commands[0] if len(batch.commands) == 1 else batch)
+            self._sealed = True
+
+    def seal(self):
+        """Prevents the newest entry from merging with the next edit."""
+        self._sealed = True
+
+    def undo(self, core):
+        """Undoes the newest entry. Returns the command, or None if there was nothing to undo."""
+        self.end_batch()
+        if not self._undo:
+            return None
+        command, size = self._undo.pop()
+        self._bytes -= size
+        command.undo(core)
+        self._redo.append(command)
+        self._sealed = True
+        return command
+
+    def redo(self, core):
+        """Redoes the most recently undone entry. Returns the command, or None."""
+        self.end_batch()
+        if not self._redo:
+            return None
+        command = self._redo.pop()
+        command.redo(core)
+        self._append(command)
+        self._sealed = True
+        return command
+
+    def clear(self):
+        """Forgets all history (after loading or creating a level)."""
+        self._undo.clear()
+        self._redo.clear()
+        self._bytes = 0
+        self._batch = None
+        self._sealed = True
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def undo_label(self):
+        return self._undo[-1][0].label if self._undo else None
+
+    def redo_label(self):
+        return self._redo[-1].label if self._redo else None
+
+    def get_stats(self):
+        """Returns entry counts and approximate memory held by the history."""
+        return {'undo_entries': len(self._undo), 'redo_entries': len(self._redo), 'bytes': self._bytes}
@@ -14,10 +14,13 @@ from PyQt6.QtWidgets import QWidget, QSizePolicy # Removed QScrollArea
 # Import pyqtSignal
 # Ensure QRect is imported
 from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal, QRect
-from PyQt6.QtGui import QPainter, QImage, QColor # Added for direct painting
+from PyQt6.QtGui import QPainter, QImage, QColor, QPen # Added for direct painting
+from PyQt6 import sip # For wrapping the Pygame pixel buffer in a QImage
 
 # Import tool constants
 from .artemis_tool_palette import TOOL_ERASER, TOOL_SELECT # Import from the new tool palette module
+from .artemis_spatial_index import SpatialIndex, get_object_rect
+from .artemis_play_preview import PlayPreview
 
 # Import background drawing functions from the main game module
 try:
@@ -35,13 +38,13 @@ print("Artemis Modules/artemis_level_view.py loaded (Pygame)")
 # --- Mock Compiler for Background Rendering ---
 # This class mimics the structure expected by the background drawing functions
 class MockCompiler:
+    """
+    Long-lived stand-in for the game's compiler. It is recreated only when the
+    level is resized; property changes are picked up with sync_level_properties().
+    """
     def __init__(self, view_widget, log_init_details=False, log_dimension_details=False):
         self.view = view_widget
         self.core = view_widget.core_logic
-        props = self.core.get_level_properties()
-        
-        if log_init_details:
-            print(f"[MockCompiler] Initializing with background_id: '{props.get('level_background')}'")
 
         self.width = self.view.level_width
         self.height = self.view.level_height
@@ -51,25 +54,9 @@ class MockCompiler:
         if log_dimension_details:
             print(f"[MockCompiler] Dimensions set to: width={self.width}, height={self.height}, scale={self.scale}")
         self.scoreboard_height = 0 # Scoreboard is handled separately now
-        
-        # Get background ID from level properties
-        self.background_id = props.get("level_background")
-        
-        # Initialize colors using the 'colors' dictionary from core_logic's properties
-        self.colors = props.get("colors", {})
-        if log_init_details:
-            if self.background_id and not self.colors:
-                print(f"[MockCompiler] Warning: No pre-loaded colors for '{self.background_id}'. Draw func may use defaults/fail.")
-            # elif not self.background_id: # This case is normal, no need to log unless debugging
-                # print(f"[MockCompiler] No background_id specified or no pre-loaded colors found for MockCompiler.")
 
         self.dt = 1/60.0 # Fixed delta time for editor animation updates
 
-        # Provide object lists (some backgrounds might use specific lists)
-        self.level_objects = self.core.level_objects # All objects
-        self.manholes = [obj for obj in self.level_objects if obj.get('type') == 'manhole']
-        # Add other specific lists if required by other backgrounds
-
         # Animation state for the draw function - managed by the view widget
         # MockCompiler gets a direct reference to this.
         if not hasattr(self.view, 'current_draw_func_anim_state'): # Should be initialized in LevelViewWidget
@@ -79,11 +66,39 @@ class MockCompiler:
         # Sludge texture - managed by the view widget (initially None)
         self.sludge_texture = getattr(self.view, 'cached_sludge_texture', None)
 
+        self.sync_level_properties(log_details=log_init_details)
+
+    def sync_level_properties(self, log_details=False):
+        """Copies the background settings from the core's level properties."""
+        props = self.core.get_level_properties()
+
+        if log_details:
+            print(f"[MockCompiler] Initializing with background_id: '{props.get('level_background')}'")
+
+        # Get background ID from level properties
+        self.background_id = props.get("level_background")
+
+        # Initialize colors using the 'colors' dictionary from core_logic's properties
+        self.colors = props.get("colors", {})
+        if log_details:
+            if self.background_id and not self.colors:
+                print(f"[MockCompiler] Warning: No pre-loaded colors for '{self.background_id}'. Draw func may use defaults/fail.")
+
         # Background details - required by some backgrounds like sewer
         self.background_details = props.get("background_details", {})
-        if log_init_details and self.background_id == "sewer" and not self.background_details:
+        if log_details and self.background_id == "sewer" and not self.background_details:
             print(f"[MockCompiler] Warning: No background_details for sewer; using defaults.")
 
+    # Provide object lists (some backgrounds might use specific lists)
+    @property
+    def level_objects(self):
+        return self.core.level_objects # All objects (live view)
+
+    @property
+    def manholes(self):
+        return [obj for obj in self.core.level_objects if obj.get('type') == 'manhole']
+        # Add other specific lists if required by other backgrounds
+
     def scale_rect(self, rect):
         # Since editor scale is 1.0, this function doesn't need to scale
         # It just needs to handle the offset (which is 0 here)
@@ -122,6 +137,10 @@ DEFAULT_SIZES = {
 DEFAULT_PADDLE_OFFSET_X = 50
 DEFAULT_PADDLE_OFFSET_Y = 0 # Centered later
 
+# Pixel masks of a 32-bit Pygame surface whose memory layout matches QImage.Format_RGB32
+# (native-endian 0x??RRGGBB words, the unused byte is ignored by Qt)
+QIMAGE_RGB32_MASKS = (0xFF0000, 0x00FF00, 0x0000FF, 0)
+
 # Removed PygameContainerWidget
 
 class LevelViewWidget(QWidget):
@@ -130,7 +149,10 @@ class LevelViewWidget(QWidget):
     """
     # --- Signals ---
     # Emits the ID of the selected object, or None if deselected
+    # (with several objects selected, the one clicked last)
     objectSelected = pyqtSignal(object, name='objectSelected')
+    # Emits the frozenset of all selected object IDs (empty if nothing is selected)
+    selectionChanged = pyqtSignal(object, name='selectionChanged')
     # Emits True when the level data is modified, False otherwise (e.g., after save/load)
     levelModified = pyqtSignal(bool, name='levelModified')
 
@@ -140,8 +162,13 @@ class LevelViewWidget(QWidget):
         self.main_window = main_window # Reference to access selected tool
         # Level state is now primarily managed by core_logic
         self.selected_object_id = None # Track the ID of the currently selected object
+        self.selected_object_ids = set() # All selected objects (includes selected_object_id)
         self.is_dragging = False
         self.drag_offset = (0, 0)
+        # --- Marquee Selection ---
+        self.marquee_origin = None # Level position where the marquee drag started
+        self.marquee_rect = None # Current (left, top, width, height) in level coordinates
+        self.marquee_additive = False # Shift held: add to the selection instead of replacing it
         # --- Zoom & Pan ---
         self.zoom_level = 1.0
         self.min_zoom = 0.1 # Minimum zoom factor
@@ -154,6 +181,9 @@ class LevelViewWidget(QWidget):
         self.grid_size = 50 # Size of grid cells in logical units (matching casino background detail)
         self.grid_enabled = False # Start with grid off
         self.grid_color = (60, 60, 60) # Dark grey for grid lines
+        # --- Object Snapping ---
+        self.object_snap_enabled = False # Snap dragged objects to edges/centers of nearby objects
+        self.object_snap_distance = 8 # Snap distance in screen pixels
         # Removed show_mock_scoreboard flag
 
         # --- Pygame Surface Setup ---
@@ -166,6 +196,10 @@ class LevelViewWidget(QWidget):
         self.render_offset_y = 0
         self.effective_surface_width = 0 # Calculated size after zoom
         self.effective_surface_height = 0
+        # Long-lived QImage sharing memory with the surface (see _create_qimage_bridge)
+        self._qimage = None
+        self._bridge_surface = None # Conversion target, only if the surface format doesn't match Qt's
+        self._bridge_dirty_rect = None # Area of the bridge surface still to be converted
 
         # --- Widget Setup ---
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -177,10 +211,15 @@ class LevelViewWidget(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
         self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
 
-        # --- Pygame Timer ---
+        # --- Redraw Scheduling ---
+        # The surface is only re-rendered after invalidate(); pan/zoom just repaint it.
+        # The timer runs only while the animated background preview is on.
+        self._surface_dirty = True
+        self.animate_background = False
         self.timer = QTimer(self)
-        self.timer.setInterval(16) # Approx 60 FPS
-        self.timer.timeout.connect(self.update_pygame)
+        self.timer.setInterval(33) # Throttled to ~30 FPS for the background preview
+        self.timer.timeout.connect(self.invalidate)
+        self.mock_compiler = None # Created on first render, recreated on resize
 
         # --- Sprite Cache ---
         self.sprite_cache = {} # Cache for loaded sprite images
@@ -192,16 +231,23 @@ class LevelViewWidget(QWidget):
         self._initial_background_draw_info_logged = False # True if initial logs for current last_logged_background_id are done
         self._log_compiler_dimensions_on_refresh = True # Log dimensions on first frame and after resize
 
+        # --- Spatial Index (picking, marquee queries, snapping) ---
+        # Created before the view's own handlers connect so it is current when they run
+        self.spatial_index = SpatialIndex(self.core_logic)
+
+        # --- Play Preview (live AI match drawn into the surface instead of the editor view) ---
+        self.play_preview = PlayPreview(self.core_logic, self)
+        self.play_preview.runningChanged.connect(self._on_play_preview_changed)
+
         # --- Connect to Core Signals ---
         self.core_logic.levelLoaded.connect(self.refresh_display)
         self.core_logic.levelPropertiesChanged.connect(self.refresh_display) # This will trigger background redraw
-        self.core_logic.objectUpdated.connect(self._handle_object_update) # Connect new signal
+        self.core_logic.objectsChanged.connect(self._handle_objects_changed) # Once per edit, however many objects
         self.core_logic.layoutRestored.connect(self.refresh_display) # Refresh after layout restore
 
         # Initial setup
         self._create_pygame_surface() # Create initial surface
         self._update_effective_surface_size() # Calculate initial scaled size
-        self.timer.start()
 
         print("LevelViewWidget initialized (Direct Paint)")
 
@@ -225,6 +271,11 @@ class LevelViewWidget(QWidget):
 
         return int(pygame_x), int(pygame_y)
 
+    def map_pygame_to_widget(self, x, y):
+        """Maps Pygame surface coordinates to widget coordinates (inverse of map_widget_to_pygame)."""
+        return ((x - self.pan_offset_x) * self.zoom_level + self.render_offset_x,
+                (y - self.pan_offset_y) * self.zoom_level + self.render_offset_y)
+
     # Removed initialize_new_level - handled by core_logic + refresh_display
     # Removed load_level_data - handled by core_logic + refresh_display
 
@@ -234,18 +285,49 @@ class LevelViewWidget(QWidget):
             # Ensure Pygame is initialized (needed for surface creation)
             if not pygame.get_init():
                 pygame.init()
-            self.pygame_surface = pygame.Surface((self.level_width, self.level_height))
+            self.pygame_surface = pygame.Surface((self.level_width, self.level_height), 0, 32)
             print(f"Pygame surface created/resized to {self.level_width}x{self.level_height}")
         except pygame.error as e:
             print(f"Error creating Pygame surface: {e}")
             # Create a small fallback surface
             self.level_width, self.level_height = 320, 180
             try:
-                self.pygame_surface = pygame.Surface((self.level_width, self.level_height))
+                self.pygame_surface = pygame.Surface((self.level_width, self.level_height), 0, 32)
                 print("Created fallback Pygame surface (320x180)")
             except pygame.error as e2:
                 print(f"FATAL: Could not create even fallback Pygame surface: {e2}")
                 self.pygame_surface = None # Indicate critical failure
+        self._create_qimage_bridge()
+
+    def _create_qimage_bridge(self):
+        """
+        Creates a QImage that views the Pygame pixel memory directly, so painting
+        needs no per-frame copy or format conversion. If the surface format doesn't
+        match Format_RGB32, a matching bridge surface is viewed instead and only
+        re-rendered areas are converted into it.
+        """
+        self._qimage = None
+        self._bridge_surface = None
+        self._bridge_dirty_rect = None
+        surface = self.pygame_surface
+        if surface is None:
+            return
+        try:
+            target = surface
+            if surface.get_bytesize() != 4 or surface.get_masks() != QIMAGE_RGB32_MASKS:
+                target = pygame.Surface(surface.get_size(), 0, 32)
+                if target.get_masks() != QIMAGE_RGB32_MASKS:
+                    print("Warning: No Pygame surface format matching QImage; painting will copy frames.")
+                    return
+                self._bridge_surface = target
+                self._bridge_dirty_rect = target.get_rect()
+            # The QImage doesn't own the memory; the surface must outlive it (both are replaced together)
+            self._qimage = QImage(sip.voidptr(target._pixels_address), target.get_width(), target.get_height(),
+                                  target.get_pitch(), QImage.Format.Format_RGB32)
+        except (AttributeError, pygame.error) as e:
+            print(f"Warning: Could not share Pygame surface memory with Qt ({e}); painting will copy frames.")
+            self._qimage = None
+            self._bridge_surface = None
 
     def refresh_display(self):
         """Updates the view based on the current state in core_logic."""
@@ -272,26 +354,58 @@ class LevelViewWidget(QWidget):
             # Consider resetting pan/zoom or clamping pan after resize? For now, just update size.
             self.update() # Schedule a repaint
 
-        # Deselect object if it no longer exists in core_logic
-        if self.selected_object_id is not None:
-             if self.core_logic.get_object_by_id(self.selected_object_id) is None:
-                 self.deselect_object() # This will emit the signal
+        elif self.mock_compiler is not None:
+            self.mock_compiler.sync_level_properties() # Background may have changed
 
-        # Always trigger a repaint, even if dimensions didn't change
+        # Deselect objects that no longer exist in core_logic
+        self._prune_selection()
+
+        # Always redraw, even if dimensions didn't change
         # (e.g., objects might have been added/deleted)
+        self.invalidate()
+
+    def invalidate(self):
+        """Marks the Pygame surface as outdated and schedules a repaint that re-renders it."""
+        self._surface_dirty = True
         self.update()
+
+    def set_background_animation(self, enabled):
+        """Turns the animated background preview on or off."""
+        self.animate_background = enabled
+        if enabled:
+            self.timer.start()
+        else:
+            self.timer.stop()
+        self.invalidate()
+
+    def set_play_preview(self, enabled):
+        """Starts or stops the live play preview. Returns True if the preview is running afterwards."""
+        if enabled:
+            return self.play_preview.start()
+        self.play_preview.stop()
+        return False
+
+    def _on_play_preview_changed(self, running):
+        if not running:
+            self.invalidate() # Bring back the editor view
+
+    def present_preview_frame(self):
+        """Shows a frame the play preview drew into the Pygame surface."""
+        if self.pygame_surface is not None:
+            self._bridge_dirty_rect = self.pygame_surface.get_rect()
+            self.update()
+
     # Removed showEvent
     
     def update_pygame(self):
-        """Update and redraw the internal Pygame surface."""
+        """Redraw the internal Pygame surface (called from paintEvent when invalidated)."""
         if not self.pygame_surface: # Check if surface creation failed
             return
             
         # --- Drawing onto self.pygame_surface ---
         # Get background ID from core logic properties
-        level_props = self.core_logic.get_level_properties()
         # Use the correct key "level_background" as indicated by debug output
-        background_id = level_props.get("level_background")
+        background_id = self.core_logic.level_properties.get("level_background")
 
         draw_func = None
         if background_id and get_background_draw_function:
@@ -312,10 +426,16 @@ class LevelViewWidget(QWidget):
         log_compiler_init_details = not self._initial_background_draw_info_logged
         log_compiler_dimension_details = self._log_compiler_dimensions_on_refresh
         
-        # Create mock compiler for the current frame
-        mock_compiler = MockCompiler(self,
-                                     log_init_details=log_compiler_init_details,
-                                     log_dimension_details=log_compiler_dimension_details)
+        # Reuse the mock compiler; it only needs recreating after a resize
+        if self.mock_compiler is None or log_compiler_dimension_details:
+            self.mock_compiler = MockCompiler(self,
+                                              log_init_details=log_compiler_init_details,
+                                              log_dimension_details=log_compiler_dimension_details)
+        elif log_compiler_init_details:
+            self.mock_compiler.sync_level_properties(log_details=True)
+        mock_compiler = self.mock_compiler
+        mock_compiler.background_animation_state = self.current_draw_func_anim_state
+        mock_compiler.sludge_texture = self.cached_sludge_texture
         
         # If MockCompiler was asked to log its init details, then this initial logging phase is done for the current background.
         # This flag will be reset if the background_id changes.
@@ -513,11 +633,9 @@ class LevelViewWidget(QWidget):
                 color = self.get_object_color(obj_data)
                 pygame.draw.rect(self.pygame_surface, color, obj_rect)
 
-            if obj_id == self.selected_object_id:
+            if obj_id in self.selected_object_ids:
                 pygame.draw.rect(self.pygame_surface, (255, 255, 0), obj_rect, 2)
 
-        self.update() # Schedule a repaint of the QWidget
-
 
     def get_object_color(self, obj_data):
         """Returns a distinct color based on the object's data."""
@@ -598,28 +716,109 @@ class LevelViewWidget(QWidget):
         self.levelModified.emit(True)
 
 
-    def select_object(self, obj_id):
-        """Selects the object with the given ID."""
-        if self.selected_object_id != obj_id:
-            self.selected_object_id = obj_id
-            self.is_dragging = False
-            print(f"Selected object ID: {self.selected_object_id}")
-            obj_data = self.core_logic.get_object_by_id(obj_id) # Get data for signal
-            self.objectSelected.emit(obj_data) # Emit actual object data or ID
-            self.update()
+    def select_object(self, obj_id, add=False):
+        """Selects the object with the given ID. With add=True, toggles it in the current selection."""
+        if add:
+            if obj_id in self.selected_object_ids:
+                remaining = self.selected_object_ids - {obj_id}
+                primary = self.selected_object_id if self.selected_object_id != obj_id else None
+                self._set_selection(remaining, primary)
+            else:
+                self._set_selection(self.selected_object_ids | {obj_id}, obj_id)
+        else:
+            self._set_selection({obj_id}, obj_id)
+
+    def select_objects(self, obj_ids, add=False):
+        """Selects several objects (e.g. from a marquee), optionally adding them to the selection."""
+        obj_ids = list(obj_ids)
+        selection = set(obj_ids) | (self.selected_object_ids if add else set())
+        primary = obj_ids[-1] if obj_ids else self.selected_object_id # Topmost of the new objects
+        self._set_selection(selection, primary)
+
+    def select_all(self):
+        """Selects every object in the level."""
+        self.select_objects([obj.get('id') for obj in self.core_logic.level_objects])
 
     def deselect_object(self):
-        """Deselects the currently selected object."""
-        if self.selected_object_id is not None:
-            print(f"Deselecting object ID: {self.selected_object_id}")
-            self.selected_object_id = None
+        """Deselects all selected objects."""
+        self._set_selection(set(), None)
+
+    def _set_selection(self, obj_ids, primary=None):
+        """Replaces the selection and notifies listeners once if it changed."""
+        obj_ids = set(obj_ids)
+        if primary not in obj_ids:
+            primary = self.selected_object_id if self.selected_object_id in obj_ids else next(iter(obj_ids), None)
+        if obj_ids == self.selected_object_ids and primary == self.selected_object_id:
+            return
+        if self.is_dragging:
+            self.core_logic.end_batch()
             self.is_dragging = False
-            self.objectSelected.emit(None)
-            self.update()
+        primary_changed = primary != self.selected_object_id
+        set_changed = obj_ids != self.selected_object_ids
+        self.selected_object_ids = obj_ids
+        self.selected_object_id = primary
+        if primary_changed:
+            self.objectSelected.emit(primary)
+        if set_changed:
+            if len(obj_ids) > 1:
+                print(f"Selected {len(obj_ids)} objects")
+            elif primary is not None:
+                print(f"Selected object ID: {primary}")
+            else:
+                print("Selection cleared")
+            self.selectionChanged.emit(frozenset(obj_ids))
+            self.invalidate() # Redraw the selection highlights
+
+    def _prune_selection(self):
+        """Drops objects that no longer exist from the selection."""
+        existing = {obj_id for obj_id in self.selected_object_ids
+                    if self.core_logic.get_object_by_id(obj_id) is not None}
+        if existing != self.selected_object_ids:
+            self._set_selection(existing, self.selected_object_id)
+
+    def _is_locked(self, obj_data):
+        """The default paddles (IDs 1 and 2) can't be moved or erased in the view."""
+        return obj_data.get("id") in [1, 2] and "paddle_spawn" in obj_data.get("type", "")
+
+    def get_movable_selection(self):
+        """Selected object IDs that can be moved, in draw order."""
+        movable = []
+        for obj_id in self.selected_object_ids:
+            obj_data = self.core_logic.get_object_by_id(obj_id)
+            if obj_data is not None and not self._is_locked(obj_data):
+                movable.append(obj_id)
+        return movable
+
+    # --- Multi-Selection Transforms (each is one undo step and one change notification) ---
+    def align_selection(self, edge):
+        """Aligns the selected objects to an edge or center line of their combined bounds."""
+        changed = self.core_logic.align_objects(self.get_movable_selection(), edge)
+        if changed:
+            print(f"Aligned {len(changed)} objects ({edge})")
+            self.levelModified.emit(True)
 
-    def _handle_object_update(self, obj_id):
-        """Handles the core signal indicating an object's properties have changed."""
-        print(f"LevelView received objectUpdated signal for ID: {obj_id}.")
+    def scale_selection(self, factor):
+        """Scales the selected objects and their spacing around the selection's center."""
+        changed = self.core_logic.scale_objects(self.get_movable_selection(), factor)
+        if changed:
+            print(f"Scaled {len(changed)} objects by {factor:g}")
+            self.levelModified.emit(True)
+
+    def _handle_objects_changed(self, obj_ids):
+        """Handles the core's coalesced change signal: one pass and one redraw per edit."""
+        removed = False
+        for obj_id in obj_ids:
+            if not self._sync_sprite_path(obj_id):
+                removed = True
+        if removed and self.selected_object_ids & obj_ids:
+            self._prune_selection()
+        self.invalidate()
+
+    def _sync_sprite_path(self, obj_id):
+        """
+        Keeps the sprite cache in step with an object's image_path, releasing sprites
+        no other object uses. Returns False if the object no longer exists.
+        """
         obj_data = self.core_logic.get_object_by_id(obj_id)
         if not obj_data:
             if obj_id in self.sprite_paths:
@@ -630,8 +829,7 @@ class LevelViewWidget(QWidget):
                         print(f"Removed unused sprite '{old_path}' from cache")
                     if old_path in self.sprite_load_errors: # Clear error if sprite is no longer used
                         self.sprite_load_errors.remove(old_path)
-            self.update() # Repaint if object was deleted (e.g. selection highlight)
-            return
+            return False
 
         if obj_data.get('type') == 'sprite' or 'image_path' in obj_data: # Handle any object that might have a sprite
             new_path = obj_data.get('image_path')
@@ -654,9 +852,7 @@ class LevelViewWidget(QWidget):
                     # Sprite will be loaded on next draw if not cached
                 elif obj_id in self.sprite_paths: # New path is None/empty, remove old association
                     del self.sprite_paths[obj_id]
-
-
-        self.update()
+        return True
 
     # --- Mouse Events ---
     def mousePressEvent(self, event):
@@ -675,75 +871,65 @@ class LevelViewWidget(QWidget):
         selected_tool = self.main_window.get_selected_tool()
         widget_pos = event.pos()
         pygame_x, pygame_y = self.map_widget_to_pygame(widget_pos)
+        shift_held = bool(event.modifiers() & Qt.KeyboardModifier.ShiftModifier)
 
         if 0 <= pygame_x < self.level_width and 0 <= pygame_y < self.level_height:
-            clicked_obj_id = None
-            # Iterate in reverse to get topmost object
-            for obj_data in reversed(self.core_logic.level_objects):
-                 x = obj_data.get('x')
-                 y = obj_data.get('y')
-                 w = obj_data.get('width')
-                 h = obj_data.get('height')
-                 size = obj_data.get('size')
-                 rect = None
-                 if x is not None and y is not None:
-                     if w is not None and h is not None:
-                         rect = pygame.Rect(x - w // 2, y - h // 2, w, h)
-                     elif size is not None:
-                         rect = pygame.Rect(x - size // 2, y - size // 2, size, size)
-                     else: # Fallback for objects with x,y but no w,h,size (should be rare)
-                          rect = pygame.Rect(x - 5, y - 5, 10, 10)
-                 
-                 if rect and rect.collidepoint(pygame_x, pygame_y):
-                     clicked_obj_id = obj_data.get('id')
-                     break
+            # Topmost object under the cursor
+            clicked_obj_id = self.spatial_index.pick(pygame_x, pygame_y)
 
             if selected_tool == TOOL_ERASER:
                 if clicked_obj_id:
                     obj_data = self.core_logic.get_object_by_id(clicked_obj_id)
                     # Prevent erasing default paddles (IDs 1 and 2)
-                    if obj_data and obj_data.get("id") in [1, 2] and "paddle_spawn" in obj_data.get("type", ""):
+                    if obj_data and self._is_locked(obj_data):
                          print(f"Cannot erase default paddle object: {clicked_obj_id}")
                     else:
                         print(f"Erasing object ID: {clicked_obj_id}")
-                        if self.selected_object_id == clicked_obj_id:
-                            self.deselect_object()
-                        self.core_logic.delete_object(clicked_obj_id)
+                        self.core_logic.delete_object(clicked_obj_id) # Leaves the selection via objectsChanged
                         self.levelModified.emit(True)
                 else:
                     print("Eraser clicked on empty space.")
 
-            elif selected_tool == TOOL_SELECT:
-                if clicked_obj_id:
-                    self.select_object(clicked_obj_id)
-                    self.is_dragging = True
-                    selected_obj_data = self.core_logic.get_object_by_id(self.selected_object_id)
-                    obj_x_center = selected_obj_data.get('x', 0)
-                    obj_y_center = selected_obj_data.get('y', 0)
-                    self.drag_offset = (pygame_x - obj_x_center, pygame_y - obj_y_center)
-                else:
-                    self.deselect_object()
-
-            elif selected_tool: # Placement tool from object palette
+            elif selected_tool and selected_tool != TOOL_SELECT: # Placement tool from object palette
                  self.deselect_object()
                  self._place_object_at(selected_tool, pygame_x, pygame_y)
 
-            else: # No tool selected - treat as select
-                 if clicked_obj_id:
-                    self.select_object(clicked_obj_id)
-                    self.is_dragging = True
-                    selected_obj_data = self.core_logic.get_object_by_id(self.selected_object_id)
-                    obj_x_center = selected_obj_data.get('x', 0)
-                    obj_y_center = selected_obj_data.get('y', 0)
-                    self.drag_offset = (pygame_x - obj_x_center, pygame_y - obj_y_center)
-                 else:
-                    self.deselect_object()
+            else: # Select tool (or no tool selected - treat as select)
+                self._handle_select_press(clicked_obj_id, pygame_x, pygame_y, shift_held)
         else: # Click outside logical pygame surface
             self.deselect_object() # Deselect if clicking outside the active area
 
         event.accept()
 
 
+    def _handle_select_press(self, clicked_obj_id, pygame_x, pygame_y, shift_held):
+        """
+        Click with the select tool: Shift+click toggles an object in the selection,
+        a click on an object selects it (keeping a multi-selection it belongs to)
+        and starts dragging the selection, a press on empty space starts a marquee.
+        """
+        if not clicked_obj_id:
+            if not shift_held:
+                self.deselect_object()
+            self.marquee_origin = (pygame_x, pygame_y)
+            self.marquee_rect = None
+            self.marquee_additive = shift_held
+            return
+
+        if shift_held:
+            self.select_object(clicked_obj_id, add=True)
+            return
+        if clicked_obj_id in self.selected_object_ids:
+            self._set_selection(self.selected_object_ids, clicked_obj_id) # Drag the group by this object
+        else:
+            self.select_object(clicked_obj_id)
+        self.is_dragging = True
+        self.core_logic.begin_batch("Move") # The whole drag is one undo step
+        selected_obj_data = self.core_logic.get_object_by_id(self.selected_object_id)
+        obj_x_center = selected_obj_data.get('x', 0)
+        obj_y_center = selected_obj_data.get('y', 0)
+        self.drag_offset = (pygame_x - obj_x_center, pygame_y - obj_y_center)
+
     def mouseMoveEvent(self, event):
         if not self.pygame_surface: return
 
@@ -766,6 +952,15 @@ class LevelViewWidget(QWidget):
             event.accept()
             return
 
+        if self.marquee_origin is not None:
+            pygame_x, pygame_y = self.map_widget_to_pygame(event.pos())
+            origin_x, origin_y = self.marquee_origin
+            self.marquee_rect = (min(origin_x, pygame_x), min(origin_y, pygame_y),
+                                 abs(pygame_x - origin_x), abs(pygame_y - origin_y))
+            self.update() # Only the overlay changes; the surface is not re-rendered
+            event.accept()
+            return
+
         if not self.is_dragging or self.selected_object_id is None:
             return
 
@@ -773,44 +968,72 @@ class LevelViewWidget(QWidget):
         if not selected_obj_data: return
 
         # Prevent dragging default paddles (IDs 1 and 2)
-        if selected_obj_data.get("id") in [1, 2] and "paddle_spawn" in selected_obj_data.get("type", ""):
+        if self._is_locked(selected_obj_data):
             return
 
+        # The whole movable selection moves with the object under the cursor
+        moving_ids = self.get_movable_selection()
+        bounds = self._get_group_bounds(moving_ids)
+        if bounds is None:
+            return
+        left, top, right, bottom = bounds
+
         widget_pos = event.pos()
         pygame_x, pygame_y = self.map_widget_to_pygame(widget_pos)
 
-        obj_w = selected_obj_data.get('width', 10) # Default to 10 if not found
-        obj_h = selected_obj_data.get('height', 10)
-
         # new_x, new_y are the new *center* coordinates
+        current_x = selected_obj_data.get('x')
+        current_y = selected_obj_data.get('y')
+        if current_x is None or current_y is None:
+            return
         new_center_x = pygame_x - self.drag_offset[0]
         new_center_y = pygame_y - self.drag_offset[1]
 
-        min_center_x = obj_w / 2
-        max_center_x = self.level_width - (obj_w / 2)
-        min_center_y = obj_h / 2
-        max_center_y = self.level_height - (obj_h / 2)
+        # Offsets that keep the group's bounds inside the level
+        min_dx, max_dx = -left, self.level_width - right
+        min_dy, max_dy = -top, self.level_height - bottom
 
-        clamped_center_x = max(min_center_x, min(new_center_x, max_center_x))
-        clamped_center_y = max(min_center_y, min(new_center_y, max_center_y))
+        dx = max(min_dx, min(new_center_x - current_x, max_dx))
+        dy = max(min_dy, min(new_center_y - current_y, max_dy))
 
-        snapped_x, snapped_y = clamped_center_x, clamped_center_y
         if self.grid_enabled:
-            snapped_x, snapped_y = self.snap_to_grid(clamped_center_x, clamped_center_y)
-            # Re-clamp after snapping
-            snapped_x = max(min_center_x, min(snapped_x, max_center_x))
-            snapped_y = max(min_center_y, min(snapped_y, max_center_y))
-
-        current_x = selected_obj_data.get('x')
-        current_y = selected_obj_data.get('y')
-        if current_x != int(snapped_x) or current_y != int(snapped_y):
-            self.core_logic.update_object_properties(self.selected_object_id, {'x': int(snapped_x), 'y': int(snapped_y)})
+            snapped_x, snapped_y = self.snap_to_grid(current_x + dx, current_y + dy)
+            dx, dy = snapped_x - current_x, snapped_y - current_y
+        elif self.object_snap_enabled:
+            width, height = right - left, bottom - top
+            center_x, center_y = left + dx + width / 2, top + dy + height / 2
+            snapped_x, snapped_y = self.snap_to_objects(center_x, center_y, width, height,
+                                                        exclude_ids=moving_ids)
+            dx, dy = dx + snapped_x - center_x, dy + snapped_y - center_y
+        # Re-clamp after snapping
+        dx = int(max(min_dx, min(dx, max_dx)))
+        dy = int(max(min_dy, min(dy, max_dy)))
+
+        if dx or dy:
+            if len(moving_ids) == 1:
+                self.core_logic.update_object_properties(self.selected_object_id, {'x': current_x + dx, 'y': current_y + dy})
+            else:
+                self.core_logic.move_objects(moving_ids, dx, dy)
             self.levelModified.emit(True)
-            # Property editor is connected to core_logic.objectUpdated via main window,
-            # or can be updated directly if main_window.property_editor.update_display(selected_obj_data) is called.
-            # For now, rely on objectUpdated signal.
+            # The property editor follows through core_logic.objectsChanged
         event.accept()
 
+    def _get_group_bounds(self, obj_ids):
+        """Returns (left, top, right, bottom) enclosing the given objects, or None."""
+        bounds = None
+        for obj_id in obj_ids:
+            obj_data = self.core_logic.get_object_by_id(obj_id)
+            rect = get_object_rect(obj_data) if obj_data is not None else None
+            if rect is None:
+                continue
+            left, top, w, h = rect
+            if bounds is None:
+                bounds = (left, top, left + w, top + h)
+            else:
+                bounds = (min(bounds[0], left), min(bounds[1], top),
+                          max(bounds[2], left + w), max(bounds[3], top + h))
+        return bounds
+
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.MouseButton.MiddleButton and self.is_panning:
@@ -820,9 +1043,23 @@ class LevelViewWidget(QWidget):
             event.accept()
             return
 
+        if event.button() == Qt.MouseButton.LeftButton and self.marquee_origin is not None:
+            marquee_rect = self.marquee_rect
+            self.marquee_origin = None
+            self.marquee_rect = None
+            if marquee_rect is not None and marquee_rect[2] > 0 and marquee_rect[3] > 0:
+                self.select_objects(self.spatial_index.query_rect(*marquee_rect), add=self.marquee_additive)
+            self.update()
+            event.accept()
+            return
+
         if event.button() == Qt.MouseButton.LeftButton and self.is_dragging:
-            print(f"Finished dragging object ID: {self.selected_object_id}")
+            if len(self.selected_object_ids) > 1:
+                print(f"Finished dragging {len(self.selected_object_ids)} objects")
+            else:
+                print(f"Finished dragging object ID: {self.selected_object_id}")
             self.is_dragging = False
+            self.core_logic.end_batch()
             # Final position already set during mouseMoveEvent
             event.accept()
             return
@@ -872,7 +1109,7 @@ class LevelViewWidget(QWidget):
         """Turns the grid display and snapping on or off."""
         self.grid_enabled = enabled
         print(f"Grid snapping {'enabled' if enabled else 'disabled'}")
-        self.update() # Redraw to show/hide grid
+        self.invalidate() # Redraw to show/hide grid
 
     def snap_to_grid(self, x, y):
         """Snaps the given coordinates to the nearest grid intersection."""
@@ -880,6 +1117,18 @@ class LevelViewWidget(QWidget):
         snapped_y = round(y / self.grid_size) * self.grid_size
         return snapped_x, snapped_y
 
+    def toggle_object_snap(self, enabled):
+        """Turns snapping to nearby object edges on or off (grid snapping takes precedence)."""
+        self.object_snap_enabled = enabled
+        print(f"Object snapping {'enabled' if enabled else 'disabled'}")
+
+    def snap_to_objects(self, center_x, center_y, width, height, exclude_ids=()):
+        """Moves a center position so the object's edges or center line up with a nearby object."""
+        threshold = self.object_snap_distance / max(self.zoom_level, 0.0001)
+        dx, dy = self.spatial_index.get_snap_offset(center_x - width / 2, center_y - height / 2,
+                                                    width, height, threshold, exclude_ids)
+        return center_x + dx, center_y + dy
+
     def draw_grid(self):
         """Draws the grid lines on the Pygame surface."""
         if not self.pygame_surface: return
@@ -904,9 +1153,13 @@ class LevelViewWidget(QWidget):
             super().paintEvent(event)
             return
 
+        if self._surface_dirty and not self.play_preview.is_running(): # The preview owns the surface while running
+            self._surface_dirty = False
+            self.update_pygame()
+            self._bridge_dirty_rect = self.pygame_surface.get_rect()
+
         painter = QPainter(self)
         widget_size = self.size()
-        surface_size = self.pygame_surface.get_size()
 
         safe_zoom = max(self.zoom_level, 0.0001)
         visible_pygame_width = widget_size.width() / safe_zoom
@@ -923,7 +1176,7 @@ class LevelViewWidget(QWidget):
         src_rect_pygame = pygame.Rect(
             int(clamped_pan_x), int(clamped_pan_y),
             int(src_width), int(src_height)
-        )
+        ).clip(self.pygame_surface.get_rect())
 
         dest_draw_width = int(src_rect_pygame.width * self.zoom_level)
         dest_draw_height = int(src_rect_pygame.height * self.zoom_level)
@@ -935,61 +1188,52 @@ class LevelViewWidget(QWidget):
             self.render_offset_x, self.render_offset_y,
             dest_draw_width, dest_draw_height
         )
+        src_rect_qt = QRect(src_rect_pygame.x, src_rect_pygame.y, src_rect_pygame.width, src_rect_pygame.height)
 
         painter.fillRect(self.rect(), QColor("#101010")) # Background for widget area
 
-        qimage = None
-        try:
-            if src_rect_pygame.width > 0 and src_rect_pygame.height > 0 and \
-               src_rect_pygame.x >= 0 and src_rect_pygame.y >= 0 and \
-               src_rect_pygame.right <= self.pygame_surface.get_width() and \
-               src_rect_pygame.bottom <= self.pygame_surface.get_height():
-
-                sub_surface = self.pygame_surface.subsurface(src_rect_pygame)
-                bytes_per_line = sub_surface.get_pitch()
-                qimage_format = QImage.Format.Format_RGB32
-                if sub_surface.get_flags() & pygame.SRCALPHA:
-                    qimage_format = QImage.Format.Format_ARGB32_Premultiplied
-                
-                buffer = sub_surface.get_buffer()
-                qimage = QImage(buffer.raw, src_rect_pygame.width, src_rect_pygame.height, bytes_per_line, qimage_format)
-            else:
-                 print(f"Warning: Invalid src_rect_pygame for subsurface: {src_rect_pygame}, Surface size: {self.pygame_surface.get_size()}")
-                 qimage = QImage(1, 1, QImage.Format.Format_RGB32)
-                 qimage.fill(Qt.GlobalColor.black)
-        except (ValueError, IndexError, pygame.error) as e: # Added pygame.error
-            print(f"Warning: Pygame subsurface/get_buffer() failed ({e}). Check rect: {src_rect_pygame}")
-            # Fallback: convert entire surface (less efficient)
-            try:
-                image_string = pygame.image.tostring(self.pygame_surface, "RGBA" if self.pygame_surface.get_flags() & pygame.SRCALPHA else "RGBX")
-                full_qimage = QImage(image_string, surface_size[0], surface_size[1], 
-                                     QImage.Format.Format_RGBA8888_Premultiplied if self.pygame_surface.get_flags() & pygame.SRCALPHA else QImage.Format.Format_RGBX8888)
-                
-                # Ensure src_rect_pygame is valid for full_qimage.copy
-                q_src_rect_for_copy = QRect(src_rect_pygame.x, src_rect_pygame.y, src_rect_pygame.width, src_rect_pygame.height)
-                if q_src_rect_for_copy.isValid() and \
-                   q_src_rect_for_copy.right() <= full_qimage.width() and \
-                   q_src_rect_for_copy.bottom() <= full_qimage.height():
-                    qimage = full_qimage.copy(q_src_rect_for_copy)
-                else:
-                    print(f"Warning: Invalid QRect for full_qimage.copy: {q_src_rect_for_copy}, Full QImage size: {full_qimage.size()}")
-                    qimage = QImage(1, 1, QImage.Format.Format_RGB32) # Tiny black image
-                    qimage.fill(Qt.GlobalColor.black)
-
-            except Exception as e_fallback:
-                print(f"FATAL: Fallback image conversion failed: {e_fallback}")
-                qimage = QImage(1, 1, QImage.Format.Format_RGB32) # Final fallback
-                qimage.fill(Qt.GlobalColor.red) # Red to indicate critical failure
-
+        if self._qimage is not None:
+            # Bring the bridge surface up to date for the re-rendered area only
+            if self._bridge_surface is not None and self._bridge_dirty_rect:
+                self._bridge_surface.blit(self.pygame_surface, self._bridge_dirty_rect, self._bridge_dirty_rect)
+            self._bridge_dirty_rect = None
+            qimage = self._qimage
+        else:
+            qimage = self._copy_surface_to_qimage(src_rect_pygame)
+            src_rect_qt = QRect(0, 0, qimage.width(), qimage.height())
 
-        if qimage and not qimage.isNull() and dest_rect_qt.isValid():
+        if not qimage.isNull() and dest_rect_qt.isValid() and src_rect_qt.isValid():
              painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-             painter.drawImage(dest_rect_qt, qimage)
+             # Qt scales straight from the source rect; no subimage is created
+             painter.drawImage(dest_rect_qt, qimage, src_rect_qt)
         else:
-             print(f"Warning: Skipping drawImage. QImage null: {qimage is None or qimage.isNull()}, DestRect valid: {dest_rect_qt.isValid()}")
+             print(f"Warning: Skipping drawImage. QImage null: {qimage.isNull()}, DestRect valid: {dest_rect_qt.isValid()}")
+
+        if self.marquee_rect is not None:
+            # Drawn over the widget so dragging the marquee doesn't re-render the level
+            left, top, width, height = self.marquee_rect
+            x1, y1 = self.map_pygame_to_widget(left, top)
+            x2, y2 = self.map_pygame_to_widget(left + width, top + height)
+            marquee_rect_qt = QRect(int(x1), int(y1), int(x2 - x1), int(y2 - y1))
+            painter.fillRect(marquee_rect_qt, QColor(255, 255, 0, 40))
+            painter.setPen(QPen(QColor(255, 255, 0), 1, Qt.PenStyle.DashLine))
+            painter.drawRect(marquee_rect_qt)
 
         painter.end()
 
+    def _copy_surface_to_qimage(self, src_rect_pygame):
+        """Fallback conversion of part of the surface into a new QImage (copies pixels)."""
+        try:
+            sub_surface = self.pygame_surface.subsurface(src_rect_pygame)
+            image_string = pygame.image.tostring(sub_surface, "RGBX")
+            return QImage(image_string, sub_surface.get_width(), sub_surface.get_height(),
+                          QImage.Format.Format_RGBX8888).copy() # Detach from the temporary bytes
+        except (ValueError, pygame.error) as e:
+            print(f"FATAL: Fallback image conversion failed: {e}")
+            qimage = QImage(1, 1, QImage.Format.Format_RGB32) # Final fallback
+            qimage.fill(Qt.GlobalColor.red) # Red to indicate critical failure
+            return qimage
+
 
     # --- Tool Handling ---
     def set_active_tool(self, tool_id):
@@ -1005,4 +1249,5 @@ class LevelViewWidget(QWidget):
         """Stop the timer when the widget closes."""
         print("LevelViewWidget closing, stopping timer.")
         self.timer.stop()
+        self.play_preview.stop()
         super().closeEvent(event)
\ No newline at end of file
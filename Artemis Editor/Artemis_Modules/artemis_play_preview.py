@@ -0,0 +1,175 @@
+"""
+Artemis Editor - Play Preview Module
+
+This module runs the edited level in the level view as a live AI match, using
+the game's own LevelCompiler, ball, obstacle and PaddleAI code. The match is
+built from the editor's in-memory level data, so no save is needed, and it is
+rebuilt shortly after every edit. Simulation runs at the game's fixed time
+step; frames are drawn into the level view's surface at a throttled rate.
+"""
+import random
+import threading
+import time
+import traceback
+
+import pygame
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+try:
+    import os
+    import sys
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+    from Ping.Modules.Core.Ping_Simulation import ScriptedMatch, FRAME_TIME
+except ImportError as e:
+    print(f"Warning: Could not import from Ping.Modules.Core.Ping_Simulation: {e}")
+    ScriptedMatch = None
+    FRAME_TIME = 1.0 / 60.0
+
+print("Artemis Modules/artemis_play_preview.py loaded")
+
+TICK_INTERVAL_MS = 16 # Simulation timer; steps are still a fixed FRAME_TIME
+RENDER_INTERVAL = 1.0 / 30.0 # Frames drawn into the level view at most this often (seconds)
+MAX_STEPS_PER_TICK = 5 # Drop simulation time rather than stall the UI after a hitch
+REBUILD_DELAY_MS = 150 # Edits closer together than this rebuild the match once
+
+
+class PlayPreview(QObject):
+    """
+    Live AI-vs-AI match of the level being edited, drawn into a LevelViewWidget.
+    The left paddle tracks the ball, the right paddle is the game's PaddleAI.
+    """
+    runningChanged = pyqtSignal(bool) # Emitted when the preview starts or stops (including on errors)
+
+    def __init__(self, core_logic, level_view):
+        super().__init__(level_view)
+        self.core_logic = core_logic
+        self.level_view = level_view
+        self.match = None
+        self.seed = 0
+        self._running = False
+        self._accumulator = 0.0
+        self._last_tick = 0.0
+        self._last_render = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(TICK_INTERVAL_MS)
+        self._timer.timeout.connect(self._tick)
+
+        self._rebuild_timer = QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(REBUILD_DELAY_MS)
+        self._rebuild_timer.timeout.connect(self._rebuild)
+
+        # Any edit rebuilds the match from the current level data
+        self.core_logic.levelLoaded.connect(self._schedule_rebuild)
+        self.core_logic.levelPropertiesChanged.connect(self._schedule_rebuild)
+        self.core_logic.objectsChanged.connect(self._schedule_rebuild)
+
+    def is_running(self):
+        return self._running
+
+    def start(self):
+        """Builds a match from the current level and starts running it. Returns True on success."""
+        if self._running:
+            return True
+        if ScriptedMatch is None:
+            print("Error: Play preview is unavailable (game modules could not be imported).")
+            self.runningChanged.emit(False)
+            return False
+        # Same serve after every rebuild, so edits can be compared against each other
+        self.seed = random.randrange(1 << 30)
+        if not self._build_match(keep_score=False):
+            self.runningChanged.emit(False)
+            return False
+        self._running = True
+        self._accumulator = 0.0
+        self._last_tick = time.perf_counter()
+        self._last_render = 0.0
+        self._timer.start()
+        self.runningChanged.emit(True)
+        print("Play preview started.")
+        return True
+
+    def stop(self):
+        """Stops the preview and releases the match."""
+        if not self._running:
+            return
+        self._running = False
+        self._timer.stop()
+        self._rebuild_timer.stop()
+        self._release_match()
+        self.runningChanged.emit(False)
+        print("Play preview stopped.")
+
+    # --- Match Lifetime ---
+    def _build_match(self, keep_score):
+        """Creates a match on the editor's current level data. Returns True on success."""
+        surface = self.level_view.pygame_surface
+        if surface is None:
+            return False
+        # Paddle sprites are converted to the display format, so a (hidden) display is needed
+        if pygame.display.get_surface() is None:
+            try:
+                pygame.display.set_mode((1, 1), pygame.HIDDEN)
+            except pygame.error as e:
+                print(f"Error: Could not create the display needed for the play preview: {e}")
+                return False
+        scores = (self.match.score_a, self.match.score_b) if keep_score and self.match else (0, 0)
+        try:
+            match = ScriptedMatch(self.core_logic.get_level_data_for_saving(), surface, self.seed,
+                                  shader=False, player_names=("Left", "Right"))
+        except Exception as e:
+            print(f"Error: Could not build the play preview for this level: {e}")
+            traceback.print_exc()
+            return False
+        match.score_a, match.score_b = scores
+        self._release_match()
+        self.match = match
+        self._last_render = 0.0 # Show the rebuilt level right away
+        return True
+
+    def _release_match(self):
+        match, self.match = self.match, None
+        if match is not None:
+            # Joining the level's texture thread can take a moment; don't block the UI for it
+            threading.Thread(target=match.close, daemon=True).start()
+
+    def _schedule_rebuild(self, *args):
+        if self._running:
+            self._rebuild_timer.start()
+
+    def _rebuild(self):
+        if self._running and not self._build_match(keep_score=True):
+            self.stop()
+
+    # --- Fixed Step Loop ---
+    def _tick(self):
+        if self.match is None:
+            return
+        if self.match.screen is not self.level_view.pygame_surface:
+            # The view recreated its surface (level resized); the pending rebuild may not have run yet
+            self._rebuild_timer.stop()
+            self._rebuild()
+            if self.match is None:
+                return
+
+        now = time.perf_counter()
+        self._accumulator += now - self._last_tick
+        self._last_tick = now
+        try:
+            steps = 0
+            while self._accumulator >= FRAME_TIME and steps < MAX_STEPS_PER_TICK:
+                self.match.step()
+                self._accumulator -= FRAME_TIME
+                steps += 1
+            if steps == MAX_STEPS_PER_TICK:
+                self._accumulator = 0.0 # Fell behind; skip ahead instead of catching up
+            if now - self._last_render >= RENDER_INTERVAL:
+                self._last_render = now
+                self.match.draw()
+                self.level_view.present_preview_frame()
+        except Exception as e:
+            print(f"Error: Play preview stopped after an error in the match: {e}")
+            traceback.print_exc()
+            self.stop()
@@ -7,7 +7,6 @@ object on the level canvas, or the level's global properties if no object
 is selected.
 """
 import os
-import pygame # Need for getting image dimensions
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFormLayout, QLineEdit,
                               QCheckBox, QScrollArea, QFrame, QPushButton,
                               QHBoxLayout, QFileDialog, QComboBox) # Added QComboBox
@@ -15,9 +14,17 @@ from PyQt6.QtCore import Qt, QObject, pyqtSignal # Correct Qt Imports
 from functools import partial
 import copy # Keep existing copy import
 
+from .artemis_thumbnail_cache import get_thumbnail_cache
+
 # Placeholder for future property editor widget
 print("Artemis Modules/artemis_property_editor.py loaded")
 
+# Object keys with an editable field, in display order (Add 'radius' for RouletteSpinner)
+EDITABLE_OBJECT_PROPS = ['x', 'y', 'width', 'height', 'size', 'radius', 'speed', 'is_left', 'is_bottom', 'target_id', 'image_path', 'properties']
+# Keys that can be set on several selected objects at once
+MULTI_EDIT_NUMERIC_PROPS = ['x', 'y', 'width', 'height', 'size', 'radius', 'speed']
+MULTI_EDIT_BOOL_PROPS = ['is_left', 'is_bottom']
+
 class PropertyEditorWidget(QWidget):
     """
     Widget to display and edit properties of the selected object or the level.
@@ -26,6 +33,7 @@ class PropertyEditorWidget(QWidget):
         super().__init__(parent)
         self.core_logic = core_logic
         self.current_object_id = None # Track displayed object ID
+        self.current_object_ids = () # Objects shown together when several are selected
         # self.level_prop_widgets = {} # Removed - Level properties handled elsewhere
         self.object_prop_widgets = {} # Store object property widgets {key: widget or layout_widget}
         self._block_signals = False # Flag to prevent update loops
@@ -57,6 +65,9 @@ class PropertyEditorWidget(QWidget):
         self.form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
         self.scroll_widget.setLayout(self.form_layout)
 
+        # Shown values follow edits made elsewhere (canvas drags, undo/redo), once per edit
+        self.core_logic.objectsChanged.connect(self._on_objects_changed)
+
         self.update_display(None) # Display empty state initially
         print("PropertyEditorWidget initialized")
 
@@ -88,6 +99,7 @@ class PropertyEditorWidget(QWidget):
         # self.level_prop_widgets.clear() # Removed
         self.object_prop_widgets.clear()
         self.current_object_id = game_object_data.get('id')
+        self.current_object_ids = ()
         self._block_signals = True # Block signals during population
 
         try:
@@ -115,9 +127,8 @@ class PropertyEditorWidget(QWidget):
             # --- Add editable fields for relevant properties ---
             # Determine editable props dynamically based on type? Or use a base set + specifics.
             obj_type = game_object_data.get('type')
-            editable_props = ['x', 'y', 'width', 'height', 'size', 'radius', 'speed', 'is_left', 'is_bottom', 'target_id', 'image_path', 'properties']
 
-            for key in editable_props:
+            for key in EDITABLE_OBJECT_PROPS:
                 if key in game_object_data:
                     value = game_object_data[key]
                     widget = None
@@ -159,12 +170,11 @@ class PropertyEditorWidget(QWidget):
                         sprite_combo = QComboBox()
                         sprite_combo.addItem("None")  # Allow removing sprite
                         
-                        # Populate sprite list from Sprites directory
+                        # Populate sprite list from Sprites directory (listing cached until it changes)
                         sprite_dir = os.path.join("..", "Ping", "Ping Assets", "Images", "Sprites")
                         if os.path.exists(sprite_dir):
-                            for filename in sorted(os.listdir(sprite_dir)):
-                                if any(filename.lower().endswith(ext) for ext in ['.png', '.webp', '.jpg', '.jpeg']):
-                                    sprite_combo.addItem(filename)
+                            sprite_combo.addItems(get_thumbnail_cache().list_images(
+                                sprite_dir, {'.png', '.webp', '.jpg', '.jpeg'}))
 
                         # Select current value or appropriate default based on type
                         current_value = str(value) if value else None
@@ -309,25 +319,11 @@ class PropertyEditorWidget(QWidget):
         full_path = os.path.join(base_path, relative_folder, relative_path)
         full_path = os.path.normpath(full_path)
 
-        try:
-            # Check if pygame is initialized (might be needed depending on timing)
-            if not pygame.get_init():
-                 print("Warning: Initializing Pygame in property editor to get image size.")
-                 pygame.init()
-
-            if pygame.get_init(): # Double check after trying init
-                 image = pygame.image.load(full_path)
-                 print(f"Loaded '{relative_path}' - Size: {image.get_size()}")
-                 return image.get_size() # Returns (width, height)
-            else:
-                print("Error: Pygame failed to initialize, cannot get image size.")
-                return None
-        except FileNotFoundError:
-            print(f"Error: Image not found for size check: {full_path}")
-            return None
-        except pygame.error as e:
-            print(f"Error loading image '{relative_path}' for size check: {e}")
-            return None
+        # Cached by path, modification time and size, so repeated selections don't reload the image
+        size = get_thumbnail_cache().get_image_size(full_path)
+        if size:
+            print(f"Size of '{relative_path}': {size}")
+        return size
 
     def _browse_for_sprite(self):
         """Opens a file dialog to select a sprite image."""
@@ -430,11 +426,11 @@ class PropertyEditorWidget(QWidget):
         print(f"PropertyEditor updating display for ID: {selected_obj_id}")
         if selected_obj_id is None:
             # If currently displaying an object, clear it
-            if self.current_object_id is not None:
+            if self.current_object_id is not None or self.current_object_ids:
                 self.display_no_object_selected()
         else:
             # If changing object or no object was selected before
-            if self.current_object_id != selected_obj_id:
+            if self.current_object_id != selected_obj_id or self.current_object_ids:
                 obj_data = self.core_logic.get_object_by_id(selected_obj_id)
                 if obj_data:
                     self.display_object_properties(obj_data)
@@ -442,9 +438,165 @@ class PropertyEditorWidget(QWidget):
                     print(f"Error: Could not find object data for ID {selected_obj_id}")
                     self.display_no_object_selected() # Fallback to empty state
 
+    def refresh_current_object(self):
+        """Re-displays the shown object after it was changed elsewhere (e.g. undo/redo)."""
+        if self.current_object_id is None:
+            return
+        obj_data = self.core_logic.get_object_by_id(self.current_object_id)
+        if obj_data:
+            self.display_object_properties(obj_data)
+        else:
+            self.display_no_object_selected()
+
+    def update_selection(self, selected_obj_ids):
+        """Shows the single selected object, or the shared properties of several."""
+        if len(selected_obj_ids) > 1:
+            self.display_multiple_objects(selected_obj_ids)
+        else:
+            self.update_display(next(iter(selected_obj_ids), None))
+
+    def display_multiple_objects(self, obj_ids):
+        """
+        Shows the properties the selected objects have in common. Fields where the
+        values differ are left empty; an entered value is applied to all of them
+        in one edit when editing finishes.
+        """
+        self._clear_layout(self.form_layout)
+        self.object_prop_widgets.clear()
+        self.current_object_id = None
+        self.current_object_ids = tuple(obj_ids)
+        objects = self._get_current_objects()
+        self._block_signals = True
+        try:
+            self.form_layout.addRow(QLabel(f"--- <b>{len(objects)} Objects Selected</b> ---"))
+            for key in MULTI_EDIT_NUMERIC_PROPS + MULTI_EDIT_BOOL_PROPS:
+                if not any(key in obj_data for obj_data in objects):
+                    continue
+                if key in MULTI_EDIT_BOOL_PROPS:
+                    widget = QCheckBox()
+                    widget.stateChanged.connect(lambda state, k=key: self._handle_multi_property_changed(k))
+                else:
+                    widget = QLineEdit()
+                    widget.setPlaceholderText("(mixed)")
+                    # Applied on editingFinished, not per keystroke, since each edit touches every object
+                    widget.editingFinished.connect(partial(self._handle_multi_property_changed, key))
+                label_text = key.replace('_', ' ').title() + ":"
+                self.form_layout.addRow(label_text, widget)
+                self.object_prop_widgets[key] = widget
+            self._refresh_multi_values(objects)
+        finally:
+            self._block_signals = False
+
+    def _get_current_objects(self):
+        """Data of the objects in the multi-selection that still exist."""
+        objects = (self.core_logic.get_object_by_id(obj_id) for obj_id in self.current_object_ids)
+        return [obj_data for obj_data in objects if obj_data is not None]
+
+    def _refresh_multi_values(self, objects):
+        """Shows the shared value of each multi-selection field (empty or partially checked if mixed)."""
+        self._block_signals = True
+        try:
+            for key, widget in self.object_prop_widgets.items():
+                values = [obj_data[key] for obj_data in objects if key in obj_data]
+                shared = values[0] if values and all(value == values[0] for value in values) else None
+                if isinstance(widget, QCheckBox):
+                    widget.setTristate(shared is None)
+                    if shared is None:
+                        widget.setCheckState(Qt.CheckState.PartiallyChecked)
+                    else:
+                        widget.setChecked(bool(shared))
+                elif not widget.hasFocus(): # Don't overwrite a value being typed
+                    widget.setText("" if shared is None else str(shared))
+        finally:
+            self._block_signals = False
+
+    def _handle_multi_property_changed(self, key):
+        """Applies a multi-selection field to every selected object that has the property."""
+        if self._block_signals or not self.current_object_ids:
+            return
+        widget = self.object_prop_widgets.get(key)
+        objects = [obj_data for obj_data in self._get_current_objects() if key in obj_data]
+        if widget is None or not objects:
+            return
+        if isinstance(widget, QCheckBox):
+            if widget.checkState() == Qt.CheckState.PartiallyChecked:
+                return
+            new_value = widget.checkState() == Qt.CheckState.Checked
+        else:
+            text = widget.text().strip()
+            if not text:
+                return # Left empty: keep each object's own value
+            target_type = float if any(isinstance(obj_data[key], float) for obj_data in objects) else int
+            try:
+                new_value = target_type(text)
+            except ValueError as e:
+                print(f"Warning: Invalid input '{text}' for property '{key}'. Error: {e}")
+                return
+        changed = self.core_logic.update_objects({obj_data['id']: {key: new_value} for obj_data in objects})
+        if changed:
+            print(f"Property '{key}' set to {new_value} on {len(changed)} objects")
+
+    def _on_objects_changed(self, obj_ids):
+        """Updates the shown values once per edit if it touched the displayed object(s)."""
+        if self.current_object_ids:
+            if obj_ids.intersection(self.current_object_ids):
+                self._refresh_multi_values(self._get_current_objects())
+            return
+        if self.current_object_id is None or self.current_object_id not in obj_ids:
+            return
+        obj_data = self.core_logic.get_object_by_id(self.current_object_id)
+        if obj_data is None:
+            self.display_no_object_selected()
+        elif set(self.object_prop_widgets) != self._get_field_keys(obj_data):
+            self.display_object_properties(obj_data) # Fields changed (e.g. new sub-properties); rebuild
+        else:
+            self._refresh_object_values(obj_data)
+
+    def _get_field_keys(self, game_object_data):
+        """Keys of object_prop_widgets that display_object_properties creates for an object."""
+        keys = set()
+        for key in EDITABLE_OBJECT_PROPS:
+            if key not in game_object_data:
+                continue
+            value = game_object_data[key]
+            if key == 'properties':
+                if isinstance(value, dict):
+                    keys.update(f"{key}.{sub_key}" for sub_key in value)
+            elif key == 'image_path':
+                keys.add('image_path_edit')
+            else:
+                keys.add(key)
+        return keys
+
+    def _refresh_object_values(self, game_object_data):
+        """Updates the fields of the displayed object in place instead of rebuilding the form."""
+        self._block_signals = True
+        try:
+            for key, widget in self.object_prop_widgets.items():
+                if key == 'image_path_edit':
+                    value = game_object_data.get('image_path')
+                elif '.' in key:
+                    main_key, sub_key = key.split('.', 1)
+                    value = game_object_data.get(main_key, {}).get(sub_key)
+                else:
+                    value = game_object_data.get(key)
+                if isinstance(widget, QComboBox):
+                    index = widget.findText(str(value)) if value else -1
+                    if index >= 0:
+                        widget.setCurrentIndex(index)
+                elif isinstance(widget, QCheckBox):
+                    widget.setChecked(bool(value))
+                elif isinstance(widget, QLineEdit) and not widget.hasFocus(): # Don't overwrite a value being typed
+                    text = "" if value is None else str(value)
+                    if widget.text() != text:
+                        widget.setText(text)
+        finally:
+            self._block_signals = False
+
     def display_no_object_selected(self):
         """Clears the property editor and shows a message."""
         self._clear_layout(self.form_layout)
         self.object_prop_widgets.clear()
         self.current_object_id = None
+        self.current_object_ids = ()
         self.form_layout.addRow(QLabel("<i>No object selected</i>"))
\ No newline at end of file
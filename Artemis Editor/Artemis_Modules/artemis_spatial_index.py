@@ -0,0 +1,201 @@
+"""
+Artemis Editor - Spatial Index Module
+
+This module contains a uniform grid over the level's objects used by the
+level view for click picking, marquee selection and edge snapping. It is
+kept up to date from ArtemisCore's object signals, so queries only look at
+the objects in the grid cells they touch instead of every object.
+"""
+
+print("Artemis Modules/artemis_spatial_index.py loaded")
+
+
+def get_object_rect(obj_data):
+    """
+    Returns the (left, top, width, height) area an object covers in the level.
+    Objects are positioned by their center, sized by width/height or size.
+    Returns None for objects without a position.
+    """
+    x = obj_data.get('x')
+    y = obj_data.get('y')
+    if x is None or y is None:
+        return None
+    w = obj_data.get('width')
+    h = obj_data.get('height')
+    size = obj_data.get('size')
+    if w is not None and h is not None:
+        return (x - w // 2, y - h // 2, w, h)
+    if size is not None:
+        return (x - size // 2, y - size // 2, size, size)
+    return (x - 5, y - 5, 10, 10)
+
+
+class SpatialIndex:
+    """
+    Uniform grid of object IDs. Each object is registered in every cell its
+    rectangle overlaps. Draw order is tracked with a rank per object so point
+    picks return the topmost object, like a reverse scan of the draw order.
+    Objects restored below others get a rank between their neighbours'.
+    """
+
+    def __init__(self, core_logic, cell_size=64):
+        self.core_logic = core_logic
+        self.cell_size = cell_size
+        self._cells = {}  # (cx, cy) -> set of object IDs
+        self._rects = {}  # object ID -> (left, top, right, bottom), right/bottom exclusive
+        self._ranks = {}  # object ID -> draw order rank (higher = drawn later = on top)
+        self._next_rank = 0
+
+        core_logic.levelLoaded.connect(self.rebuild)
+        core_logic.objectAdded.connect(self._on_object_added)
+        core_logic.objectUpdated.connect(self._on_object_updated)
+        core_logic.objectDeleted.connect(self.remove)
+        self.rebuild()
+
+    # --- Maintenance ---
+    def rebuild(self):
+        """Re-indexes all objects from the core."""
+        self._cells.clear()
+        self._rects.clear()
+        self._ranks.clear()
+        self._next_rank = 0
+        for obj_data in self.core_logic.level_objects:
+            self._insert(obj_data)
+
+    def _insert(self, obj_data, rank=None):
+        obj_id = obj_data.get('id')
+        rect = get_object_rect(obj_data)
+        if rank is None:
+            rank = self._next_rank
+            self._next_rank += 1
+        self._ranks[obj_id] = rank
+        if rect is None:
+            return
+        left, top, w, h = rect
+        bounds = (left, top, left + max(w, 1), top + max(h, 1))
+        self._rects[obj_id] = bounds
+        for cell in self._cells_for(bounds):
+            self._cells.setdefault(cell, set()).add(obj_id)
+
+    def remove(self, obj_id):
+        """Removes an object from the index."""
+        self._ranks.pop(obj_id, None)
+        bounds = self._rects.pop(obj_id, None)
+        if bounds is None:
+            return
+        for cell in self._cells_for(bounds):
+            ids = self._cells.get(cell)
+            if ids is not None:
+                ids.discard(obj_id)
+                if not ids:
+                    del self._cells[cell]
+
+    def _renumber_ranks(self):
+        """Reassigns evenly spaced ranks in draw order. The grid cells are left as they are."""
+        self._ranks = {obj_data.get('id'): rank for rank, obj_data in enumerate(self.core_logic.level_objects)}
+        self._next_rank = len(self._ranks)
+
+    def _rank_between(self, below_id, above_id):
+        if below_id is None:
+            return self._ranks[above_id] - 1
+        low, high = self._ranks[below_id], self._ranks[above_id]
+        rank = (low + high) / 2
+        return rank if low < rank < high else None # None once float precision runs out
+
+    def _on_object_added(self, obj_id):
+        obj_data = self.core_logic.get_object_by_id(obj_id)
+        if obj_data is None:
+            return
+        below_id, above_id = self.core_logic.get_neighbor_ids(obj_id)
+        if above_id is None:
+            self._insert(obj_data)
+            return
+        # Restored below other objects (undo of a delete): rank it between its neighbours
+        rank = self._rank_between(below_id, above_id)
+        if rank is None:
+            self._renumber_ranks() # Also ranks the new object; its neighbours now differ by 1
+            rank = self._ranks[obj_id]
+        self._insert(obj_data, rank)
+
+    def _on_object_updated(self, obj_id):
+        obj_data = self.core_logic.get_object_by_id(obj_id)
+        if obj_data is None:
+            self.remove(obj_id)
+            return
+        rank = self._ranks.get(obj_id)
+        rect = get_object_rect(obj_data)
+        if rect is not None:
+            left, top, w, h = rect
+            if self._rects.get(obj_id) == (left, top, left + max(w, 1), top + max(h, 1)):
+                return # Position and size unchanged
+        self.remove(obj_id)
+        self._insert(obj_data)
+        if rank is not None:
+            self._ranks[obj_id] = rank # Updating doesn't change the draw order
+
+    def _cells_for(self, bounds):
+        left, top, right, bottom = bounds
+        size = self.cell_size
+        for cx in range(int(left // size), int((right - 1) // size) + 1):
+            for cy in range(int(top // size), int((bottom - 1) // size) + 1):
+                yield (cx, cy)
+
+    # --- Queries ---
+    def pick(self, x, y):
+        """Returns the ID of the topmost object containing the point, or None."""
+        size = self.cell_size
+        best_id, best_rank = None, float('-inf')
+        for obj_id in self._cells.get((int(x // size), int(y // size)), ()):
+            left, top, right, bottom = self._rects[obj_id]
+            if left <= x < right and top <= y < bottom:
+                rank = self._ranks.get(obj_id, float('-inf'))
+                if rank > best_rank:
+                    best_id, best_rank = obj_id, rank
+        return best_id
+
+    def query_rect(self, left, top, width, height):
+        """Returns the IDs of all objects overlapping the rectangle, in draw order."""
+        right, bottom = left + max(width, 1), top + max(height, 1)
+        found = set()
+        for cell in self._cells_for((left, top, right, bottom)):
+            ids = self._cells.get(cell)
+            if ids:
+                found.update(ids)
+        hits = [obj_id for obj_id in found
+                if self._rects[obj_id][0] < right and left < self._rects[obj_id][2]
+                and self._rects[obj_id][1] < bottom and top < self._rects[obj_id][3]]
+        hits.sort(key=lambda obj_id: self._ranks.get(obj_id, -1))
+        return hits
+
+    def get_snap_offset(self, left, top, width, height, threshold, exclude_ids=()):
+        """
+        Finds the smallest move (dx, dy) that lines up an edge or center of the
+        rectangle with an edge or center of a nearby object, per axis. An axis
+        with no candidate within `threshold` gets an offset of 0.
+        """
+        exclude_ids = set(exclude_ids)
+        right, bottom = left + width, top + height
+        xs = (left, left + width / 2, right)
+        ys = (top, top + height / 2, bottom)
+        best_dx, best_dy = None, None
+        candidates = self.query_rect(left - threshold, top - threshold,
+                                     width + 2 * threshold, height + 2 * threshold)
+        for obj_id in candidates:
+            if obj_id in exclude_ids:
+                continue
+            o_left, o_top, o_right, o_bottom = self._rects[obj_id]
+            for target in (o_left, (o_left + o_right) / 2, o_right):
+                for edge in xs:
+                    d = target - edge
+                    if abs(d) <= threshold and (best_dx is None or abs(d) < abs(best_dx)):
+                        best_dx = d
+            for target in (o_top, (o_top + o_bottom) / 2, o_bottom):
+                for edge in ys:
+                    d = target - edge
+                    if abs(d) <= threshold and (best_dy is None or abs(d) < abs(best_dy)):
+                        best_dy = d
+        return (best_dx or 0, best_dy or 0)
+
+    def get_stats(self):
+        """Returns object and cell counts."""
+        return {'objects': len(self._rects), 'cells': len(self._cells)}
@@ -6,7 +6,10 @@ Widget for selecting sprites in the Artemis Editor.
 
 import os
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QListWidget, QListWidgetItem, QLabel
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, Qt, QSize
+from PyQt6.QtGui import QIcon, QPixmap
+
+from .artemis_thumbnail_cache import get_thumbnail_cache, THUMBNAIL_SIZE
 
 # Define the path to the sprites directory relative to the project root
 SPRITE_DIR = "../Ping/Ping Assets/Images/Sprites"
@@ -21,6 +24,11 @@ class SpritePalette(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Sprites")
+        self._sprite_items = {} # Normalized file path -> list item
+        # Thumbnails are decoded off the UI thread and arrive via thumbnailReady
+        self.thumbnail_cache = get_thumbnail_cache()
+        self.thumbnail_cache.thumbnailReady.connect(self._on_thumbnail_ready)
+        self.thumbnail_cache.directoryChanged.connect(self._on_directory_changed)
         self._init_ui()
         self._populate_sprites()
 
@@ -37,14 +45,19 @@ class SpritePalette(QWidget):
 
         self.sprite_list = QListWidget()
         self.sprite_list.setSpacing(2)
+        self.sprite_list.setIconSize(QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
         self.sprite_list.currentItemChanged.connect(self._on_sprite_selected)
         layout.addWidget(self.sprite_list)
 
         self.setLayout(layout)
 
     def _populate_sprites(self):
-        """Fetch available sprites from the SPRITE_DIR and add them to the list."""
+        """
+        Lists the sprites in SPRITE_DIR and requests their thumbnails. Files are not
+        opened here; invalid images are disabled when their decode fails.
+        """
         self.sprite_list.clear()
+        self._sprite_items.clear()
 
         # Add a "None" option
         none_item = QListWidgetItem("None")
@@ -57,38 +70,62 @@ class SpritePalette(QWidget):
             self.sprite_list.addItem(error_item)
             return
 
-        try:
-            found_sprites = False
-            for filename in sorted(os.listdir(SPRITE_DIR)):
-                file_ext = os.path.splitext(filename)[1].lower()
-                # Only show supported image files
-                if file_ext in ALLOWED_EXTENSIONS:
-                    try:
-                        # Validate that the file is a readable image before adding
-                        full_path = os.path.join(SPRITE_DIR, filename)
-                        with open(full_path, 'rb') as f:
-                            # Just read first few bytes to check header
-                            header = f.read(8)
-                            # Basic PNG/JPEG header check
-                            if (file_ext == '.png' and header.startswith(b'\x89PNG\r\n\x1a\n')) or \
-                               (file_ext in {'.jpg', '.jpeg'} and header.startswith(b'\xff\xd8')) or \
-                               (file_ext == '.webp' and header[8:12] == b'WEBP'):
-                                item = QListWidgetItem(filename)
-                                self.sprite_list.addItem(item)
-                                found_sprites = True
-                    except Exception as e:
-                        print(f"Warning: Invalid or corrupt sprite file '{filename}': {e}")
-
-            if not found_sprites:
-                placeholder_item = QListWidgetItem("No sprites found")
-                placeholder_item.setFlags(placeholder_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-                self.sprite_list.addItem(placeholder_item)
-
-        except Exception as e:
-            print(f"Error populating sprite list: {e}")
-            error_item = QListWidgetItem("Error loading sprites")
-            error_item.setFlags(error_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-            self.sprite_list.addItem(error_item)
+        filenames = self.thumbnail_cache.list_images(SPRITE_DIR, ALLOWED_EXTENSIONS)
+        for filename in filenames:
+            self._add_sprite_item(filename)
+
+        if not filenames:
+            placeholder_item = QListWidgetItem("No sprites found")
+            placeholder_item.setFlags(placeholder_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
+            self.sprite_list.addItem(placeholder_item)
+
+    def _add_sprite_item(self, filename, row=None):
+        """Adds a list item for a sprite file and shows or requests its thumbnail."""
+        item = QListWidgetItem(filename)
+        if row is None:
+            self.sprite_list.addItem(item)
+        else:
+            self.sprite_list.insertItem(row, item)
+        path = os.path.normpath(os.path.join(SPRITE_DIR, filename))
+        self._sprite_items[path] = item
+        image = self.thumbnail_cache.request(path)
+        if image is not None:
+            self._on_thumbnail_ready(path, image)
+
+    def _on_thumbnail_ready(self, path, image):
+        """Sets a decoded thumbnail on its item, or disables the item if the file is invalid."""
+        item = self._sprite_items.get(path)
+        if item is None:
+            return
+        if image is None:
+            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsSelectable & ~Qt.ItemFlag.ItemIsEnabled)
+            item.setToolTip("Invalid or corrupt image file")
+            return
+        item.setIcon(QIcon(QPixmap.fromImage(image)))
+        size = self.thumbnail_cache.get_image_size(path)
+        if size:
+            item.setToolTip(f"{os.path.basename(path)} ({size[0]}x{size[1]})")
+
+    def _on_directory_changed(self, directory):
+        """Adds, removes and refreshes items for files that changed in the sprite directory."""
+        if directory != os.path.normpath(SPRITE_DIR):
+            return
+        if not self._sprite_items:
+            self._populate_sprites() # Placeholder or error items only; rebuild
+            return
+        filenames = self.thumbnail_cache.list_images(SPRITE_DIR, ALLOWED_EXTENSIONS)
+        current = {os.path.normpath(os.path.join(SPRITE_DIR, name)): name for name in filenames}
+
+        for path in [path for path in self._sprite_items if path not in current]:
+            item = self._sprite_items.pop(path)
+            self.sprite_list.takeItem(self.sprite_list.row(item))
+            self.thumbnail_cache.forget(path)
+
+        for row, (path, filename) in enumerate(current.items(), start=1): # Row 0 is "None"
+            if path not in self._sprite_items:
+                self._add_sprite_item(filename, row)
+            elif self.thumbnail_cache.refresh(path):
+                self._sprite_items[path].setIcon(QIcon()) # New icon arrives via thumbnailReady
 
     def _on_sprite_selected(self, current_item, previous_item):
         """Emit signal when a sprite is selected."""
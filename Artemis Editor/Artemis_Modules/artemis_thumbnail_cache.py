@@ -0,0 +1,250 @@
+"""
+Artemis Editor - Thumbnail Cache Module
+
+This module decodes sprite images into small icons on background threads
+and remembers their full sizes. Icons are also kept on disk, keyed by file
+path, modification time and size, so unchanged images are not decoded again
+the next time the editor opens. Directories being listed are watched so the
+palettes can refresh incrementally when files are added, removed or changed.
+"""
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from PyQt6.QtCore import QObject, pyqtSignal, QFileSystemWatcher
+from PyQt6.QtGui import QImage
+
+print("Artemis Modules/artemis_thumbnail_cache.py loaded")
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", "Artemis_Data", "thumbnail_cache")
+INDEX_FILENAME = "index.json"
+THUMBNAIL_SIZE = 48 # Longest side of an icon in pixels
+
+
+class ThumbnailCache(QObject):
+    """
+    Thumbnail and image size cache shared by the palettes and the property editor.
+    Results are delivered on the UI thread through the thumbnailReady signal.
+    """
+    thumbnailReady = pyqtSignal(str, object) # (path, QImage, or None if the file couldn't be decoded)
+    directoryChanged = pyqtSignal(str) # A watched directory gained, lost or changed files
+
+    def __init__(self, cache_dir=CACHE_DIR, thumbnail_size=THUMBNAIL_SIZE, workers=2):
+        super().__init__()
+        self.cache_dir = os.path.normpath(cache_dir)
+        self.thumbnail_size = thumbnail_size
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="artemis-thumbnails")
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock() # Serializes index writes from workers and shutdown
+        self._images = {} # path -> QImage icon
+        self._info = {} # path -> (mtime_ns, size, width, height) of the file the entry was made from
+        self._pending = set() # Paths queued for decoding
+        self._listings = {} # directory -> sorted image filenames
+        self._index = self._load_index() # cache key -> {'path', 'width', 'height'}
+        self._index_dirty = False
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+
+    # --- Directory Listing ---
+    def list_images(self, directory, extensions):
+        """
+        Returns the sorted image filenames in a directory without opening them,
+        and starts watching the directory for changes. Listings are cached until
+        the directory changes.
+        """
+        directory = os.path.normpath(directory)
+        listing = self._listings.get(directory)
+        if listing is None:
+            try:
+                listing = sorted(name for name in os.listdir(directory)
+                                 if os.path.splitext(name)[1].lower() in extensions)
+            except OSError as e:
+                print(f"Error listing images in '{directory}': {e}")
+                return []
+            self._listings[directory] = listing
+            if directory not in self._watcher.directories():
+                self._watcher.addPath(directory)
+        return list(listing)
+
+    def _on_directory_changed(self, directory):
+        self._listings.pop(os.path.normpath(directory), None)
+        self.directoryChanged.emit(os.path.normpath(directory))
+
+    # --- Thumbnails ---
+    def request(self, path):
+        """
+        Returns the icon for an image if it is already decoded, otherwise queues it
+        for decoding and returns None (thumbnailReady is emitted when it's done).
+        """
+        path = os.path.normpath(path)
+        with self._lock:
+            image = self._images.get(path)
+            if image is not None or path in self._pending:
+                return image
+            self._pending.add(path)
+        self._executor.submit(self._load_thumbnail, path)
+        return None
+
+    def refresh(self, path):
+        """Drops the entry for a file if it changed on disk and queues it again. Returns True if it changed."""
+        path = os.path.normpath(path)
+        with self._lock:
+            info = self._info.get(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            self.forget(path)
+            return True
+        if info is not None and info[:2] == (st.st_mtime_ns, st.st_size):
+            return False
+        self.forget(path)
+        self.request(path)
+        return True
+
+    def forget(self, path):
+        """Removes a file's entry from memory (e.g. after it was deleted)."""
+        path = os.path.normpath(path)
+        with self._lock:
+            self._images.pop(path, None)
+            self._info.pop(path, None)
+
+    def _load_thumbnail(self, path):
+        """Worker thread: loads an icon from the disk cache or decodes the image."""
+        image = None
+        try:
+            st = os.stat(path)
+            key = self._make_key(path, st)
+            icon_path = os.path.join(self.cache_dir, key + ".png")
+            with self._lock:
+                entry = self._index.get(key)
+            if entry is not None and os.path.isfile(icon_path):
+                image = QImage(icon_path)
+                size = (entry['width'], entry['height'])
+            if image is None or image.isNull():
+                image, size = self._decode(path)
+                os.makedirs(self.cache_dir, exist_ok=True)
+                image.save(icon_path, "PNG")
+                with self._lock:
+                    self._index[key] = {'path': path, 'width': size[0], 'height': size[1]}
+                    self._index_dirty = True
+            with self._lock:
+                self._images[path] = image
+                self._info[path] = (st.st_mtime_ns, st.st_size, size[0], size[1])
+        except Exception as e: # Unreadable or corrupt image
+            print(f"Warning: Invalid or corrupt sprite file '{path}': {e}")
+            image = None
+        finally:
+            with self._lock:
+                self._pending.discard(path)
+                save_now = not self._pending and self._index_dirty
+        self.thumbnailReady.emit(path, image) # Queued to the UI thread
+        if save_now:
+            self.save_index()
+
+    def _decode(self, path):
+        """Decodes an image and scales it down to an icon. Returns (QImage, (width, height))."""
+        surface = pygame.image.load(path)
+        width, height = surface.get_size()
+        scale = min(1.0, self.thumbnail_size / max(width, height, 1))
+        icon_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        rgba = pygame.Surface((width, height), pygame.SRCALPHA, 32) # smoothscale needs 32-bit input
+        rgba.blit(surface, (0, 0))
+        icon = pygame.transform.smoothscale(rgba, icon_size)
+        data = pygame.image.tostring(icon, "RGBA")
+        image = QImage(data, icon_size[0], icon_size[1], QImage.Format.Format_RGBA8888).copy() # Own the pixels
+        return image, (width, height)
+
+    # --- Image Sizes ---
+    def get_image_size(self, path):
+        """
+        Returns the (width, height) of an image, from memory or the disk index when
+        the file is unchanged, otherwise by loading it once. Returns None on failure.
+        """
+        path = os.path.normpath(path)
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            print(f"Error: Image not found for size check: {path} ({e})")
+            return None
+        with self._lock:
+            info = self._info.get(path)
+            if info is not None and info[:2] == (st.st_mtime_ns, st.st_size):
+                return info[2], info[3]
+            entry = self._index.get(self._make_key(path, st))
+        if entry is not None:
+            return entry['width'], entry['height']
+        try:
+            size = pygame.image.load(path).get_size()
+        except pygame.error as e:
+            print(f"Error loading image '{path}' for size check: {e}")
+            return None
+        with self._lock:
+            # Record the size; the icon is still made by request()
+            self._index[self._make_key(path, st)] = {'path': path, 'width': size[0], 'height': size[1]}
+            self._index_dirty = True
+        return size
+
+    # --- Disk Index ---
+    def _make_key(self, path, st):
+        ident = f"{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}|{self.thumbnail_size}"
+        return hashlib.sha1(ident.encode("utf-8")).hexdigest()
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.cache_dir, INDEX_FILENAME), "r", encoding="utf-8") as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def save_index(self):
+        """Writes the index of cached sizes and icons, dropping entries for outdated file versions."""
+        with self._lock:
+            if not self._index_dirty:
+                return
+            current_keys = {}
+            for path, (mtime_ns, size, _, _) in self._info.items():
+                ident = f"{os.path.abspath(path)}|{mtime_ns}|{size}|{self.thumbnail_size}"
+                current_keys[path] = hashlib.sha1(ident.encode("utf-8")).hexdigest()
+            stale = [key for key, entry in self._index.items()
+                     if entry.get('path') in current_keys and current_keys[entry['path']] != key]
+            for key in stale:
+                del self._index[key]
+            index = dict(self._index)
+            self._index_dirty = False
+        with self._save_lock:
+            for key in stale:
+                try:
+                    os.remove(os.path.join(self.cache_dir, key + ".png"))
+                except OSError:
+                    pass
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                index_path = os.path.join(self.cache_dir, INDEX_FILENAME)
+                temp_path = index_path + ".tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(index, f)
+                os.replace(temp_path, index_path) # Atomic: readers never see a partial index
+            except OSError as e:
+                print(f"Warning: Could not save thumbnail cache index: {e}")
+
+    def shutdown(self):
+        """Stops the worker threads and saves the index. Call before pygame.quit()."""
+        # Drop queued decodes but wait for running ones, so no worker touches pygame after quit
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.save_index()
+
+
+# Global thumbnail cache instance
+_thumbnail_cache = None
+
+def get_thumbnail_cache():
+    """Get or create the global thumbnail cache (needs a QApplication)."""
+    global _thumbnail_cache
+    if _thumbnail_cache is None:
+        _thumbnail_cache = ThumbnailCache()
+    return _thumbnail_cache
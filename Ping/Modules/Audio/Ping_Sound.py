@@ -6,6 +6,7 @@ import logging
 from queue import Queue, Empty, Full
 from collections import deque
 from ..Graphics.Menus.Ping_Settings import SettingsScreen # Import SettingsScreen
+from ..Core.Ping_Logging import get_logger
 
 def get_game_parameters_path():
     """Get the correct path to Game Parameters directory."""
@@ -38,8 +39,7 @@ DEFAULT_FADE_DURATION = 1.0
 SOUND_END_EVENT = pygame.USEREVENT + 1 # Custom event for sound completion
 
 # --- Logging Setup ---
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
+logger = get_logger("sound")
 
 class SoundManager:
     """
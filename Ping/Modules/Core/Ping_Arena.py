@@ -2,6 +2,9 @@ import pygame
 from Ping.Modules.Objects.Ping_GameObjects import ObstacleObject, GoalObject, PortalObject, PowerUpBallObject, ManHoleObject
 # Removed import for DebugLevel, SewerLevel
 from Ping.Modules.Graphics.UI.Ping_Scoreboard import Scoreboard
+from Ping.Modules.Core.Ping_Logging import get_logger
+
+collision_logger = get_logger("collision")
 
 
 class Arena:
@@ -275,16 +278,17 @@ class Arena:
     def check_power_up_collision(self, ball, ball_count):
         """Check for collisions between ball and power-up."""
         if self.power_up:
-            print(f"Checking powerup collision. Powerup active: {self.power_up.power_up.active}")
-            print(f"Ball position: ({ball.rect.x}, {ball.rect.y}), Powerup position: ({self.power_up.rect.x}, {self.power_up.rect.y})")
+            collision_logger.debug("Checking powerup collision. Powerup active: %s", self.power_up.power_up.active)
+            collision_logger.debug("Ball position: (%s, %s), Powerup position: (%s, %s)",
+                                   ball.rect.x, ball.rect.y, self.power_up.rect.x, self.power_up.rect.y)
             # Directly return the result from the power-up's collision handler
             # This will be either a raw Ball instance or None/False
             result = self.power_up.handle_collision(ball)
             if result:
-                print(f"Powerup collision returned: {type(result)}")
+                collision_logger.debug("Powerup collision returned: %s", type(result))
             return result
         else:
-            print("No powerup exists in arena")
+            collision_logger.debug("No powerup exists in arena")
         return None
 
     def update_power_up(self, ball_count):
@@ -0,0 +1,231 @@
+"""
+Ping Benchmark Module
+Headless, reproducible update/draw timings for every PMF level.
+
+Run from the repository root:
+    python -m Ping.Modules.Core.Ping_Benchmark --frames 600 --output bench.json
+    python -m Ping.Modules.Core.Ping_Benchmark --baseline bench.json
+"""
+
+import os
+
+# Render and mix without a window or audio device (must be set before pygame initializes)
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+# Keep pygame's import banner off stdout, which carries the JSON report
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import contextlib
+import glob
+import json
+import platform
+import sys
+import time
+from typing import Dict, List, Optional
+
+import pygame
+
+from Ping.Modules.Core.Ping_MatchHistory import detect_build
+from Ping.Modules.Core.Ping_Profiler import get_profiler
+from Ping.Modules.Core.Ping_Simulation import ScriptedMatch
+from Ping.Modules.Graphics.Ping_RenderQueue import get_render_queue
+from Ping.Modules.Graphics.Ping_SurfacePool import get_surface_pool
+
+
+MODES = ('no_shader', 'shader')
+
+
+def get_ping_root():
+    """Get the Ping directory (the game resolves its assets relative to it)."""
+    # Get the directory of this file (Ping/Modules/Core/)
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.normpath(os.path.join(current_dir, "..", ".."))
+
+
+def discover_levels(levels_dir: Optional[str] = None) -> List[str]:
+    """Every .pmf file in the levels directory, sorted by name."""
+    levels_dir = levels_dir or os.path.join(get_ping_root(), "Ping Assets", "Levels")
+    return sorted(glob.glob(os.path.join(levels_dir, "*.pmf")))
+
+
+def summarize_ns(samples: List[int]) -> Dict[str, float]:
+    """Mean, p50, p95, p99 and max of nanosecond samples, in milliseconds."""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    def percentile(point):
+        return ordered[min(len(ordered) - 1, int(round(point / 100.0 * (len(ordered) - 1))))] / 1e6
+    return {
+        'mean_ms': sum(ordered) / len(ordered) / 1e6,
+        'p50_ms': percentile(50),
+        'p95_ms': percentile(95),
+        'p99_ms': percentile(99),
+        'max_ms': ordered[-1] / 1e6,
+    }
+
+
+def run_level(level_path: str, screen, frames: int, warmup: int, seed: int, shader: bool,
+              dirty_rects: bool = False) -> Dict:
+    """Time `frames` update and draw steps (after `warmup` untimed ones) for one level and mode."""
+    match = ScriptedMatch(level_path, screen, seed, shader, dirty_rects=dirty_rects)
+    profiler = get_profiler()
+    render_queue = get_render_queue()
+    surface_pool = get_surface_pool()
+    profiler.history = frames
+    update_ns, draw_ns = [], []
+    try:
+        for frame in range(warmup + frames):
+            if frame == warmup:
+                profiler.reset()
+            profiler.begin_frame()
+            start = time.perf_counter_ns()
+            match.step()
+            middle = time.perf_counter_ns()
+            match.draw()
+            end = time.perf_counter_ns()
+            # Per-frame bookkeeping the game loop in ping_base does after drawing
+            render_queue.end_frame()
+            surface_pool.end_frame()
+            if frame >= warmup:
+                update_ns.append(middle - start)
+                draw_ns.append(end - middle)
+        profiler.begin_frame()
+        scopes = {name: stats for name, stats in profiler.get_summary().items()
+                  if name not in ('frame', 'other')}
+    finally:
+        match.close()
+    return {
+        'update': summarize_ns(update_ns),
+        'draw': summarize_ns(draw_ns),
+        'scopes_mean_ms': {name: stats['mean'] for name, stats in scopes.items()},
+        'final_score': [match.score_a, match.score_b],
+    }
+
+
+def run_benchmarks(levels: List[str], frames: int = 600, warmup: int = 60, seed: int = 1234,
+                   resolution=(800, 600), modes=MODES, shader_frames: int = 60,
+                   dirty_rects: bool = False) -> Dict:
+    """
+    Benchmark every level in every mode and return the JSON-ready report.
+
+    The shader is far slower per frame than everything else, so shader runs use
+    shader_frames timed frames (and at most 10 warmup frames) instead. Dirty rect
+    drawing is off unless dirty_rects is set, whatever settings.txt says.
+    """
+    pygame.init()
+    screen = pygame.display.set_mode(resolution)
+    report = {
+        'meta': {
+            'build': detect_build(),
+            'frames': frames,
+            'warmup': warmup,
+            'shader_frames': shader_frames,
+            'dirty_rects': dirty_rects,
+            'seed': seed,
+            'resolution': list(resolution),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'timestamp': time.time(),
+        },
+        'levels': {},
+    }
+    for level_path in levels:
+        name = os.path.splitext(os.path.basename(level_path))[0]
+        report['levels'][name] = {}
+        for mode in modes:
+            if mode == 'shader':
+                result = run_level(level_path, screen, shader_frames, min(warmup, 10), seed, True, dirty_rects)
+            else:
+                result = run_level(level_path, screen, frames, warmup, seed, False, dirty_rects)
+            report['levels'][name][mode] = result
+    return report
+
+
+def compare_reports(current: Dict, baseline: Dict, threshold: float = 0.10) -> List[Dict]:
+    """
+    Compare mean and p95 times against a baseline report.
+
+    Returns:
+        list: One row per level/mode/phase/stat present in both reports, with the
+              change ratio and whether it regressed by more than `threshold`.
+    """
+    rows = []
+    for level, modes in current.get('levels', {}).items():
+        for mode, phases in modes.items():
+            baseline_phases = baseline.get('levels', {}).get(level, {}).get(mode)
+            if not baseline_phases:
+                continue
+            for phase in ('update', 'draw'):
+                for stat in ('mean_ms', 'p95_ms'):
+                    new = phases.get(phase, {}).get(stat)
+                    old = baseline_phases.get(phase, {}).get(stat)
+                    if new is None or not old:
+                        continue
+                    change = new / old - 1.0
+                    rows.append({'level': level, 'mode': mode, 'phase': phase, 'stat': stat,
+                                 'baseline': old, 'current': new, 'change': change,
+                                 'regression': change > threshold})
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Headless Ping update/draw benchmark over the PMF levels.")
+    parser.add_argument('--frames', type=int, default=600, help="Timed frames per level and mode")
+    parser.add_argument('--warmup', type=int, default=60, help="Untimed frames before measuring")
+    parser.add_argument('--shader-frames', type=int, default=60, help="Timed frames per level with the shader on")
+    parser.add_argument('--seed', type=int, default=1234, help="Random seed for every run")
+    parser.add_argument('--resolution', default="800x600", help="Window size, WIDTHxHEIGHT")
+    parser.add_argument('--levels', nargs='*', help="PMF files to run (default: every level in Ping Assets/Levels)")
+    parser.add_argument('--modes', default=",".join(MODES), help="Comma separated: no_shader,shader")
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help="Draw with dirty rects instead of full frames (off by default, independent of settings.txt)")
+    parser.add_argument('--output', help="Write the JSON report here instead of stdout")
+    parser.add_argument('--baseline', help="Compare against a previously saved report")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Fractional slowdown counted as a regression (default 0.10)")
+    args = parser.parse_args(argv)
+
+    resolution = tuple(int(value) for value in args.resolution.lower().split('x'))
+    modes = [mode for mode in args.modes.split(',') if mode in MODES]
+    levels = [os.path.abspath(path) for path in args.levels] if args.levels else discover_levels()
+    output = os.path.abspath(args.output) if args.output else None
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+    if not levels:
+        print("Error: No PMF levels found", file=sys.stderr)
+        return 2
+
+    # Assets are loaded relative to the Ping directory, like running the game
+    os.chdir(get_ping_root())
+    # Level loading chatter goes to stderr so stdout stays valid JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run_benchmarks(levels, args.frames, args.warmup, args.seed, resolution, modes, args.shader_frames,
+                                args.dirty_rects)
+
+    text = json.dumps(report, indent=2)
+    if output:
+        with open(output, 'w') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if baseline_path:
+        with open(baseline_path, 'r') as f:
+            baseline = json.load(f)
+        if baseline.get('meta', {}).get('dirty_rects', False) != args.dirty_rects:
+            print("Warning: The baseline was run with a different --dirty-rects setting; timings aren't comparable",
+                  file=sys.stderr)
+        rows = compare_reports(report, baseline, args.threshold)
+        for row in rows:
+            marker = "REGRESSION" if row['regression'] else ""
+            print(f"{row['level']:<20} {row['mode']:<10} {row['phase']:<6} {row['stat']:<8} "
+                  f"{row['baseline']:8.3f} -> {row['current']:8.3f} ms ({row['change'] * 100:+6.1f}%) {marker}",
+                  file=sys.stderr)
+        if any(row['regression'] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""
+Ping Logging Module
+Central logging with per-subsystem levels, rate limiting and deduplication.
+
+Records are filtered and queued on the calling thread; a background listener
+writes them to the log file, stderr and the debug console, so logging from the
+game loop never blocks on terminal or disk I/O.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+ROOT_LOGGER_NAME = "ping"
+DEFAULT_LEVEL = logging.INFO
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+
+
+def get_game_parameters_path():
+    """Get the correct path to Game Parameters directory."""
+    # Get the directory of this file (Ping/Modules/Core/)
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    # Go up two levels to get to Ping directory, then into Game Parameters
+    game_params_dir = os.path.join(current_dir, "..", "..", "Game Parameters")
+    return os.path.normpath(game_params_dir)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Drops repeated and excessive log records before they are queued.
+
+    Identical records (same logger, level, message and arguments) are logged at
+    most once per dedup_window seconds; the next one that gets through notes how
+    many repeats were skipped. Each subsystem also gets a token bucket of `rate`
+    records per second (bursts up to `burst`). Errors are deduplicated but never
+    rate limited.
+    """
+
+    def __init__(self, rate: float = 20.0, burst: int = 50, dedup_window: float = 5.0, max_keys: int = 512):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.dedup_window = dedup_window
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._recent: Dict[tuple, list] = {}   # key -> [time last logged, repeats skipped since]
+        self._buckets: Dict[str, list] = {}    # logger name -> [tokens, last refill, records dropped since]
+
+        # Counters
+        self.suppressed = 0
+        self.dropped = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        now = time.monotonic()
+        key = self._dedup_key(record)
+        with self._lock:
+            entry = self._recent.get(key)
+            if entry is not None and now - entry[0] < self.dedup_window:
+                entry[1] += 1
+                self.suppressed += 1
+                return False
+            repeats = entry[1] if entry is not None else 0
+
+            dropped = 0
+            if record.levelno < logging.ERROR:
+                bucket = self._buckets.get(record.name)
+                if bucket is None:
+                    bucket = self._buckets[record.name] = [float(self.burst), now, 0]
+                bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+                if bucket[0] < 1.0:
+                    bucket[2] += 1
+                    self.dropped += 1
+                    return False
+                bucket[0] -= 1.0
+                dropped, bucket[2] = bucket[2], 0
+
+            if len(self._recent) >= self.max_keys and key not in self._recent:
+                # Forget entries whose window has passed; if none have, start over
+                self._recent = {k: v for k, v in self._recent.items() if now - v[0] < self.dedup_window}
+                if len(self._recent) >= self.max_keys:
+                    self._recent.clear()
+            self._recent[key] = [now, 0]
+
+        notes = []
+        if repeats:
+            notes.append(f"repeated {repeats} more times")
+        if dropped:
+            notes.append(f"{dropped} earlier messages dropped")
+        if notes:
+            record.msg = f"{record.getMessage()} ({', '.join(notes)})"
+            record.args = None
+        return True
+
+    @staticmethod
+    def _dedup_key(record: logging.LogRecord) -> tuple:
+        """Key identifying identical records without formatting them when possible."""
+        try:
+            key = (record.name, record.levelno, record.msg, record.args)
+            hash(key)
+            return key
+        except TypeError:
+            return (record.name, record.levelno, record.getMessage(), None)
+
+
+class _ConsoleSinkHandler(logging.Handler):
+    """Forwards records to the debug console (runs on the listener thread)."""
+
+    def emit(self, record: logging.LogRecord):
+        sink = _console_sink
+        if sink is None:
+            return
+        try:
+            subsystem = record.name.split(".", 1)[-1]
+            sink(f"[{subsystem}] {record.levelname}: {record.getMessage()}")
+        except Exception:
+            self.handleError(record)
+
+
+# Module state
+_lock = threading.Lock()
+_configured = False
+_listener: Optional[logging.handlers.QueueListener] = None
+_rate_filter: Optional[RateLimitFilter] = None
+_console_sink: Optional[Callable[[str], None]] = None
+
+
+def configure_logging(log_file: Optional[str] = None):
+    """
+    Set up the queue-backed handlers on the 'ping' logger (called automatically by get_logger).
+
+    Per-subsystem levels can be given in the PING_LOG_LEVELS environment variable,
+    e.g. PING_LOG_LEVELS="ai=DEBUG,shader=WARNING".
+
+    Args:
+        log_file (str, optional): Log file path; defaults to Game Parameters/ping.log.
+    """
+    global _configured, _listener, _rate_filter
+    with _lock:
+        if _configured:
+            return
+        _configured = True
+
+        root = logging.getLogger(ROOT_LOGGER_NAME)
+        root.setLevel(DEFAULT_LEVEL)
+        root.propagate = False  # Don't also go through handlers set up with basicConfig
+
+        formatter = logging.Formatter(LOG_FORMAT)
+        handlers = []
+        try:
+            log_file = log_file or os.path.join(get_game_parameters_path(), "ping.log")
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+            file_handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=1024 * 1024,
+                                                                backupCount=2, encoding="utf-8")
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+        except OSError as e:
+            print(f"Error opening log file, logging to the terminal only: {e}")
+
+        stream_handler = logging.StreamHandler(sys.stderr)
+        stream_handler.setFormatter(formatter)
+        handlers.append(stream_handler)
+        handlers.append(_ConsoleSinkHandler())
+
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        _rate_filter = RateLimitFilter()
+        queue_handler.addFilter(_rate_filter)
+        root.addHandler(queue_handler)
+
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+    for entry in os.environ.get("PING_LOG_LEVELS", "").split(","):
+        if "=" in entry:
+            subsystem, level = entry.split("=", 1)
+            set_level(subsystem.strip(), level.strip())
+
+
+def shutdown_logging():
+    """Write out everything still queued and stop the listener (registered with atexit)."""
+    global _listener
+    with _lock:
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+def get_logger(subsystem: str) -> logging.Logger:
+    """
+    Get the logger for a subsystem (e.g. 'ai', 'render', 'sound').
+
+    Log with %-style arguments (logger.debug("x=%s", x)) in hot paths so disabled
+    messages are never formatted.
+    """
+    if not _configured:
+        configure_logging()
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{subsystem}")
+
+
+def set_level(subsystem: str, level) -> bool:
+    """
+    Set the level of one subsystem, or of every subsystem without its own level for 'all'.
+
+    Args:
+        subsystem (str): Subsystem name, or 'all'.
+        level (str or int): Level name ('DEBUG', 'info', ...) or number.
+
+    Returns:
+        bool: False if the level wasn't recognized.
+    """
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    if not isinstance(level, int):
+        return False
+    name = ROOT_LOGGER_NAME if subsystem == "all" else f"{ROOT_LOGGER_NAME}.{subsystem}"
+    logging.getLogger(name).setLevel(level)
+    return True
+
+
+def get_levels() -> Dict[str, str]:
+    """Effective level of every subsystem that has logged or been configured."""
+    prefix = ROOT_LOGGER_NAME + "."
+    levels = {"all": logging.getLevelName(logging.getLogger(ROOT_LOGGER_NAME).getEffectiveLevel())}
+    for name, logger in sorted(logging.Logger.manager.loggerDict.items()):
+        if name.startswith(prefix) and isinstance(logger, logging.Logger):
+            levels[name[len(prefix):]] = logging.getLevelName(logger.getEffectiveLevel())
+    return levels
+
+
+def set_console_sink(sink: Optional[Callable[[str], None]]):
+    """Route log output to a callable taking one line of text (the debug console), or None to stop."""
+    global _console_sink
+    _console_sink = sink
+
+
+def get_log_stats() -> Dict[str, int]:
+    """Returns how many records deduplication and rate limiting have held back."""
+    if _rate_filter is None:
+        return {'suppressed': 0, 'dropped': 0}
+    return {'suppressed': _rate_filter.suppressed, 'dropped': _rate_filter.dropped}
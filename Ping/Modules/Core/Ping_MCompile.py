@@ -6,6 +6,7 @@ import pygame
 import pygame.gfxdraw # For smooth lighting
 import random  # Import random for background generation
 import math  # Import math for river animation
+import copy
 import json # Import JSON for PMF parsing (assuming JSON format)
 import threading
 import time
@@ -15,7 +16,15 @@ from Ping.Modules.Objects.Ping_Obstacles import RouletteSpinner, PistonObstacle,
 from Ping.Modules.Graphics.UI.Ping_Scoreboard import Scoreboard
 # Import the generation function specifically
 from Ping.Modules.Graphics.ping_graphics import get_background_draw_function, generate_sludge_texture
+from Ping.Modules.Graphics.Ping_DirtyRects import DirtyRectTracker
+from Ping.Modules.Graphics.Ping_DynamicResolution import DynamicResolutionController
+from Ping.Modules.Graphics.Ping_SurfacePool import get_surface_pool
+from Ping.Modules.Graphics.Ping_RenderQueue import get_render_queue
+from Ping.Modules.Core.Ping_Logging import get_logger
+from Ping.Modules.Core.Ping_Profiler import get_profiler
+from Ping.Modules.Core.Ping_PMF import load_pmf_data, migrate_pmf, validate_pmf
 
+logger = get_logger("level")
 
 class LevelCompiler: # Renamed from Arena
     """Handles loading and compiling level data from .pmf files or level instances."""
@@ -24,7 +33,7 @@ class LevelCompiler: # Renamed from Arena
         Initialize the level compiler.
 
         Args:
-            level_source: Either a path to a .pmf file (str) or a level instance object.
+            level_source: A path to a .pmf file (str), loaded PMF data (dict) or a level instance object.
         """
         params = None
         self.level_instance = None # Keep track if we loaded from an instance
@@ -50,6 +59,16 @@ class LevelCompiler: # Renamed from Arena
                 # params = {} # Or None
                 pmf_data = None # Ensure pmf_data is None on fallback
                 self.level_source_path = None # No path on fallback
+        elif isinstance(level_source, dict):
+            # PMF data already in memory (e.g. the level being edited in Artemis)
+            pmf_data = copy.deepcopy(level_source) # Migration works in place
+            migrate_pmf(pmf_data)
+            errors, _ = validate_pmf(pmf_data)
+            if errors:
+                raise ValueError("Invalid level data:\n  " + "\n  ".join(errors))
+            params = self._parse_pmf_to_params(pmf_data)
+            self.level_instance = None
+            self.level_source_path = None # Not backed by a file
         elif hasattr(level_source, 'get_parameters'):
             # Load from level instance (existing behavior)
             self.level_instance = level_source
@@ -93,6 +112,7 @@ class LevelCompiler: # Renamed from Arena
         self._shader = None
         self._settings = None
         self._shader_instance = None
+        self.shader_override = None  # True/False forces the shader on/off instead of reading settings (benchmarks)
         try:
             from Ping.Modules.Graphics.Menus.Ping_Settings import SettingsScreen
             from Ping.Modules.Graphics.Effects.Ping_Shader import get_shader
@@ -105,6 +125,8 @@ class LevelCompiler: # Renamed from Arena
         except Exception as e: # Catch other potential errors during shader init
              self._log_warning(f"Error initializing shader system: {e}")
              self._shader_warning_shown = True
+        # The settings file is read once here; set_shader_enabled() updates it when the setting changes
+        self._shader_setting = bool(self._settings and self._settings.get_shader_enabled())
 
 
         # Get colors from level configuration
@@ -209,6 +231,33 @@ class LevelCompiler: # Renamed from Arena
             # obstacle_params is already set from params dict earlier in this case
             self._create_objects_from_params(params)
 
+        # --- Render Resolution ---
+        # 'native' draws straight to the window, 'fixed' draws into a framebuffer of the
+        # level's logical size and scales it to the window, 'integer' does the same with
+        # the largest whole-number scale that fits.
+        self.render_resolution_mode = self._settings.get_render_resolution_mode() if self._settings else 'native'
+        self._framebuffer = None
+        self.window_width = self.width
+        self.window_height = self.height + self.scoreboard_height
+        self.present_rect = pygame.Rect(0, 0, self.window_width, self.window_height) # Where the framebuffer lands on screen
+        self.framebuffer_size = (self.window_width, self.window_height)
+
+        # --- Dynamic Resolution ---
+        # Lowers the render scale and shader detail when drawing runs over budget
+        self.dynamic_resolution = None
+        if self._settings and self._settings.get_dynamic_resolution_enabled():
+            base_pixel_size = self._shader_instance.pixel_size if self._shader_instance else 3
+            self.dynamic_resolution = DynamicResolutionController(
+                min_scale=self._settings.get_dynamic_resolution_min_scale(),
+                base_pixel_size=base_pixel_size,
+                max_pixel_size=base_pixel_size * 3)
+
+        # --- Dirty Rect Rendering ---
+        self.dirty_rects_enabled = self._settings.get_dirty_rects_enabled() if self._settings else False
+        self._dirty_tracker = DirtyRectTracker()
+        self._static_layer = None # Background and sprites, reused between dirty rect frames
+        self._static_layer_key = None
+
         # --- Generate Static Background Features (like cracks) ---
         self._generate_background_features()
 
@@ -223,7 +272,7 @@ class LevelCompiler: # Renamed from Arena
         # Sprite objects are now created in _create_objects_from_pmf
 
         if self.level_background == 'sewer':
-            self._log_warning("Sewer background detected, starting texture generation thread.")
+            logger.info("Sewer background detected, starting texture generation thread.")
             self.needs_sludge_texture_update = True # Initial generation needed
             self.sludge_thread = threading.Thread(target=self._sludge_texture_worker, daemon=True)
             self.sludge_thread.start()
@@ -231,18 +280,18 @@ class LevelCompiler: # Renamed from Arena
     def stop_background_threads(self):
         """Signals any running background threads to stop and waits for them."""
         if self.sludge_thread and self.sludge_thread.is_alive():
-            self._log_warning("Stopping sludge texture thread...")
+            logger.info("Stopping sludge texture thread...")
             self.stop_sludge_thread.set()
             self.sludge_thread.join(timeout=2) # Wait max 2 seconds
             if self.sludge_thread.is_alive():
                 self._log_warning("Sludge texture thread did not stop gracefully.")
             else:
-                self._log_warning("Sludge texture thread stopped.")
+                logger.info("Sludge texture thread stopped.")
 
 
     def _sludge_texture_worker(self):
         """Worker function for the background thread generating sludge texture."""
-        self._log_warning("Sludge texture worker thread started.")
+        logger.info("Sludge texture worker thread started.")
         while not self.stop_sludge_thread.is_set():
             update_needed = False
             with self.sludge_texture_lock: # Check flag under lock
@@ -251,7 +300,7 @@ class LevelCompiler: # Renamed from Arena
                     self.needs_sludge_texture_update = False # Reset flag
 
             if update_needed:
-                self._log_warning("Generating new sludge texture...")
+                logger.debug("Generating new sludge texture...")
                 # Generate texture using current state (ensure these are thread-safe reads if they change)
                 # It's generally safer to pass necessary values if they might change,
                 # but for scale/dimensions updated in main thread via update_scaling,
@@ -268,7 +317,7 @@ class LevelCompiler: # Renamed from Arena
                 if new_texture:
                     with self.sludge_texture_lock:
                         self.sludge_texture = new_texture
-                        self._log_warning(f"Sludge texture updated (Size: {new_texture.get_size()}).")
+                        logger.debug(f"Sludge texture updated (Size: {new_texture.get_size()}).")
                 else:
                      self._log_warning("Failed to generate sludge texture (invalid dimensions?).")
 
@@ -277,7 +326,7 @@ class LevelCompiler: # Renamed from Arena
             # This doesn't directly control animation FPS, just how often it checks the flag.
             time.sleep(0.1) # Check for updates 10 times per second
 
-        self._log_warning("Sludge texture worker thread finished.")
+        logger.info("Sludge texture worker thread finished.")
 
 
     def _generate_background_features(self):
@@ -292,7 +341,7 @@ class LevelCompiler: # Renamed from Arena
                      'manhole_brick_padding': 5, 'crack_frequency': 0.03, # Use updated freq
                      'vegetation_frequency': 0.02
                 }
-                self._log_warning("Using default sewer background details for crack generation.")
+                logger.info("Using default sewer background details for crack generation.")
 
             # Ensure background_details is a dictionary before proceeding
             if not isinstance(self.background_details, dict):
@@ -367,7 +416,7 @@ class LevelCompiler: # Renamed from Arena
 
             # Store the generated cracks (list of lists of points) in background_details
             self.background_details['cracks'] = cracks_data
-            self._log_warning(f"Generated {len(cracks_data)} cracks for sewer background.")
+            logger.debug(f"Generated {len(cracks_data)} cracks for sewer background.")
 
 
     def _generate_zigzag_points(self, start_pos, end_pos, segments=5, magnitude=3):
@@ -479,10 +528,8 @@ class LevelCompiler: # Renamed from Arena
                 rel_y = (obj_y + obj_h / 2) / playable_height
                 # Clamp rel_y between 0 and 1? Or let it be outside? For now, let it be.
 
-                # Get properties dict for this object
-                properties = obj.get('properties', {})
-                # Get 'is_left' from the properties dict (Standardized PMF)
-                is_left = properties.get('is_left', False) # Default to False if missing
+                # 'is_left' is a top-level field (older layouts are moved there by migrate_pmf)
+                is_left = obj.get('is_left', False) # Default to False if missing
 
                 if is_left:
                     params['paddle_positions']['left'] = {'x': rel_x, 'y': rel_y}
@@ -536,7 +583,7 @@ class LevelCompiler: # Renamed from Arena
             self.goals.append(GoalObject(self.width, self.height, self.scoreboard_height, self.scale_rect, is_left_goal=False))
 
         # --- Create Objects from COMBINED PMF List ---
-        self._log_warning(f"DEBUG: Processing combined list of {len(combined_list)} objects/sprites from PMF.") # ++Log++
+        logger.debug(f"Processing combined list of {len(combined_list)} objects/sprites from PMF.")
         for obj_index, obj in enumerate(combined_list): # Iterate the combined list
             obj_type = obj.get('type')
             # Get common geometry and properties (default to empty dict)
@@ -575,7 +622,7 @@ class LevelCompiler: # Renamed from Arena
                 manhole = ManHoleObject(self.width, self.height, self.scoreboard_height, self.scale_rect,
                                         obj_x, obj_y, obj_width, obj_height, is_bottom, properties) # Pass properties
                 self.manholes.append(manhole)
-                self._log_warning(f"Created ManHoleObject at logical ({obj_x},{obj_y}) with properties: {properties}")
+                logger.debug(f"Created ManHoleObject at logical ({obj_x},{obj_y}) with properties: {properties}")
 
             elif obj_type == 'bumper':
                 bumper = BumperObject(
@@ -588,7 +635,7 @@ class LevelCompiler: # Renamed from Arena
                     radius=properties.get('radius', 30)
                 )
                 self.bumpers.append(bumper)
-                self._log_warning(f"Created BumperObject at logical ({obj_x},{obj_y}) with properties: {properties}")
+                logger.debug(f"Created BumperObject at logical ({obj_x},{obj_y}) with properties: {properties}")
 
             elif obj_type == 'obstacle':
                 # Create and append ObstacleObject
@@ -605,7 +652,7 @@ class LevelCompiler: # Renamed from Arena
                     properties=properties # Pass the properties dict
                 )
                 self.obstacles.append(new_obstacle) # Append to list
-                self._log_warning(f"Created and appended ObstacleObject at logical ({obj_x},{obj_y}) with properties: {properties}")
+                logger.debug(f"Created and appended ObstacleObject at logical ({obj_x},{obj_y}) with properties: {properties}")
 
             elif obj_type == 'roulette_spinner': # Match lowercase type from PMF
                 # Handle the new RouletteSpinner obstacle type
@@ -627,7 +674,7 @@ class LevelCompiler: # Renamed from Arena
                     spin_speed_deg_s=spin_speed
                 )
                 self.obstacles.append(new_spinner) # Append to list
-                self._log_warning(f"Created and appended RouletteSpinner at logical ({obj_x},{obj_y}) with radius={radius}, segments={num_segments}, speed={spin_speed}")
+                logger.debug(f"Created and appended RouletteSpinner at logical ({obj_x},{obj_y}) with radius={radius}, segments={num_segments}, speed={spin_speed}")
 
             elif obj_type == 'powerup_ball_duplicator': # Specific type
                 # Only create one powerup for now
@@ -647,7 +694,7 @@ class LevelCompiler: # Renamed from Arena
                         properties=properties # Pass the properties dict
                     )
                     powerup_created_from_list = True
-                    self._log_warning(f"Created PowerUpBallObject at logical ({obj_x},{obj_y}) with size {powerup_size} and properties: {properties}")
+                    logger.debug(f"Created PowerUpBallObject at logical ({obj_x},{obj_y}) with size {powerup_size} and properties: {properties}")
                 else:
                      self._log_warning(f"Ignoring additional PMF powerup object #{obj_index} (only one supported currently): {obj}")
 
@@ -668,7 +715,7 @@ class LevelCompiler: # Renamed from Arena
                      # Properties are not currently used by PortalObject/Portal, but could be passed: properties=properties
                  )
                  self.portals.append(portal)
-                 self._log_warning(f"Created PortalObject (id={portal_id}, target={target_id}) at logical ({obj_x},{obj_y}).")
+                 logger.debug(f"Created PortalObject (id={portal_id}, target={target_id}) at logical ({obj_x},{obj_y}).")
 
                  # Store data needed for linking later
                  if not hasattr(self, '_portal_link_data'):
@@ -687,7 +734,7 @@ class LevelCompiler: # Renamed from Arena
                      properties=properties # Pass properties dict
                  )
                  self.obstacles.append(piston)
-                 self._log_warning(f"Created PistonObstacle at logical ({obj_x},{obj_y}) with properties: {properties}")
+                 logger.debug(f"Created PistonObstacle at logical ({obj_x},{obj_y}) with properties: {properties}")
 
             elif obj_type == 'tesla_coil':
                  # Use Y coordinate directly
@@ -706,11 +753,11 @@ class LevelCompiler: # Renamed from Arena
                      properties=tesla_props # Pass properties dict
                  )
                  self.obstacles.append(tesla)
-                 self._log_warning(f"Created TeslaCoilObstacle at logical ({obj_x},{obj_y}) with properties: {tesla_props}")
+                 logger.debug(f"Created TeslaCoilObstacle at logical ({obj_x},{obj_y}) with properties: {tesla_props}")
 
 
             elif obj_type == 'sprite': # Now correctly indented
-                 self._log_warning(f"DEBUG: Found PMF object of type 'sprite': {obj}") # ++ ADDED LOG ++
+                 logger.debug(f"Found PMF object of type 'sprite': {obj}")
                  image_path = obj.get('image_path') # Standardized key from Artemis
                  if not image_path: # Skip if path is missing or empty
                       self._log_warning(f"Skipping PMF sprite object #{obj_index} due to missing 'image_path': {obj}")
@@ -735,9 +782,9 @@ class LevelCompiler: # Renamed from Arena
                      image_path=image_path,
                      properties=properties # Pass properties dict as well
                  )
-                 self._log_warning(f"DEBUG: Attempting to append SpriteObject: {sprite}") # ++ ADDED LOG ++
+                 logger.debug(f"Attempting to append SpriteObject: {sprite}")
                  self.sprites.append(sprite)
-                 self._log_warning(f"Successfully created and appended SpriteObject with path '{image_path}' at logical ({obj_x},{obj_y})") # Modified log
+                 logger.debug(f"Successfully created and appended SpriteObject with path '{image_path}' at logical ({obj_x},{obj_y})") # Modified log
 
             elif obj_type == 'candle':
                 # Use Y coordinate directly
@@ -752,7 +799,7 @@ class LevelCompiler: # Renamed from Arena
                     properties=properties
                 )
                 self.candles.append(candle)
-                self._log_warning(f"Created CandleObject at logical ({obj_x},{obj_y}) with properties: {properties}")
+                logger.debug(f"Created CandleObject at logical ({obj_x},{obj_y}) with properties: {properties}")
 
             elif obj_type == 'ghost':
                 obj_y_relative_to_playable = obj_y
@@ -773,9 +820,9 @@ class LevelCompiler: # Renamed from Arena
                 # We only add it to the list if it's an active instance.
                 if ghost.is_active_instance:
                     self.ghost_obstacles.append(ghost)
-                    self._log_warning(f"Created GhostObstacleObject at logical ({obj_x},{obj_y}) with properties: {properties}")
+                    logger.debug(f"Created GhostObstacleObject at logical ({obj_x},{obj_y}) with properties: {properties}")
                 else:
-                    self._log_warning(f"GhostObstacleObject at logical ({obj_x},{obj_y}) not added, MAX_GHOSTS_ON_SCREEN likely reached during init or instance marked inactive.")
+                    logger.debug(f"GhostObstacleObject at logical ({obj_x},{obj_y}) not added, MAX_GHOSTS_ON_SCREEN likely reached during init or instance marked inactive.")
 
             elif obj_type == 'pickles':
                 obj_y_relative_to_playable = obj_y
@@ -788,7 +835,7 @@ class LevelCompiler: # Renamed from Arena
                 if original_pmf_width != 60 or original_pmf_height != 40:
                     self._log_warning(f"Pickles object at ({obj_x},{obj_y}): Forcing width=60, height=40. Original PMF values were width={original_pmf_width}, height={original_pmf_height}.")
                 else:
-                    self._log_warning(f"Pickles object at ({obj_x},{obj_y}): PMF values matched desired 60x40 or were absent, ensuring 60x40.")
+                    logger.debug(f"Pickles object at ({obj_x},{obj_y}): PMF values matched desired 60x40 or were absent, ensuring 60x40.")
 
 
                 pickles_instance = Pickles(
@@ -801,7 +848,7 @@ class LevelCompiler: # Renamed from Arena
                     properties=properties # Pass the (potentially modified) properties
                 )
                 self.pickles_objects.append(pickles_instance)
-                self._log_warning(f"Created Pickles object at logical ({obj_x},{obj_y}) with properties: {properties}")
+                logger.debug(f"Created Pickles object at logical ({obj_x},{obj_y}) with properties: {properties}")
 
 
             else: # Now correctly indented
@@ -825,7 +872,7 @@ class LevelCompiler: # Renamed from Arena
                  target_portal_instance = portal_id_map.get(target_id)
                  if target_portal_instance:
                      portal_instance.set_target(target_portal_instance)
-                     self._log_warning(f"Linked portal (id={portal_id}) to target portal (id={target_id}).")
+                     logger.debug(f"Linked portal (id={portal_id}) to target portal (id={target_id}).")
                  else:
                      self._log_warning(f"Could not link portal (id={portal_id}): Target portal with id={target_id} not found in PMF objects.")
 
@@ -834,7 +881,7 @@ class LevelCompiler: # Renamed from Arena
 
         # Create default obstacle if flag is set AND the obstacles list is empty
         if not self.obstacles and self.can_spawn_obstacles: # Check if list is empty
-             self._log_warning("No obstacles defined in PMF 'objects', creating default obstacle because 'can_spawn_obstacles' is true.")
+             logger.info("No obstacles defined in PMF 'objects', creating default obstacle because 'can_spawn_obstacles' is true.")
              # Create default obstacle (ObstacleObject handles random positioning)
              # Pass empty properties dict for default obstacle
              default_obstacle = ObstacleObject(
@@ -851,13 +898,13 @@ class LevelCompiler: # Renamed from Arena
         # The GhostObstacle class itself manages the maximum number on screen.
         # GhostObstacle.reset_class_vars() was already called at the start of _create_objects_from_pmf
         if self.can_spawn_ghosts: # Use the new specific flag
-            self._log_warning("Runtime Spawning: Checking for GhostObstacle creation as 'can_spawn_ghosts' is true.")
+            logger.info("Runtime Spawning: Checking for GhostObstacle creation as 'can_spawn_ghosts' is true.")
             
             # Try to spawn ghosts up to the MAX_GHOSTS_ON_SCREEN limit.
             # PMF-defined ghosts would have already incremented active_ghost_count.
             for _ in range(GhostObstacle.MAX_GHOSTS_ON_SCREEN):
                 if GhostObstacle.active_ghost_count >= GhostObstacle.MAX_GHOSTS_ON_SCREEN:
-                    self._log_warning(f"Runtime Spawning: Ghost limit ({GhostObstacle.MAX_GHOSTS_ON_SCREEN}) reached. No more runtime ghosts will be spawned. Current active: {GhostObstacle.active_ghost_count}")
+                    logger.debug(f"Runtime Spawning: Ghost limit ({GhostObstacle.MAX_GHOSTS_ON_SCREEN}) reached. No more runtime ghosts will be spawned. Current active: {GhostObstacle.active_ghost_count}")
                     break # Stop trying if max is already met or exceeded
 
                 ghost_width = 30  # Default width for runtime spawned ghosts
@@ -884,21 +931,22 @@ class LevelCompiler: # Renamed from Arena
                 # which increments active_ghost_count and sets ghost.is_active_instance.
                 if ghost.is_active_instance:
                     self.ghost_obstacles.append(ghost)
-                    self._log_warning(f"Runtime Spawning: Successfully spawned and added GhostObstacleObject at logical ({rand_x},{rand_y}). Active count now: {GhostObstacle.active_ghost_count}")
+                    logger.debug(f"Runtime Spawning: Successfully spawned and added GhostObstacleObject at logical ({rand_x},{rand_y}). Active count now: {GhostObstacle.active_ghost_count}")
                 else:
                     # This implies GhostObstacle.__init__ decided not to activate this instance (MAX reached).
-                    self._log_warning(f"Runtime Spawning: GhostObstacleObject at logical ({rand_x},{rand_y}) created but not activated (MAX likely reached during its init). Active count: {GhostObstacle.active_ghost_count}")
+                    logger.debug(f"Runtime Spawning: GhostObstacleObject at logical ({rand_x},{rand_y}) created but not activated (MAX likely reached during its init). Active count: {GhostObstacle.active_ghost_count}")
                     break # If an instance wasn't activated, the limit is hit.
         
          # Create default powerup if flag is set AND none were created from list
         if not powerup_created_from_list and self.can_spawn_powerups:
-             print(f"Creating default powerup! can_spawn_powerups: {self.can_spawn_powerups}, powerup_created_from_list: {powerup_created_from_list}")
-             self._log_warning("No powerup defined in PMF 'objects', creating default powerup because 'can_spawn_powerups' is true.")
+             logger.debug("Creating default powerup! can_spawn_powerups: %s, powerup_created_from_list: %s",
+                          self.can_spawn_powerups, powerup_created_from_list)
+             logger.info("No powerup defined in PMF 'objects', creating default powerup because 'can_spawn_powerups' is true.")
              # Create default powerup (PowerUpBallObject handles positioning)
              # Pass empty properties dict for default powerup
              default_x = self.width / 2
              default_y = self.height / 2
-             print(f"Creating powerup at position ({default_x}, {default_y})")
+             logger.debug("Creating powerup at position (%s, %s)", default_x, default_y)
              self.power_up = PowerUpBallObject(
                  arena_width=self.width,
                  arena_height=self.height,
@@ -909,7 +957,7 @@ class LevelCompiler: # Renamed from Arena
                  # Use default size from constructor
                  properties={}
              )
-             print(f"Powerup created successfully. Active: {self.power_up.power_up.active}")
+             logger.debug("Powerup created successfully. Active: %s", self.power_up.power_up.active)
 
 
     def _create_objects_from_params(self, params):
@@ -992,13 +1040,12 @@ class LevelCompiler: # Renamed from Arena
 
 
     def _log_warning(self, message):
-        """Logs a warning message, trying the debug console first."""
-        try:
-            from Ping.Modules.Graphics.UI.Ping_DBConsole import get_console
-            debug_console = get_console()
-            debug_console.log(f"Warning: {message}")
-        except ImportError:
-            print(f"Warning: {message}") # Fallback to print if console not available
+        """
+        Logs a warning about a real problem with the level or renderer (shown in the
+        debug console, repeats are rate limited). Progress and per-object details
+        go to logger.info / logger.debug instead.
+        """
+        logger.warning(message)
 
     def _load_pmf(self, file_path):
         """Loads and parses a .pmf file (assuming JSON format)."""
@@ -1012,12 +1059,15 @@ class LevelCompiler: # Renamed from Arena
             if os.path.exists(full_path):
                 file_path = full_path
         
-        print(f"Attempting to load PMF: {file_path}") # Debug print
+        logger.debug("Attempting to load PMF: %s", file_path)
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            # TODO: Add schema validation for PMF data structure here
-            print(f"Successfully loaded PMF data.") # Debug print
+            # Migrated to the current schema and validated (see Ping_PMF)
+            data, changes, warnings = load_pmf_data(file_path)
+            for message in changes:
+                logger.debug("PMF migration: %s", message)
+            for message in warnings:
+                self._log_warning(f"PMF {os.path.basename(file_path)}: {message}")
+            logger.debug("Successfully loaded PMF data.")
             return data # Assuming the JSON root is the 'params' dictionary
         except FileNotFoundError:
              print(f"Error: PMF file not found at {file_path}")
@@ -1025,6 +1075,9 @@ class LevelCompiler: # Renamed from Arena
         except json.JSONDecodeError as e:
              print(f"Error: Invalid JSON in PMF file {file_path}: {e}")
              raise # Re-raise the exception
+        except ValueError as e:
+             print(f"Error: {e}")
+             raise # Re-raise the exception
         except Exception as e:
              print(f"Error: An unexpected error occurred loading PMF {file_path}: {e}")
              raise # Re-raise the exception
@@ -1125,12 +1178,12 @@ class LevelCompiler: # Renamed from Arena
             ghost_obj.update(delta_time, game_ball_instance, self.candles, self.pickles_objects, self.scale, self.scale_rect)
             if ghost_obj.is_done():
                 self.ghost_obstacles.remove(ghost_obj)
-                self._log_warning(f"Removed an inactive ghost. Active count: {GhostObstacle.active_ghost_count}")
+                logger.debug(f"Removed an inactive ghost. Active count: {GhostObstacle.active_ghost_count}")
 
         # Attempt to spawn new ghosts if below max and level allows
         if self.can_spawn_ghosts:
             while GhostObstacle.active_ghost_count < GhostObstacle.MAX_GHOSTS_ON_SCREEN:
-                self._log_warning(f"Attempting to spawn new ghost. Current active: {GhostObstacle.active_ghost_count}, Max: {GhostObstacle.MAX_GHOSTS_ON_SCREEN}")
+                logger.debug(f"Attempting to spawn new ghost. Current active: {GhostObstacle.active_ghost_count}, Max: {GhostObstacle.MAX_GHOSTS_ON_SCREEN}")
                 ghost_width = 30
                 ghost_height = 40
                 # Ensure spawn position is within playable area (self.height is playable height)
@@ -1151,12 +1204,12 @@ class LevelCompiler: # Renamed from Arena
                 )
                 if new_ghost.is_active_instance:
                     self.ghost_obstacles.append(new_ghost)
-                    self._log_warning(f"Successfully spawned GhostObstacleObject at logical ({rand_x},{rand_y}). Active count now: {GhostObstacle.active_ghost_count}")
+                    logger.debug(f"Successfully spawned GhostObstacleObject at logical ({rand_x},{rand_y}). Active count now: {GhostObstacle.active_ghost_count}")
                 else:
                     # This means GhostObstacle.__init__ decided not to activate, likely because MAX_GHOSTS_ON_SCREEN was (momentarily) hit
                     # by another concurrent spawn attempt if this were threaded, or if MAX_GHOSTS_ON_SCREEN is 0.
                     # Or, if the GhostObstacleObject itself decided not to be active for other reasons.
-                    self._log_warning(f"Failed to spawn new ghost (MAX likely reached or instance not activated during its init). Active count: {GhostObstacle.active_ghost_count}")
+                    logger.debug(f"Failed to spawn new ghost (MAX likely reached or instance not activated during its init). Active count: {GhostObstacle.active_ghost_count}")
                     break # Stop trying to spawn if one attempt fails to activate
 
     def update_pickles(self, delta_time, all_game_entities, scale_factor):
@@ -1193,7 +1246,7 @@ class LevelCompiler: # Renamed from Arena
 
         # Re-add a default obstacle if the flag is set (mirroring PMF loading logic)
         if self.can_spawn_obstacles: # This remains for general obstacles
-             self._log_warning("Resetting obstacles: Adding default obstacle because 'can_spawn_obstacles' is true.")
+             logger.info("Resetting obstacles: Adding default obstacle because 'can_spawn_obstacles' is true.")
              default_obstacle = ObstacleObject(
                  arena_width=self.width,
                  arena_height=self.height,
@@ -1222,8 +1275,41 @@ class LevelCompiler: # Renamed from Arena
             }
         )
 
+    def uses_fixed_resolution(self):
+        """Returns True if the level is drawn into a logical-size framebuffer and scaled to the window."""
+        return self.render_resolution_mode in ('fixed', 'integer')
+
+    def _uses_framebuffer(self):
+        """Returns True if frames are drawn off-screen and scaled to the window (fixed mode or reduced dynamic scale)."""
+        return self.uses_fixed_resolution() or (self.dynamic_resolution is not None and self.dynamic_resolution.render_scale < 1.0)
+
+    def set_dynamic_resolution_enabled(self, enabled):
+        """Turn dynamic resolution scaling on or off, returning to full quality either way."""
+        if enabled and self.dynamic_resolution is None:
+            base_pixel_size = self._shader_instance.pixel_size if self._shader_instance else 3
+            min_scale = self._settings.get_dynamic_resolution_min_scale() if self._settings else 0.5
+            self.dynamic_resolution = DynamicResolutionController(
+                min_scale=min_scale, base_pixel_size=base_pixel_size, max_pixel_size=base_pixel_size * 3)
+        elif not enabled:
+            self.dynamic_resolution = None
+        self._framebuffer = None
+        self.update_scaling(self.window_width, self.window_height)
+        self.request_full_redraw()
+
+    def set_render_resolution_mode(self, mode):
+        """Switch between 'native', 'fixed' and 'integer' rendering and recompute scaling."""
+        if mode not in ('native', 'fixed', 'integer'):
+            self._log_warning(f"Unknown render resolution mode '{mode}', using 'native'.")
+            mode = 'native'
+        self.render_resolution_mode = mode
+        self._framebuffer = None
+        self.update_scaling(self.window_width, self.window_height)
+        self.request_full_redraw()
+
     def update_scaling(self, window_width, window_height):
         """Update scaling factors based on window dimensions."""
+        self.window_width = window_width
+        self.window_height = window_height
         # Use total logical height for scaling calculations
         total_logical_height = self.height + self.scoreboard_height
         if self.width <= 0 or total_logical_height <= 0: # Prevent division by zero
@@ -1245,6 +1331,29 @@ class LevelCompiler: # Renamed from Arena
         self.offset_x = (window_width - scaled_total_width) / 2
         self.offset_y = (window_height - scaled_total_height) / 2
 
+        render_scale = self.dynamic_resolution.render_scale if self.dynamic_resolution else 1.0
+        if self.uses_fixed_resolution():
+            # Work out where the framebuffer is presented, then draw the world at 1:1 into it
+            present_scale = self.scale
+            if self.render_resolution_mode == 'integer' and present_scale >= 1:
+                present_scale = int(present_scale)
+            present_width = int(self.width * present_scale)
+            present_height = int(total_logical_height * present_scale)
+            self.present_rect = pygame.Rect((window_width - present_width) // 2, (window_height - present_height) // 2,
+                                            present_width, present_height)
+            self.scale_x = self.scale_y = self.scale = render_scale
+            self.offset_x = self.offset_y = 0
+            self.framebuffer_size = (max(1, int(self.width * render_scale)), max(1, int(total_logical_height * render_scale)))
+        else:
+            # Native mode; a reduced dynamic render scale shrinks the whole window-sized frame
+            self.present_rect = pygame.Rect(0, 0, window_width, window_height)
+            self.scale_x *= render_scale
+            self.scale_y *= render_scale
+            self.scale *= render_scale
+            self.offset_x *= render_scale
+            self.offset_y *= render_scale
+            self.framebuffer_size = (max(1, int(window_width * render_scale)), max(1, int(window_height * render_scale)))
+
         # Update scoreboard scaling if initialized
         if self.scoreboard:
             # Scoreboard should probably scale uniformly with the rest of the game
@@ -1254,7 +1363,7 @@ class LevelCompiler: # Renamed from Arena
         if self.level_background == 'sewer':
              with self.sludge_texture_lock:
                  self.needs_sludge_texture_update = True
-             self._log_warning("Scaling updated, flagged sludge texture for regeneration.")
+             logger.debug("Scaling updated, flagged sludge texture for regeneration.")
 
 
     def scale_rect(self, rect):
@@ -1368,9 +1477,10 @@ class LevelCompiler: # Renamed from Arena
 
     def draw_pause_overlay(self, screen, font):
         """Draw pause overlay and text."""
-        overlay = pygame.Surface((screen.get_width(), screen.get_height()), pygame.SRCALPHA) # Use SRCALPHA for transparency
+        overlay = get_surface_pool().acquire(screen.get_size(), pygame.SRCALPHA, clear=False) # Use SRCALPHA for transparency
         overlay.fill((*self.colors.get('BLACK', (0,0,0)), 128)) # Fill with semi-transparent black
         screen.blit(overlay, (0, 0))
+        get_surface_pool().release(overlay)
 
         if font:
             try:
@@ -1421,12 +1531,12 @@ class LevelCompiler: # Renamed from Arena
 
     # Removed redundant _draw_sewer_background method.
     # The drawing is now handled by the imported function from ping_graphics.py
-    def draw(self, screen, game_objects, font, player_name, score_a, opponent_name, score_b, respawn_timer=None, paused=False):
-        """Draw the complete game state."""
-        # Create intermediate surface for shader processing if shaders might be used
-        use_intermediate = self._settings and self._shader_instance and self._settings.get_shader_enabled()
-        target_surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA) if use_intermediate else screen
+    def request_full_redraw(self):
+        """Forces the next dirty rect frame to repaint and present the whole screen."""
+        self._dirty_tracker.request_full_redraw()
 
+    def _draw_background(self, target_surface):
+        """Clear the target and draw the level background (and center line fallback)."""
         # --- Fill background first to prevent artifacts ---
         target_surface.fill(self.colors.get('BLACK', (0, 0, 0))) # Clear with black
 
@@ -1457,7 +1567,7 @@ class LevelCompiler: # Renamed from Arena
 
             else:
                 # Fallback if no specific function found (should ideally not happen if 'default' exists)
-                self._log_warning(f"No background draw function found for identifier: '{bg_identifier}'. Drawing solid color.")
+                logger.debug("No background draw function found for identifier: '%s'. Drawing solid color.", bg_identifier)
                 # Don't fill again here, just draw center line if needed
                 self.draw_center_line(target_surface) # Draw center line on top
         except Exception as e:
@@ -1465,171 +1575,353 @@ class LevelCompiler: # Renamed from Arena
             # Don't fill again here, just draw center line if needed
             self.draw_center_line(target_surface) # Draw center line on top
 
-        # --- Draw Game Elements ---
-        # No clipping needed now, scale_rect handles coordinate mapping.
-
-        # Draw Sprites
-        if self.sprites:
-             for sprite in self.sprites:
-                 sprite.draw(target_surface) # SpriteObject uses scale_rect internally
+    def _update_draw_animations(self, game_objects):
+        """Advance the purely visual animations that are stepped once per drawn frame."""
+        for candle in self.candles:
+            candle.update(1/60.0, self.scale) # Update animation with fixed dt and current scale
 
-        # Draw Candles
-        if self.candles:
-            for candle in self.candles:
-                candle.update(1/60.0, self.scale) # Update animation with fixed dt and current scale
-                candle.draw(target_surface, self.scale) # Draw candle
-
-        # Draw portals
-        for portal in self.portals:
-             portal.draw(target_surface, self.colors, self.scale_rect) # PortalObject uses scale_rect
-
-        # Draw manholes and bumpers
-        for manhole in self.manholes:
-            manhole.draw(target_surface, self.colors) # ManholeObject uses scale_rect
-        
-        # Update and Draw Pickles
+        # Update Pickles
         # Assuming a fixed delta_time for now, similar to bumpers.
         # game_objects is passed to LevelCompiler.draw from ping_base.py
         self.update_pickles(self.dt, game_objects, self.scale)
 
         for bumper in self.bumpers:
             bumper.update(1/60)
-            bumper.draw(target_surface, self.colors.get('WHITE', (255, 255, 255))) # BumperObject uses scale_rect
 
-        # Draw goals
+    def _collect_drawables(self, game_objects):
+        """
+        Build the back-to-front list of dynamic objects for this frame.
+        Sprites are not included since they belong to the static layer.
+
+        Returns:
+            list: (object, draw function taking the target surface) tuples.
+        """
+        white = self.colors.get('WHITE', (255, 255, 255))
+        drawables = []
+
+        # Candles
+        for candle in self.candles:
+            drawables.append((candle, lambda target, c=candle: c.draw(target, self.scale)))
+
+        # Portals
+        for portal in self.portals:
+            drawables.append((portal, lambda target, p=portal: p.draw(target, self.colors, self.scale_rect)))
+
+        # Manholes and bumpers
+        for manhole in self.manholes:
+            drawables.append((manhole, lambda target, m=manhole: m.draw(target, self.colors)))
+        for bumper in self.bumpers:
+            drawables.append((bumper, lambda target, b=bumper: b.draw(target, white)))
+
+        # Goals
         for goal in self.goals:
-            goal.draw(target_surface, self.colors.get('WHITE', (255, 255, 255))) # GoalObject uses scale_rect
+            drawables.append((goal, lambda target, g=goal: g.draw(target, white)))
 
-        # Draw obstacles
+        # Obstacles
         for obstacle in self.obstacles: # Iterate through the list
-             if obstacle and hasattr(obstacle, 'draw') and callable(obstacle.draw):
-                 # ObstacleObject and RouletteSpinner use scale_rect or handle scaling internally
-                 obstacle.draw(target_surface, self.colors, self.scale_rect)
-        
-        # Draw Ghost Obstacles
+            if obstacle and hasattr(obstacle, 'draw') and callable(obstacle.draw):
+                # ObstacleObject and RouletteSpinner use scale_rect or handle scaling internally
+                drawables.append((obstacle, lambda target, o=obstacle: o.draw(target, self.colors, self.scale_rect)))
+
+        # Ghost Obstacles
         for ghost_obj in self.ghost_obstacles:
-            ghost_obj.draw(target_surface, self.colors)
+            drawables.append((ghost_obj, lambda target, g=ghost_obj: g.draw(target, self.colors)))
 
-        # Draw Pickles Objects
+        # Pickles Objects
         for pickles_obj in self.pickles_objects:
-            pickles_obj.draw(target_surface, self.colors) # Pickles.draw uses scale_rect internally via self.scale_rect
-
+            drawables.append((pickles_obj, lambda target, p=pickles_obj: p.draw(target, self.colors)))
 
-        # Draw game objects (Paddles, Ball)
+        # Game objects (Paddles, then power-up if active, then balls last)
         paddles = [obj for obj in game_objects if not isinstance(obj, BallObject)]
         balls = [obj for obj in game_objects if isinstance(obj, BallObject)]
         for obj in paddles:
-             if hasattr(obj, 'draw') and callable(obj.draw):
-                 # Assumes PaddleObject.draw uses scale_rect or handles scaling
-                 obj.draw(target_surface, self.colors.get('WHITE', (255, 255, 255)))
-        # Draw power-up if active
+            if hasattr(obj, 'draw') and callable(obj.draw):
+                drawables.append((obj, lambda target, o=obj: o.draw(target, white)))
         if self.power_up and self.power_up.power_up.active:
-            # PowerUpBallObject uses scale_rect
-            self.power_up.draw(target_surface, self.colors.get('WHITE', (255, 255, 255)))
-        # Draw balls last
+            drawables.append((self.power_up, lambda target: self.power_up.draw(target, white)))
         for obj in balls:
-             if hasattr(obj, 'draw') and callable(obj.draw):
-                 # Assumes BallObject.draw uses scale_rect or handles scaling
-                 obj.draw(target_surface, self.colors.get('WHITE', (255, 255, 255)))
+            if hasattr(obj, 'draw') and callable(obj.draw):
+                drawables.append((obj, lambda target, o=obj: o.draw(target, white)))
+
+        return drawables
+
+    def _draw_lighting(self, target_surface):
+        """Darken the playable area and punch out light around each candle."""
+        # Create a surface for the dimming overlay
+        # Playable area dimensions scaled
+        overlay_width = int(self.width * self.scale)
+        overlay_height = int(self.height * self.scale)
+
+        if overlay_width > 0 and overlay_height > 0:
+            lighting_overlay_surface = get_surface_pool().acquire((overlay_width, overlay_height), pygame.SRCALPHA, clear=False)
+            lighting_overlay_surface.fill((0, 0, 0, 192))  # Black with ~75% opacity (192/255)
+
+            # Calculate position for the overlay (top-left of the scaled playable area)
+            overlay_x = self.offset_x
+            overlay_y = self.offset_y + (self.scoreboard_height * self.scale)
+
+            # Apply light sources (e.g., from candles)
+            for candle in self.candles:
+                if hasattr(candle, 'get_light_properties'):
+                    light_props = candle.get_light_properties(self.scale)
+                    if light_props:
+                        # light_props contains scaled x, y, radius, intensity
+                        # x, y are absolute screen coordinates
+                        # We need to draw on lighting_overlay_surface, so adjust coordinates
+                        light_center_x_on_overlay = light_props['x'] - overlay_x
+                        light_center_y_on_overlay = light_props['y'] - overlay_y
+                        radius = light_props['radius']
+                        intensity = light_props['intensity'] # 0 to 1
+
+                        if radius > 0 and intensity > 0:
+                            # Create a circular "hole" in the overlay.
+                            # The alpha value determines how much the dimming is reduced.
+                            # Max reduction (alpha 0) for full intensity.
+                            # No reduction (alpha 192) for zero intensity (though light_props would be None).
+                            # For simplicity, let's make it fully clear if intensity > some threshold,
+                            # or scale the transparency.
+                            # Using (0,0,0,0) will make the area fully transparent.
+                            # A more advanced approach could use intensity to blend.
+                            # For now, full punch-out:
+                            light_color_alpha = 0 # Fully transparent
+
+                            # To make the light effect softer, we can draw a gradient or use blending.
+                            # For now, a simple circle punch-out:
+                            # Ensure integer coordinates for drawing
+                            draw_x = int(light_center_x_on_overlay)
+                            draw_y = int(light_center_y_on_overlay)
+                            draw_radius = int(radius)
+                            center_x_on_overlay = int(light_center_x_on_overlay)
+                            center_y_on_overlay = int(light_center_y_on_overlay)
+
+                            if draw_radius > 0 and intensity > 0:
+                                # Create a single surface for the entire light effect gradient
+                                light_effect_surface_size = draw_radius * 2
+                                if light_effect_surface_size <= 0: continue
+
+                                light_effect_surface = get_surface_pool().acquire((light_effect_surface_size, light_effect_surface_size), pygame.SRCALPHA, clear=False)
+                                light_effect_surface.fill((0, 0, 0, 192))  # Initialize with overlay's base alpha
+
+                                # Iterate from the outer edge of the light to the center, drawing on light_effect_surface
+                                for r_step in range(draw_radius, 0, -1):
+                                    if r_step <= 0: continue # Should not happen with range(draw_radius, 0, -1) if draw_radius > 0
+
+                                    edge_progress = r_step / float(draw_radius)
+                                    min_alpha_at_center = 192 * (1.0 - intensity)
+                                    alpha_value = int(min_alpha_at_center + (192 - min_alpha_at_center) * edge_progress)
+                                    alpha_value = max(0, min(192, alpha_value))
+
+                                    # Draw circle directly onto light_effect_surface, centered
+                                    # The center of light_effect_surface is (draw_radius, draw_radius)
+                                    pygame.gfxdraw.filled_circle(light_effect_surface, draw_radius, draw_radius, r_step, (0, 0, 0, alpha_value))
+
+                                # Blit the completed light_effect_surface onto the lighting_overlay_surface
+                                blit_pos_x = center_x_on_overlay - draw_radius
+                                blit_pos_y = center_y_on_overlay - draw_radius
+                                lighting_overlay_surface.blit(light_effect_surface, (blit_pos_x, blit_pos_y), special_flags=pygame.BLEND_RGBA_MIN)
+                                get_surface_pool().release(light_effect_surface)
+            target_surface.blit(lighting_overlay_surface, (overlay_x, overlay_y))
+            get_surface_pool().release(lighting_overlay_surface)
+
+    def draw(self, screen, game_objects, font, player_name, score_a, opponent_name, score_b, respawn_timer=None, paused=False):
+        """Draw the complete game state."""
+        draw_start_time = time.perf_counter()
+        if self._uses_framebuffer():
+            # Draw at the level's logical size (or reduced dynamic scale), then present with a single scale pass
+            framebuffer_size = self.framebuffer_size
+            if self._framebuffer is None or self._framebuffer.get_size() != framebuffer_size:
+                self._framebuffer = pygame.Surface(framebuffer_size).convert() if pygame.display.get_surface() else pygame.Surface(framebuffer_size)
+            self._draw_frame(self._framebuffer, game_objects, font, player_name, score_a, opponent_name, score_b, respawn_timer, paused)
+            self._present_framebuffer(screen)
+        else:
+            self._draw_frame(screen, game_objects, font, player_name, score_a, opponent_name, score_b, respawn_timer, paused)
+
+        # The screen no longer matches what the dirty rect tracker last saw
+        self._dirty_tracker.request_full_redraw()
+
+        if self.dynamic_resolution:
+            self._update_dynamic_resolution((time.perf_counter() - draw_start_time) * 1000.0)
+
+    def _shader_enabled(self):
+        """Whether the pixel shader runs this frame (shader_override wins over the cached setting)."""
+        if not self._shader_instance:
+            return False
+        if self.shader_override is not None:
+            return bool(self.shader_override)
+        return self._shader_setting
+
+    def set_shader_enabled(self, enabled):
+        """Turn the pixel shader on or off after the setting changed (settings menu or console)."""
+        self._shader_setting = bool(enabled)
+        self.request_full_redraw()
+
+    def _update_dynamic_resolution(self, draw_ms):
+        """Feed the frame's draw time to the controller and rescale if it picked a new render scale."""
+        previous_scale = self.dynamic_resolution.render_scale
+        shader_active = self._shader_enabled()
+        if self.dynamic_resolution.report_draw_time(draw_ms, shader_active):
+            if self.dynamic_resolution.render_scale != previous_scale:
+                self.update_scaling(self.window_width, self.window_height)
+            logger.info(f"Dynamic resolution: render scale {self.dynamic_resolution.render_scale:.2f}, "
+                        f"shader pixel size {self.dynamic_resolution.pixel_size} "
+                        f"(avg draw {self.dynamic_resolution.average_draw_ms:.1f} ms)")
+
+    def _present_framebuffer(self, screen):
+        """Scale the fixed resolution framebuffer onto the window, letterboxing any leftover space."""
+        present_rect = self.present_rect.clip(screen.get_rect())
+        if present_rect.width <= 0 or present_rect.height <= 0:
+            return
+        if present_rect != screen.get_rect():
+            screen.fill(self.colors.get('BLACK', (0, 0, 0)))
+        if present_rect.size == self._framebuffer.get_size():
+            screen.blit(self._framebuffer, present_rect)
+        else:
+            pygame.transform.scale(self._framebuffer, present_rect.size, screen.subsurface(present_rect))
+
+    def _draw_frame(self, screen, game_objects, font, player_name, score_a, opponent_name, score_b, respawn_timer=None, paused=False):
+        """Draw the complete game state onto the given surface using the current scaling."""
+        # Create intermediate surface for shader processing if shaders might be used
+        use_intermediate = self._shader_enabled()
+        target_surface = get_surface_pool().acquire(screen.get_size(), pygame.SRCALPHA, clear=False) if use_intermediate else screen
+        profiler = get_profiler()
+
+        with profiler.scope('background'):
+            self._draw_background(target_surface)
+
+            # --- Draw Game Elements ---
+            # No clipping needed now, scale_rect handles coordinate mapping.
+
+            # Draw Sprites
+            if self.sprites:
+                 for sprite in self.sprites:
+                     sprite.draw(target_surface) # SpriteObject uses scale_rect internally
+
+        with profiler.scope('objects'):
+            self._update_draw_animations(game_objects)
+            # Particles and glows are queued while the objects draw and blitted in one batch
+            render_queue = get_render_queue()
+            render_queue.begin()
+            for _obj, draw_object in self._collect_drawables(game_objects):
+                draw_object(target_surface)
+            render_queue.flush(target_surface)
 
         # --- Draw Lighting Layer ---
         if self.has_lighting:
-            # Create a surface for the dimming overlay
-            # Playable area dimensions scaled
-            overlay_width = int(self.width * self.scale)
-            overlay_height = int(self.height * self.scale)
-
-            if overlay_width > 0 and overlay_height > 0:
-                lighting_overlay_surface = pygame.Surface((overlay_width, overlay_height), pygame.SRCALPHA)
-                lighting_overlay_surface.fill((0, 0, 0, 192))  # Black with ~75% opacity (192/255)
-
-                # Calculate position for the overlay (top-left of the scaled playable area)
-                overlay_x = self.offset_x
-                overlay_y = self.offset_y + (self.scoreboard_height * self.scale)
-
-                # Apply light sources (e.g., from candles)
-                for candle in self.candles:
-                    if hasattr(candle, 'get_light_properties'):
-                        light_props = candle.get_light_properties(self.scale)
-                        if light_props:
-                            # light_props contains scaled x, y, radius, intensity
-                            # x, y are absolute screen coordinates
-                            # We need to draw on lighting_overlay_surface, so adjust coordinates
-                            light_center_x_on_overlay = light_props['x'] - overlay_x
-                            light_center_y_on_overlay = light_props['y'] - overlay_y
-                            radius = light_props['radius']
-                            intensity = light_props['intensity'] # 0 to 1
-
-                            if radius > 0 and intensity > 0:
-                                # Create a circular "hole" in the overlay.
-                                # The alpha value determines how much the dimming is reduced.
-                                # Max reduction (alpha 0) for full intensity.
-                                # No reduction (alpha 192) for zero intensity (though light_props would be None).
-                                # For simplicity, let's make it fully clear if intensity > some threshold,
-                                # or scale the transparency.
-                                # Using (0,0,0,0) will make the area fully transparent.
-                                # A more advanced approach could use intensity to blend.
-                                # For now, full punch-out:
-                                light_color_alpha = 0 # Fully transparent
-                                
-                                # To make the light effect softer, we can draw a gradient or use blending.
-                                # For now, a simple circle punch-out:
-                                # Ensure integer coordinates for drawing
-                                draw_x = int(light_center_x_on_overlay)
-                                draw_y = int(light_center_y_on_overlay)
-                                draw_radius = int(radius)
-                                center_x_on_overlay = int(light_center_x_on_overlay)
-                                center_y_on_overlay = int(light_center_y_on_overlay)
-
-                                if draw_radius > 0 and intensity > 0:
-                                    # Create a single surface for the entire light effect gradient
-                                    light_effect_surface_size = draw_radius * 2
-                                    if light_effect_surface_size <= 0: continue
-
-                                    light_effect_surface = pygame.Surface((light_effect_surface_size, light_effect_surface_size), pygame.SRCALPHA)
-                                    light_effect_surface.fill((0, 0, 0, 192))  # Initialize with overlay's base alpha
-
-                                    # Iterate from the outer edge of the light to the center, drawing on light_effect_surface
-                                    for r_step in range(draw_radius, 0, -1):
-                                        if r_step <= 0: continue # Should not happen with range(draw_radius, 0, -1) if draw_radius > 0
-
-                                        edge_progress = r_step / float(draw_radius)
-                                        min_alpha_at_center = 192 * (1.0 - intensity)
-                                        alpha_value = int(min_alpha_at_center + (192 - min_alpha_at_center) * edge_progress)
-                                        alpha_value = max(0, min(192, alpha_value))
-
-                                        # Draw circle directly onto light_effect_surface, centered
-                                        # The center of light_effect_surface is (draw_radius, draw_radius)
-                                        pygame.gfxdraw.filled_circle(light_effect_surface, draw_radius, draw_radius, r_step, (0, 0, 0, alpha_value))
-
-                                    # Blit the completed light_effect_surface onto the lighting_overlay_surface
-                                    blit_pos_x = center_x_on_overlay - draw_radius
-                                    blit_pos_y = center_y_on_overlay - draw_radius
-                                    lighting_overlay_surface.blit(light_effect_surface, (blit_pos_x, blit_pos_y), special_flags=pygame.BLEND_RGBA_MIN)
-                target_surface.blit(lighting_overlay_surface, (overlay_x, overlay_y))
-
+            with profiler.scope('lighting'):
+                self._draw_lighting(target_surface)
 
         # --- Draw UI Elements ---
-        # Scoreboard is drawn relative to the top of the screen (0,0) before offsets/scaling are applied by its own draw method
-        self.draw_scoreboard(target_surface, player_name, score_a, opponent_name, score_b, font, respawn_timer)
+        with profiler.scope('ui'):
+            # Scoreboard is drawn relative to the top of the screen (0,0) before offsets/scaling are applied by its own draw method
+            self.draw_scoreboard(target_surface, player_name, score_a, opponent_name, score_b, font, respawn_timer)
 
-        # Draw pause overlay if paused (drawn last on the target surface)
-        if paused:
-            self.draw_pause_overlay(target_surface, font)
+            # Draw pause overlay if paused (drawn last on the target surface)
+            if paused:
+                self.draw_pause_overlay(target_surface, font)
 
         # --- Final Blit / Shader Application ---
         if use_intermediate:
             # Try to apply shader if enabled and available
+            with profiler.scope('shader'):
+                try:
+                    pixel_size = self.dynamic_resolution.pixel_size if self.dynamic_resolution else None
+                    processed = self._shader_instance.apply_to_surface(target_surface, pixel_size)
+                    screen.blit(processed, (0, 0))
+                except Exception as e:
+                    if not self._shader_warning_shown:
+                        self._log_warning(f"Shader processing failed, using fallback rendering: {e}")
+                        self._shader_warning_shown = True
+                    # Fall back to direct rendering if shader failed
+                    screen.blit(target_surface, (0, 0))
+            get_surface_pool().release(target_surface)
+        # else: screen already holds the drawn elements if not using intermediate
+
+    def _get_static_layer(self, screen_size):
+        """
+        Return the cached static layer (background and sprites), rebuilding it when the
+        window size, scaling or sludge texture changed. The background is frozen on the
+        frame the layer was built, which is the trade-off of dirty rect rendering.
+        """
+        with self.sludge_texture_lock:
+            texture_id = id(self.sludge_texture)
+        layer_key = (screen_size, self.scale, self.offset_x, self.offset_y, texture_id)
+        if self._static_layer is None or self._static_layer_key != layer_key:
+            self._static_layer = pygame.Surface(screen_size).convert() if pygame.display.get_surface() else pygame.Surface(screen_size)
+            self._draw_background(self._static_layer)
+            for sprite in self.sprites:
+                sprite.draw(self._static_layer)
+            self._static_layer_key = layer_key
+            self._dirty_tracker.request_full_redraw()
+        return self._static_layer
+
+    def _get_object_draw_bounds(self, obj, screen_rect):
+        """Screen bounds of an object for dirty rect tracking; unknown objects cover the screen."""
+        if hasattr(obj, 'get_draw_bounds'):
             try:
-                processed = self._shader_instance.apply_to_surface(target_surface)
-                screen.blit(processed, (0, 0))
+                return obj.get_draw_bounds(self.scale_rect)
             except Exception as e:
-                if not self._shader_warning_shown:
-                    self._log_warning(f"Shader processing failed, using fallback rendering: {e}")
-                    self._shader_warning_shown = True
-                # Fall back to direct rendering if shader failed
-                screen.blit(target_surface, (0, 0))
-        # else: screen already holds the drawn elements if not using intermediate
+                self._log_warning(f"Failed to get draw bounds for {type(obj).__name__}: {e}")
+        return screen_rect.copy()
+
+    def draw_dirty(self, screen, game_objects, font, player_name, score_a, opponent_name, score_b, respawn_timer=None, paused=False):
+        """
+        Draw the game state by restoring and redrawing only the regions that changed.
+        Falls back to draw() when the shader, lighting, pause overlay or fixed resolution
+        rendering would touch the whole screen.
+
+        Returns:
+            list: Screen rects to pass to pygame.display.update(), or None if the
+                  whole screen was redrawn and should be flipped.
+        """
+        if paused or self.has_lighting or self._uses_framebuffer() or self._shader_enabled():
+            self.draw(screen, game_objects, font, player_name, score_a, opponent_name, score_b, respawn_timer, paused)
+            return None
+
+        profiler = get_profiler()
+        screen_rect = screen.get_rect()
+        tracker = self._dirty_tracker
+        tracker.set_screen_rect(screen_rect)
+        with profiler.scope('background'):
+            static_layer = self._get_static_layer(screen.get_size())
+
+        profiler.start('objects')
+        self._update_draw_animations(game_objects)
+        drawables = self._collect_drawables(game_objects)
+
+        # --- Track the bounds of everything drawn this frame ---
+        tracker.begin_frame()
+        entry_bounds = []
+        for obj, _draw_object in drawables:
+            bounds = self._get_object_draw_bounds(obj, screen_rect).clip(screen_rect)
+            tracker.track(id(obj), bounds, static=getattr(obj, 'STATIC_VISUAL', False))
+            entry_bounds.append(bounds)
+
+        # The scoreboard glows every frame; its score boxes hang slightly below the bar
+        scoreboard_rect = pygame.Rect(0, 0, screen_rect.width, int(self.scoreboard_height * self.scale) + 50)
+        tracker.track('scoreboard', scoreboard_rect)
+        if respawn_timer is not None and respawn_timer > 0:
+            tracker.track('respawn_timer', pygame.Rect(0, 0, 120, 120).move(screen_rect.centerx - 60, screen_rect.centery - 60))
+
+        dirty_rects, redraw = tracker.expand_to_cover(tracker.end_frame(), entry_bounds)
+
+        profiler.stop('objects')
+
+        # --- Restore and redraw the dirty regions ---
+        with profiler.scope('background'):
+            for rect in dirty_rects:
+                screen.blit(static_layer, rect, rect)
+        profiler.start('objects')
+        render_queue = get_render_queue()
+        render_queue.begin()
+        for (_obj, draw_object), needs_redraw in zip(drawables, redraw):
+            if needs_redraw:
+                draw_object(screen)
+        render_queue.flush(screen)
+        profiler.stop('objects')
+
+        with profiler.scope('ui'):
+            self.draw_scoreboard(screen, player_name, score_a, opponent_name, score_b, font, respawn_timer)
+        return dirty_rects
 
 # Helper function to get parameters from a source (path or instance)
 # This could be used externally to create the LevelCompiler instance
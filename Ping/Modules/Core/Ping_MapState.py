@@ -5,21 +5,36 @@ Manages persistent state for the roguelike map system.
 
 import json
 import os
+import threading
 from typing import Optional, Dict, Any
 from .Ping_MapTree import MapTreeManager, MapZone, MapNode
+from .Ping_Persistence import get_persistence_writer
+from .Ping_RunJournal import RunJournal
 
 class MapStateManager:
-    """Manages the persistent state of the map progression system."""
+    """Manages the persistent state of the map progression system.
+    
+    State changes during a run are appended to a journal (run_journal.jsonl) and
+    replayed on top of the last snapshot (map_progress.json and player_stats.json)
+    when a run is continued. Once the journal grows past JOURNAL_COMPACT_THRESHOLD
+    events a fresh snapshot is written and the covered events are dropped.
+    """
+    
+    JOURNAL_COMPACT_THRESHOLD = 32
     
     def __init__(self, save_directory: str = "Ping/Game Parameters/"):
         self.save_directory = save_directory
         self.map_progress_file = os.path.join(save_directory, "map_progress.json")
         self.player_stats_file = os.path.join(save_directory, "player_stats.json")
+        self.journal_file = os.path.join(save_directory, "run_journal.jsonl")
         
         # Ensure save directory exists
         os.makedirs(save_directory, exist_ok=True)
         
         self.map_manager = MapTreeManager(self.map_progress_file)
+        self.journal = RunJournal(self.journal_file)
+        self.stats_journal_seq = 0  # Last journal event included in the saved player stats
+        self._snapshot_pending = False
         self.player_stats = {
             "currency": 0,
             "upgrades_purchased": [],
@@ -28,8 +43,8 @@ class MapStateManager:
             "best_streak": 0
         }
         
-    def initialize_new_run(self):
-        """Start a completely new campaign run."""
+    def initialize_new_run(self, procedural: bool = False, seed: Optional[int] = None, layers: int = 12):
+        """Start a completely new campaign run (optionally on a procedurally generated zone)."""
         # Reset player stats
         self.player_stats = {
             "currency": 0,
@@ -39,8 +54,12 @@ class MapStateManager:
             "best_streak": 0
         }
         
-        # Generate new map tree
-        self.map_manager.generate_new_run()
+        # Generate new map tree, the snapshot covers every earlier journal event
+        self.map_manager.journal_seq = self.journal.last_seq
+        if procedural:
+            self.map_manager.generate_procedural_run(seed, layers)
+        else:
+            self.map_manager.generate_new_run()
         
         # Save both map progress and player stats
         self.save_all_data()
@@ -50,12 +69,66 @@ class MapStateManager:
         map_loaded = self.map_manager.load_progress()
         stats_loaded = self.load_player_stats()
         
+        if map_loaded and stats_loaded:
+            self.replay_journal()
+        
         return map_loaded and stats_loaded
     
+    def replay_journal(self):
+        """Apply journal events newer than the loaded snapshots."""
+        map_seq = self.map_manager.journal_seq
+        stats_seq = self.stats_journal_seq
+        self.journal.ensure_seq_after(max(map_seq, stats_seq))
+        
+        for event in self.journal.load():
+            try:
+                self._apply_event(event, event['seq'] > map_seq, event['seq'] > stats_seq)
+            except Exception as e:
+                print(f"Error replaying run journal event {event.get('seq')}: {e}")
+        
+        self.map_manager.journal_seq = self.stats_journal_seq = self.journal.last_seq
+    
+    def _apply_event(self, event: Dict[str, Any], apply_map: bool, apply_stats: bool):
+        """Re-apply a single journal event to the map and/or player stats."""
+        event_type = event['type']
+        zone = self.map_manager.get_zone(event['zone_id']) if 'zone_id' in event else None
+        
+        if event_type == "move":
+            if apply_map and zone:
+                zone.set_current_node(event['node_id'])
+        elif event_type == "complete":
+            if apply_map and zone:
+                zone.complete_node(event['node_id'])
+            if apply_stats:
+                self.player_stats["levels_completed"] += 1
+                self.player_stats["total_score"] += event['score']
+                self.player_stats["currency"] += event['currency']
+        elif event_type == "purchase":
+            if apply_stats:
+                self.player_stats["currency"] -= event['cost']
+                if event['upgrade_id'] not in self.player_stats["upgrades_purchased"]:
+                    self.player_stats["upgrades_purchased"].append(event['upgrade_id'])
+        elif event_type == "reward":
+            if apply_stats:
+                self.player_stats["currency"] += event['amount']
+    
+    def _record(self, event_type: str, **data):
+        """Append a state change to the journal, snapshotting once it grows too long."""
+        try:
+            self.journal.append(event_type, **data)
+        except Exception as e:
+            print(f"Error writing run journal, saving full snapshot instead: {e}")
+            self.save_all_data()
+            return
+        if not self._snapshot_pending and len(self.journal) >= self.JOURNAL_COMPACT_THRESHOLD:
+            self.save_all_data()
+    
     def has_existing_run(self) -> bool:
         """Check if there's an existing run to continue."""
-        return (os.path.exists(self.map_progress_file) and 
-                os.path.exists(self.player_stats_file))
+        writer = get_persistence_writer()
+        # A save still queued in the background counts as existing
+        return all(os.path.exists(path) or writer.has_pending(path)
+                   for path in (self.map_progress_file, self.player_stats_file))
     
     def get_current_zone(self) -> Optional[MapZone]:
         """Get the current active zone."""
@@ -86,7 +159,8 @@ class MapStateManager:
             self.player_stats["currency"] += currency_earned
             
             # Save progress
-            self.save_all_data()
+            self._record("complete", zone_id=zone.id, node_id=current_node.id,
+                         score=score, currency=currency_earned)
             
             return currency_earned
         
@@ -107,16 +181,16 @@ class MapStateManager:
             target_node = zone.get_node(node_id)
             if target_node and target_node.is_accessible:
                 zone.set_current_node(node_id)
-                self.save_all_data()
+                self._record("move", zone_id=zone.id, node_id=node_id)
                 return True
         return False
     
     def can_access_node(self, node_id: str) -> bool:
-        """Check if a node is accessible to the player."""
+        """Check if a node is accessible to the player (available and ahead of the current node)."""
         zone = self.get_current_zone()
-        if zone:
-            node = zone.get_node(node_id)
-            return node and node.is_accessible and not node.is_completed
+        if zone and zone.is_node_available(node_id):
+            # Branches the player has moved away from stay closed
+            return zone.current_node_id is None or zone.can_reach(zone.current_node_id, node_id)
         return False
     
     def get_available_nodes(self) -> list:
@@ -132,10 +206,15 @@ class MapStateManager:
             self.player_stats["currency"] -= cost
             if upgrade_id not in self.player_stats["upgrades_purchased"]:
                 self.player_stats["upgrades_purchased"].append(upgrade_id)
-            self.save_all_data()
+            self._record("purchase", upgrade_id=upgrade_id, cost=cost)
             return True
         return False
     
+    def award_currency(self, amount: int, reason: str = ""):
+        """Give the player currency outside of level completion (e.g. bonuses)."""
+        self.player_stats["currency"] += amount
+        self._record("reward", amount=amount, reason=reason)
+    
     def get_player_currency(self) -> int:
         """Get player's current currency."""
         return self.player_stats["currency"]
@@ -149,23 +228,58 @@ class MapStateManager:
         return upgrade_id in self.player_stats["upgrades_purchased"]
     
     def save_all_data(self):
-        """Save both map progress and player stats."""
-        self.map_manager.save_progress()
-        self.save_player_stats()
+        """
+        Snapshot map progress and player stats; the journal is compacted once both are on disk.
+        If either write fails the journal is kept, and the next recorded event tries again.
+        """
+        seq = self.journal.last_seq
+        self.map_manager.journal_seq = seq
+        self.stats_journal_seq = seq
+        
+        lock = threading.Lock()
+        remaining = [2]
+        all_ok = [True]
+        def on_done(ok):
+            with lock:
+                remaining[0] -= 1
+                all_ok[0] = all_ok[0] and ok
+                if remaining[0]:
+                    return
+            try:
+                if all_ok[0]:
+                    self.journal.compact_to(seq)
+            finally:
+                self._snapshot_pending = False
+        
+        self._snapshot_pending = True
+        self.map_manager.save_progress(on_done)
+        self.save_player_stats(on_done)
     
-    def save_player_stats(self):
-        """Save player statistics to file."""
+    def save_player_stats(self, on_done=None):
+        """
+        Queue player statistics to be written in the background.
+        on_done(ok) is called once the write finished or failed (also if serializing fails).
+        """
         try:
-            with open(self.player_stats_file, 'w') as f:
-                json.dump(self.player_stats, f, indent=2)
+            save_data = dict(self.player_stats, journal_seq=self.stats_journal_seq)
+            get_persistence_writer().save(self.player_stats_file, save_data, on_done)
         except Exception as e:
             print(f"Error saving player stats: {e}")
+            if on_done is not None:
+                on_done(False)
+    
+    def flush_saves(self, timeout: Optional[float] = None) -> bool:
+        """Block until all queued saves are on disk. Returns False if the timeout expired."""
+        return get_persistence_writer().flush(timeout)
     
     def load_player_stats(self) -> bool:
         """Load player statistics from file. Returns True if successful."""
         try:
+            # Make sure a save still queued in the background isn't missed
+            get_persistence_writer().flush()
             with open(self.player_stats_file, 'r') as f:
                 self.player_stats = json.load(f)
+            self.stats_journal_seq = self.player_stats.pop("journal_seq", 0)
             return True
         except FileNotFoundError:
             # No save file exists yet
@@ -181,8 +295,8 @@ class MapStateManager:
             return {}
         
         total_nodes = len(zone.nodes)
-        completed_nodes = sum(1 for node in zone.nodes.values() if node.is_completed)
-        accessible_nodes = sum(1 for node in zone.nodes.values() if node.is_accessible)
+        completed_nodes = zone.get_completed_count()
+        accessible_nodes = zone.get_accessible_count()
         
         return {
             "zone_name": zone.name,
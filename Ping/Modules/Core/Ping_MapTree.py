@@ -7,6 +7,7 @@ import random
 import json
 from enum import Enum
 from typing import List, Dict, Optional, Tuple
+from .Ping_Persistence import get_persistence_writer
 
 class NodeType(Enum):
     START = "start"
@@ -27,11 +28,14 @@ class MapNode:
         self.is_completed = False
         self.is_accessible = False
         self.properties = {}  # Additional node-specific data
+        self.zone = None  # Zone the node was added to, told when connections change
         
     def add_connection(self, node_id: str):
         """Add a connection to another node."""
         if node_id not in self.connections:
             self.connections.append(node_id)
+            if self.zone is not None:
+                self.zone.invalidate_index()
     
     def to_dict(self):
         """Convert node to dictionary for serialization."""
@@ -62,7 +66,14 @@ class MapNode:
         return node
 
 class MapZone:
-    """Represents a complete zone with branching paths."""
+    """Represents a complete zone with branching paths.
+    
+    Node connections are indexed into arrays (node index -> connected indices) and
+    node state is mirrored in integer bitmasks, so accessibility and reachability
+    checks are O(1). Change node state through the zone (complete_node) so the
+    bitmasks stay in sync with the node flags. Adding nodes or connections marks
+    the index dirty and bumps index_version.
+    """
     
     def __init__(self, zone_name: str, zone_id: str):
         self.name = zone_name
@@ -71,30 +82,135 @@ class MapZone:
         self.current_node_id = None
         self.music_file = None
         self.background_theme = "sewer"
+        self.seed = None  # Set for procedurally generated zones
+        
+        # Index arrays, rebuilt lazily after nodes or connections are added
+        self._index_dirty = True
+        self._node_ids: List[str] = []
+        self._node_index: Dict[str, int] = {}
+        self._adjacency: List[Tuple[int, ...]] = []
+        self._reachable: List[int] = []  # Bitmask of nodes reachable from each node (including itself)
+        self._accessible_mask = 0
+        self._completed_mask = 0
+        self.index_version = 0  # Increases whenever nodes or connections change (for caches such as map layouts)
         
     def add_node(self, node: MapNode):
         """Add a node to the zone."""
         self.nodes[node.id] = node
+        node.zone = self
+        self.invalidate_index()
+    
+    def invalidate_index(self):
+        """Rebuild the index arrays on the next query (after nodes or connections changed)."""
+        self._index_dirty = True
+        self.index_version += 1
         
     def get_node(self, node_id: str) -> Optional[MapNode]:
         """Get a node by ID."""
         return self.nodes.get(node_id)
     
+    def _ensure_index(self):
+        """Build the index arrays and state bitmasks if nodes or connections changed."""
+        if not self._index_dirty:
+            return
+        self._node_ids = list(self.nodes.keys())
+        self._node_index = {node_id: i for i, node_id in enumerate(self._node_ids)}
+        self._adjacency = [
+            tuple(self._node_index[connection_id] for connection_id in self.nodes[node_id].connections
+                  if connection_id in self._node_index)
+            for node_id in self._node_ids
+        ]
+        self._accessible_mask = 0
+        self._completed_mask = 0
+        for i, node_id in enumerate(self._node_ids):
+            node = self.nodes[node_id]
+            if node.is_accessible:
+                self._accessible_mask |= 1 << i
+            if node.is_completed:
+                self._completed_mask |= 1 << i
+        self._reachable = self._compute_reachability()
+        self._index_dirty = False
+    
+    def _compute_reachability(self) -> List[int]:
+        """Bitmask of reachable nodes per node, folded in reverse topological order."""
+        count = len(self._node_ids)
+        incoming = [0] * count
+        for targets in self._adjacency:
+            for target in targets:
+                incoming[target] += 1
+        order = [i for i in range(count) if incoming[i] == 0]
+        for i in order: # order grows while iterating (Kahn's algorithm)
+            for target in self._adjacency[i]:
+                incoming[target] -= 1
+                if incoming[target] == 0:
+                    order.append(target)
+        
+        reachable = [1 << i for i in range(count)]
+        if len(order) == count:
+            for i in reversed(order):
+                for target in self._adjacency[i]:
+                    reachable[i] |= reachable[target]
+        else:
+            # Not a DAG (hand-made zone with a loop), fall back to a search per node
+            for start in range(count):
+                stack = [start]
+                while stack:
+                    for target in self._adjacency[stack.pop()]:
+                        if not reachable[start] >> target & 1:
+                            reachable[start] |= 1 << target
+                            stack.append(target)
+        return reachable
+    
+    def is_node_available(self, node_id: str) -> bool:
+        """Check whether a node is accessible and not yet completed."""
+        self._ensure_index()
+        i = self._node_index.get(node_id)
+        if i is None:
+            return False
+        return bool((self._accessible_mask & ~self._completed_mask) >> i & 1)
+    
+    def can_reach(self, from_node_id: str, to_node_id: str) -> bool:
+        """Check whether to_node_id can be reached by following connections from from_node_id."""
+        self._ensure_index()
+        source = self._node_index.get(from_node_id)
+        target = self._node_index.get(to_node_id)
+        if source is None or target is None:
+            return False
+        return bool(self._reachable[source] >> target & 1)
+    
     def get_available_nodes(self) -> List[MapNode]:
         """Get all accessible nodes that aren't completed."""
-        return [node for node in self.nodes.values() 
-                if node.is_accessible and not node.is_completed]
+        self._ensure_index()
+        available = []
+        mask = self._accessible_mask & ~self._completed_mask
+        while mask:
+            lowest = mask & -mask
+            available.append(self.nodes[self._node_ids[lowest.bit_length() - 1]])
+            mask ^= lowest
+        return available
+    
+    def get_completed_count(self) -> int:
+        """Number of completed nodes."""
+        self._ensure_index()
+        return bin(self._completed_mask).count("1")
+    
+    def get_accessible_count(self) -> int:
+        """Number of accessible nodes (completed or not)."""
+        self._ensure_index()
+        return bin(self._accessible_mask).count("1")
     
     def complete_node(self, node_id: str):
         """Mark a node as completed and unlock connected nodes."""
-        node = self.get_node(node_id)
-        if node:
-            node.is_completed = True
-            # Unlock connected nodes
-            for connection_id in node.connections:
-                connected_node = self.get_node(connection_id)
-                if connected_node:
-                    connected_node.is_accessible = True
+        self._ensure_index()
+        i = self._node_index.get(node_id)
+        if i is None:
+            return
+        self.nodes[node_id].is_completed = True
+        self._completed_mask |= 1 << i
+        # Unlock connected nodes
+        for target in self._adjacency[i]:
+            self.nodes[self._node_ids[target]].is_accessible = True
+            self._accessible_mask |= 1 << target
     
     def set_current_node(self, node_id: str):
         """Set the current player position."""
@@ -109,7 +225,8 @@ class MapZone:
             'nodes': {node_id: node.to_dict() for node_id, node in self.nodes.items()},
             'current_node_id': self.current_node_id,
             'music_file': self.music_file,
-            'background_theme': self.background_theme
+            'background_theme': self.background_theme,
+            'seed': self.seed
         }
     
     @classmethod
@@ -119,6 +236,7 @@ class MapZone:
         zone.current_node_id = data.get('current_node_id')
         zone.music_file = data.get('music_file')
         zone.background_theme = data.get('background_theme', 'sewer')
+        zone.seed = data.get('seed')
         
         # Load nodes
         for node_data in data.get('nodes', {}).values():
@@ -215,6 +333,87 @@ class MapTreeGenerator:
         
         return zone
 
+    @staticmethod
+    def generate_layered_zone(zone_name: str, zone_id: str, seed: Optional[int] = None,
+                              layers: int = 12, min_width: int = 2, max_width: int = 5,
+                              level_files: Optional[List[str]] = None, shop_chance: float = 0.15,
+                              branch_chance: float = 0.35, x_spacing: int = 120,
+                              y_spacing: int = 100, center_x: int = 400, top_y: int = 50) -> MapZone:
+        """
+        Generate a zone as a layered DAG: a start node, layers of branching nodes and a boss.
+        
+        Every node connects to at least one node in the next layer and every node has
+        at least one incoming connection, so the boss is reachable from everywhere.
+        The same seed always produces the same zone.
+        
+        Args:
+            zone_name (str): Display name of the zone.
+            zone_id (str): Zone ID.
+            seed (int, optional): Random seed; a random one is picked (and stored) if None.
+            layers (int): Number of layers between start and boss.
+            min_width (int): Fewest nodes in a layer.
+            max_width (int): Most nodes in a layer.
+            level_files (list, optional): PMF files to pick level nodes from.
+            shop_chance (float): Chance for a node to be a shop.
+            branch_chance (float): Chance for a node to get a second outgoing connection.
+            x_spacing (int): Horizontal distance between nodes in a layer.
+            y_spacing (int): Vertical distance between layers.
+            center_x (int): X coordinate layers are centered on.
+            top_y (int): Y coordinate of the start node.
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 31)
+        rng = random.Random(seed)
+        level_files = level_files or ["Debug Level.pmf", "Spooky Test.pmf", "Roulette Test.pmf"]
+        
+        zone = MapZone(zone_name, zone_id)
+        zone.seed = seed
+        
+        # Decide the width of every layer, start and boss are single nodes
+        widths = [1] + [rng.randint(min_width, max_width) for _ in range(layers)] + [1]
+        layer_nodes: List[List[MapNode]] = []
+        
+        for layer, width in enumerate(widths):
+            y = top_y + layer * y_spacing
+            nodes = []
+            for i in range(width):
+                x = center_x + int((i - (width - 1) / 2) * x_spacing)
+                if layer == 0:
+                    node = MapNode("start", NodeType.START, (x, y))
+                    node.level_file = "Manhole Mayhem.pmf"  # Fixed first level
+                    node.is_accessible = True
+                elif layer == len(widths) - 1:
+                    node = MapNode("boss", NodeType.BOSS, (x, y))
+                    node.level_file = "Manhole Mayhem.pmf"
+                else:
+                    node_type = NodeType.SHOP if rng.random() < shop_chance else NodeType.LEVEL
+                    node = MapNode(f"l{layer}_n{i}", node_type, (x, y))
+                    if node_type == NodeType.LEVEL:
+                        node.level_file = rng.choice(level_files)
+                nodes.append(node)
+                zone.add_node(node)
+            layer_nodes.append(nodes)
+        
+        # Connect each layer to the next without crossing too much: every node links to the
+        # node at the same relative position, sometimes also to a neighbour of it
+        for current, following in zip(layer_nodes, layer_nodes[1:]):
+            has_incoming = [False] * len(following)
+            for i, node in enumerate(current):
+                target = round(i * (len(following) - 1) / max(1, len(current) - 1))
+                node.add_connection(following[target].id)
+                has_incoming[target] = True
+                if len(following) > 1 and rng.random() < branch_chance:
+                    extra = min(len(following) - 1, max(0, target + rng.choice((-1, 1))))
+                    node.add_connection(following[extra].id)
+                    has_incoming[extra] = True
+            for j, linked in enumerate(has_incoming):
+                if not linked:
+                    source = round(j * (len(current) - 1) / max(1, len(following) - 1))
+                    current[source].add_connection(following[j].id)
+        
+        zone.set_current_node("start")
+        return zone
+
 class MapTreeManager:
     """Manages multiple zones and save/load functionality."""
     
@@ -222,6 +421,7 @@ class MapTreeManager:
         self.save_file_path = save_file_path
         self.zones: Dict[str, MapZone] = {}
         self.current_zone_id = None
+        self.journal_seq = 0  # Last run journal event included in the saved progress
         
     def add_zone(self, zone: MapZone):
         """Add a zone to the manager."""
@@ -255,23 +455,44 @@ class MapTreeManager:
         # Save the new run
         self.save_progress()
     
-    def save_progress(self):
-        """Save current progress to file."""
+    def generate_procedural_run(self, seed: Optional[int] = None, layers: int = 12):
+        """Generate a fresh run with a procedurally generated (seeded) zone."""
+        self.zones.clear()
+        
+        sewerlines = MapTreeGenerator.generate_layered_zone(
+            "New Arkadia Sewerlines", "new_arkadia_sewerlines", seed=seed, layers=layers)
+        sewerlines.music_file = "New Arkadia Sewerlines"
+        sewerlines.background_theme = "sewer"
+        self.add_zone(sewerlines)
+        self.set_current_zone(sewerlines.id)
+        
+        self.save_progress()
+    
+    def save_progress(self, on_done=None):
+        """
+        Queue the current progress to be written in the background.
+        on_done(ok) is called once the write finished or failed (also if serializing fails).
+        """
         try:
             save_data = {
                 'zones': {zone_id: zone.to_dict() for zone_id, zone in self.zones.items()},
-                'current_zone_id': self.current_zone_id
+                'current_zone_id': self.current_zone_id,
+                'journal_seq': self.journal_seq
             }
             
-            with open(self.save_file_path, 'w') as f:
-                json.dump(save_data, f, indent=2)
+            # Serialized now, written atomically off the main thread
+            get_persistence_writer().save(self.save_file_path, save_data, on_done)
                 
         except Exception as e:
             print(f"Error saving map progress: {e}")
+            if on_done is not None:
+                on_done(False)
     
     def load_progress(self) -> bool:
         """Load progress from file. Returns True if successful."""
         try:
+            # Make sure a save still queued in the background isn't missed
+            get_persistence_writer().flush()
             with open(self.save_file_path, 'r') as f:
                 save_data = json.load(f)
             
@@ -282,6 +503,7 @@ class MapTreeManager:
                 self.add_zone(zone)
             
             self.current_zone_id = save_data.get('current_zone_id')
+            self.journal_seq = save_data.get('journal_seq', 0)
             return True
             
         except FileNotFoundError:
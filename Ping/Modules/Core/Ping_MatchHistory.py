@@ -0,0 +1,250 @@
+"""
+Ping Match History Module
+Records per-match results in a local SQLite database and answers historical queries.
+"""
+
+import atexit
+import os
+import queue
+import sqlite3
+import subprocess
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+def get_game_parameters_path():
+    """Get the correct path to Game Parameters directory."""
+    # Get the directory of this file (Ping/Modules/Core/)
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    # Go up two levels to get to Ping directory, then into Game Parameters
+    game_params_dir = os.path.join(current_dir, "..", "..", "Game Parameters")
+    return os.path.normpath(game_params_dir)
+
+
+def detect_build() -> str:
+    """Identify the running build: PING_BUILD if set, else the git commit, else 'dev'."""
+    build = os.environ.get("PING_BUILD")
+    if build:
+        return build
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, timeout=2)
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        pass
+    return "dev"
+
+
+MATCH_COLUMNS = (
+    "played_at", "build", "level", "player_a", "player_b", "ai_mode",
+    "score_a", "score_b", "winner", "completed", "duration_s",
+    "rallies", "longest_rally", "paddle_hits", "avg_frame_ms"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    played_at REAL NOT NULL,
+    build TEXT NOT NULL,
+    level TEXT NOT NULL,
+    player_a TEXT,
+    player_b TEXT,
+    ai_mode INTEGER NOT NULL,
+    score_a INTEGER NOT NULL,
+    score_b INTEGER NOT NULL,
+    winner TEXT,
+    completed INTEGER NOT NULL,
+    duration_s REAL,
+    rallies INTEGER,
+    longest_rally INTEGER,
+    paddle_hits INTEGER,
+    avg_frame_ms REAL
+);
+CREATE INDEX IF NOT EXISTS idx_matches_level ON matches (level, played_at);
+CREATE INDEX IF NOT EXISTS idx_matches_build ON matches (build, played_at);
+CREATE INDEX IF NOT EXISTS idx_matches_player ON matches (player_a, level);
+"""
+
+
+class MatchHistoryStore:
+    """
+    SQLite-backed match history.
+
+    record_match() only queues the row; a background thread owns the write
+    connection and inserts queued rows in batches, one transaction per batch.
+    Queries open their own read connection after flushing pending rows.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, batch_interval: float = 1.0, max_batch: int = 64):
+        """
+        Args:
+            db_path (str, optional): Database file; defaults to Game Parameters/match_history.db.
+            batch_interval (float): Seconds to wait for more rows before writing a batch.
+            max_batch (int): Write immediately once this many rows are queued.
+        """
+        self.db_path = db_path or os.path.join(get_game_parameters_path(), "match_history.db")
+        self.batch_interval = batch_interval
+        self.max_batch = max_batch
+        self.build = None  # Detected on the writer thread, running git would hitch the game
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._schema_ready = False
+
+    def record_match(self, level: str, player_a: str, player_b: str, ai_mode: bool,
+                     score_a: int, score_b: int, winner: Optional[str], completed: bool,
+                     duration_s: float, rallies: int = 0, longest_rally: int = 0,
+                     paddle_hits: int = 0, avg_frame_ms: float = 0.0):
+        """Queue one match result for writing. Returns immediately."""
+        row = (time.time(), None, os.path.basename(str(level)), player_a, player_b,
+               int(bool(ai_mode)), int(score_a), int(score_b), winner, int(bool(completed)),
+               float(duration_s), int(rallies), int(longest_rally), int(paddle_hits), float(avg_frame_ms))
+        self._queue.put(row)
+        self._ensure_thread()
+
+    def flush(self, timeout: Optional[float] = None):
+        """Block until every queued row has been written (or the timeout expires)."""
+        if self._thread is None or not self._thread.is_alive():
+            # No writer running, write anything left on this thread
+            self._write_batch(self._drain())
+            return
+        event = threading.Event()
+        self._queue.put(event)
+        event.wait(timeout)
+
+    def close(self):
+        """Flush outstanding rows (registered with atexit)."""
+        self.flush(timeout=5.0)
+
+    def win_rate_by_level(self, player_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Win rate of the left player per level over completed matches.
+
+        Args:
+            player_name (str, optional): Only count matches played by this player.
+        """
+        sql = ("SELECT level, COUNT(*) AS matches, "
+               "SUM(CASE WHEN winner = player_a THEN 1 ELSE 0 END) AS wins, "
+               "AVG(duration_s) AS avg_duration_s "
+               "FROM matches WHERE completed = 1")
+        params = []
+        if player_name:
+            sql += " AND player_a = ?"
+            params.append(player_name)
+        sql += " GROUP BY level ORDER BY level"
+        rows = self._query(sql, params)
+        for row in rows:
+            row['win_rate'] = row['wins'] / row['matches'] if row['matches'] else 0.0
+        return rows
+
+    def frame_time_by_build(self, level: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Average and worst frame time per build (most recent build first), to spot regressions."""
+        sql = ("SELECT build, COUNT(*) AS matches, AVG(avg_frame_ms) AS avg_frame_ms, "
+               "MAX(avg_frame_ms) AS worst_frame_ms, MAX(played_at) AS last_played "
+               "FROM matches")
+        params = []
+        if level:
+            sql += " WHERE level = ?"
+            params.append(os.path.basename(level))
+        sql += " GROUP BY build ORDER BY last_played DESC"
+        return self._query(sql, params)
+
+    def recent_matches(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """The most recent matches, newest first."""
+        columns = ", ".join(MATCH_COLUMNS)
+        return self._query(f"SELECT {columns} FROM matches ORDER BY played_at DESC LIMIT ?", [limit])
+
+    def _query(self, sql: str, params) -> List[Dict[str, Any]]:
+        """Run a read query after flushing pending rows."""
+        self.flush(timeout=2.0)
+        try:
+            connection = self._connect()
+            try:
+                connection.row_factory = sqlite3.Row
+                return [dict(row) for row in connection.execute(sql, params)]
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            print(f"Error querying match history: {e}")
+            return []
+
+    def _connect(self):
+        """Open a connection, creating the database and schema on first use."""
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=5.0)
+        if not self._schema_ready:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+            self._schema_ready = True
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _ensure_thread(self):
+        """Start the writer thread if it isn't running."""
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="MatchHistoryWriter", daemon=True)
+                self._thread.start()
+
+    def _drain(self):
+        """Take everything currently queued without blocking."""
+        items = []
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    def _write_batch(self, items):
+        """Insert queued rows in one transaction and release anyone waiting on a flush."""
+        rows = [item for item in items if isinstance(item, tuple)]
+        if rows:
+            if self.build is None:
+                self.build = detect_build()
+            rows = [(row[0], self.build) + row[2:] for row in rows]
+            placeholders = ", ".join("?" for _ in MATCH_COLUMNS)
+            try:
+                connection = self._connect()
+                try:
+                    with connection:
+                        connection.executemany(
+                            f"INSERT INTO matches ({', '.join(MATCH_COLUMNS)}) VALUES ({placeholders})", rows)
+                finally:
+                    connection.close()
+            except sqlite3.Error as e:
+                print(f"Error writing match history: {e}")
+        for item in items:
+            if isinstance(item, threading.Event):
+                item.set()
+
+    def _run(self):
+        """Writer thread loop: wait for a row, gather a batch, write it."""
+        while True:
+            items = [self._queue.get()]
+            deadline = time.monotonic() + self.batch_interval
+            while len(items) < self.max_batch and not isinstance(items[-1], threading.Event):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            items.extend(self._drain())
+            self._write_batch(items)
+
+
+# Global match history instance
+_match_history = None
+
+def get_match_history() -> MatchHistoryStore:
+    """Get or create the global match history store, flushed automatically on exit."""
+    global _match_history
+    if _match_history is None:
+        _match_history = MatchHistoryStore()
+        atexit.register(_match_history.close)
+    return _match_history
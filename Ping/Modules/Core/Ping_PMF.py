@@ -0,0 +1,410 @@
+"""
+Ping PMF Module
+The declared schema of .pmf level files, shared by the game's LevelCompiler and
+the Artemis editor, with migration of older field names, validation and
+normalization (stable field order and numeric precision).
+
+Also a batch tool that checks every level under a directory in parallel.
+Run from the repository root:
+    python -m Ping.Modules.Core.Ping_PMF
+    python -m Ping.Modules.Core.Ping_PMF "Ping/Ping Assets/Levels" --strict
+    python -m Ping.Modules.Core.Ping_PMF --write
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+from Ping.Modules.Core.Ping_Persistence import atomic_write_text
+
+
+FLOAT_PRECISION = 3 # Decimal places kept for floats by normalize_pmf
+
+NUMBER = (int, float)
+COLOR = 'color' # An [r, g, b] list of ints 0-255
+
+# Level properties in saved order: name -> (allowed types, expected).
+# Missing expected properties only warn, since the game falls back to defaults.
+PROPERTY_FIELDS = {
+    'name': (str, True),
+    'width': (int, True),
+    'height': (int, True),
+    'background_color': (COLOR, False),
+    'bounce_walls': (bool, False),
+    'use_goals': (bool, False),
+    'can_spawn_obstacles': (bool, False),
+    'can_spawn_powerups': (bool, False),
+    'can_spawn_ghosts': (bool, False),
+    'level_music': ((str, type(None)), False),
+    'level_background': ((str, type(None)), False),
+    'has_lighting': (bool, False),
+    'lighting_level': (int, False),
+}
+
+# Object fields in saved order (the nested 'properties' dict goes last): name -> allowed types
+OBJECT_FIELDS = {
+    'id': int,
+    'type': str,
+    'x': NUMBER,
+    'y': NUMBER,
+    'width': NUMBER,
+    'height': NUMBER,
+    'size': NUMBER,
+    'radius': NUMBER,
+    'base_radius': NUMBER,
+    'top_radius': NUMBER,
+    'speed': NUMBER,
+    'is_left': bool,
+    'is_bottom': bool,
+    'target_id': (int, type(None)),
+    'image_path': str,
+    'properties': dict,
+}
+
+# Object types the LevelCompiler creates, with the fields it can't do without.
+# Objects missing one of these are skipped in-game.
+OBJECT_TYPES = {
+    'paddle_spawn': ('x', 'y', 'width', 'height'),
+    'manhole': ('x', 'y', 'width', 'height'),
+    'bumper': ('x', 'y', 'width', 'height'),
+    'obstacle': ('x', 'y', 'width', 'height'),
+    'roulette_spinner': ('x', 'y', 'width', 'height'),
+    'powerup_ball_duplicator': ('x', 'y', 'width', 'height'),
+    'portal': ('x', 'y', 'width', 'height', 'target_id'),
+    'piston': ('x', 'y', 'width', 'height'),
+    'tesla_coil': ('x', 'y', 'height'),
+    'sprite': ('x', 'y', 'width', 'height', 'image_path'),
+    'candle': ('x', 'y', 'width', 'height'),
+    'ghost': ('x', 'y', 'width', 'height'),
+    'pickles': ('x', 'y', 'width', 'height'),
+}
+
+# Older type names -> (current type, fields implied by the old name)
+RENAMED_OBJECT_TYPES = {
+    'paddle_spawn_left': ('paddle_spawn', {'is_left': True}),
+    'paddle_spawn_right': ('paddle_spawn', {'is_left': False}),
+}
+
+
+# --- Migration ---
+def migrate_pmf(data: Dict) -> List[str]:
+    """
+    Rewrite older field names and layouts in place to the current schema.
+
+    Returns:
+        list: A description of each change made (empty if the data was current).
+    """
+    changes = []
+    if not isinstance(data, dict):
+        return changes
+    properties = data.get('properties')
+    if isinstance(properties, dict):
+        if 'level_name' in properties:
+            name = properties.pop('level_name')
+            if 'name' not in properties:
+                properties['name'] = name
+                changes.append("properties: 'level_name' renamed to 'name'")
+            else:
+                changes.append("properties: dropped 'level_name' (superseded by 'name')")
+        dimensions = properties.get('dimensions')
+        if isinstance(dimensions, (list, tuple)) and len(dimensions) == 2:
+            properties.setdefault('width', dimensions[0])
+            properties.setdefault('height', dimensions[1])
+            del properties['dimensions']
+            changes.append("properties: 'dimensions' split into 'width' and 'height'")
+
+    for key in ('objects', 'sprites'):
+        objects = data.get(key)
+        if not isinstance(objects, list):
+            continue
+        for index, obj in enumerate(objects):
+            if not isinstance(obj, dict):
+                continue
+            renamed = RENAMED_OBJECT_TYPES.get(obj.get('type'))
+            if renamed:
+                new_type, implied = renamed
+                changes.append(f"{key}[{index}]: type '{obj['type']}' renamed to '{new_type}'")
+                obj['type'] = new_type
+                for field, value in implied.items():
+                    obj.setdefault(field, value)
+            nested = obj.get('properties')
+            if obj.get('type') == 'paddle_spawn' and isinstance(nested, dict) and 'is_left' in nested:
+                # The editor keeps the paddle side at the top level, like the other object flags
+                is_left = nested.pop('is_left')
+                obj.setdefault('is_left', is_left)
+                changes.append(f"{key}[{index}]: 'properties.is_left' moved to 'is_left'")
+    return changes
+
+
+# --- Validation ---
+def _type_ok(value, allowed) -> bool:
+    if allowed == COLOR:
+        return (isinstance(value, (list, tuple)) and len(value) == 3
+                and all(isinstance(v, int) and not isinstance(v, bool) and 0 <= v <= 255 for v in value))
+    if isinstance(value, bool):
+        # bool is an int subclass; only accept it where a bool is declared
+        return allowed is bool or (isinstance(allowed, tuple) and bool in allowed)
+    return isinstance(value, allowed)
+
+
+def _type_name(allowed) -> str:
+    if allowed == COLOR:
+        return "[r, g, b]"
+    if isinstance(allowed, tuple):
+        return " or ".join(_type_name(t) for t in allowed)
+    return 'null' if allowed is type(None) else allowed.__name__
+
+
+def validate_pmf(data: Any) -> Tuple[List[str], List[str]]:
+    """
+    Check PMF data (after migrate_pmf) against the schema.
+
+    Returns:
+        tuple: (errors, warnings). Errors make the file unusable as a level;
+               warnings are problems the game works around, usually by
+               skipping an object.
+    """
+    errors, warnings = [], []
+    if not isinstance(data, dict):
+        return [f"root must be an object, not {type(data).__name__}"], warnings
+
+    properties = data.get('properties')
+    if properties is None:
+        warnings.append("missing 'properties' (the game uses defaults)")
+        properties = {}
+    elif not isinstance(properties, dict):
+        errors.append("'properties' must be an object")
+        properties = {}
+    for field, (allowed, expected) in PROPERTY_FIELDS.items():
+        if field not in properties:
+            if expected:
+                warnings.append(f"properties: missing '{field}' (the game uses a default)")
+            continue
+        if not _type_ok(properties[field], allowed):
+            errors.append(f"properties.{field}: expected {_type_name(allowed)}, got {properties[field]!r}")
+    for field in ('width', 'height'):
+        value = properties.get(field)
+        if _type_ok(value, int) and value <= 0:
+            errors.append(f"properties.{field}: must be positive, got {value}")
+    lighting = properties.get('lighting_level')
+    if _type_ok(lighting, int) and not 0 <= lighting <= 100:
+        errors.append(f"properties.lighting_level: must be 0-100, got {lighting}")
+    for field in properties:
+        if field not in PROPERTY_FIELDS:
+            warnings.append(f"properties: unknown field '{field}'")
+
+    all_objects = []
+    for key in ('objects', 'sprites'):
+        if key not in data:
+            if key == 'objects':
+                warnings.append("missing 'objects' list (the level is empty)")
+            continue
+        if not isinstance(data[key], list):
+            errors.append(f"'{key}' must be a list")
+            continue
+        for index, obj in enumerate(data[key]):
+            where = f"{key}[{index}]"
+            if not isinstance(obj, dict):
+                errors.append(f"{where}: must be an object")
+                continue
+            all_objects.append((where, obj))
+
+    ids = {}
+    for where, obj in all_objects:
+        for field, allowed in OBJECT_FIELDS.items():
+            if field in obj and not _type_ok(obj[field], allowed):
+                errors.append(f"{where}.{field}: expected {_type_name(allowed)}, got {obj[field]!r}")
+        obj_type = obj.get('type')
+        if obj_type is None:
+            errors.append(f"{where}: missing 'type'")
+        elif obj_type not in OBJECT_TYPES:
+            warnings.append(f"{where}: unknown type '{obj_type}' (ignored by the game)")
+        else:
+            missing = [field for field in OBJECT_TYPES[obj_type] if obj.get(field) is None]
+            if missing:
+                warnings.append(f"{where} ({obj_type}): missing {', '.join(missing)} (skipped by the game)")
+        obj_id = obj.get('id')
+        if obj_id is not None:
+            if obj_id in ids:
+                errors.append(f"{where}: duplicate id {obj_id} (also {ids[obj_id]})")
+            else:
+                ids[obj_id] = where
+
+    for where, obj in all_objects:
+        target_id = obj.get('target_id')
+        if obj.get('type') == 'portal' and target_id is not None and target_id not in ids:
+            warnings.append(f"{where}: portal target_id {target_id} doesn't match any object")
+    return errors, warnings
+
+
+# --- Normalization ---
+def _normalize_value(value):
+    if isinstance(value, float):
+        return round(value, FLOAT_PRECISION)
+    if isinstance(value, dict):
+        return {key: _normalize_value(value[key]) for key in sorted(value)}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_value(item) for item in value]
+    return value
+
+
+def _ordered(mapping: Dict, field_order) -> Dict:
+    """Known fields in schema order, then any others in their existing order."""
+    result = {field: _normalize_value(mapping[field]) for field in field_order if field in mapping}
+    for field, value in mapping.items():
+        if field not in result:
+            result[field] = _normalize_value(value)
+    return result
+
+
+def normalize_pmf(data: Dict) -> Dict:
+    """
+    Return a copy of PMF data with a stable layout: top-level sections, level
+    properties and object fields in schema order, nested dicts sorted by key,
+    and floats rounded to FLOAT_PRECISION. Saving normalized data makes
+    re-saved levels diff cleanly.
+    """
+    result = {}
+    if isinstance(data.get('properties'), dict):
+        result['properties'] = _ordered(data['properties'], PROPERTY_FIELDS)
+    for key in ('objects', 'sprites'):
+        if isinstance(data.get(key), list):
+            result[key] = [_ordered(obj, OBJECT_FIELDS) if isinstance(obj, dict) else obj for obj in data[key]]
+    for key, value in data.items():
+        if key not in result:
+            result[key] = _normalize_value(value)
+    return result
+
+
+def dumps_pmf(data: Dict) -> str:
+    """Serialize PMF data the way the editor saves it."""
+    return json.dumps(data, indent=4) + "\n"
+
+
+# --- Loading ---
+def load_pmf_data(file_path: str) -> Tuple[Dict, List[str], List[str]]:
+    """
+    Load a .pmf file, migrate it and validate it.
+
+    Returns:
+        tuple: (data, changes, warnings), changes as listed by migrate_pmf.
+
+    Raises:
+        OSError: If the file can't be read.
+        ValueError: If the file isn't valid JSON or fails validation (the
+                    message lists every error).
+    """
+    with open(file_path, 'r') as f:
+        data = json.load(f) # json.JSONDecodeError is a ValueError
+    changes = migrate_pmf(data)
+    errors, warnings = validate_pmf(data)
+    if errors:
+        raise ValueError(f"Invalid PMF file {file_path}:\n  " + "\n  ".join(errors))
+    return data, changes, warnings
+
+
+# --- Batch Tool ---
+def check_file(file_path: str, write: bool = False) -> Dict:
+    """Load, migrate, validate and normalize one file. Returns a JSON-ready report row."""
+    row = {'file': file_path, 'errors': [], 'warnings': [], 'changes': [], 'rewritten': False}
+    start = time.perf_counter()
+    try:
+        with open(file_path, 'r') as f:
+            text = f.read()
+        data = json.loads(text)
+    except (OSError, ValueError) as e:
+        row['errors'].append(str(e))
+        row['load_ms'] = (time.perf_counter() - start) * 1000
+        return row
+    loaded = time.perf_counter()
+    row['changes'] = migrate_pmf(data)
+    row['errors'], row['warnings'] = validate_pmf(data)
+    row['load_ms'] = (loaded - start) * 1000
+    row['validate_ms'] = (time.perf_counter() - loaded) * 1000
+    if not row['errors'] and isinstance(data, dict):
+        normalized = dumps_pmf(normalize_pmf(data))
+        row['normalized'] = normalized == text
+        if write and normalized != text:
+            atomic_write_text(file_path, normalized)
+            row['rewritten'] = True
+    return row
+
+
+def check_files(files: List[str], write: bool = False, jobs: int = 0) -> List[Dict]:
+    """Check files in parallel worker processes (jobs=0 uses one per CPU, 1 runs in-process)."""
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(files) < 2:
+        return [check_file(path, write) for path in files]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(files))) as executor:
+        return list(executor.map(check_file, files, [write] * len(files)))
+
+
+def discover_pmf_files(paths: List[str]) -> List[str]:
+    """Every .pmf file in the given files and directories (searched recursively), sorted."""
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            files.update(glob.glob(os.path.join(path, "**", "*.pmf"), recursive=True))
+        else:
+            files.add(path)
+    return sorted(os.path.abspath(path) for path in files)
+
+
+def main(argv=None) -> int:
+    default_dir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                "..", "..", "Ping Assets", "Levels"))
+    parser = argparse.ArgumentParser(description="Validate, migrate and normalize Ping .pmf level files.")
+    parser.add_argument('paths', nargs='*', default=[default_dir],
+                        help="PMF files or directories to search (default: Ping Assets/Levels)")
+    parser.add_argument('--write', action='store_true',
+                        help="Rewrite valid files that aren't migrated and normalized")
+    parser.add_argument('--strict', action='store_true', help="Fail on warnings as well as errors")
+    parser.add_argument('--jobs', type=int, default=0, help="Worker processes (default: one per CPU)")
+    parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    files = discover_pmf_files(args.paths)
+    if not files:
+        print("Error: No PMF files found", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    rows = check_files(files, args.write, args.jobs)
+    total_ms = (time.perf_counter() - start) * 1000
+
+    if args.json:
+        print(json.dumps({'files': rows, 'total_ms': total_ms}, indent=2))
+    else:
+        for row in rows:
+            status = "ERROR" if row['errors'] else "WARN" if row['warnings'] else "OK"
+            notes = []
+            if row['changes']:
+                notes.append(f"{len(row['changes'])} migration(s)")
+            if row.get('normalized') is False:
+                notes.append("rewritten" if row['rewritten'] else "not normalized")
+            timing = f"{row['load_ms']:7.2f} ms load"
+            if 'validate_ms' in row:
+                timing += f", {row['validate_ms']:6.2f} ms check"
+            print(f"{status:<5} {os.path.basename(row['file']):<32} {timing}  {'; '.join(notes)}")
+            for message in row['errors']:
+                print(f"      error: {message}")
+            for message in row['warnings']:
+                print(f"      warning: {message}")
+            for message in row['changes']:
+                print(f"      migrate: {message}")
+        print(f"{len(rows)} file(s) checked in {total_ms:.1f} ms")
+
+    if any(row['errors'] for row in rows):
+        return 1
+    if args.strict and any(row['warnings'] for row in rows):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+Ping Persistence Module
+Crash-safe, debounced saving of JSON save files on a background thread.
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+def dumps_compact(data: Any) -> str:
+    """Serialize data to compact JSON (no indentation, so the C encoder is used)."""
+    return json.dumps(data, separators=(',', ':'))
+
+
+def atomic_write_text(path: str, text: str):
+    """
+    Write text to path atomically.
+
+    The text goes to a temporary file in the same directory, which is flushed to disk
+    and then swapped in with os.replace, so a crash mid-write leaves the previous
+    save intact instead of a truncated file.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_json(path: str, data: Any):
+    """Serialize data compactly and write it atomically."""
+    atomic_write_text(path, dumps_compact(data))
+
+
+class PersistenceWriter:
+    """
+    Background writer that coalesces saves per file.
+
+    save() serializes on the caller's thread (so later mutations can't race the
+    writer) and returns immediately. The file is written once no newer save for it
+    has arrived for debounce_seconds; a burst of saves results in a single write of
+    the latest data.
+    """
+
+    def __init__(self, debounce_seconds: float = 0.25):
+        self.debounce_seconds = debounce_seconds
+        self._pending: Dict[str, tuple] = {}  # path -> (serialized text, time scheduled, callbacks)
+        self._writing: Optional[str] = None
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopped = False
+
+        # Counters
+        self.saves_requested = 0
+        self.writes_completed = 0
+        self.writes_failed = 0
+
+    def save(self, path: str, data: Any, on_done: Optional[Callable[[bool], None]] = None):
+        """
+        Queue data to be written to path, replacing any pending save for the same file.
+
+        Args:
+            path (str): File to write.
+            data: JSON-serializable data, serialized before this call returns.
+            on_done (callable, optional): Called (on the writer thread) with True once this
+                                          data, or newer data for the same file, is on disk,
+                                          or with False if that write failed.
+
+        Raises:
+            TypeError, ValueError: If data can't be serialized (nothing is queued).
+        """
+        text = dumps_compact(data)
+        with self._condition:
+            self.saves_requested += 1
+            callbacks = self._pending[path][2] if path in self._pending else []
+            if on_done is not None:
+                callbacks.append(on_done)
+            self._pending[path] = (text, time.monotonic(), callbacks)
+            if self._stopped:
+                # Late save during shutdown, write it straight away
+                self._write_pending_locked()
+                return
+            self._ensure_thread_locked()
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every pending save has been written.
+
+        Returns:
+            bool: True if everything was written, False if the timeout expired first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            if self._thread is None or not self._thread.is_alive():
+                # No writer running (or it died), write on this thread
+                self._write_pending_locked()
+                return True
+            # Skip the debounce for everything queued so far
+            for path, (text, _scheduled, callbacks) in self._pending.items():
+                self._pending[path] = (text, 0.0, callbacks)
+            self._condition.notify_all()
+            while self._pending or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def shutdown(self):
+        """Flush outstanding saves and stop the writer thread (registered with atexit)."""
+        self.flush()
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+
+    def has_pending(self, path: Optional[str] = None) -> bool:
+        """Check whether a save (optionally for a specific file) is still waiting to be written."""
+        with self._condition:
+            if path is None:
+                return bool(self._pending) or self._writing is not None
+            return path in self._pending or self._writing == path
+
+    def _ensure_thread_locked(self):
+        """Start the writer thread if it isn't running."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="PersistenceWriter", daemon=True)
+            self._thread.start()
+
+    def _write_pending_locked(self):
+        """Write every pending save on the current thread. Caller holds the lock."""
+        for path, (text, _scheduled, callbacks) in list(self._pending.items()):
+            del self._pending[path]
+            self._write(path, text, callbacks)
+        self._condition.notify_all()
+
+    def _write(self, path: str, text: str, callbacks):
+        """Write one file, reporting (not raising) failures like the rest of the save code."""
+        try:
+            atomic_write_text(path, text)
+            self.writes_completed += 1
+            ok = True
+        except Exception as e:
+            print(f"Error saving {os.path.basename(path)}: {e}")
+            self.writes_failed += 1
+            ok = False
+        for callback in callbacks:
+            try:
+                callback(ok)
+            except Exception as e:
+                print(f"Error in save callback for {os.path.basename(path)}: {e}")
+
+    def _run(self):
+        """Writer thread loop."""
+        with self._condition:
+            while not self._stopped:
+                if not self._pending:
+                    self._condition.wait()
+                    continue
+
+                # Pick the save whose debounce window ends first
+                now = time.monotonic()
+                path, (text, scheduled, callbacks) = min(self._pending.items(), key=lambda item: item[1][1])
+                wait_time = scheduled + self.debounce_seconds - now
+                if scheduled > 0.0 and wait_time > 0:
+                    self._condition.wait(wait_time)
+                    continue
+
+                del self._pending[path]
+                self._writing = path
+                self._condition.release()
+                try:
+                    self._write(path, text, callbacks)
+                finally:
+                    self._condition.acquire()
+                    self._writing = None
+                    self._condition.notify_all()
+
+
+# Global persistence writer instance
+_persistence_writer = None
+
+def get_persistence_writer() -> PersistenceWriter:
+    """Get or create the global persistence writer, flushed automatically on exit."""
+    global _persistence_writer
+    if _persistence_writer is None:
+        _persistence_writer = PersistenceWriter()
+        atexit.register(_persistence_writer.shutdown)
+    return _persistence_writer
@@ -0,0 +1,271 @@
+"""
+Ping Profiler Module
+Lightweight per-frame timing of named game loop scopes with a graph overlay.
+"""
+
+import time
+from collections import deque
+from typing import Dict, Optional
+
+import pygame
+
+
+# Scopes in the order they're stacked in the overlay graph
+SCOPES = ('input', 'ai', 'physics', 'obstacles', 'collision',
+          'background', 'objects', 'lighting', 'shader', 'ui', 'flip')
+
+SCOPE_COLORS = {
+    'input': (200, 200, 200),
+    'ai': (255, 120, 200),
+    'physics': (80, 160, 255),
+    'obstacles': (160, 110, 255),
+    'collision': (60, 220, 220),
+    'background': (90, 200, 90),
+    'objects': (230, 230, 80),
+    'lighting': (255, 170, 60),
+    'shader': (255, 80, 80),
+    'ui': (150, 150, 255),
+    'flip': (120, 120, 120),
+    'other': (70, 70, 70),
+}
+
+
+class _Scope:
+    """Reusable context manager timing one named scope."""
+    __slots__ = ('profiler', 'name', 'start_ns')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start_ns = 0
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.add(self.name, time.perf_counter_ns() - self.start_ns)
+        return False
+
+
+class _NullScope:
+    """Scope used while the profiler is disabled."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class FrameProfiler:
+    """
+    Accumulates time spent in named scopes each frame and keeps a rolling
+    history of the last `history` frames per scope.
+
+    Time a block with `with profiler.scope('physics'):`, or with start()/stop()
+    pairs where a block is too long to wrap. A scope entered several times in a
+    frame (e.g. inside the fixed-step loop) adds up. begin_frame() closes the
+    previous frame; time not covered by any scope is recorded as 'other'.
+    """
+
+    def __init__(self, history: int = 240, graph_height: int = 80, graph_ms: float = 33.3):
+        """
+        Args:
+            history (int): Frames kept per scope (also the graph width in pixels).
+            graph_height (int): Overlay graph height in pixels.
+            graph_ms (float): Frame time at the top of the graph.
+        """
+        self.enabled = True
+        self.overlay_visible = False
+        self.history = history
+        self.graph_height = graph_height
+        self.graph_ms = graph_ms
+
+        self._scopes: Dict[str, _Scope] = {}
+        self._current: Dict[str, int] = {}   # Scope -> ns accumulated this frame
+        self._started: Dict[str, int] = {}   # Scope -> start ns of an open start()
+        self._frame_start_ns = None
+        self.samples: Dict[str, deque] = {}  # Scope (plus 'frame' and 'other') -> ns per frame
+
+        # Overlay state
+        self._graph = None
+        self._legend = None
+        self._legend_frames = 0
+
+    def scope(self, name: str):
+        """Context manager adding the time spent inside it to the named scope."""
+        if not self.enabled:
+            return _NULL_SCOPE
+        scope = self._scopes.get(name)
+        if scope is None:
+            scope = self._scopes[name] = _Scope(self, name)
+        return scope
+
+    def start(self, name: str):
+        """Start timing a scope (pair with stop())."""
+        if self.enabled:
+            self._started[name] = time.perf_counter_ns()
+
+    def stop(self, name: str):
+        """Stop timing a scope started with start(). Unmatched stops are ignored."""
+        start_ns = self._started.pop(name, None)
+        if start_ns is not None:
+            self.add(name, time.perf_counter_ns() - start_ns)
+
+    def add(self, name: str, elapsed_ns: int):
+        """Add elapsed nanoseconds to a scope for the current frame."""
+        self._current[name] = self._current.get(name, 0) + elapsed_ns
+
+    def begin_frame(self):
+        """Close the previous frame's measurements and start a new frame."""
+        now = time.perf_counter_ns()
+        if self.enabled and self._frame_start_ns is not None:
+            frame_ns = now - self._frame_start_ns
+            scoped_ns = 0
+            for name in set(self._current).union(self.samples).difference(('frame', 'other')):
+                elapsed = self._current.get(name, 0)
+                scoped_ns += elapsed
+                self._record(name, elapsed)
+            self._record('frame', frame_ns)
+            self._record('other', max(0, frame_ns - scoped_ns))
+            if self.overlay_visible:
+                self._update_graph()
+        self._current.clear()
+        self._started.clear()
+        self._frame_start_ns = now if self.enabled else None
+
+    def _record(self, name: str, elapsed_ns: int):
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.history)
+        samples.append(elapsed_ns)
+
+    def reset(self):
+        """Forget all recorded frames."""
+        self.samples.clear()
+        self._current.clear()
+        self._started.clear()
+        self._frame_start_ns = None
+        self._graph = None
+
+    def percentiles(self, name: str, points=(50, 95, 99)) -> Optional[Dict[str, float]]:
+        """
+        Mean and percentiles of a scope over the recorded frames, in milliseconds.
+
+        Returns:
+            dict: {'mean': ms, 'p50': ms, ...}, or None if the scope has no samples.
+        """
+        samples = self.samples.get(name)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        result = {'mean': sum(ordered) / len(ordered) / 1e6}
+        for point in points:
+            index = min(len(ordered) - 1, int(round(point / 100.0 * (len(ordered) - 1))))
+            result[f"p{point}"] = ordered[index] / 1e6
+        return result
+
+    def get_summary(self) -> Dict[str, Dict[str, float]]:
+        """Percentiles of the frame and every recorded scope (SCOPES order first)."""
+        names = ['frame'] + [name for name in SCOPES if name in self.samples]
+        names += sorted(name for name in self.samples if name not in names and name != 'other')
+        names.append('other')
+        return {name: self.percentiles(name) for name in names if name in self.samples}
+
+    def toggle_overlay(self) -> bool:
+        """Show or hide the overlay graph. Returns the new state."""
+        self.overlay_visible = not self.overlay_visible
+        self._graph = None
+        return self.overlay_visible
+
+    def _update_graph(self):
+        """Scroll the graph one pixel and draw the newest frame as a stacked column."""
+        if self._graph is None:
+            self._graph = pygame.Surface((self.history, self.graph_height))
+            self._graph.fill((15, 15, 25))
+        graph = self._graph
+        graph.scroll(-1, 0)
+        x = self.history - 1
+        height = self.graph_height
+        graph.fill((15, 15, 25), (x, 0, 1, height))
+
+        px_per_ns = height / (self.graph_ms * 1e6)
+        bottom = float(height)
+        for name in SCOPES + ('other',):
+            samples = self.samples.get(name)
+            if not samples:
+                continue
+            segment = samples[-1] * px_per_ns
+            if segment <= 0:
+                continue
+            top = max(0.0, bottom - segment)
+            if int(bottom) > int(top):
+                graph.fill(SCOPE_COLORS.get(name, (255, 255, 255)), (x, int(top), 1, int(bottom) - int(top)))
+            bottom = top
+            if bottom <= 0:
+                break
+        # 60 FPS budget line
+        budget_y = height - int(16.7 * 1e6 * px_per_ns)
+        if 0 <= budget_y < height:
+            graph.set_at((x, budget_y), (255, 255, 255))
+
+    def draw_overlay(self, screen, font) -> Optional[pygame.Rect]:
+        """
+        Draw the graph and a legend with mean times in the bottom left corner.
+
+        Returns:
+            pygame.Rect: Screen area covered, or None if the overlay is hidden.
+        """
+        if not self.overlay_visible:
+            return None
+        if self._graph is None:
+            self._update_graph()
+
+        # The legend text changes slowly, re-render it twice a second
+        self._legend_frames -= 1
+        if self._legend is None or self._legend_frames <= 0:
+            self._legend = self._render_legend(font)
+            self._legend_frames = 30
+
+        legend_width, legend_height = self._legend.get_size()
+        width = self.history + 8 + legend_width
+        height = max(self.graph_height, legend_height)
+        rect = pygame.Rect(4, screen.get_height() - height - 4, width, height)
+        screen.fill((15, 15, 25), rect)
+        screen.blit(self._graph, (rect.x, rect.bottom - self.graph_height))
+        screen.blit(self._legend, (rect.x + self.history + 8, rect.y))
+        return rect
+
+    def _render_legend(self, font):
+        """Render one line per scope with its color and mean time."""
+        lines = []
+        frame = self.percentiles('frame')
+        if frame:
+            lines.append((f"frame {frame['mean']:.1f} p99 {frame['p99']:.1f} ms", (255, 255, 255)))
+        for name in SCOPES + ('other',):
+            stats = self.percentiles(name)
+            if stats and stats['mean'] >= 0.05:
+                lines.append((f"{name} {stats['mean']:.2f}", SCOPE_COLORS.get(name, (255, 255, 255))))
+        surfaces = [font.render(text, True, color) for text, color in lines] or [font.render("no samples", True, (255, 255, 255))]
+        line_height = max(surface.get_height() for surface in surfaces)
+        legend = pygame.Surface((max(surface.get_width() for surface in surfaces), line_height * len(surfaces)))
+        legend.fill((15, 15, 25))
+        for i, surface in enumerate(surfaces):
+            legend.blit(surface, (0, i * line_height))
+        return legend
+
+
+# Global profiler instance
+_profiler = None
+
+def get_profiler() -> FrameProfiler:
+    """Get or create the global frame profiler."""
+    global _profiler
+    if _profiler is None:
+        _profiler = FrameProfiler()
+    return _profiler
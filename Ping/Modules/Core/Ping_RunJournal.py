@@ -0,0 +1,128 @@
+"""
+Ping Run Journal Module
+Append-only event journal for campaign run state.
+"""
+
+import json
+import threading
+from typing import Any, Dict, List
+
+from .Ping_Persistence import atomic_write_text, dumps_compact
+
+
+class RunJournal:
+    """
+    One JSON event per line, each with an increasing sequence number.
+
+    Snapshots record the sequence number they include, so replay only applies
+    newer events and compaction can drop everything a snapshot already covers.
+    After compaction the file starts with a 'base' line carrying the sequence
+    number, so numbering keeps increasing even when no events are left.
+    """
+
+    BASE_EVENT = "base"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: List[tuple] = []  # (seq, line) for every event currently on disk
+        self._base_seq = 0
+        self._next_seq = 1
+        self._needs_newline = False  # Last line on disk was torn by a crash
+        self._loaded = False
+
+    def __len__(self):
+        with self._lock:
+            self._ensure_loaded_locked()
+            return len(self._entries)
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recent event (or base)."""
+        with self._lock:
+            self._ensure_loaded_locked()
+            return self._next_seq - 1
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Re-read the journal from disk and return its events in order."""
+        with self._lock:
+            self._loaded = False
+            self._ensure_loaded_locked()
+            return [json.loads(line) for _seq, line in self._entries]
+
+    def append(self, event_type: str, **data) -> int:
+        """
+        Append an event and return its sequence number.
+
+        The line is flushed to the OS before returning so it survives the game crashing.
+        """
+        with self._lock:
+            self._ensure_loaded_locked()
+            seq = self._next_seq
+            event = {'seq': seq, 'type': event_type}
+            event.update(data)
+            line = dumps_compact(event) + "\n"
+            with open(self.path, 'a') as f:
+                if self._needs_newline:
+                    f.write("\n")
+                    self._needs_newline = False
+                f.write(line)
+                f.flush()
+            self._entries.append((seq, line))
+            self._next_seq = seq + 1
+            return seq
+
+    def compact_to(self, seq: int):
+        """Drop every event with a sequence number up to seq (already covered by a snapshot)."""
+        with self._lock:
+            self._ensure_loaded_locked()
+            if seq <= self._base_seq and not any(entry_seq <= seq for entry_seq, _line in self._entries):
+                return
+            self._base_seq = max(self._base_seq, seq)
+            self._entries = [(entry_seq, line) for entry_seq, line in self._entries if entry_seq > seq]
+            header = dumps_compact({'seq': self._base_seq, 'type': self.BASE_EVENT}) + "\n"
+            atomic_write_text(self.path, header + "".join(line for _seq, line in self._entries))
+            self._needs_newline = False
+
+    def _ensure_loaded_locked(self):
+        """Read the file once to learn the existing events and the next sequence number."""
+        if self._loaded:
+            return
+        self._loaded = True
+        self._entries = []
+        self._base_seq = 0
+        self._needs_newline = False
+        try:
+            with open(self.path, 'r') as f:
+                content = f.read()
+        except FileNotFoundError:
+            content = ""
+        except Exception as e:
+            print(f"Error reading run journal: {e}")
+            content = ""
+
+        if content and not content.endswith("\n"):
+            self._needs_newline = True
+
+        for raw_line in content.splitlines():
+            if not raw_line.strip():
+                continue
+            try:
+                event = json.loads(raw_line)
+                seq = int(event['seq'])
+            except (ValueError, KeyError, TypeError):
+                # A torn write at the end of the file, skip it
+                continue
+            if event.get('type') == self.BASE_EVENT:
+                self._base_seq = max(self._base_seq, seq)
+            else:
+                self._entries.append((seq, raw_line + "\n"))
+
+        highest = max([self._base_seq] + [seq for seq, _line in self._entries])
+        self._next_seq = max(self._next_seq, highest + 1)
+
+    def ensure_seq_after(self, seq: int):
+        """Make sure new events are numbered after seq (e.g. a snapshot's sequence number)."""
+        with self._lock:
+            self._ensure_loaded_locked()
+            self._next_seq = max(self._next_seq, seq + 1)
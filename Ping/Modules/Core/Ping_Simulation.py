@@ -0,0 +1,177 @@
+"""
+Ping Simulation Module
+Fixed-step AI matches on a level without input or sound, shared by the
+benchmark and the Artemis editor's play preview.
+"""
+
+import random
+
+import numpy as np
+
+from Ping.Modules.Core.Ping_MCompile import LevelCompiler
+from Ping.Modules.Objects.Ping_Ball import Ball
+from Ping.Modules.Objects.Ping_GameObjects import PaddleObject, BallObject, ObstacleObject
+from Ping.Modules.Objects.Ping_Obstacles import RouletteSpinner, PistonObstacle, TeslaCoilObstacle
+from Ping.Modules.AI.Ping_AI import PaddleAI
+from Ping.Modules.Graphics.UI.Ping_Fonts import get_pixel_font
+
+
+# Same values as the game loop in ping_base
+PADDLE_WIDTH = 40
+PADDLE_HEIGHT = 120
+BALL_SIZE = 20
+FRAME_TIME = 1.0 / 60.0
+
+
+class ScriptedMatch:
+    """
+    A deterministic AI-vs-scripted-paddle match on one level.
+
+    The level can be a .pmf path or PMF data already in memory (see LevelCompiler).
+
+    The right paddle is the game's PaddleAI, the left paddle tracks the ball.
+    step() runs one fixed simulation step following the game loop in ping_base
+    (minus sound and input); draw() renders the frame through the level compiler.
+    """
+
+    def __init__(self, level_source, screen, seed: int, shader: bool, player_names=("Bench A", "Bench B"),
+                 dirty_rects: bool = False):
+        random.seed(seed)
+        np.random.seed(seed)
+        self.screen = screen
+        self.player_names = player_names
+        self.arena = LevelCompiler(level_source)
+        arena = self.arena
+        width, height = screen.get_size()
+        arena.update_scaling(width, height)
+        arena.initialize_scoreboard()
+        # Pin everything the settings file would otherwise decide
+        arena.shader_override = shader
+        arena.set_render_resolution_mode('native')
+        arena.set_dynamic_resolution_enabled(False)
+        arena.dirty_rects_enabled = dirty_rects
+
+        self.paddle_a = PaddleObject(60, (arena.height - PADDLE_HEIGHT) // 2, PADDLE_WIDTH, PADDLE_HEIGHT,
+                                     arena.width, arena.height, arena.scoreboard_height, arena.scale_rect, True)
+        self.paddle_b = PaddleObject(arena.width - 100, (arena.height - PADDLE_HEIGHT) // 2, PADDLE_WIDTH, PADDLE_HEIGHT,
+                                     arena.width, arena.height, arena.scoreboard_height, arena.scale_rect, False)
+        self.paddle_ai = PaddleAI(arena)
+        self.balls = [self._new_ball()]
+        self.score_a = 0
+        self.score_b = 0
+        self.respawn_timer = None
+        self.font = get_pixel_font(max(12, int(28 * arena.scale_y)))
+
+    def _new_ball(self):
+        ball = BallObject(arena_width=self.arena.width, arena_height=self.arena.height,
+                          scoreboard_height=self.arena.scoreboard_height,
+                          scale_rect=self.arena.scale_rect, size=BALL_SIZE)
+        ball.reset_position()
+        return ball
+
+    def step(self):
+        """Advance the match by one fixed time step."""
+        arena = self.arena
+        balls = self.balls
+        ball = balls[0]
+        ball_frozen = self.respawn_timer is not None
+
+        # Left paddle follows the ball, right paddle is the game AI
+        paddle_a = self.paddle_a
+        paddle_a.moving_up = ball.rect.centery < paddle_a.rect.centery - 10
+        paddle_a.moving_down = ball.rect.centery > paddle_a.rect.centery + 10
+        paddle_a.move(FRAME_TIME)
+        self.paddle_b.rect.y = self.paddle_ai.move_paddle(
+            ball.rect.x, ball.rect.y, ball.ball.velocity_x, ball.ball.velocity_y,
+            self.paddle_b.rect.y, self.paddle_b.speed * FRAME_TIME, ball_frozen,
+            all_balls=balls, score_ai=self.score_b, score_opponent=self.score_a, frame_time=FRAME_TIME)
+
+        if self.respawn_timer is not None:
+            self.respawn_timer -= FRAME_TIME
+            if self.respawn_timer <= 0:
+                self.respawn_timer = None
+
+        if arena.can_spawn_powerups and arena.power_up:
+            arena.update_power_up(len(balls))
+        if arena.manholes:
+            arena.update_manholes(FRAME_TIME)
+        for obstacle in arena.obstacles:
+            if isinstance(obstacle, (RouletteSpinner, PistonObstacle)):
+                obstacle.update(FRAME_TIME)
+            elif isinstance(obstacle, TeslaCoilObstacle):
+                obstacle.update(FRAME_TIME, arena.scale)
+        if hasattr(arena, 'update_ghosts'):
+            arena.update_ghosts(FRAME_TIME, ball)
+
+        scored = None
+        for current_ball in list(balls):
+            if not ball_frozen:
+                current_ball.move(FRAME_TIME)
+                current_ball.handle_wall_collision()
+            current_ball.handle_paddle_collision(self.paddle_a)
+            current_ball.handle_paddle_collision(self.paddle_b)
+
+            for i, obstacle in enumerate(arena.obstacles):
+                if isinstance(obstacle, RouletteSpinner):
+                    if obstacle.handle_collision(current_ball):
+                        break
+                elif hasattr(obstacle, 'handle_collision') and obstacle.handle_collision(current_ball, None):
+                    if isinstance(obstacle, ObstacleObject):
+                        # Breakable walls stay broken for the rest of the run
+                        arena.obstacles.pop(i)
+                    break
+
+            arena.check_portal_collisions(current_ball)
+            arena.check_manhole_collisions(current_ball)
+            for bumper in arena.bumpers:
+                bumper.handle_collision(current_ball, None)
+            for ghost_obj in getattr(arena, 'ghost_obstacles', []):
+                ghost_obj.handle_collision(current_ball)
+
+            new_ball = arena.check_power_up_collision(current_ball, len(balls))
+            if isinstance(new_ball, Ball):
+                balls.append(BallObject(arena_width=arena.width, arena_height=arena.height,
+                                        scoreboard_height=arena.scoreboard_height, scale_rect=arena.scale_rect,
+                                        size=new_ball.size,
+                                        initial_state={'x': new_ball.rect.x, 'y': new_ball.rect.y,
+                                                       'dx': new_ball.dx, 'dy': new_ball.dy, 'speed': new_ball.speed,
+                                                       'velocity_x': new_ball.velocity_x, 'velocity_y': new_ball.velocity_y}))
+
+            current_ball.handle_wall_collision(bounce_walls=arena.bounce_walls)
+            if arena.use_goals:
+                ball_scored = arena.check_goal_collisions(current_ball)
+            elif not arena.bounce_walls:
+                ball_scored = current_ball.handle_scoring()
+            else:
+                ball_scored = None
+            if ball_scored:
+                scored = ball_scored
+                balls.remove(current_ball)
+
+        if scored:
+            if scored == "right":
+                self.score_b += 1
+            else:
+                self.score_a += 1
+            # Restart with a single ball after a two second pause, like the game
+            self.balls = [self._new_ball()]
+            self.paddle_ai.reset_position()
+            self.respawn_timer = 2.0
+        elif not balls:
+            self.balls = [self._new_ball()]
+
+    def draw(self):
+        """Render one frame the way the game loop does (dirty rects only if the match was created with them)."""
+        arena = self.arena
+        arena.dt = FRAME_TIME
+        game_objects = [self.paddle_a, self.paddle_b] + self.balls
+        name_a, name_b = self.player_names
+        if arena.dirty_rects_enabled:
+            arena.draw_dirty(self.screen, game_objects, self.font, name_a, self.score_a,
+                             name_b, self.score_b, self.respawn_timer, False)
+        else:
+            arena.draw(self.screen, game_objects, self.font, name_a, self.score_a,
+                       name_b, self.score_b, self.respawn_timer, False)
+
+    def close(self):
+        self.arena.stop_background_threads()
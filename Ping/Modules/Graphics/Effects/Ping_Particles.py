@@ -1,6 +1,26 @@
 import pygame
 import random
 import math
+from ..Ping_RenderQueue import get_render_queue, LAYER_EFFECTS
+
+# Pre-drawn particle sprites keyed by (diameter, color, alpha step). Alpha is
+# quantized so fading particles share a handful of surfaces, which lets a whole
+# spout be queued as one batch without a fresh surface per particle.
+_PARTICLE_ALPHA_STEPS = 16
+_particle_surfaces = {}
+
+def _get_particle_surface(diameter, color, alpha):
+    """Return a cached circle sprite for the given diameter, color and alpha."""
+    alpha_step = max(0, min(_PARTICLE_ALPHA_STEPS, round(alpha * _PARTICLE_ALPHA_STEPS / 255)))
+    key = (diameter, color, alpha_step)
+    surface = _particle_surfaces.get(key)
+    if surface is None:
+        surface = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+        radius = diameter / 2
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        surface.set_alpha(alpha_step * 255 // _PARTICLE_ALPHA_STEPS)
+        _particle_surfaces[key] = surface
+    return surface
 
 class Particle:
     """Individual particle for effects like water."""
@@ -26,18 +46,12 @@ class Particle:
 
     def draw(self, screen, scale_rect):
         """Draw the particle with proper scaling."""
-        # Create surface and draw particle
-        particle_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
         alpha = int(255 * (self.lifetime / self.max_lifetime))
-        # Create color with alpha
-        r, g, b = self.color
-        pygame.draw.circle(particle_surface, (r, g, b), (self.size, self.size), self.size)
-        # Apply alpha to the whole surface
-        particle_surface.set_alpha(alpha)
-        
+        particle_surface = _get_particle_surface(int(self.size * 2), self.color, alpha)
+
         # Scale and position the particle
         scaled_pos = scale_rect(pygame.Rect(self.x, self.y, self.size * 2, self.size * 2))
-        screen.blit(particle_surface, scaled_pos)
+        get_render_queue().submit(screen, LAYER_EFFECTS, particle_surface, scaled_pos)
     
     @property
     def is_alive(self):
@@ -103,7 +117,19 @@ class WaterSpout:
         particle = Particle(x, y, velocity_x, velocity_y, lifetime, size, color, gravity_scale)
         self.particles.append(particle)
     
+    def get_bounds(self, scale_rect):
+        """Screen-space rect covering all live particles, or None if there are none."""
+        bounds = None
+        for particle in self.particles:
+            size = int(particle.size * 2) + 1
+            particle_rect = scale_rect(pygame.Rect(particle.x, particle.y, size, size)).inflate(size, size)
+            if bounds is None:
+                bounds = particle_rect
+            else:
+                bounds.union_ip(particle_rect)
+        return bounds
+
     def draw(self, screen, scale_rect):
-        """Draw all particles."""
+        """Draw all particles (queued on LAYER_EFFECTS, so above all arena objects while batching)."""
         for particle in self.particles:
             particle.draw(screen, scale_rect)
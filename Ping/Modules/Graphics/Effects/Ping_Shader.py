@@ -2,11 +2,10 @@ import pygame
 import time
 import numpy as np # Use 'np' convention
 import atexit
-import logging
+from Ping.Modules.Core.Ping_Logging import get_logger
 
 # --- Configuration ---
-# Set up basic logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = get_logger("shader")
 
 # Track if numpy/surfarray is available (essential for this version)
 _has_numpy = False
@@ -17,7 +16,7 @@ try:
     _has_numpy = True
     del _test_surf, _test_arr
 except (ImportError, AttributeError, pygame.error) as e:
-    logging.error(f"Critical Error: numpy and/or pygame.surfarray not functional: {e}")
+    logger.error(f"Critical Error: numpy and/or pygame.surfarray not functional: {e}")
     # This shader heavily relies on numpy, so we might want to raise an error
     # or provide a clear message that it won't work.
     # For now, we'll let it proceed but it will likely fail later.
@@ -49,7 +48,7 @@ def reset_shader_stats():
     """Reset performance counters."""
     global _shader_stats
     _shader_stats = {k: 0.0 if isinstance(v, float) else 0 for k, v in _shader_stats.items()}
-    logging.info("Shader stats reset.")
+    logger.info("Shader stats reset.")
 
 # Register reset at exit (optional, good for long sessions)
 atexit.register(reset_shader_stats)
@@ -77,7 +76,7 @@ class PixelShader:
         """
         if not _has_numpy:
             # Log error and disable shader if numpy isn't working
-            logging.error("PixelShader disabled: numpy/surfarray unavailable or failed initialization.")
+            logger.error("PixelShader disabled: numpy/surfarray unavailable or failed initialization.")
             self._enabled = False
             return
         self._enabled = True
@@ -100,7 +99,7 @@ class PixelShader:
         # Initialize color tables
         self._update_color_tables()
 
-        logging.info(f"PixelShader initialized (numpy enabled: {_has_numpy})")
+        logger.info(f"PixelShader initialized (numpy enabled: {_has_numpy})")
 
     def configure(self, **kwargs):
         """
@@ -135,7 +134,7 @@ class PixelShader:
         if color_params_changed:
             self._needs_table_update = True
             # No need to call _update_color_tables here, apply_to_surface will do it.
-            logging.debug("Shader color parameters changed, tables will update on next apply.")
+            logger.debug("Shader color parameters changed, tables will update on next apply.")
 
     def _update_color_tables(self):
         """Initialize or update lookup tables for color enhancement using numpy."""
@@ -159,10 +158,10 @@ class PixelShader:
             self._sharpness_table = np.clip(sharpness_adj, 0, 255).astype(np.uint8)
 
             self._needs_table_update = False
-            logging.debug("Color lookup tables updated.")
+            logger.debug("Color lookup tables updated.")
             return True
         except Exception as e:
-            logging.error(f"Failed to create color tables: {e}")
+            logger.error(f"Failed to create color tables: {e}")
             _shader_stats['errors'] += 1
             # Use identity tables as fallback
             self._contrast_table = np.arange(256, dtype=np.uint8)
@@ -173,7 +172,7 @@ class PixelShader:
     def _enhance_color_batch(self, colors_rgb):
         """Enhance a batch of RGB colors using lookup tables."""
         if self._contrast_table is None or self._sharpness_table is None:
-            logging.warning("Color tables not initialized, skipping enhancement.")
+            logger.warning("Color tables not initialized, skipping enhancement.")
             return colors_rgb # Return original if tables failed
 
         # Apply contrast then sharpness using the tables
@@ -189,21 +188,22 @@ class PixelShader:
                 # Create new cache surface with SRCALPHA for transparency
                 self._cached_result_surface = pygame.Surface((width, height), pygame.SRCALPHA)
                 self._cached_surface_size = (width, height)
-                logging.debug(f"Shader cache resized to {width}x{height}")
+                logger.debug(f"Shader cache resized to {width}x{height}")
             except Exception as e:
-                logging.error(f"Failed to create cache surface: {e}")
+                logger.error(f"Failed to create cache surface: {e}")
                 _shader_stats['errors'] += 1
                 self._cached_result_surface = None
                 self._cached_surface_size = (0, 0)
                 return False
         return True
 
-    def apply_to_surface(self, surface):
+    def apply_to_surface(self, surface, pixel_size=None):
         """
         Apply the pixel art effect to the input surface.
 
         Args:
             surface (pygame.Surface): The surface to process.
+            pixel_size (int, optional): Block size for this call only, overriding the configured one.
 
         Returns:
             pygame.Surface: The processed surface (or the original if disabled/error).
@@ -214,10 +214,11 @@ class PixelShader:
             return surface # Return original if shader is disabled
 
         width, height = surface.get_width(), surface.get_height()
+        ps = max(1, int(pixel_size)) if pixel_size else self.pixel_size
 
         # Basic checks
-        if width < self.pixel_size or height < self.pixel_size:
-            logging.warning("Surface too small for pixel size, skipping shader.")
+        if width < ps or height < ps:
+            logger.warning("Surface too small for pixel size, skipping shader.")
             return surface # Not worth processing
 
         # Ensure color tables are up-to-date
@@ -226,7 +227,7 @@ class PixelShader:
 
         # Ensure cache is ready
         if not self._init_cache(width, height) or not self._cached_result_surface:
-            logging.error("Cache initialization failed, returning original surface.")
+            logger.error("Cache initialization failed, returning original surface.")
             return surface
 
         process_start_time = time.perf_counter()
@@ -247,7 +248,6 @@ class PixelShader:
             result_alpha = np.zeros_like(alpha)
 
             # --- Block Processing ---
-            ps = self.pixel_size
             for y in range(0, height, ps):
                 for x in range(0, width, ps):
                     # Define block boundaries, clamping to surface edges
@@ -341,7 +341,7 @@ class PixelShader:
 
             # Log performance warning if processing takes too long
             if process_time > 0.05: # 50ms threshold
-                 logging.warning(f"Shader processing took {process_time*1000:.2f} ms")
+                 logger.warning(f"Shader processing took {process_time*1000:.2f} ms")
 
             apply_time = time.perf_counter() - apply_start_time
             _shader_stats['last_apply_time'] = apply_time
@@ -349,10 +349,10 @@ class PixelShader:
             return self._cached_result_surface # Return the processed cache
 
         except Exception as e:
-            logging.exception(f"Error applying shader: {e}") # Log full traceback
+            logger.exception(f"Error applying shader: {e}") # Log full traceback
             _shader_stats['errors'] += 1
             self._enabled = False # Disable shader on critical error to prevent spam
-            logging.error("Disabling PixelShader due to error.")
+            logger.error("Disabling PixelShader due to error.")
             return surface # Return original surface on error
 
 
@@ -375,7 +375,7 @@ def get_shader(preset='default', **kwargs):
     """
     global _shader_instances
     if preset not in _shader_instances:
-        logging.info(f"Creating new PixelShader instance for preset '{preset}' with options: {kwargs}")
+        logger.info(f"Creating new PixelShader instance for preset '{preset}' with options: {kwargs}")
         _shader_instances[preset] = PixelShader(**kwargs)
     # Note: Subsequent calls with the same preset name ignore kwargs.
     # Use the configure() method on the returned instance to change settings later.
@@ -384,7 +384,7 @@ def get_shader(preset='default', **kwargs):
 def cleanup_shaders():
     """Explicitly clear shader instances (optional)."""
     global _shader_instances
-    logging.info("Cleaning up shader instances.")
+    logger.info("Cleaning up shader instances.")
     # Help garbage collection by removing references
     # No explicit shutdown needed for this version as there are no threads.
     _shader_instances.clear()
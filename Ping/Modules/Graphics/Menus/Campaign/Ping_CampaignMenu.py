@@ -105,7 +105,7 @@ class IndustrialSteamParticle:
 
 class CampaignMenu:
     def __init__(self, sound_manager):
-        self.options = ["Start New Run", "Continue Run", "Back to Title"]
+        self.options = ["Start New Run", "Procedural Run", "Continue Run", "Back to Title"]
         self.selected_option = 0
         self.button = get_button()
         self.sound_manager = sound_manager
@@ -878,6 +878,10 @@ class CampaignMenu:
                         # Initialize new map tree run
                         self.map_state.initialize_new_run()
                         return "start_new_run"
+                    elif action == "procedural_run":
+                        # New run on a seeded, procedurally generated zone
+                        self.map_state.initialize_new_run(procedural=True)
+                        return "start_new_run"
                     elif action == "continue_run":
                         # Continue existing run or start new if none exists
                         if self.map_state.has_existing_run():
@@ -902,6 +906,10 @@ class CampaignMenu:
                             # Initialize new map tree run
                             self.map_state.initialize_new_run()
                             return "start_new_run"
+                        elif action == "procedural_run":
+                            # New run on a seeded, procedurally generated zone
+                            self.map_state.initialize_new_run(procedural=True)
+                            return "start_new_run"
                         elif action == "continue_run":
                             # Continue existing run or start new if none exists
                             if self.map_state.has_existing_run():
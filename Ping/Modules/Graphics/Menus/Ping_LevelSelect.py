@@ -6,6 +6,7 @@ import time
 # Removed import for DebugLevel, SewerLevel
 from ..UI.Ping_Fonts import get_pixel_font
 from ..UI.Ping_Button import get_button
+from ..Ping_SurfacePool import get_surface_pool
 from ...Audio.Ping_Sound import SoundManager
 
 def get_ping_levels_path():
@@ -244,9 +245,10 @@ class RetroAnimatedBackground:
                 color = (*self.NEON_CYAN, alpha)
                 try:
                     # Create surface for alpha blending
-                    surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+                    surf = get_surface_pool().acquire((self.width, self.height), pygame.SRCALPHA)
                     pygame.draw.circle(surf, color, (int(wave['x']), int(wave['y'])), int(wave['radius']), 2)
                     screen.blit(surf, (0, 0))
+                    get_surface_pool().release(surf)
                 except:
                     # Fallback without alpha
                     pygame.draw.circle(screen, self.NEON_CYAN, (int(wave['x']), int(wave['y'])), int(wave['radius']), 2)
@@ -516,4 +518,5 @@ class LevelSelect:
                 debug_console.draw(screen, WINDOW_WIDTH, WINDOW_HEIGHT)
 
             pygame.display.flip()
+            get_surface_pool().end_frame()
             clock.tick(60)
\ No newline at end of file
@@ -8,10 +8,11 @@ import math
 import time
 import random
 from typing import Optional, List, Tuple
-from ....Core.Ping_MapState import get_map_state, MapStateManager
-from ....Core.Ping_MapTree import NodeType, MapNode, MapZone
+from ...Core.Ping_MapState import get_map_state, MapStateManager
+from ...Core.Ping_MapTree import NodeType, MapNode, MapZone
 from ..UI.Ping_Fonts import get_pixel_font
 from ..UI.Ping_Button import get_button
+from ..Ping_SurfacePool import get_surface_pool
 
 # Sewer-themed color palette
 SEWER_DARK = (25, 35, 30)           # Base dark sewer
@@ -64,9 +65,10 @@ class WaterParticle:
             
             # Create a temporary surface for alpha blending
             if self.size > 1:
-                temp_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
+                temp_surface = get_surface_pool().acquire((self.size * 2, self.size * 2), pygame.SRCALPHA)
                 pygame.draw.circle(temp_surface, color, (self.size, self.size), self.size)
                 screen.blit(temp_surface, (int(self.x - self.size), int(self.y - self.size)))
+                get_surface_pool().release(temp_surface)
             else:
                 screen.set_at((int(self.x), int(self.y)), color[:3])
                 
@@ -74,7 +76,15 @@ class WaterParticle:
         return self.life > 0
 
 class MapTreeMenu:
-    """Main map tree menu interface."""
+    """Main map tree menu interface.
+    
+    Node screen positions, connection bounds and a grid of nodes are cached per zone
+    and window size, so drawing only touches nodes and pipes inside the visible
+    window and hover picking only checks the nodes in one grid cell.
+    """
+    
+    GRID_CELL_SIZE = 64  # Pixels per hover picking grid cell
+    CULL_MARGIN = 70  # Extra pixels around the view so rings, arrows and pipe joints aren't clipped
     
     def __init__(self, sound_manager):
         self.sound_manager = sound_manager
@@ -106,6 +116,18 @@ class MapTreeMenu:
         self.background_width = 0
         self.background_height = 0
         
+        # Layout cache (unscrolled screen positions, edges and picking grid)
+        self._layout_key = None
+        self._node_positions = {}  # node_id -> (x, y) without scrolling
+        self._node_order = {}  # node_id -> index in the zone, nodes are drawn in this order
+        self._edges = []  # (from node_id, to node_id)
+        self._edge_rects = []  # Bounding rect of each edge, same order as _edges
+        self._node_grid = {}  # (cell x, cell y) -> list of node_ids whose hit circle overlaps the cell
+        self._scroll_limits = (-self.scroll_bounds, self.scroll_bounds, -self.scroll_bounds, self.scroll_bounds)
+        
+        # Pre-rendered node sprites keyed by (type, state, size)
+        self._node_sprites = {}
+        
         # Initialize map state if needed
         if not self.map_state.get_current_zone():
             if self.map_state.has_existing_run():
@@ -114,9 +136,61 @@ class MapTreeMenu:
                 self.map_state.initialize_new_run()
     
     def _clamp_scroll(self):
-        """Clamp scroll values within bounds."""
-        self.scroll_x = max(-self.scroll_bounds, min(self.scroll_bounds, self.scroll_x))
-        self.scroll_y = max(-self.scroll_bounds, min(self.scroll_bounds, self.scroll_y))
+        """Clamp scroll values within bounds (extended to cover zones larger than the screen)."""
+        min_x, max_x, min_y, max_y = self._scroll_limits
+        self.scroll_x = max(min_x, min(max_x, self.scroll_x))
+        self.scroll_y = max(min_y, min(max_y, self.scroll_y))
+    
+    def _ensure_layout(self, zone: MapZone, width: int, height: int):
+        """Rebuild the cached node positions, edge bounds and picking grid when the zone or window changes."""
+        layout_key = (id(zone), zone.index_version, width, height)
+        if layout_key == self._layout_key:
+            return
+        self._layout_key = layout_key
+        
+        # Map logical coordinates (0-800, 0-500) to screen coordinates
+        self._node_positions = {
+            node_id: (int((node.position[0] / 800) * width), int((node.position[1] / 500) * height))
+            for node_id, node in zone.nodes.items()
+        }
+        self._node_order = {node_id: i for i, node_id in enumerate(zone.nodes)}
+        
+        self._edges = []
+        self._edge_rects = []
+        for node_id, node in zone.nodes.items():
+            start_x, start_y = self._node_positions[node_id]
+            for connection_id in node.connections:
+                if connection_id in self._node_positions:
+                    end_x, end_y = self._node_positions[connection_id]
+                    self._edges.append((node_id, connection_id))
+                    self._edge_rects.append(pygame.Rect(min(start_x, end_x), min(start_y, end_y),
+                                                        abs(end_x - start_x) + 1, abs(end_y - start_y) + 1))
+        
+        # Picking grid: every node is listed in each cell its largest hit circle overlaps
+        cell = self.GRID_CELL_SIZE
+        self._node_grid = {}
+        for node_id, (x, y) in self._node_positions.items():
+            radius = 28
+            for cell_x in range((x - radius) // cell, (x + radius) // cell + 1):
+                for cell_y in range((y - radius) // cell, (y + radius) // cell + 1):
+                    self._node_grid.setdefault((cell_x, cell_y), []).append(node_id)
+        
+        # Let the view scroll far enough to reach every node
+        if self._node_positions:
+            xs = [x for x, _y in self._node_positions.values()]
+            ys = [y for _x, y in self._node_positions.values()]
+            margin = self.CULL_MARGIN
+            self._scroll_limits = (
+                -self.scroll_bounds - max(0, max(xs) + margin - width),
+                self.scroll_bounds + max(0, margin - min(xs)),
+                -self.scroll_bounds - max(0, max(ys) + margin - height),
+                self.scroll_bounds + max(0, margin - min(ys)),
+            )
+        self._clamp_scroll()
+    
+    def _get_visible_rect(self, width: int, height: int) -> pygame.Rect:
+        """The visible window in unscrolled layout coordinates, padded by CULL_MARGIN."""
+        return pygame.Rect(-self.scroll_x, -self.scroll_y, width, height).inflate(self.CULL_MARGIN * 2, self.CULL_MARGIN * 2)
     
     def _create_sewer_background(self, width: int, height: int) -> pygame.Surface:
         """Create animated sewer background."""
@@ -209,25 +283,21 @@ class MapTreeMenu:
         """Draw a single map node."""
         x, y = position
         
-        # Determine node color and size
+        # Determine node state and size
         if is_current:
-            color = NODE_CURRENT
+            state = "current"
             size = 25
         elif node.is_completed:
-            color = NODE_COMPLETED
+            state = "completed"
             size = 20
         elif node.is_accessible:
-            color = NODE_ACCESSIBLE
+            state = "accessible"
             size = 22
         else:
-            color = NODE_BLOCKED
+            state = "blocked"
             size = 18
         
-        # Special colors for special node types
-        if node.type == NodeType.SHOP:
-            color = NODE_SHOP
-        elif node.type == NodeType.BOSS:
-            color = NODE_BOSS
+        if node.type == NodeType.BOSS:
             size = 28
         
         # Pulsing effect for current node
@@ -240,38 +310,55 @@ class MapTreeMenu:
             ring_color = TEXT_YELLOW if is_hovered else TEXT_WHITE
             pygame.draw.circle(surface, ring_color, (x, y), size + 8, 3)
         
+        # Shadow, body, highlight and icon come pre-rendered
+        sprite = self._get_node_sprite(node.type, state, size)
+        surface.blit(sprite, (x - size - 2, y - size - 2))
+    
+    def _get_node_sprite(self, node_type: NodeType, state: str, size: int) -> pygame.Surface:
+        """Return the cached sprite (shadow, circle, highlight and icon) for a node look."""
+        key = (node_type, state, size)
+        sprite = self._node_sprites.get(key)
+        if sprite is not None:
+            return sprite
+        
+        color = {
+            "current": NODE_CURRENT,
+            "completed": NODE_COMPLETED,
+            "accessible": NODE_ACCESSIBLE,
+            "blocked": NODE_BLOCKED
+        }[state]
+        # Special colors for special node types
+        if node_type == NodeType.SHOP:
+            color = NODE_SHOP
+        elif node_type == NodeType.BOSS:
+            color = NODE_BOSS
+        
+        sprite = pygame.Surface((size * 2 + 4, size * 2 + 4), pygame.SRCALPHA)
+        center = (size + 2, size + 2)
+        
         # Node shadow
-        shadow_color = (0, 0, 0, 100)
-        shadow_surface = pygame.Surface((size * 2 + 4, size * 2 + 4), pygame.SRCALPHA)
-        pygame.draw.circle(shadow_surface, shadow_color, (size + 2, size + 2), size)
-        surface.blit(shadow_surface, (x - size - 2, y - size - 2))
+        pygame.draw.circle(sprite, (0, 0, 0, 100), center, size)
         
         # Main node circle
-        pygame.draw.circle(surface, color, (x, y), size)
+        pygame.draw.circle(sprite, color, center, size)
         
         # Node highlight
         highlight_color = tuple(min(255, c + 60) for c in color)
-        pygame.draw.circle(surface, highlight_color, (x - size//3, y - size//3), size//2)
+        pygame.draw.circle(sprite, highlight_color, (center[0] - size//3, center[1] - size//3), size//2)
         
         # Node type indicator
-        if node.type == NodeType.SHOP:
-            # Shop icon ($ symbol)
-            font = get_pixel_font(16)
-            text = font.render("$", True, TEXT_WHITE)
-            text_rect = text.get_rect(center=(x, y))
-            surface.blit(text, text_rect)
-        elif node.type == NodeType.BOSS:
-            # Boss icon (skull symbol)
-            font = get_pixel_font(18)
-            text = font.render("☠", True, TEXT_WHITE)
-            text_rect = text.get_rect(center=(x, y))
-            surface.blit(text, text_rect)
-        elif node.is_completed:
-            # Completed checkmark
-            font = get_pixel_font(14)
-            text = font.render("✓", True, TEXT_WHITE)
-            text_rect = text.get_rect(center=(x, y))
-            surface.blit(text, text_rect)
+        icon = None
+        if node_type == NodeType.SHOP:
+            icon = get_pixel_font(16).render("$", True, TEXT_WHITE) # Shop icon ($ symbol)
+        elif node_type == NodeType.BOSS:
+            icon = get_pixel_font(18).render("☠", True, TEXT_WHITE) # Boss icon (skull symbol)
+        elif state == "completed":
+            icon = get_pixel_font(14).render("✓", True, TEXT_WHITE) # Completed checkmark
+        if icon is not None:
+            sprite.blit(icon, icon.get_rect(center=center))
+        
+        self._node_sprites[key] = sprite
+        return sprite
     
     def _draw_current_position_arrow(self, surface: pygame.Surface, position: Tuple[int, int]):
         """Draw arrow pointing to current position."""
@@ -324,33 +411,36 @@ class MapTreeMenu:
     
     def _get_node_screen_position(self, node: MapNode, width: int, height: int) -> Tuple[int, int]:
         """Convert node logical position to screen coordinates with scrolling."""
-        # Scale the node positions to fit the screen
-        node_x, node_y = node.position
-        
-        # Map logical coordinates (0-800, 0-500) to screen coordinates
-        screen_x = int((node_x / 800) * width) + self.scroll_x
-        screen_y = int((node_y / 500) * height) + self.scroll_y
-        
-        return screen_x, screen_y
+        position = self._node_positions.get(node.id) if self._layout_key and self._layout_key[2:] == (width, height) else None
+        if position is None:
+            # Map logical coordinates (0-800, 0-500) to screen coordinates
+            position = (int((node.position[0] / 800) * width), int((node.position[1] / 500) * height))
+        return position[0] + self.scroll_x, position[1] + self.scroll_y
     
     def _get_node_at_position(self, pos: Tuple[int, int], width: int, height: int) -> Optional[str]:
         """Get the node ID at the given screen position."""
         zone = self.map_state.get_current_zone()
         if not zone:
             return None
-        
-        mouse_x, mouse_y = pos
-        
-        for node_id, node in zone.nodes.items():
-            node_x, node_y = self._get_node_screen_position(node, width, height)
-            distance = math.sqrt((mouse_x - node_x) ** 2 + (mouse_y - node_y) ** 2)
+        self._ensure_layout(zone, width, height)
+        
+        # Only the nodes listed in the grid cell under the mouse can be hit
+        mouse_x = pos[0] - self.scroll_x
+        mouse_y = pos[1] - self.scroll_y
+        cell = (mouse_x // self.GRID_CELL_SIZE, mouse_y // self.GRID_CELL_SIZE)
+        
+        for node_id in self._node_grid.get(cell, ()):
+            node = zone.nodes.get(node_id)
+            if node is None:
+                continue
+            node_x, node_y = self._node_positions[node_id]
             
             # Node radius varies by type and state
             radius = 25 if node_id == zone.current_node_id else 22
             if node.type == NodeType.BOSS:
                 radius = 28
             
-            if distance <= radius:
+            if (mouse_x - node_x) ** 2 + (mouse_y - node_y) ** 2 <= radius ** 2:
                 return node_id
         
         return None
@@ -497,20 +587,27 @@ class MapTreeMenu:
         if not zone:
             return
         
-        # Draw connections between nodes
-        for node_id, node in zone.nodes.items():
-            start_pos = self._get_node_screen_position(node, width, height)
-            
-            for connection_id in node.connections:
-                connected_node = zone.get_node(connection_id)
-                if connected_node:
-                    end_pos = self._get_node_screen_position(connected_node, width, height)
-                    is_accessible = connected_node.is_accessible
-                    self._draw_connection_line(screen, start_pos, end_pos, is_accessible)
+        self._ensure_layout(zone, width, height)
+        visible_rect = self._get_visible_rect(width, height)
+        
+        # Draw connections between nodes (only pipes crossing the visible window)
+        for edge_index in visible_rect.collidelistall(self._edge_rects):
+            node_id, connection_id = self._edges[edge_index]
+            start_pos = self._get_node_screen_position(zone.nodes[node_id], width, height)
+            connected_node = zone.nodes[connection_id]
+            end_pos = self._get_node_screen_position(connected_node, width, height)
+            self._draw_connection_line(screen, start_pos, end_pos, connected_node.is_accessible)
+        
+        # Draw visible nodes, in zone order so overlapping nodes stack as before
+        visible_nodes = set()
+        cell = self.GRID_CELL_SIZE
+        for cell_x in range(visible_rect.left // cell, visible_rect.right // cell + 1):
+            for cell_y in range(visible_rect.top // cell, visible_rect.bottom // cell + 1):
+                visible_nodes.update(self._node_grid.get((cell_x, cell_y), ()))
         
-        # Draw nodes
         current_node_id = zone.current_node_id
-        for node_id, node in zone.nodes.items():
+        for node_id in sorted(visible_nodes, key=self._node_order.__getitem__):
+            node = zone.nodes[node_id]
             position = self._get_node_screen_position(node, width, height)
             is_current = (node_id == current_node_id)
             is_selected = (node_id == self.selected_node)
@@ -610,4 +707,5 @@ class MapTreeMenu:
                 debug_console.draw(screen, width, height)
             
             pygame.display.flip()
+            get_surface_pool().end_frame()
             clock.tick(60)
\ No newline at end of file
@@ -6,6 +6,7 @@ import os
 from sys import exit
 from ..UI.Ping_Fonts import get_pixel_font
 from ..UI.Ping_Button import get_button
+from ..Ping_SurfacePool import get_surface_pool
 
 class RetroAnimatedBackground:
     """Ultra-creative animated retro background for quick play menu."""
@@ -235,9 +236,10 @@ class RetroAnimatedBackground:
                 color = (*self.NEON_CYAN, alpha)
                 try:
                     # Create surface for alpha blending
-                    surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+                    surf = get_surface_pool().acquire((self.width, self.height), pygame.SRCALPHA)
                     pygame.draw.circle(surf, color, (int(wave['x']), int(wave['y'])), int(wave['radius']), 2)
                     screen.blit(surf, (0, 0))
+                    get_surface_pool().release(surf)
                 except:
                     # Fallback without alpha
                     pygame.draw.circle(screen, self.NEON_CYAN, (int(wave['x']), int(wave['y'])), int(wave['radius']), 2)
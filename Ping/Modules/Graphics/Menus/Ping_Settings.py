@@ -6,6 +6,9 @@ import os
 from sys import exit
 from ..UI.Ping_Fonts import get_pixel_font
 from ..UI.Ping_Button import get_button
+from ...Core.Ping_Logging import get_logger
+
+logger = get_logger("settings")
 
 def get_game_parameters_path():
     """Get the correct path to Game Parameters directory."""
@@ -673,6 +676,10 @@ class SettingsScreen:
     PLAYER_NAME = "Player"  # Default value
     PLAYER_B_NAME = "Player B"  # Default value for 2P mode
     SHADER_ENABLED = True  # Default value
+    DIRTY_RECTS_ENABLED = False  # Default value
+    RENDER_RESOLUTION_MODE = "native"  # Default value ("native", "fixed" or "integer")
+    DYNAMIC_RESOLUTION_ENABLED = False  # Default value
+    DYNAMIC_RESOLUTION_MIN_SCALE = 0.5  # Lowest render scale dynamic resolution may use
     RETRO_EFFECTS_ENABLED = True  # Default value
     SCANLINE_INTENSITY = 40  # Default value
     GLOW_INTENSITY = 80  # Default value
@@ -784,6 +791,107 @@ class SettingsScreen:
             print(f"Error updating shader setting: {e}")
             return False
 
+    @classmethod
+    def get_dirty_rects_enabled(cls):
+        """Get current dirty rect rendering state from settings."""
+        try:
+            with open(os.path.join(get_game_parameters_path(), "settings.txt"), "r") as f:
+                settings = dict(line.strip().split('=') for line in f
+                              if '=' in line and not line.strip().startswith('#'))
+                return settings.get('DIRTY_RECTS_ENABLED', str(cls.DIRTY_RECTS_ENABLED)).lower() == 'true'
+        except Exception as e:
+            print(f"Error loading dirty rects setting: {e}")
+            return cls.DIRTY_RECTS_ENABLED
+
+    @classmethod
+    def update_dirty_rects_enabled(cls, enabled):
+        """Update dirty rect rendering state in settings file."""
+        try:
+            current_settings = {}
+            with open(os.path.join(get_game_parameters_path(), "settings.txt"), "r") as f:
+                current_settings = dict(line.strip().split('=') for line in f
+                                   if '=' in line and not line.strip().startswith('#'))
+            current_settings['DIRTY_RECTS_ENABLED'] = str(enabled).lower()
+            with open(os.path.join(get_game_parameters_path(), "settings.txt"), "w") as f:
+                for key, value in current_settings.items():
+                    f.write(f"{key}={value}\n")
+            return True
+        except Exception as e:
+            print(f"Error updating dirty rects setting: {e}")
+            return False
+
+    @classmethod
+    def get_render_resolution_mode(cls):
+        """Get current render resolution mode ('native', 'fixed' or 'integer') from settings."""
+        try:
+            with open(os.path.join(get_game_parameters_path(), "settings.txt"), "r") as f:
+                settings = dict(line.strip().split('=') for line in f
+                              if '=' in line and not line.strip().startswith('#'))
+                mode = settings.get('RENDER_RESOLUTION_MODE', cls.RENDER_RESOLUTION_MODE).lower()
+                return mode if mode in ('native', 'fixed', 'integer') else cls.RENDER_RESOLUTION_MODE
+        except Exception as e:
+            print(f"Error loading render resolution mode: {e}")
+            return cls.RENDER_RESOLUTION_MODE
+
+    @classmethod
+    def update_render_resolution_mode(cls, mode):
+        """Update render resolution mode in settings file."""
+        try:
+            current_settings = {}
+            with open(os.path.join(get_game_parameters_path(), "settings.txt"), "r") as f:
+                current_settings = dict(line.strip().split('=') for line in f
+                                   if '=' in line and not line.strip().startswith('#'))
+            current_settings['RENDER_RESOLUTION_MODE'] = mode
+            with open(os.path.join(get_game_parameters_path(), "settings.txt"), "w") as f:
+                for key, value in current_settings.items():
+                    f.write(f"{key}={value}\n")
+            return True
+        except Exception as e:
+            print(f"Error updating render resolution mode: {e}")
+            return False
+
+    @classmethod
+    def get_dynamic_resolution_enabled(cls):
+        """Get current dynamic resolution scaling state from settings."""
+        try:
+            with open(os.path.join(get_game_parameters_path(), "settings.txt"), "r") as f:
+                settings = dict(line.strip().split('=') for line in f
+                              if '=' in line and not line.strip().startswith('#'))
+                return settings.get('DYNAMIC_RESOLUTION_ENABLED', str(cls.DYNAMIC_RESOLUTION_ENABLED)).lower() == 'true'
+        except Exception as e:
+            print(f"Error loading dynamic resolution setting: {e}")
+            return cls.DYNAMIC_RESOLUTION_ENABLED
+
+    @classmethod
+    def update_dynamic_resolution_enabled(cls, enabled):
+        """Update dynamic resolution scaling state in settings file."""
+        try:
+            current_settings = {}
+            with open(os.path.join(get_game_parameters_path(), "settings.txt"), "r") as f:
+                current_settings = dict(line.strip().split('=') for line in f
+                                   if '=' in line and not line.strip().startswith('#'))
+            current_settings['DYNAMIC_RESOLUTION_ENABLED'] = str(enabled).lower()
+            with open(os.path.join(get_game_parameters_path(), "settings.txt"), "w") as f:
+                for key, value in current_settings.items():
+                    f.write(f"{key}={value}\n")
+            return True
+        except Exception as e:
+            print(f"Error updating dynamic resolution setting: {e}")
+            return False
+
+    @classmethod
+    def get_dynamic_resolution_min_scale(cls):
+        """Get the lowest render scale dynamic resolution may drop to (0.1 to 1.0)."""
+        try:
+            with open(os.path.join(get_game_parameters_path(), "settings.txt"), "r") as f:
+                settings = dict(line.strip().split('=') for line in f
+                              if '=' in line and not line.strip().startswith('#'))
+                min_scale = float(settings.get('DYNAMIC_RESOLUTION_MIN_SCALE', cls.DYNAMIC_RESOLUTION_MIN_SCALE))
+                return max(0.1, min(1.0, min_scale))
+        except Exception as e:
+            print(f"Error loading dynamic resolution min scale: {e}")
+            return cls.DYNAMIC_RESOLUTION_MIN_SCALE
+
     @classmethod
     def get_win_scores(cls):
         """Get current win scores setting."""
@@ -890,6 +998,10 @@ class SettingsScreen:
         self.player_name = self.PLAYER_NAME
         self.player_b_name = self.PLAYER_B_NAME
         self.shader_enabled = self.SHADER_ENABLED
+        self.dirty_rects_enabled = self.DIRTY_RECTS_ENABLED
+        self.render_resolution_mode = self.RENDER_RESOLUTION_MODE
+        self.dynamic_resolution_enabled = self.DYNAMIC_RESOLUTION_ENABLED
+        self.dynamic_resolution_min_scale = self.DYNAMIC_RESOLUTION_MIN_SCALE
         self.retro_effects_enabled = self.RETRO_EFFECTS_ENABLED
         self.scroll_y = 0  # Initialize scroll position
         self.scanline_intensity = self.SCANLINE_INTENSITY
@@ -954,6 +1066,10 @@ class SettingsScreen:
                 self.player_name = settings.get('PLAYER_NAME', self.PLAYER_NAME)
                 self.player_b_name = settings.get('PLAYER_B_NAME', self.PLAYER_B_NAME)
                 self.shader_enabled = settings.get('SHADER_ENABLED', 'true').lower() == 'true'
+                self.dirty_rects_enabled = settings.get('DIRTY_RECTS_ENABLED', str(self.DIRTY_RECTS_ENABLED)).lower() == 'true'
+                self.render_resolution_mode = settings.get('RENDER_RESOLUTION_MODE', self.RENDER_RESOLUTION_MODE)
+                self.dynamic_resolution_enabled = settings.get('DYNAMIC_RESOLUTION_ENABLED', str(self.DYNAMIC_RESOLUTION_ENABLED)).lower() == 'true'
+                self.dynamic_resolution_min_scale = float(settings.get('DYNAMIC_RESOLUTION_MIN_SCALE', self.DYNAMIC_RESOLUTION_MIN_SCALE))
                 self.retro_effects_enabled = settings.get('RETRO_EFFECTS_ENABLED', 'true').lower() == 'true'
                 self.scanline_intensity = int(settings.get('SCANLINE_INTENSITY', self.SCANLINE_INTENSITY))
                 self.glow_intensity = int(settings.get('GLOW_INTENSITY', self.GLOW_INTENSITY))
@@ -984,6 +1100,10 @@ class SettingsScreen:
                 'PLAYER_NAME': self.player_name,
                 'PLAYER_B_NAME': self.player_b_name,
                 'SHADER_ENABLED': str(self.shader_enabled).lower(),
+                'DIRTY_RECTS_ENABLED': str(self.dirty_rects_enabled).lower(),
+                'RENDER_RESOLUTION_MODE': self.render_resolution_mode,
+                'DYNAMIC_RESOLUTION_ENABLED': str(self.dynamic_resolution_enabled).lower(),
+                'DYNAMIC_RESOLUTION_MIN_SCALE': self.dynamic_resolution_min_scale,
                 'RETRO_EFFECTS_ENABLED': str(self.retro_effects_enabled).lower(),
                 'SCANLINE_INTENSITY': self.scanline_intensity,
                 'GLOW_INTENSITY': self.glow_intensity,
@@ -1177,8 +1297,7 @@ class SettingsScreen:
                         if max_scroll_dd > 0:
                             self.dropdown_scroll_offset -= scroll_direction
                             self.dropdown_scroll_offset = max(0, min(self.dropdown_scroll_offset, max_scroll_dd))
-                        if hasattr(self, 'debug_console') and self.debug_console and self.debug_console.debug_settings:
-                            print(f"[DEBUG] Resolution Dropdown scroll offset: {self.dropdown_scroll_offset}")
+                        logger.debug("Resolution Dropdown scroll offset: %s", self.dropdown_scroll_offset)
                         continue
 
                 # Display Mode Dropdown Scroll Check (no scroll needed as it's short)
@@ -1207,9 +1326,7 @@ class SettingsScreen:
                 # Adjust max_scroll calculation
                 max_scroll = -(total_height - (height - title_area_height - 80)) # Subtract title and button area heights
                 self.scroll_y = min(0, max(max_scroll, self.scroll_y + scroll_amount))
-                # Only print scroll debug if settings debug is enabled
-                if hasattr(self, 'debug_console') and self.debug_console and self.debug_console.debug_settings:
-                    print(f"[DEBUG] Scrolling: {self.scroll_y}")
+                logger.debug("Scrolling: %s", self.scroll_y)
 
         # Create title area with semi-transparent overlay
         title_area = pygame.Surface((width, title_area_height), pygame.SRCALPHA)
@@ -1734,8 +1851,7 @@ class SettingsScreen:
                             # Update original loaded values to reflect the save for subsequent comparisons
                             self.original_loaded_display_mode = newly_saved_mode
                             self.original_loaded_size_index = self.current_size_index
-                            if hasattr(self, 'debug_console') and self.debug_console and self.debug_console.debug_settings:
-                                print(f"[DEBUG] Display settings changed and saved. Mode: {newly_saved_mode}, Res: {newly_saved_width}x{newly_saved_height}")
+                            logger.debug("Display settings changed and saved. Mode: %s, Res: %sx%s", newly_saved_mode, newly_saved_width, newly_saved_height)
                             if back_fn: return back_fn() # Trigger display update via main loop
                         # No display-related changes, continue in settings
                     else:
@@ -1769,7 +1885,7 @@ class SettingsScreen:
                             self.current_size_index = actual_option_index
                             self.show_resolutions = False
                             self.dropdown_scroll_offset = 0
-                            if hasattr(self, 'debug_console') and self.debug_console and self.debug_console.debug_settings: print(f"[DEBUG] Selected resolution index: {actual_option_index}")
+                            logger.debug("Selected resolution index: %s", actual_option_index)
                             res_dropdown_handled = True
                             break
                     dropdown_bg_rect_drawn = pygame.Rect(res_btn_rect.x, res_btn_rect.bottom, res_btn_rect.width, actual_res_dropdown_height_drawn)
@@ -1786,7 +1902,7 @@ class SettingsScreen:
                         if dm_option_rect.collidepoint(mouse_pos_rel):
                             self.current_display_mode = mode_text
                             self.show_display_modes = False
-                            if hasattr(self, 'debug_console') and self.debug_console and self.debug_console.debug_settings: print(f"[DEBUG] Selected display mode: {mode_text}")
+                            logger.debug("Selected display mode: %s", mode_text)
                             dm_dropdown_handled = True
                             break
                     dm_dropdown_bg_rect = pygame.Rect(display_mode_btn_rect.x, display_mode_btn_rect.bottom, display_mode_btn_rect.width, dm_dropdown_height)
@@ -0,0 +1,154 @@
+"""
+Dirty rectangle tracking for partial screen updates.
+Objects report their screen bounds every frame; the tracker compares them to the
+previous frame and hands back the regions that need restoring and redrawing.
+"""
+
+import pygame
+
+
+def merge_rects(rects, padding=0):
+    """
+    Merge overlapping (or nearly touching) rectangles into a smaller list.
+
+    Args:
+        rects (list): List of pygame.Rect objects.
+        padding (int): Rectangles closer than this many pixels are merged as well.
+
+    Returns:
+        list: New list of merged pygame.Rect objects.
+    """
+    merged = [pygame.Rect(r) for r in rects if r.width > 0 and r.height > 0]
+    changed = True
+    while changed:
+        changed = False
+        result = []
+        while merged:
+            current = merged.pop()
+            probe = current.inflate(padding * 2, padding * 2) if padding else current
+            i = 0
+            while i < len(merged):
+                if probe.colliderect(merged[i]):
+                    current.union_ip(merged.pop(i))
+                    probe = current.inflate(padding * 2, padding * 2) if padding else current
+                    changed = True
+                else:
+                    i += 1
+            result.append(current)
+        merged = result
+    return merged
+
+
+class DirtyRectTracker:
+    """
+    Tracks the screen bounds of drawable entries between frames.
+
+    Entries are either animated (always redrawn, both old and new bounds are dirty)
+    or static (only dirty when they appear, disappear or move).
+    """
+    def __init__(self, screen_rect=None):
+        self.screen_rect = pygame.Rect(screen_rect) if screen_rect else None
+        self._previous = {} # key -> (rect, static)
+        self._current = {}
+        self._full_redraw = True # First frame always needs a complete repaint
+
+        # Stats for the most recent frame
+        self.last_dirty_count = 0
+        self.last_dirty_area = 0
+
+    def request_full_redraw(self):
+        """Forces the next frame to restore and redraw the whole screen."""
+        self._full_redraw = True
+
+    def needs_full_redraw(self):
+        """Returns True if the next frame must be a complete repaint."""
+        return self._full_redraw
+
+    def set_screen_rect(self, screen_rect):
+        """Update the screen bounds used for clipping; a size change forces a full redraw."""
+        screen_rect = pygame.Rect(screen_rect)
+        if self.screen_rect != screen_rect:
+            self.screen_rect = screen_rect
+            self._full_redraw = True
+
+    def begin_frame(self):
+        """Start collecting entries for a new frame."""
+        self._current = {}
+
+    def track(self, key, rect, static=False):
+        """
+        Record the screen bounds of an entry for the current frame.
+
+        Args:
+            key: Hashable identifier that is stable between frames (e.g. id(obj)).
+            rect (pygame.Rect): Screen-space bounds of everything the entry draws.
+            static (bool): True if the entry looks the same every frame when it doesn't move.
+        """
+        rect = pygame.Rect(rect)
+        if self.screen_rect:
+            rect = rect.clip(self.screen_rect)
+        self._current[key] = (rect, static)
+
+    def end_frame(self):
+        """
+        Finish the frame and compute the dirty regions.
+
+        Returns:
+            list: Merged list of pygame.Rect regions that changed since the last frame.
+                  Contains only the screen rect if a full redraw was requested.
+        """
+        if self._full_redraw and self.screen_rect:
+            dirty = [self.screen_rect.copy()]
+        else:
+            dirty = []
+            for key, (rect, static) in self._current.items():
+                previous = self._previous.get(key)
+                if previous is None:
+                    dirty.append(rect) # Newly appeared
+                elif not static or previous[0] != rect:
+                    dirty.append(previous[0])
+                    dirty.append(rect)
+            for key, (rect, _static) in self._previous.items():
+                if key not in self._current:
+                    dirty.append(rect) # Disappeared, restore what was underneath
+            dirty = merge_rects(dirty)
+
+        self._previous = self._current
+        self._current = {}
+        self._full_redraw = False
+
+        self.last_dirty_count = len(dirty)
+        self.last_dirty_area = sum(r.width * r.height for r in dirty)
+        return dirty
+
+    def expand_to_cover(self, dirty, entries):
+        """
+        Grow the dirty region so every entry it touches is fully restored before being redrawn.
+        Without this, redrawing an entry that only partially overlaps a dirty rect would blend
+        translucent pixels (shadows, glows) on top of its previous frame.
+
+        Args:
+            dirty (list): Dirty rects from end_frame().
+            entries (list): List of pygame.Rect bounds, one per drawable.
+
+        Returns:
+            tuple: (merged dirty rects, list of booleans telling which entries must be redrawn)
+        """
+        redraw = [False] * len(entries)
+        changed = True
+        while changed:
+            changed = False
+            for i, bounds in enumerate(entries):
+                if redraw[i] or bounds.width <= 0 or bounds.height <= 0:
+                    continue
+                if bounds.collidelist(dirty) != -1:
+                    redraw[i] = True
+                    if not any(d.contains(bounds) for d in dirty):
+                        dirty.append(bounds.copy())
+                        changed = True
+            if changed:
+                dirty = merge_rects(dirty)
+
+        self.last_dirty_count = len(dirty)
+        self.last_dirty_area = sum(r.width * r.height for r in dirty)
+        return dirty, redraw
@@ -0,0 +1,128 @@
+"""
+Dynamic resolution scaling.
+Watches how long each frame takes to draw and trades render resolution (and shader
+block size) for frame rate when the draw budget is exceeded, with hysteresis so the
+image doesn't flicker between quality levels.
+"""
+
+
+class DynamicResolutionController:
+    """
+    Adjusts a render scale and a shader pixel size from measured draw times.
+
+    Quality is lowered quickly when frames run over budget and raised slowly once
+    there is comfortable headroom. After every change the controller waits a few
+    frames before reacting again so the new setting can be measured.
+    """
+    def __init__(self, draw_budget_ms=12.0, min_scale=0.5, max_scale=1.0, scale_step=0.1,
+                 base_pixel_size=3, max_pixel_size=8, smoothing=0.1,
+                 degrade_ratio=1.0, upgrade_ratio=0.6,
+                 degrade_frames=10, upgrade_frames=90, cooldown_frames=30):
+        """
+        Args:
+            draw_budget_ms (float): Target draw time per frame in milliseconds.
+            min_scale (float): Lowest render scale the controller may pick.
+            max_scale (float): Highest render scale (normally 1.0, full resolution).
+            scale_step (float): How much the render scale changes per adjustment.
+            base_pixel_size (int): Shader block size used at full quality.
+            max_pixel_size (int): Largest shader block size the controller may pick.
+            smoothing (float): Weight of the newest sample in the moving average (0-1).
+            degrade_ratio (float): Lower quality when the average exceeds budget * ratio.
+            upgrade_ratio (float): Raise quality when the average is below budget * ratio.
+            degrade_frames (int): Consecutive slow frames needed before lowering quality.
+            upgrade_frames (int): Consecutive fast frames needed before raising quality.
+            cooldown_frames (int): Frames to ignore after any change.
+        """
+        self.draw_budget_ms = draw_budget_ms
+        self.min_scale = max(0.1, min(min_scale, max_scale))
+        self.max_scale = max_scale
+        self.scale_step = scale_step
+        self.base_pixel_size = max(1, int(base_pixel_size))
+        self.max_pixel_size = max(self.base_pixel_size, int(max_pixel_size))
+        self.smoothing = smoothing
+        self.degrade_ratio = degrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.degrade_frames = degrade_frames
+        self.upgrade_frames = upgrade_frames
+        self.cooldown_frames = cooldown_frames
+
+        self.render_scale = self.max_scale
+        self.pixel_size = self.base_pixel_size
+        self.average_draw_ms = 0.0
+        self._slow_frames = 0
+        self._fast_frames = 0
+        self._cooldown = 0
+
+    def reset(self):
+        """Return to full quality and forget previous measurements."""
+        self.render_scale = self.max_scale
+        self.pixel_size = self.base_pixel_size
+        self.average_draw_ms = 0.0
+        self._slow_frames = 0
+        self._fast_frames = 0
+        self._cooldown = 0
+
+    def report_draw_time(self, draw_ms, shader_active=False):
+        """
+        Feed the draw time of the last frame.
+
+        Args:
+            draw_ms (float): Time spent drawing the frame, in milliseconds.
+            shader_active (bool): Whether the pixel shader ran this frame. The shader
+                                  block size is only adjusted while it's in use.
+
+        Returns:
+            bool: True if render_scale or pixel_size changed.
+        """
+        if self.average_draw_ms <= 0:
+            self.average_draw_ms = draw_ms
+        else:
+            self.average_draw_ms += (draw_ms - self.average_draw_ms) * self.smoothing
+
+        if self._cooldown > 0:
+            self._cooldown -= 1
+            return False
+
+        if self.average_draw_ms > self.draw_budget_ms * self.degrade_ratio:
+            self._slow_frames += 1
+            self._fast_frames = 0
+            if self._slow_frames >= self.degrade_frames:
+                return self._apply(self._degrade(shader_active))
+        elif self.average_draw_ms < self.draw_budget_ms * self.upgrade_ratio:
+            self._fast_frames += 1
+            self._slow_frames = 0
+            if self._fast_frames >= self.upgrade_frames:
+                return self._apply(self._upgrade())
+        else:
+            # Inside the hysteresis band, hold the current quality
+            self._slow_frames = 0
+            self._fast_frames = 0
+        return False
+
+    def _degrade(self, shader_active):
+        """Lower quality one step: coarser shader blocks first (cheap to notice), then resolution."""
+        if shader_active and self.pixel_size < self.max_pixel_size:
+            self.pixel_size += 1
+            return True
+        if self.render_scale > self.min_scale:
+            self.render_scale = round(max(self.min_scale, self.render_scale - self.scale_step), 3)
+            return True
+        return False
+
+    def _upgrade(self):
+        """Raise quality one step, restoring resolution before shader detail."""
+        if self.render_scale < self.max_scale:
+            self.render_scale = round(min(self.max_scale, self.render_scale + self.scale_step), 3)
+            return True
+        if self.pixel_size > self.base_pixel_size:
+            self.pixel_size -= 1
+            return True
+        return False
+
+    def _apply(self, changed):
+        """Reset the frame counters after an adjustment attempt and start the cooldown if anything changed."""
+        self._slow_frames = 0
+        self._fast_frames = 0
+        if changed:
+            self._cooldown = self.cooldown_frames
+        return changed
@@ -0,0 +1,117 @@
+"""
+Batched blit render queue.
+Objects submit blits with a layer key while a frame is being built; the queue sorts
+the layers once and flushes each one with a single Surface.blits() call instead of
+one Python-level blit per surface.
+"""
+
+from .Ping_SurfacePool import get_surface_pool
+
+# Layer keys, lower layers are drawn first
+LAYER_OBJECTS = 10 # Blits that sit on top of the object they belong to
+# Particles and additive glows. They are flushed after every arena object has drawn,
+# so they appear above paddles, balls and obstacles, not where their owner sits in
+# the draw order as they did when they were blitted immediately.
+LAYER_EFFECTS = 20
+LAYER_UI = 30 # Text and overlays above everything else
+
+
+class RenderQueue:
+    """
+    Collects (surface, dest, area, special_flags) blit commands per layer.
+
+    Outside of begin()/flush() submissions are blitted immediately, so code that
+    uses the queue still works when nothing is batching the frame.
+    """
+    def __init__(self):
+        self._layers = {} # layer key -> list of blit tuples
+        self._pooled = [] # Pool surfaces to release after flushing
+        self.active = False
+
+        # Per-frame counters (current frame, and the last completed frame)
+        self.submitted = 0
+        self.draw_calls = 0
+        self.last_frame_submitted = 0
+        self.last_frame_draw_calls = 0
+
+    def begin(self):
+        """Start batching submissions."""
+        self.active = True
+
+    def submit(self, target, layer, surface, dest, area=None, special_flags=0, pooled=False):
+        """
+        Queue a blit, or perform it straight away if the queue isn't active.
+
+        Args:
+            target (pygame.Surface): Surface the blit is meant for; used only for immediate blits.
+            layer (int): Layer key, see the LAYER_* constants.
+            surface (pygame.Surface): Source surface.
+            dest: Destination position or rect.
+            area (pygame.Rect, optional): Portion of the source to blit.
+            special_flags (int): pygame blend flags.
+            pooled (bool): True if the surface came from the SurfacePool and should be
+                           released once it has been blitted.
+        """
+        self.submitted += 1
+        if not self.active:
+            target.blit(surface, dest, area, special_flags)
+            self.draw_calls += 1
+            if pooled:
+                get_surface_pool().release(surface)
+            return
+
+        self._layers.setdefault(layer, []).append((surface, dest, area, special_flags))
+        if pooled:
+            self._pooled.append(surface)
+
+    def flush(self, target, max_layer=None):
+        """
+        Blit the queued layers onto the target in layer order.
+
+        Args:
+            target (pygame.Surface): Surface to draw onto.
+            max_layer (int, optional): Only flush layers up to and including this key.
+        """
+        for layer in sorted(self._layers):
+            if max_layer is not None and layer > max_layer:
+                continue
+            commands = self._layers.pop(layer)
+            if commands:
+                target.blits(commands, doreturn=False)
+                self.draw_calls += 1
+
+        if not self._layers:
+            pool = get_surface_pool()
+            for surface in self._pooled:
+                pool.release(surface)
+            self._pooled = []
+            self.active = False
+
+    def end_frame(self):
+        """Roll the per-frame counters and drop anything that was never flushed."""
+        if self._layers:
+            self._layers.clear()
+        self._pooled = []
+        self.active = False
+        self.last_frame_submitted = self.submitted
+        self.last_frame_draw_calls = self.draw_calls
+        self.submitted = 0
+        self.draw_calls = 0
+
+    def get_stats(self):
+        """Returns blit counters for the last completed frame."""
+        return {
+            'blits_submitted': self.last_frame_submitted,
+            'draw_calls': self.last_frame_draw_calls
+        }
+
+
+# Global render queue instance
+_render_queue = None
+
+def get_render_queue():
+    """Get or create the global render queue instance."""
+    global _render_queue
+    if _render_queue is None:
+        _render_queue = RenderQueue()
+    return _render_queue
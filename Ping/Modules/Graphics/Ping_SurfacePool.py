@@ -0,0 +1,125 @@
+"""
+Surface pool for short-lived drawing surfaces.
+Glows, shadows, overlays and particles used to allocate a new pygame.Surface every
+frame; the pool hands out cleared surfaces keyed by (size, flags) and reuses them.
+"""
+
+import pygame
+
+
+class SurfacePool:
+    """
+    Hands out cleared temporary surfaces and takes them back for reuse.
+
+    Surfaces can be returned with release() as soon as they have been blitted, and
+    anything still checked out is reclaimed by end_frame(). A surface must not be
+    kept or drawn from after it has been released or the frame has ended.
+    """
+    def __init__(self, max_free_per_key=4, max_idle_frames=120, max_in_use=512):
+        """
+        Args:
+            max_free_per_key (int): Spare surfaces kept for each (size, flags) key.
+            max_idle_frames (int): Frames a key may go unused before its spares are dropped.
+            max_in_use (int): Checked out surfaces tracked at once; past this, acquire()
+                              returns untracked surfaces so a loop that never calls
+                              end_frame() can't grow the pool without bound.
+        """
+        self.max_free_per_key = max_free_per_key
+        self.max_idle_frames = max_idle_frames
+        self.max_in_use = max_in_use
+
+        self._free = {} # (size, flags) -> list of spare surfaces
+        self._in_use = {} # id(surface) -> (key, surface)
+        self._last_used_frame = {} # (size, flags) -> frame number
+        self.frame = 0
+
+        # Per-frame counters (current frame, and the last completed frame)
+        self.allocations = 0
+        self.reuses = 0
+        self.last_frame_allocations = 0
+        self.last_frame_reuses = 0
+
+    def acquire(self, size, flags=0, clear=True):
+        """
+        Get a surface of the given size and flags.
+
+        Args:
+            size (tuple): (width, height) in pixels; negative values are clamped to 0.
+            flags (int): pygame surface flags, e.g. pygame.SRCALPHA.
+            clear (bool): Fill with transparent (SRCALPHA) or black before returning.
+
+        Returns:
+            pygame.Surface: A surface owned by the caller until release() or end_frame().
+        """
+        key = ((max(0, int(size[0])), max(0, int(size[1]))), flags)
+        free_list = self._free.get(key)
+        if free_list:
+            surface = free_list.pop()
+            surface.set_alpha(None)
+            surface.set_colorkey(None)
+            if clear:
+                surface.fill((0, 0, 0, 0))
+            self.reuses += 1
+        else:
+            surface = pygame.Surface(key[0], flags)
+            self.allocations += 1
+
+        self._last_used_frame[key] = self.frame
+        if len(self._in_use) < self.max_in_use:
+            self._in_use[id(surface)] = (key, surface)
+        return surface
+
+    def release(self, surface):
+        """Return a surface obtained from acquire() so it can be reused this frame."""
+        entry = self._in_use.pop(id(surface), None)
+        if entry is None:
+            return # Not ours, or already released
+        key, surface = entry
+        free_list = self._free.setdefault(key, [])
+        if len(free_list) < self.max_free_per_key:
+            free_list.append(surface)
+
+    def end_frame(self):
+        """Reclaim every surface still checked out, roll the counters and drop idle sizes."""
+        for _surface_id, (_key, surface) in list(self._in_use.items()):
+            self.release(surface)
+
+        self.last_frame_allocations = self.allocations
+        self.last_frame_reuses = self.reuses
+        self.allocations = 0
+        self.reuses = 0
+        self.frame += 1
+
+        # Sizes that change every frame (pulsing glows) would otherwise pile up
+        stale_keys = [key for key, last_used in self._last_used_frame.items()
+                      if self.frame - last_used > self.max_idle_frames]
+        for key in stale_keys:
+            self._free.pop(key, None)
+            del self._last_used_frame[key]
+
+    def clear(self):
+        """Drop every pooled surface (e.g. after a display mode change)."""
+        self._free.clear()
+        self._in_use.clear()
+        self._last_used_frame.clear()
+
+    def get_stats(self):
+        """Returns counters describing pool usage."""
+        return {
+            'frame_allocations': self.last_frame_allocations,
+            'frame_reuses': self.last_frame_reuses,
+            'in_use': len(self._in_use),
+            'pooled': sum(len(free_list) for free_list in self._free.values()),
+            'sizes': len(self._free)
+        }
+
+
+# Global surface pool instance
+_surface_pool = None
+
+def get_surface_pool():
+    """Get or create the global surface pool instance."""
+    global _surface_pool
+    if _surface_pool is None:
+        _surface_pool = SurfacePool()
+    return _surface_pool
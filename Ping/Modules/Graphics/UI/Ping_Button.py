@@ -1,4 +1,68 @@
 import pygame
+from collections import OrderedDict
+from ...Core.Ping_Logging import get_logger
+
+logger = get_logger("ui")
+
+class WidgetCache:
+    """
+    Least-recently-used cache of pre-rendered widget surfaces.
+    
+    Entries are keyed by everything that affects how a widget looks (text, size,
+    font, state and colors) and hold (surface, offset), where offset is the
+    position of the surface relative to the widget rect's top left corner.
+    """
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the cached (surface, offset) for key, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        """Store (surface, offset) for key, evicting the least recently used entry if full."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached surface."""
+        self._entries.clear()
+
+    def get_stats(self):
+        """Returns cache counters."""
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+def _render_widget(size, bounds_fn, draw_fn):
+    """
+    Render a widget onto a transparent surface.
+    
+    Args:
+        size: (width, height) of the widget rect.
+        bounds_fn: Called with the local rect, returns a rect covering everything drawn
+                   (text can stick out of the widget rect).
+        draw_fn: Called with (surface, rect) to draw the widget with rect in surface coordinates.
+    
+    Returns:
+        tuple: (surface, offset of the surface from the widget rect's top left)
+    """
+    local_rect = pygame.Rect((0, 0), size)
+    bounds = bounds_fn(local_rect)
+    surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+    draw_fn(surface, local_rect.move(-bounds.x, -bounds.y))
+    return surface, bounds.topleft
+
 
 class Button:
     def __init__(self):
@@ -10,9 +74,15 @@ class Button:
         self.border_width = 2
         self.corner_radius = 8
 
+    def _style_key(self):
+        """Everything about the styling that changes how a button looks."""
+        return (self.bg_default, self.bg_hover, self.border_default, self.border_hover,
+                self.border_width, self.corner_radius)
+
     def draw(self, screen, rect, text, font, is_hovered=False, is_checkbox=False, is_checked=False):
         """
         Draw a button or checkbox with consistent styling.
+        Each look is rendered once and then blitted from the widget cache.
         
         Args:
             screen: Pygame surface to draw on
@@ -23,50 +93,75 @@ class Button:
             is_checkbox: Whether to draw as checkbox
             is_checked: Whether checkbox is checked (ignored if not checkbox)
         """
-        # Select colors based on hover state
-        bg_color = self.bg_hover if is_hovered else self.bg_default
-        border_color = self.border_hover if is_hovered else self.border_default
-        
-        if is_checkbox:
-            # Draw checkbox portion
-            checkbox_size = min(rect.height - 4, 20)  # Size relative to rect height
-            checkbox_rect = pygame.Rect(rect.x + 4, rect.y + (rect.height - checkbox_size) // 2,
-                                     checkbox_size, checkbox_size)
-            
-            # Draw checkbox background
-            pygame.draw.rect(screen, bg_color, checkbox_rect,
-                           border_radius=self.corner_radius)
-            pygame.draw.rect(screen, border_color, checkbox_rect,
-                           self.border_width, border_radius=self.corner_radius)
-            
-            # Draw checkmark if checked
-            if is_checked:
-                checkmark_points = [
-                    (checkbox_rect.x + checkbox_size * 0.2, checkbox_rect.y + checkbox_size * 0.5),
-                    (checkbox_rect.x + checkbox_size * 0.4, checkbox_rect.y + checkbox_size * 0.7),
-                    (checkbox_rect.x + checkbox_size * 0.8, checkbox_rect.y + checkbox_size * 0.3)
-                ]
-                pygame.draw.lines(screen, border_color, False, checkmark_points, 2)
-            
-            # Draw label text
-            text_surf = font.render(text, True, (255, 255, 255))
-            text_pos = (checkbox_rect.right + 8,
-                       rect.centery - text_surf.get_height() // 2)
-            screen.blit(text_surf, text_pos)
-            
-        else:
-            # Draw regular button
-            pygame.draw.rect(screen, bg_color, rect,
-                           border_radius=self.corner_radius)
-            pygame.draw.rect(screen, border_color, rect,
-                           self.border_width, border_radius=self.corner_radius)
-            
-            # Draw centered text
-            text_surf = font.render(text, True, (255, 255, 255))
+        rect = pygame.Rect(rect)
+        is_hovered = bool(is_hovered)
+        is_checkbox = bool(is_checkbox)
+        is_checked = bool(is_checked) and is_checkbox
+        key = ('button', text, rect.size, font, is_hovered, is_checkbox, is_checked, self._style_key())
+        cache = get_widget_cache()
+        entry = cache.get(key)
+        if entry is None:
+            entry = self._render(rect.size, text, font, is_hovered, is_checkbox, is_checked)
+            cache.put(key, entry)
+        surface, offset = entry
+        screen.blit(surface, (rect.x + offset[0], rect.y + offset[1]))
+
+    def _render(self, size, text, font, is_hovered, is_checkbox, is_checked):
+        """Render one button look to a cacheable surface."""
+        text_surf = font.render(text, True, (255, 255, 255))
+
+        def layout(rect):
+            """Checkbox rect (or None) and text position for a button rect."""
+            if is_checkbox:
+                checkbox_size = min(rect.height - 4, 20)  # Size relative to rect height
+                checkbox_rect = pygame.Rect(rect.x + 4, rect.y + (rect.height - checkbox_size) // 2,
+                                         checkbox_size, checkbox_size)
+                text_pos = (checkbox_rect.right + 8,
+                           rect.centery - text_surf.get_height() // 2)
+                return checkbox_rect, text_pos
             text_pos = (rect.centerx - text_surf.get_width() // 2,
                        rect.centery - text_surf.get_height() // 2)
+            return None, text_pos
+
+        def bounds(rect):
+            checkbox_rect, text_pos = layout(rect)
+            covered = rect.union(text_surf.get_rect(topleft=text_pos))
+            return covered.union(checkbox_rect) if checkbox_rect else covered
+
+        def draw(screen, rect):
+            # Select colors based on hover state
+            bg_color = self.bg_hover if is_hovered else self.bg_default
+            border_color = self.border_hover if is_hovered else self.border_default
+            checkbox_rect, text_pos = layout(rect)
+
+            if is_checkbox:
+                checkbox_size = checkbox_rect.width
+                # Draw checkbox background
+                pygame.draw.rect(screen, bg_color, checkbox_rect,
+                               border_radius=self.corner_radius)
+                pygame.draw.rect(screen, border_color, checkbox_rect,
+                               self.border_width, border_radius=self.corner_radius)
+
+                # Draw checkmark if checked
+                if is_checked:
+                    checkmark_points = [
+                        (checkbox_rect.x + checkbox_size * 0.2, checkbox_rect.y + checkbox_size * 0.5),
+                        (checkbox_rect.x + checkbox_size * 0.4, checkbox_rect.y + checkbox_size * 0.7),
+                        (checkbox_rect.x + checkbox_size * 0.8, checkbox_rect.y + checkbox_size * 0.3)
+                    ]
+                    pygame.draw.lines(screen, border_color, False, checkmark_points, 2)
+            else:
+                # Draw regular button
+                pygame.draw.rect(screen, bg_color, rect,
+                               border_radius=self.corner_radius)
+                pygame.draw.rect(screen, border_color, rect,
+                               self.border_width, border_radius=self.corner_radius)
+
+            # Draw label text
             screen.blit(text_surf, text_pos)
 
+        return _render_widget(size, bounds, draw)
+
 class Dropdown:
     def __init__(self, items, max_items=None):
         """
@@ -91,9 +186,16 @@ class Dropdown:
         self.scroll_offset = 0
         self.hovered_index = -1
 
+    def _style_key(self):
+        """Everything about the styling that changes how the dropdown looks."""
+        return (self.bg_default, self.bg_hover, self.border_default, self.border_hover,
+                self.border_width, self.corner_radius)
+
     def draw(self, screen, rect, font, hover_check_fn=None):
         """
         Draw the dropdown menu.
+        The closed button and the open list are rendered once per look and then
+        blitted from the widget cache.
         
         Args:
             screen: Pygame surface to draw on
@@ -101,31 +203,22 @@ class Dropdown:
             font: Font to use for text
             hover_check_fn: Function to check if button is being hovered
         """
+        rect = pygame.Rect(rect)
+        cache = get_widget_cache()
         # Use provided hover check function or fallback to simple collision
         mouse_pos = pygame.mouse.get_pos()
         is_hovered = hover_check_fn(rect, mouse_pos) if hover_check_fn else rect.collidepoint(mouse_pos)
-        # Draw main button with hover effect
-        bg_color = self.bg_hover if (self.is_open or is_hovered) else self.bg_default
-        border_color = self.border_hover if (self.is_open or is_hovered) else self.border_default
+        highlighted = bool(self.is_open or is_hovered)
 
-        pygame.draw.rect(screen, bg_color, rect, border_radius=self.corner_radius)
-        pygame.draw.rect(screen, border_color, rect, self.border_width, border_radius=self.corner_radius)
-
-        # Draw selected item
+        # Draw main button with hover effect
         selected_text = self.items[self.selected_index] if self.items else ""
-        text_color = (200, 200, 255) if (is_hovered or self.is_open) else (255, 255, 255)
-        text_surf = font.render(selected_text, True, text_color)
-        text_pos = (rect.x + 10, rect.centery - text_surf.get_height() // 2)
-        screen.blit(text_surf, text_pos)
-
-        # Draw dropdown arrow
-        arrow_points = [
-            (rect.right - 20, rect.centery - 4),
-            (rect.right - 10, rect.centery - 4),
-            (rect.right - 15, rect.centery + 4)
-        ]
-        arrow_color = self.border_hover if (is_hovered or self.is_open) else self.border_default
-        pygame.draw.polygon(screen, arrow_color, arrow_points)
+        key = ('dropdown', selected_text, rect.size, font, highlighted, self._style_key())
+        entry = cache.get(key)
+        if entry is None:
+            entry = self._render_button(rect.size, selected_text, font, highlighted)
+            cache.put(key, entry)
+        surface, offset = entry
+        screen.blit(surface, (rect.x + offset[0], rect.y + offset[1]))
 
         # Draw dropdown list if open
         if self.is_open and self.items:
@@ -138,7 +231,6 @@ class Dropdown:
             screen_height = screen.get_height()
             should_appear_above = rect.bottom + dropdown_height > screen_height
             
-            # Create dropdown list surface with extra space for scrolling
             if should_appear_above:
                 dropdown_rect = pygame.Rect(rect.x, rect.top - dropdown_height,
                                         rect.width, dropdown_height)
@@ -146,6 +238,50 @@ class Dropdown:
                 dropdown_rect = pygame.Rect(rect.x, rect.bottom,
                                         rect.width, dropdown_height)
 
+            key = ('dropdown_list', tuple(self.items), dropdown_rect.size, item_height, font,
+                   self.scroll_offset, self.hovered_index, self.selected_index, self._style_key())
+            entry = cache.get(key)
+            if entry is None:
+                entry = self._render_list(dropdown_rect.size, item_height, visible_items, font)
+                cache.put(key, entry)
+            surface, offset = entry
+            screen.blit(surface, (dropdown_rect.x + offset[0], dropdown_rect.y + offset[1]))
+
+    def _render_button(self, size, selected_text, font, highlighted):
+        """Render the closed dropdown button to a cacheable surface."""
+        text_color = (200, 200, 255) if highlighted else (255, 255, 255)
+        text_surf = font.render(selected_text, True, text_color)
+
+        def bounds(rect):
+            return rect.union(text_surf.get_rect(topleft=(rect.x + 10, rect.centery - text_surf.get_height() // 2)))
+
+        def draw(screen, rect):
+            bg_color = self.bg_hover if highlighted else self.bg_default
+            border_color = self.border_hover if highlighted else self.border_default
+
+            pygame.draw.rect(screen, bg_color, rect, border_radius=self.corner_radius)
+            pygame.draw.rect(screen, border_color, rect, self.border_width, border_radius=self.corner_radius)
+
+            # Draw selected item
+            text_pos = (rect.x + 10, rect.centery - text_surf.get_height() // 2)
+            screen.blit(text_surf, text_pos)
+
+            # Draw dropdown arrow
+            arrow_points = [
+                (rect.right - 20, rect.centery - 4),
+                (rect.right - 10, rect.centery - 4),
+                (rect.right - 15, rect.centery + 4)
+            ]
+            arrow_color = self.border_hover if highlighted else self.border_default
+            pygame.draw.polygon(screen, arrow_color, arrow_points)
+
+        return _render_widget(size, bounds, draw)
+
+    def _render_list(self, size, item_height, visible_items, font):
+        """Render the open dropdown list to a cacheable surface."""
+        def draw(screen, dropdown_rect):
+            dropdown_height = dropdown_rect.height
+
             # Fill the background behind the dropdown
             pygame.draw.rect(screen, (30, 30, 50), dropdown_rect,
                            border_radius=self.corner_radius)
@@ -157,8 +293,6 @@ class Dropdown:
                            (0, 0, dropdown_rect.width, dropdown_height),
                            border_radius=self.corner_radius)
             
-            # Create a rect for hover checking dropdown items
-            base_item_rect = pygame.Rect(rect.x, rect.bottom, rect.width, rect.height)
             # Calculate visible range based on scroll offset
             start_idx = self.scroll_offset
             end_idx = min(start_idx + visible_items, len(self.items))
@@ -167,16 +301,6 @@ class Dropdown:
             for i in range(start_idx, end_idx):
                 item_rect = pygame.Rect(0, (i - start_idx) * item_height,
                                      dropdown_rect.width, item_height)
-                # Calculate the rect for hover checking this item
-                if should_appear_above:
-                    item_rect_for_hover = pygame.Rect(rect.x,
-                                                    rect.top - (visible_items - (i - start_idx)) * item_height,
-                                                    rect.width, item_height)
-                else:
-                    item_rect_for_hover = pygame.Rect(rect.x,
-                                                    rect.bottom + (i - start_idx) * item_height,
-                                                    rect.width, item_height)
-                
                 
                 # Draw item background
                 item_bg_color = self.bg_hover if (i == self.hovered_index or i == self.selected_index) else (40, 40, 60)
@@ -207,6 +331,9 @@ class Dropdown:
                            (dropdown_rect.right - self.corner_radius, dropdown_rect.top),
                            1)
 
+        # Item text is clipped to the list surface, so the list rect covers everything
+        return _render_widget(size, lambda rect: rect, draw)
+
     def handle_event(self, event, rect, hover_check_fn=None):
         """
         Handle mouse events for the dropdown.
@@ -231,7 +358,7 @@ class Dropdown:
                 if is_clicked:
                     # Only toggle if it's the main button click
                     self.is_open = not self.is_open
-                    print(f"[DEBUG] Dropdown is_open: {self.is_open}")  # Add this debug print
+                    logger.debug("Dropdown is_open: %s", self.is_open)
                     return None
                 
                 if self.is_open:
@@ -275,7 +402,7 @@ class Dropdown:
                     if clicked_index is not None and clicked_index < len(self.items):
                         self.selected_index = clicked_index
                         self.is_open = False
-                        print(f"[DEBUG] Selected item {clicked_index}: {self.items[clicked_index]}")
+                        logger.debug("Selected item %s: %s", clicked_index, self.items[clicked_index])
                         return clicked_index
                     # Only close if clicking outside the dropdown area
                     elif not dropdown_rect.collidepoint(mouse_pos):
@@ -327,6 +454,14 @@ class Dropdown:
 # Global instances
 _button = None
 _dropdown = None
+_widget_cache = None
+
+def get_widget_cache():
+    """Get the global widget surface cache."""
+    global _widget_cache
+    if _widget_cache is None:
+        _widget_cache = WidgetCache()
+    return _widget_cache
 
 def get_button():
     """Get the global button instance."""
@@ -1,12 +1,28 @@
 import pygame
 import time
 from .Ping_Fonts import get_pixel_font
-from collections import deque
+from ..Ping_SurfacePool import get_surface_pool
+from ..Ping_RenderQueue import get_render_queue
+from ...Core.Ping_MatchHistory import get_match_history
+from ...Core.Ping_Logging import set_level, get_levels, get_log_stats, set_console_sink
+from ...Core.Ping_Profiler import get_profiler
+from collections import deque, OrderedDict
+from itertools import islice
+
+class _ConsoleMessage:
+    """A console message and its wrapped lines for the last layout it was wrapped for."""
+    __slots__ = ('text', 'wrap_key', 'lines')
+
+    def __init__(self, text):
+        self.text = text
+        self.wrap_key = None
+        self.lines = []
 
 class DebugConsole:
     def __init__(self):
         # Message storage
-        self.messages = deque(maxlen=1000)  # Keep last 1000 messages
+        self.messages = deque(maxlen=1000)  # Ring buffer of the last 1000 messages
+        self.posted_messages = deque(maxlen=1000)  # Messages from other threads, logged on the next update/draw
         self.visible = False
         self.toggle_time = 0
         self.scroll_offset = 0
@@ -29,8 +45,14 @@ class DebugConsole:
         self.console_height = 300
         
         # Line wrapping
-        self.wrapped_lines = []  # Cache for wrapped lines
+        self.wrapped_lines = []  # Wrapped lines of every message, kept in sync with self.messages
         self.max_line_width = 0  # Will be set in draw()
+        self._layout_key = None  # (font size, width) the wrapped lines were laid out for
+        self._pending_messages = 0  # Newest messages not yet added to wrapped_lines
+        
+        # Rendered line surfaces, most recently used last
+        self.line_cache = OrderedDict()
+        self.max_cached_lines = 256
         
         # Selection handling
         self.selection_start = None  # (line_index, char_index)
@@ -51,6 +73,14 @@ class DebugConsole:
             'help': self.cmd_help,
             'clear': self.cmd_clear,
             'toggle_shader': self.cmd_toggle_shader,
+            'toggle_dirty_rects': self.cmd_toggle_dirty_rects,
+            'render_mode': self.cmd_render_mode,
+            'toggle_dynamic_res': self.cmd_toggle_dynamic_res,
+            'pool_stats': self.cmd_pool_stats,
+            'draw_stats': self.cmd_draw_stats,
+            'match_history': self.cmd_match_history,
+            'log_level': self.cmd_log_level,
+            'perf': self.cmd_perf,
             'win_scores': self.cmd_win_scores,
             'debug_ai': self.cmd_debug_ai,
             'debug_collisions': self.cmd_debug_collisions,
@@ -64,6 +94,7 @@ class DebugConsole:
 
     def update(self, events):
         """Update console state based on events."""
+        self._log_posted()
         current_time = time.time()
         
         # Handle backtick toggle first
@@ -120,7 +151,23 @@ class DebugConsole:
     def log(self, message):
         """Add a message to the console."""
         timestamp = time.strftime("%H:%M:%S", time.localtime())
-        self.messages.append(f"[{timestamp}] {message}")
+        if len(self.messages) == self.messages.maxlen:
+            # The oldest message is about to drop out of the ring buffer
+            if len(self.messages) > self._pending_messages:
+                del self.wrapped_lines[:len(self.messages[0].lines)]
+            else:
+                self._pending_messages -= 1
+        self.messages.append(_ConsoleMessage(f"[{timestamp}] {message}"))
+        self._pending_messages += 1
+
+    def post(self, message):
+        """Queue a message from any thread; it's added to the console on the next update or draw."""
+        self.posted_messages.append(message)
+
+    def _log_posted(self):
+        """Log messages posted from other threads (on the main thread)."""
+        while self.posted_messages:
+            self.log(self.posted_messages.popleft())
     
     def execute_command(self):
         """Execute entered command."""
@@ -154,6 +201,14 @@ class DebugConsole:
             'help': 'Show this help message',
             'clear': 'Clear console messages',
             'toggle_shader': 'Toggle shader effects on/off',
+            'toggle_dirty_rects': 'Toggle dirty rect rendering (partial screen updates)',
+            'render_mode': 'Set render resolution (usage: render_mode <native|fixed|integer>)',
+            'toggle_dynamic_res': 'Toggle dynamic resolution scaling based on draw time',
+            'pool_stats': 'Show temporary surface pool allocation counts',
+            'draw_stats': 'Show batched blit and draw call counts for the last frame',
+            'match_history': 'Show win rate per level and frame time per build',
+            'log_level': 'Show or set logging levels (usage: log_level [subsystem|all] [level])',
+            'perf': 'Show frame time percentiles per subsystem (usage: perf [overlay|reset])',
             'win_scores': 'Set number of scores needed to win (usage: win_scores <number>)',
             'debug_ai': 'Toggle AI debug messages',
             'debug_collisions': 'Toggle collision detection debug messages',
@@ -170,6 +225,8 @@ class DebugConsole:
     def cmd_clear(self, args):
         """Clear console messages."""
         self.messages.clear()
+        self.wrapped_lines = []
+        self._pending_messages = 0
         self.log("Console cleared")
     
     def cmd_toggle_shader(self, args):
@@ -177,8 +234,100 @@ class DebugConsole:
         from ..Menus.Ping_Settings import SettingsScreen
         current = SettingsScreen.get_shader_enabled()
         SettingsScreen.update_shader_enabled(not current)
+        if self.game_state and hasattr(self.game_state, 'arena'):
+            self.game_state.arena.set_shader_enabled(not current)
         self.log(f"Shader {'disabled' if current else 'enabled'}")
 
+    def cmd_toggle_dirty_rects(self, args):
+        """Toggle dirty rect rendering on/off."""
+        from ..Menus.Ping_Settings import SettingsScreen
+        current = SettingsScreen.get_dirty_rects_enabled()
+        SettingsScreen.update_dirty_rects_enabled(not current)
+        if self.game_state and hasattr(self.game_state, 'arena'):
+            self.game_state.arena.dirty_rects_enabled = not current
+            self.game_state.arena.request_full_redraw()
+        self.log(f"Dirty rect rendering {'disabled' if current else 'enabled'}")
+
+    def cmd_render_mode(self, args):
+        """Set the render resolution mode."""
+        from ..Menus.Ping_Settings import SettingsScreen
+        if not args:
+            self.log(f"Current render mode: {SettingsScreen.get_render_resolution_mode()}")
+            return
+        mode = args[0].lower()
+        if mode not in ('native', 'fixed', 'integer'):
+            self.log("Error: Render mode must be native, fixed or integer")
+            return
+        SettingsScreen.update_render_resolution_mode(mode)
+        if self.game_state and hasattr(self.game_state, 'arena'):
+            self.game_state.arena.set_render_resolution_mode(mode)
+        self.log(f"Render mode set to {mode}")
+
+    def cmd_toggle_dynamic_res(self, args):
+        """Toggle dynamic resolution scaling on/off."""
+        from ..Menus.Ping_Settings import SettingsScreen
+        current = SettingsScreen.get_dynamic_resolution_enabled()
+        SettingsScreen.update_dynamic_resolution_enabled(not current)
+        if self.game_state and hasattr(self.game_state, 'arena'):
+            self.game_state.arena.set_dynamic_resolution_enabled(not current)
+        self.log(f"Dynamic resolution {'disabled' if current else 'enabled'}")
+
+    def cmd_pool_stats(self, args):
+        """Show surface pool statistics for the last frame."""
+        stats = get_surface_pool().get_stats()
+        self.log(f"Surface pool: {stats['frame_allocations']} allocated, {stats['frame_reuses']} reused last frame")
+        self.log(f"  {stats['pooled']} pooled across {stats['sizes']} sizes, {stats['in_use']} in use")
+
+    def cmd_draw_stats(self, args):
+        """Show render queue counters for the last frame."""
+        stats = get_render_queue().get_stats()
+        self.log(f"Render queue: {stats['blits_submitted']} blits in {stats['draw_calls']} draw calls last frame")
+
+    def cmd_log_level(self, args):
+        """Show logging levels, or set the level of a subsystem."""
+        if len(args) >= 2:
+            if set_level(args[0], args[1]):
+                self.log(f"Log level for {args[0]} set to {args[1].upper()}")
+            else:
+                self.log("Error: Level must be DEBUG, INFO, WARNING, ERROR or CRITICAL")
+            return
+        for subsystem, level in get_levels().items():
+            if not args or args[0] == subsystem:
+                self.log(f"  {subsystem:<16} {level}")
+        stats = get_log_stats()
+        self.log(f"  {stats['suppressed']} repeated and {stats['dropped']} rate-limited messages held back")
+
+    def cmd_perf(self, args):
+        """Show profiler percentiles, or toggle/reset the profiler overlay."""
+        profiler = get_profiler()
+        if args and args[0].lower() == 'overlay':
+            visible = profiler.toggle_overlay()
+            self.log(f"Profiler overlay {'shown' if visible else 'hidden'}")
+            return
+        if args and args[0].lower() == 'reset':
+            profiler.reset()
+            self.log("Profiler samples cleared")
+            return
+        summary = profiler.get_summary()
+        if not summary:
+            self.log("No frames profiled yet")
+            return
+        frames = len(profiler.samples.get('frame', ()))
+        self.log(f"Last {frames} frames (ms):      mean     p50     p95     p99")
+        for name, stats in summary.items():
+            self.log(f"  {name:<12} {stats['mean']:>7.2f} {stats['p50']:>7.2f} {stats['p95']:>7.2f} {stats['p99']:>7.2f}")
+
+    def cmd_match_history(self, args):
+        """Show summaries from the match history database."""
+        history = get_match_history()
+        levels = history.win_rate_by_level()
+        if not levels:
+            self.log("No completed matches recorded yet")
+        for row in levels:
+            self.log(f"  {row['level']:<24} {row['wins']}/{row['matches']} won ({row['win_rate'] * 100:.0f}%)")
+        for row in history.frame_time_by_build()[:5]:
+            self.log(f"  build {row['build']:<10} {row['avg_frame_ms']:.2f} ms avg, {row['worst_frame_ms']:.2f} ms worst ({row['matches']} matches)")
+
     def cmd_win_scores(self, args):
         """Set the number of scores needed to win."""
         if not args:
@@ -197,16 +346,19 @@ class DebugConsole:
     def cmd_debug_ai(self, args):
         """Toggle AI debug messages."""
         self.debug_ai = not self.debug_ai
+        set_level('ai', 'DEBUG' if self.debug_ai else 'INFO')
         self.log(f"AI debug messages {'enabled' if self.debug_ai else 'disabled'}")
     
     def cmd_debug_collisions(self, args):
         """Toggle collision detection debug messages."""
         self.debug_collisions = not self.debug_collisions
+        set_level('collision', 'DEBUG' if self.debug_collisions else 'INFO')
         self.log(f"Collision debug messages {'enabled' if self.debug_collisions else 'disabled'}")
     
     def cmd_debug_input(self, args):
         """Toggle input processing debug messages."""
         self.debug_input = not self.debug_input
+        set_level('input', 'DEBUG' if self.debug_input else 'INFO')
         self.log(f"Input debug messages {'enabled' if self.debug_input else 'disabled'}")
     
     def cmd_debug_sound(self, args):
@@ -217,11 +369,13 @@ class DebugConsole:
     def cmd_debug_physics(self, args):
         """Toggle physics simulation debug messages."""
         self.debug_physics = not self.debug_physics
+        set_level('physics', 'DEBUG' if self.debug_physics else 'INFO')
         self.log(f"Physics debug messages {'enabled' if self.debug_physics else 'disabled'}")
 
     def cmd_debug_settings(self, args):
         """Toggle settings menu debug messages."""
         self.debug_settings = not self.debug_settings
+        set_level('settings', 'DEBUG' if self.debug_settings else 'INFO')
         self.log(f"Settings menu debug messages {'enabled' if self.debug_settings else 'disabled'}")
 
     def cmd_toggle_sound_debug(self, args):
@@ -314,11 +468,12 @@ class DebugConsole:
         current_line = []
         current_width = 0
         
+        space_width = font.size(' ')[0]
+        
         for word in words:
-            word_surface = font.render(word, True, self.text_color)
-            word_width = word_surface.get_width()
+            word_width = font.size(word)[0]
             
-            if current_width + word_width + (len(current_line) * font.size(' ')[0]) <= max_width:
+            if current_width + word_width + (len(current_line) * space_width) <= max_width:
                 current_line.append(word)
                 current_width += word_width
             else:
@@ -332,24 +487,52 @@ class DebugConsole:
         
         return lines
 
+    def _update_layout(self, font, max_width):
+        """Bring wrapped_lines up to date, wrapping only messages new since the last layout."""
+        layout_key = (self.font_size, max_width)
+        if layout_key != self._layout_key:
+            # Width changed, relayout every message (each keeps its wrap for its own key)
+            self._layout_key = layout_key
+            self.wrapped_lines = []
+            self._pending_messages = len(self.messages)
+        if not self._pending_messages:
+            return
+        for message in islice(self.messages, len(self.messages) - self._pending_messages, None):
+            if message.wrap_key != layout_key:
+                message.lines = self.wrap_text(message.text, font, max_width)
+                message.wrap_key = layout_key
+            self.wrapped_lines.extend(message.lines)
+        self._pending_messages = 0
+
+    def _render_line(self, font, line):
+        """Get the rendered surface for a line of console text."""
+        key = (self.font_size, line)
+        surface = self.line_cache.get(key)
+        if surface is None:
+            surface = font.render(line, True, self.text_color)
+            self.line_cache[key] = surface
+            if len(self.line_cache) > self.max_cached_lines:
+                self.line_cache.popitem(last=False)
+        else:
+            self.line_cache.move_to_end(key)
+        return surface
+
     def draw(self, screen, WINDOW_WIDTH, WINDOW_HEIGHT):
         """Draw the console if visible."""
+        self._log_posted()
         if not self.visible:
             return
             
         # Create console background
-        console_surface = pygame.Surface((WINDOW_WIDTH, self.console_height), pygame.SRCALPHA)
+        console_surface = get_surface_pool().acquire((WINDOW_WIDTH, self.console_height), pygame.SRCALPHA)
         pygame.draw.rect(console_surface, self.bg_color, (0, 0, WINDOW_WIDTH, self.console_height))
         
         # Get font for console text
         font = get_pixel_font(self.font_size)
         self.max_line_width = WINDOW_WIDTH - (2 * self.padding)
         
-        # Update wrapped lines cache
-        self.wrapped_lines = []
-        for message in self.messages:
-            wrapped = self.wrap_text(message, font, self.max_line_width)
-            self.wrapped_lines.extend(wrapped)
+        # Wrap any new messages
+        self._update_layout(font, self.max_line_width)
         
         # Calculate max visible lines
         max_lines = (self.console_height - (3 * self.padding) - self.line_height) // self.line_height
@@ -379,7 +562,7 @@ class DebugConsole:
                 pygame.draw.rect(console_surface, self.selected_color, selection_rect)
             
             # Draw text
-            text = font.render(line, True, self.text_color)
+            text = self._render_line(font, line)
             console_surface.blit(text, (self.padding, y))
             y -= self.line_height
         
@@ -390,11 +573,12 @@ class DebugConsole:
         wrapped_cmd = self.wrap_text(prompt, font, self.max_line_width)
         y = self.console_height - self.padding - (len(wrapped_cmd) * self.line_height)
         for line in wrapped_cmd:
-            cmd_text = font.render(line, True, self.text_color)
+            cmd_text = self._render_line(font, line)
             console_surface.blit(cmd_text, (self.padding, y))
             y += self.line_height
         
         screen.blit(console_surface, (0, 0))
+        get_surface_pool().release(console_surface)
         
     def start_selection(self, mouse_pos):
         """Start text selection at the given mouse position."""
@@ -478,6 +662,7 @@ def get_console():
     global _console
     if _console is None:
         _console = DebugConsole()
+        set_console_sink(_console.post)
     return _console
 
 def log_message(message):
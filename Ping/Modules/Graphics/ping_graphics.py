@@ -9,6 +9,9 @@ import pygame # Ensure pygame is imported if not already
 
 import os # Needed for path manipulation
 import time # Import time for blinking animation
+from Ping.Modules.Core.Ping_Logging import get_logger
+
+logger = get_logger("render")
 
 # Global cache for loaded sprite images
 # Key: relative path (e.g., "MySprite.png"), Value: pygame.Surface
@@ -93,6 +96,10 @@ def generate_sludge_texture(width, height, scale, colors):
     # Draw slightly more to ensure coverage when wrapping/seeding
     num_vertical_steps = int(tex_height / (blob_base_radius * 0.5)) + 5
 
+    # Own generator: this runs on the sludge worker thread, and re-seeding the
+    # global one would change the game's random sequence (e.g. seeded benchmark runs)
+    rng = random.Random()
+
     for i in range(num_vertical_steps):
         # Calculate base y position for this 'row' of blobs
         y_base_logical = (i * blob_base_radius * 0.5)
@@ -106,16 +113,16 @@ def generate_sludge_texture(width, height, scale, colors):
         for j in range(num_blobs_per_row * 2): # Draw double for overlap
             # Seed randomness based on vertical position and horizontal index
             # Ensures the generated texture is consistent if parameters are the same
-            random.seed(f"{y_seed_pos:.2f}-{j}")
+            rng.seed(f"{y_seed_pos:.2f}-{j}")
 
             # Randomize blob properties
-            blob_radius = max(1, int(blob_base_radius * random.uniform(0.6, 1.6)))
-            x_pos = random.uniform(0, tex_width)
+            blob_radius = max(1, int(blob_base_radius * rng.uniform(0.6, 1.6)))
+            x_pos = rng.uniform(0, tex_width)
             y_pos = y_base_logical # Draw relative to the logical y base for this step
 
             # Choose base color and alpha (reduced alpha range for murkier blend)
-            base_color_rgb = random.choice([sludge_mid_color_rgb, sludge_highlight_color_rgb, sludge_mid_color_rgb])
-            alpha = random.randint(60, 140) # Lower max alpha
+            base_color_rgb = rng.choice([sludge_mid_color_rgb, sludge_highlight_color_rgb, sludge_mid_color_rgb])
+            alpha = rng.randint(60, 140) # Lower max alpha
             final_color = (base_color_rgb[0], base_color_rgb[1], base_color_rgb[2], alpha)
 
             # Draw the blob onto the texture surface
@@ -226,7 +233,8 @@ def draw_casino_background(surface, compiler_instance):
         anim_state['pinball_lights_last_dims'] = (0, 0) # Initialize stored dimensions
     elif anim_state.get('pinball_lights_last_dims') != (arena_width, arena_height):
         recalculate_lights = True
-        print(f"Casino BG: Dimensions changed from {anim_state.get('pinball_lights_last_dims')} to {(arena_width, arena_height)}. Recalculating light positions.")
+        logger.debug("Casino BG: Dimensions changed from %s to %s. Recalculating light positions.",
+                     anim_state.get('pinball_lights_last_dims'), (arena_width, arena_height))
 
     if recalculate_lights:
         # Store the current dimensions used for calculation
@@ -1318,7 +1326,8 @@ def draw_factory_background(surface, compiler_instance):
     current_dims_scale = (arena_width, arena_height, scale)
     recalculate_geometry = False
     if anim_state.get('factory_last_dims_scale') != current_dims_scale:
-        print(f"Factory BG: Dimensions/Scale changed from {anim_state.get('factory_last_dims_scale')} to {current_dims_scale}. Recalculating geometry & fonts.")
+        logger.debug("Factory BG: Dimensions/Scale changed from %s to %s. Recalculating geometry & fonts.",
+                     anim_state.get('factory_last_dims_scale'), current_dims_scale)
         recalculate_geometry = True
         anim_state['factory_last_dims_scale'] = current_dims_scale
 
@@ -1338,12 +1347,12 @@ def draw_factory_background(surface, compiler_instance):
             anim_state['factory_small_font'] = pygame.font.Font(None, font_size_small_init)
             anim_state['factory_large_font'] = pygame.font.Font(None, font_size_large_init)
         except Exception as e_font:
-            print(f"Warning: Failed to load default font, falling back to SysFont: {e_font}")
+            logger.warning("Failed to load default font, falling back to SysFont: %s", e_font)
             try:
                  anim_state['factory_small_font'] = pygame.font.SysFont("monospace", font_size_small_init)
                  anim_state['factory_large_font'] = pygame.font.SysFont("monospace", font_size_large_init)
             except Exception as e_sysfont:
-                 print(f"ERROR: Failed to load ANY font: {e_sysfont}")
+                 logger.error("Failed to load ANY font: %s", e_sysfont)
                  anim_state['factory_small_font'] = None
                  anim_state['factory_large_font'] = None
 
@@ -1484,13 +1493,13 @@ def draw_factory_background(surface, compiler_instance):
             anim_state['factory_small_font'] = pygame.font.Font(None, font_size_small_init)
             anim_state['factory_large_font'] = pygame.font.Font(None, font_size_large_init)
         except Exception as e_font:
-            print(f"Warning: Failed to load default font, falling back to SysFont: {e_font}")
+            logger.warning("Failed to load default font, falling back to SysFont: %s", e_font)
             try:
                  # Fallback to monospace system font
                  anim_state['factory_small_font'] = pygame.font.SysFont("monospace", font_size_small_init)
                  anim_state['factory_large_font'] = pygame.font.SysFont("monospace", font_size_large_init)
             except Exception as e_sysfont:
-                 print(f"ERROR: Failed to load ANY font: {e_sysfont}")
+                 logger.error("Failed to load ANY font: %s", e_sysfont)
                  # Store None to prevent errors later, though text won't render
                  anim_state['factory_small_font'] = None
                  anim_state['factory_large_font'] = None
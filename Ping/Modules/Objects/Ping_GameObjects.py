@@ -3,10 +3,20 @@ import math
 import random
 from Ping.Modules.Objects.Ping_Ball import Ball
 from Ping.Modules.Objects.Ping_Paddle import Paddle
+from Ping.Modules.Graphics.Ping_SurfacePool import get_surface_pool
+from Ping.Modules.Graphics.Ping_RenderQueue import get_render_queue, LAYER_EFFECTS
+from Ping.Modules.Core.Ping_Logging import get_logger
 from Ping.Modules.Objects.Ping_Obstacles import Obstacle, Goal, Portal, PowerUpBall, Manhole, Bumper, GhostObstacle # Added Bumper and GhostObstacle
 
+logger = get_logger("objects")
+
 class ArenaObject:
     """Base class for objects that need arena properties."""
+    # Screen pixels around the scaled rect that draw() may touch (drop shadows, outlines)
+    DRAW_MARGIN = 6
+    # True if the object looks identical every frame while it stays in place
+    STATIC_VISUAL = False
+
     def __init__(self, arena_width, arena_height, scoreboard_height, scale_rect):
         self.arena_width = arena_width
         self.arena_height = arena_height
@@ -18,6 +28,11 @@ class ArenaObject:
         scaled_rect = self.scale_rect(self.rect)
         pygame.draw.rect(screen, color, scaled_rect)
 
+    def get_draw_bounds(self, scale_rect=None):
+        """Screen-space rect covering everything draw() touches, used by the dirty rect renderer."""
+        scale_rect = scale_rect or self.scale_rect
+        return scale_rect(self.rect).inflate(self.DRAW_MARGIN * 2, self.DRAW_MARGIN * 2)
+
 class PaddleObject(ArenaObject):
     def __init__(self, x, y, width, height, arena_width, arena_height, scoreboard_height, scale_rect, is_left_paddle=True):
         """Initialize a paddle object with arena properties."""
@@ -147,6 +162,8 @@ class BallObject(ArenaObject):
 # Added for Sewer Level implementation
 class GoalObject(ArenaObject):
     """Goal object that handles scoring zones behind paddles."""
+    STATIC_VISUAL = True
+
     def __init__(self, arena_width, arena_height, scoreboard_height, scale_rect, is_left_goal=True):
         """Initialize a goal object with arena properties."""
         super().__init__(arena_width, arena_height, scoreboard_height, scale_rect)
@@ -199,11 +216,12 @@ class GoalObject(ArenaObject):
             pygame.draw.line(screen, highlight_color, (bar_rect.left, bar_rect.top), (bar_rect.right, bar_rect.top), 1)
 
         # Add a subtle glow effect behind the bars
-        glow_surface = pygame.Surface(scaled_rect.size, pygame.SRCALPHA)
+        glow_surface = get_surface_pool().acquire(scaled_rect.size, pygame.SRCALPHA)
         glow_rect_inner = scaled_rect.inflate(-10, -10) # Smaller inner glow
         # Draw the glow centered within the goal area
         pygame.draw.rect(glow_surface, glow_color, glow_surface.get_rect().inflate(-5, -5), border_radius=5)
         screen.blit(glow_surface, scaled_rect.topleft)
+        get_surface_pool().release(glow_surface)
 
         # Draw a border to make it stand out
         pygame.draw.rect(screen, highlight_color, scaled_rect, 2, border_radius=3)
@@ -240,6 +258,8 @@ class PortalObject(ArenaObject):
         self.portal.draw(screen, colors, scale_rect)
 
 class ObstacleObject(ArenaObject):
+    STATIC_VISUAL = True
+
     # Added x, y, and properties parameters
     def __init__(self, arena_width, arena_height, scoreboard_height, scale_rect, x=None, y=None, width=20, height=60, properties=None):
         """Initialize an obstacle with arena properties, position, and optional properties."""
@@ -353,6 +373,10 @@ class ManHoleObject(ArenaObject):
     def draw(self, screen, color):
         """Override draw method to handle both dormant and spouting states."""
         self.manhole.draw(screen, color, self.scale_rect)
+
+    def get_draw_bounds(self, scale_rect=None):
+        """Screen-space rect covering the hole, flying cover and water spout."""
+        return self.manhole.get_draw_bounds(scale_rect or self.scale_rect)
     
     @property
     def is_spouting(self):
@@ -576,14 +600,29 @@ class CandleObject(ArenaObject):
         # Simple light glow around the candle flame, modulated by visual factor
         glow_radius = scaled_candle_body_h * 2.0 * self.current_visual_factor # Glow relative to body size & pulse
         glow_radius = max(1, int(glow_radius))
-        glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+        glow_surf = get_surface_pool().acquire((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
         glow_color_with_alpha = (self.flame_outer_color[0], self.flame_outer_color[1], self.flame_outer_color[2], 30) # Keep glow subtle
         pygame.draw.circle(glow_surf, glow_color_with_alpha, (glow_radius, glow_radius), glow_radius)
         
         # Glow should be centered around the flame area
         glow_center_x = flame_center_x_draw
         glow_center_y = wick_top_y - current_flame_h / 2 # Center of the flame height
-        surface.blit(glow_surf, (glow_center_x - glow_radius, glow_center_y - glow_radius), special_flags=pygame.BLEND_RGBA_ADD)
+        # Queued on the effects layer, so the glow also brightens objects drawn after the candle
+        get_render_queue().submit(surface, LAYER_EFFECTS, glow_surf, (glow_center_x - glow_radius, glow_center_y - glow_radius),
+                                  special_flags=pygame.BLEND_RGBA_ADD, pooled=True)
+
+    def get_draw_bounds(self, scale_rect=None):
+        """Screen-space rect covering the body, the swaying flame and its glow."""
+        scale_rect = scale_rect or self.scale_rect
+        # Everything above the base: body, wick, the tallest pulsed flame and the glow radius around it
+        max_factor = 1.0 + self.pulse_magnitude_visual
+        height_above_logic = (self.body_height_logic + self.wick_height_logic
+                              + self.flame_base_height_logic * 1.2 * max_factor
+                              + self.body_height_logic * 2.0 * max_factor)
+        half_width_logic = max(self.body_width_logic, self.body_height_logic * 2.0 * max_factor) + 2
+        logic_rect = pygame.Rect(self.x - half_width_logic, self.y - height_above_logic,
+                                 half_width_logic * 2, height_above_logic + self.body_height_logic)
+        return scale_rect(logic_rect).inflate(self.DRAW_MARGIN * 2, self.DRAW_MARGIN * 2)
 
     def get_light_properties(self, scale):
         """
@@ -655,15 +694,15 @@ class SpriteObject(ArenaObject):
             try:
                 # Scale the loaded image to the dimensions defined in the PMF
                 # Use smoothscale for better quality, scale for performance
-                print(f"DEBUG SpriteObject: Scaling sprite '{image_path}' to ({width}x{height})")
+                logger.debug("SpriteObject: Scaling sprite '%s' to (%dx%d)", image_path, width, height)
                 self.surface = pygame.transform.smoothscale(original_surface, (width, height))
             except Exception as e:
-                 print(f"Error scaling sprite image '{image_path}' to ({width}x{height}): {e}")
+                 logger.error("Error scaling sprite image '%s' to (%dx%d): %s", image_path, width, height, e)
                  # Optionally, keep the original surface if scaling fails? Or set to None?
                  # Setting to None means it won't draw if scaling fails.
                  self.surface = None
         else:
-            print(f"Warning: Failed to load sprite image '{image_path}' for SpriteObject at ({x},{y}). Cannot scale or draw.")
+            logger.warning("Failed to load sprite image '%s' for SpriteObject at (%s,%s). Cannot scale or draw.", image_path, x, y)
             
         # Note: The self.rect uses the width/height from the PMF/editor.
         # The loaded surface might have different dimensions, but we blit at the defined x, y.
@@ -671,17 +710,11 @@ class SpriteObject(ArenaObject):
     # Override draw method to use the loaded surface
     def draw(self, screen): # Does not need 'color' argument
         """Draw the sprite if its surface was loaded."""
-        # Add a debug log inside the draw method
-        # print(f"DEBUG: SpriteObject.draw called for path: {self.image_path}. Surface exists: {self.surface is not None}") # Uncomment if verbose logging needed
         if self.surface:
             # Use the ArenaObject's scale_rect to get the drawing position and handle scaling/offset
             # We scale the position (rect.topleft) but not the surface itself
             scaled_rect = self.scale_rect(self.rect)
-            # Adding a print statement here to confirm draw *is attempting* to blit
-            print(f"DEBUG: Drawing sprite '{self.image_path}' at {scaled_rect.topleft}")
             screen.blit(self.surface, scaled_rect.topleft)
-        # else: # Optionally log when surface is None
-            # print(f"DEBUG: Skipping draw for sprite '{self.image_path}' - surface not loaded.") # Uncomment if needed
 
         # No placeholder drawing here; if load failed, it simply won't draw.
 
@@ -715,6 +748,11 @@ class GhostObstacleObject(ArenaObject):
         # self.scale_rect is inherited from ArenaObject.
         self.ghost.draw(screen, colors, self.scale_rect)
 
+    def get_draw_bounds(self, scale_rect=None):
+        """Screen-space rect covering the ghost body blobs, which extend past the logical rect."""
+        scaled_rect = (scale_rect or self.scale_rect)(self.rect)
+        return scaled_rect.inflate(scaled_rect.width + self.DRAW_MARGIN * 2, scaled_rect.height + self.DRAW_MARGIN * 2)
+
     def handle_collision(self, ball_instance):
         """Handle collision between ghost and ball."""
         # This might not be strictly necessary if all collision logic is in update,
@@ -1052,6 +1090,11 @@ class Pickles(ArenaObject):
         # self.rect.center will be updated at the end of the main update method.
 
 
+    def get_draw_bounds(self, scale_rect=None):
+        """Screen-space rect covering the cat, whose tail and ears stick out of the logical rect."""
+        scaled_rect = (scale_rect or self.scale_rect)(self.rect)
+        return scaled_rect.inflate(scaled_rect.width + self.DRAW_MARGIN * 2, scaled_rect.height + self.DRAW_MARGIN * 2)
+
     def draw(self, screen, colors=None):
         # print(f"Pickles.draw() called. State: {self.state}") # Confirm draw method entry. REMOVED TO REDUCE SPAM
         sr = self.scale_rect(self.rect) # Scaled rect for drawing
@@ -3,6 +3,11 @@ import random
 import math
 from .Ping_Ball import Ball
 from ..Graphics.Effects.Ping_Particles import WaterSpout
+from ..Graphics.Ping_SurfacePool import get_surface_pool
+from ..Core.Ping_Logging import get_logger
+
+logger = get_logger("objects")
+collision_logger = get_logger("collision")
 
 class Bumper:
     def __init__(self, x, y, radius=30):
@@ -333,10 +338,11 @@ class Portal(Obstacle):
 
         # 3. Add subtle glow effect inside the portal void
         # Create a surface with alpha for transparency
-        glow_surface = pygame.Surface(inner_rect.size, pygame.SRCALPHA)
+        glow_surface = get_surface_pool().acquire(inner_rect.size, pygame.SRCALPHA, clear=False)
         # Fill with glow color and low alpha (e.g., 60 out of 255)
         glow_surface.fill((*portal_glow, 60))
         screen.blit(glow_surface, inner_rect.topleft)
+        get_surface_pool().release(glow_surface)
 
         # 4. Optional: Add a hint of vegetation/slime dripping down
         if random.random() < 0.1: # Low chance to draw slime
@@ -547,6 +553,21 @@ class Manhole:
             # Draw the cover in its normal position over the hole
             self._draw_pixelated_cover(screen, colors, cover_center, cover_radius)
 
+    def get_draw_bounds(self, scale_rect):
+        """Screen-space rect covering the hole, the cover flight path and the water particles."""
+        hole_logic_rect = pygame.Rect(self.x, self.initial_y, self.width, self.height)
+        bounds = scale_rect(hole_logic_rect).inflate(8, 16) # Hole and cover shadows
+        if self.is_spouting:
+            flight_rect = bounds.copy()
+            scaled_fly_distance = scale_rect(pygame.Rect(0, 0, 0, self.cover_fly_distance)).height
+            scaled_drift_distance = scale_rect(pygame.Rect(0, 0, self.cover_drift_distance, 0)).width
+            flight_rect.move_ip(0, -scaled_fly_distance if self.is_bottom else scaled_fly_distance)
+            bounds.union_ip(flight_rect.inflate(scaled_drift_distance * 2, 0))
+            spout_bounds = self.water_spout.get_bounds(scale_rect)
+            if spout_bounds:
+                bounds.union_ip(spout_bounds)
+        return bounds
+
     def _draw_pixelated_cover(self, screen, colors, center, radius):
         """Draw a pixelated top-down manhole cover (circle) with distinct sections."""
         center_x, center_y = int(center[0]), int(center[1])
@@ -682,7 +703,7 @@ class PowerUpBall:
             return False
 
         if ball.rect.colliderect(self.rect):
-            print(f"PowerUpBall collision detected! Creating new ball...")
+            collision_logger.debug("PowerUpBall collision detected! Creating new ball...")
             # Create new raw ball with same properties
             new_ball = Ball(ball.ball.size)
             # Start new ball offset from power-up location to avoid immediate collision
@@ -693,7 +714,8 @@ class PowerUpBall:
             new_ball.speed = ball.ball.speed
             new_ball.velocity_x = ball.ball.velocity_x
             new_ball.velocity_y = ball.ball.velocity_y
-            print(f"New ball created at ({new_ball.rect.x}, {new_ball.rect.y}) with velocity ({new_ball.velocity_x}, {new_ball.velocity_y})")
+            collision_logger.debug("New ball created at (%s, %s) with velocity (%s, %s)",
+                                   new_ball.rect.x, new_ball.rect.y, new_ball.velocity_x, new_ball.velocity_y)
 
             # Deactivate power up
             self.active = False
@@ -836,7 +858,7 @@ class RouletteSpinner:
             self.timer_font = pygame.font.SysFont(None, self.timer_font_size)
             self.number_font = pygame.font.SysFont(None, self.number_font_size)
         except Exception as e:
-            print(f"Warning: Could not load default system font for RouletteSpinner: {e}")
+            logger.warning("Could not load default system font for RouletteSpinner: %s", e)
             class DummyFont:
                 def render(self, *args, **kwargs):
                     surf = pygame.Surface((1,1), pygame.SRCALPHA); surf.fill((0,0,0,0)); return surf
@@ -976,6 +998,11 @@ class RouletteSpinner:
         # if sound_manager: sound_manager.play_sfx('roulette_release')
 
 
+    def get_draw_bounds(self, scale_rect):
+        """Screen-space rect covering the wheel, its shadow and the timer text."""
+        logic_rect = pygame.Rect(self.x - self.radius, self.y - self.radius, self.radius * 2, self.radius * 2)
+        return scale_rect(logic_rect).inflate((self.shadow_offset + 4) * 2, (self.shadow_offset + 4) * 2)
+
     def draw(self, screen, colors, scale_rect):
         """Draw the updated roulette spinner graphics."""
         # Scale the core properties
@@ -1003,9 +1030,10 @@ class RouletteSpinner:
 
         # 1. Draw Shadow (using a surface for potential alpha blending)
         shadow_center_roulette = (scaled_center[0] + self.shadow_offset, scaled_center[1] + self.shadow_offset) # Renamed
-        shadow_surface = pygame.Surface((scaled_radius_draw*2 + self.shadow_offset*2, scaled_radius_draw*2 + self.shadow_offset*2), pygame.SRCALPHA)
+        shadow_surface = get_surface_pool().acquire((scaled_radius_draw*2 + self.shadow_offset*2, scaled_radius_draw*2 + self.shadow_offset*2), pygame.SRCALPHA)
         pygame.draw.circle(shadow_surface, shadow_color, (scaled_radius_draw + self.shadow_offset, scaled_radius_draw + self.shadow_offset), scaled_radius_draw)
         screen.blit(shadow_surface, (scaled_center[0] - scaled_radius_draw, scaled_center[1] - scaled_radius_draw))
+        get_surface_pool().release(shadow_surface)
 
 
         # 2. Draw Outer Ring Segments and Numbers
@@ -1046,7 +1074,7 @@ class RouletteSpinner:
                     num_rect = num_surf.get_rect(center=(int(num_x), int(num_y)))
                     screen.blit(num_surf, num_rect)
                 except Exception as e:
-                    print(f"Error rendering segment number: {e}") # Handle font errors
+                    logger.error("Error rendering segment number: %s", e) # Handle font errors
 
         # 3. Draw Inner Yellow Wheel
         if inner_wheel_radius > 0:
@@ -1094,7 +1122,7 @@ class RouletteSpinner:
                 text_rect = text_surface.get_rect(center=scaled_center)
                 screen.blit(text_surface, text_rect)
             except Exception as e:
-                 print(f"Error rendering timer text: {e}")
+                 logger.error("Error rendering timer text: %s", e)
 
 
         # Note: The captured ball itself is positioned in update().
@@ -1232,6 +1260,18 @@ class PistonObstacle:
             return True
         return False
 
+    def get_draw_bounds(self, scale_rect):
+        """Screen-space rect covering the base, the fully extended head and any steam particles."""
+        extended_rect_logic = self.base_rect_logic.union(
+            pygame.Rect(self.base_rect_logic.left, self.base_rect_logic.top - self.head_height,
+                        self.width, self.head_height))
+        bounds = scale_rect(extended_rect_logic).inflate(8, 8)
+        for particle in self.steam_particles:
+            radius = int(particle['radius'] * 2) + 1 # Radius is scaled at draw time, stay generous
+            bounds.union_ip(pygame.Rect(int(particle['pos'][0]) - radius, int(particle['pos'][1]) - radius,
+                                        radius * 2, radius * 2))
+        return bounds
+
     def draw(self, screen, colors, scale_rect):
         """Draw the piston based on its current state."""
         # Get scaled dimensions and positions
@@ -1405,6 +1445,20 @@ class TeslaCoilObstacle:
         return False
 
 
+    def get_draw_bounds(self, scale_rect):
+        """Screen-space rect covering the coil and, while sparking, every spark branch and its glow."""
+        scaled_center_x, scaled_center_y = scale_rect(pygame.Rect(self.x, self.y, 0, 0)).center
+        scaled_base_radius = scale_rect(pygame.Rect(0, 0, self.base_radius_logic, 0)).width
+        scaled_height = scale_rect(pygame.Rect(0, 0, 0, self.height_logic)).height
+        half_width = max(scaled_base_radius, 1) + 4
+        bounds = pygame.Rect(scaled_center_x - half_width, scaled_center_y - scaled_height // 2 - half_width,
+                             half_width * 2, scaled_height + half_width * 2 + scaled_base_radius)
+        if self.sparking:
+            for branch in self.spark_points:
+                for point in branch:
+                    bounds.union_ip(pygame.Rect(int(point[0]) - 12, int(point[1]) - 12, 24, 24))
+        return bounds
+
     def draw(self, screen, colors, scale_rect):
         """Draw the tesla coil and sparks."""
         # Scale core dimensions
@@ -8,6 +8,8 @@ from Ping.Modules.AI.Ping_AI import PaddleAI
 from Ping.Modules.Graphics.Ping_UI import init_display, player_name_screen, TitleScreen, pause_screen, win_screen, level_select_screen
 from Ping.Modules.Objects.Ping_GameObjects import PaddleObject, BallObject
 from Ping.Modules.Graphics.UI.Ping_DBConsole import get_console
+from Ping.Modules.Graphics.Ping_SurfacePool import get_surface_pool
+from Ping.Modules.Graphics.Ping_RenderQueue import get_render_queue
 # Removed import for DebugLevel and SewerLevel as they no longer exist
 from Ping.Modules.Graphics.UI.Ping_Fonts import get_pixel_font  # Moved import here
 from Ping.Modules.Graphics.Menus.Ping_StartupAnimation import run_startup_animation  # Import the new animation function
@@ -26,8 +28,13 @@ pygame.init()
 pygame.mixer.init()
 
 from Ping.Modules.Core.Ping_MCompile import LevelCompiler # Import the new compiler for PMF levels
+from Ping.Modules.Core.Ping_MatchHistory import get_match_history
+from Ping.Modules.Core.Ping_Logging import get_logger
+from Ping.Modules.Core.Ping_Profiler import get_profiler
 from Ping.Modules.Graphics.Menus.Ping_Settings import SettingsScreen
 
+logger = get_logger("game")
+
 # Initialize global debug console (singleton)
 debug_console = get_console()
 debug_console.log("Game initialized")
@@ -409,13 +416,41 @@ def main_game(ai_mode, player_name, level, window_width, window_height, debug_co
 
     accumulated_time = 0
 
+    # Match stats recorded in the match history when the game ends
+    match_start_time = last_frame_time
+    frame_time_total = 0.0
+    frame_count = 0
+    rally_hits = 0
+    rallies = 0
+    longest_rally = 0
+    paddle_hits = 0
+
+    def record_match_result(winner_name, completed):
+        """Queue this match's result for the match history store (written off-thread)."""
+        try:
+            get_match_history().record_match(
+                level=level, player_a=current_player_name, player_b=player_b_name, ai_mode=ai_mode,
+                score_a=score_a, score_b=score_b, winner=winner_name, completed=completed,
+                duration_s=time.time() - match_start_time, rallies=rallies,
+                longest_rally=max(longest_rally, rally_hits), paddle_hits=paddle_hits,
+                avg_frame_ms=(frame_time_total / frame_count) * 1000 if frame_count else 0.0)
+        except Exception as e:
+            debug_console.log(f"Error recording match history: {e}")
+
+    profiler = get_profiler()
+
     while True:
+        profiler.begin_frame()
         current_time = time.time()
         delta_time = current_time - last_frame_time
         last_frame_time = current_time
         accumulated_time += delta_time
+        if not paused:
+            frame_time_total += delta_time
+            frame_count += 1
 
         # Get events and handle debug console first
+        profiler.start('input')
         events = pygame.event.get()
         if debug_console.update(events):
             continue
@@ -479,8 +514,11 @@ def main_game(ai_mode, player_name, level, window_width, window_height, debug_co
                             # Reset scoreboard debug flag to show message on resume
                             arena.scoreboard._debug_shown = False
                             paused = False
+                            # The pause menu drew over the whole screen
+                            arena.request_full_redraw()
                         elif menu_result == "title":
                             # Music is stopped within pause_screen now
+                            record_match_result(None, False)
                             # Return to title screen
                             return "title"
                         elif menu_result == "settings":
@@ -524,6 +562,8 @@ def main_game(ai_mode, player_name, level, window_width, window_height, debug_co
                                     current_player_name = settings.get_player_name() # Ensure name is current
                                     # No screen re-initialization needed as per Ping_Settings logic for this return.
                                     pass
+                            # The shader may have been toggled; the level compiler caches the setting
+                            arena.set_shader_enabled(SettingsScreen.get_shader_enabled())
                             # Always redraw console and flip after settings, regardless of outcome
                             debug_console.draw(screen, width, height)
                             pygame.display.flip()
@@ -538,8 +578,11 @@ def main_game(ai_mode, player_name, level, window_width, window_height, debug_co
                     elif event.key == pygame.K_DOWN:
                         paddle_b_down = False
 
+        profiler.stop('input')
+
         if not paused:
             while accumulated_time >= FRAME_TIME:
+                profiler.start('physics')
                 # Update paddle movement flags
                 paddle_a.moving_up = paddle_a_up
                 paddle_a.moving_down = paddle_a_down
@@ -548,7 +591,9 @@ def main_game(ai_mode, player_name, level, window_width, window_height, debug_co
 
                 # Move paddles
                 paddle_a.move(FRAME_TIME)
+                profiler.stop('physics')
                 if ai_mode:
+                    profiler.start('ai')
                     # Use AI to move paddle with improved integration
                     # Let AI determine most threatening ball rather than forcing primary ball
                     target_y = paddle_ai.move_paddle(
@@ -565,8 +610,10 @@ def main_game(ai_mode, player_name, level, window_width, window_height, debug_co
                     # AI now handles its own movement validation and momentum using proper game area bounds
                     # Apply AI-calculated position (AI handles all bounds checking internally)
                     paddle_b.rect.y = target_y
+                    profiler.stop('ai')
                 else:
-                    paddle_b.move(FRAME_TIME)
+                    with profiler.scope('physics'):
+                        paddle_b.move(FRAME_TIME)
 
                 # Update respawn timer if active
                 if respawn_timer is not None:
@@ -575,6 +622,7 @@ def main_game(ai_mode, player_name, level, window_width, window_height, debug_co
                         respawn_timer = None
                         ball_frozen = False
 
+                profiler.start('obstacles')
                 # Update power-up state if allowed and powerup exists
                 if arena.can_spawn_powerups and arena.power_up:
                     arena.update_power_up(len(balls))
@@ -673,6 +721,7 @@ def main_game(ai_mode, player_name, level, window_width, window_height, debug_co
                     # Pass the first ball instance if available, otherwise None
                     current_main_ball = balls[0] if balls else None
                     arena.update_ghosts(FRAME_TIME, current_main_ball)
+                profiler.stop('obstacles')
 
                 # Handle all active balls
                 scored = None
@@ -681,14 +730,19 @@ def main_game(ai_mode, player_name, level, window_width, window_height, debug_co
                 for current_ball in balls:
                     # Move ball if not frozen
                     if not ball_frozen:
+                        profiler.start('physics')
                         current_ball.move(FRAME_TIME)
 
                         # Handle collisions
                         if current_ball.handle_wall_collision():
                             sound_manager.play_sfx('paddle') # Use new method
+                        profiler.stop('physics')
 
+                    profiler.start('collision')
                     if current_ball.handle_paddle_collision(paddle_a) or current_ball.handle_paddle_collision(paddle_b):
                         sound_manager.play_sfx('paddle') # Use new method
+                        rally_hits += 1
+                        paddle_hits += 1
 
                     # Ball collision with obstacles (iterate through the list)
                     obstacles_to_remove = []
@@ -761,7 +815,7 @@ def main_game(ai_mode, player_name, level, window_width, window_height, debug_co
                     new_ball_result = arena.check_power_up_collision(current_ball, len(balls))
                     # Check if the collision result is a raw Ball instance
                     if isinstance(new_ball_result, Ball):
-                        print(f"PowerUp triggered! Adding new ball to game. Current ball count: {len(balls)}")
+                        logger.info("PowerUp triggered! Adding new ball to game. Current ball count: %d", len(balls))
                         # Prepare initial state from the raw Ball instance
                         initial_state = {
                             'x': new_ball_result.rect.x, # Use position from the raw ball
@@ -782,7 +836,7 @@ def main_game(ai_mode, player_name, level, window_width, window_height, debug_co
                             initial_state=initial_state # Pass the prepared state
                         )
                         balls.append(new_ball_object) # Append the wrapped object
-                        print(f"New ball added! New ball count: {len(balls)}")
+                        logger.info("New ball added! New ball count: %d", len(balls))
                     # No need for an elif here, as Arena won't return a BallObject anymore
 
                     # Handle wall collisions and scoring based on arena properties
@@ -803,6 +857,7 @@ def main_game(ai_mode, player_name, level, window_width, window_height, debug_co
                              scored = ball_scored
                              # If side scoring happens, remove the ball
                              balls_to_remove.append(current_ball)
+                    profiler.stop('collision')
 
                 # Remove scored balls
                 for ball_to_remove in balls_to_remove:
@@ -816,14 +871,19 @@ def main_game(ai_mode, player_name, level, window_width, window_height, debug_co
                     else:
                         score_a += 1
                     sound_manager.play_sfx('score') # Use new method
+                    rallies += 1
+                    longest_rally = max(longest_rally, rally_hits)
+                    rally_hits = 0
 
                     # Check for win condition
                     win_score = settings.get_win_scores()
                     if score_a >= win_score:
+                        record_match_result(current_player_name, True)
                         width, height = settings.get_dimensions()
                         sound_manager.stop_music() # Stop music before win screen
                         return win_screen(screen, clock, width, height, current_player_name, debug_console)
                     elif score_b >= win_score:
+                        record_match_result(player_b_name, True)
                         width, height = settings.get_dimensions()
                         sound_manager.stop_music() # Stop music before win screen
                         return win_screen(screen, clock, width, height, player_b_name, debug_console)
@@ -864,13 +924,30 @@ def main_game(ai_mode, player_name, level, window_width, window_height, debug_co
 
         # Draw complete game state using arena
         game_objects = [paddle_a, paddle_b] + balls  # Include all active balls
-        arena.draw(screen, game_objects, scaled_font, current_player_name, score_a, player_b_name, score_b, respawn_timer, paused)
+        dirty_rects = None
+        if arena.dirty_rects_enabled and not debug_console.visible:
+            # Only the changed regions are redrawn and pushed to the display
+            dirty_rects = arena.draw_dirty(screen, game_objects, scaled_font, current_player_name, score_a, player_b_name, score_b, respawn_timer, paused)
+        else:
+            arena.draw(screen, game_objects, scaled_font, current_player_name, score_a, player_b_name, score_b, respawn_timer, paused)
 
         # Draw debug console (handles its own visibility)
-        debug_console.draw(screen, width, height)
+        with profiler.scope('ui'):
+            debug_console.draw(screen, width, height)
+            overlay_rect = profiler.draw_overlay(screen, get_pixel_font(10))
+            if overlay_rect is not None and dirty_rects is not None:
+                dirty_rects = dirty_rects + [overlay_rect]
 
         # Final display update
-        pygame.display.flip()
+        with profiler.scope('flip'):
+            if dirty_rects is not None:
+                pygame.display.update(dirty_rects)
+            else:
+                pygame.display.flip()
+
+        # Roll the blit counters and hand this frame's temporary surfaces back to the pool
+        get_render_queue().end_frame()
+        get_surface_pool().end_frame()
 
 def get_player_name():
     """Get the player name from settings or prompt for a new one."""
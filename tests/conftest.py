@@ -0,0 +1,16 @@
+"""
+Shared pytest setup: makes the Ping package and the Artemis editor modules
+importable from the repository root, and keeps pygame away from any display
+or audio device.
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (REPO_ROOT, os.path.join(REPO_ROOT, "Artemis Editor")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
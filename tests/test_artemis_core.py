@@ -0,0 +1,131 @@
+"""Tests for the editor core's indexed, copy-on-write object store (artemis_core)."""
+
+import pytest
+
+pytest.importorskip("PyQt6") # ArtemisCore is a QObject; signals work without a QApplication
+
+from Artemis_Modules.artemis_core import ArtemisCore
+
+
+def _box(x=0):
+    return {'type': 'obstacle', 'x': x, 'y': 0, 'width': 10, 'height': 10}
+
+
+@pytest.fixture
+def core():
+    core = ArtemisCore(None)
+    core.new_level()
+    for x in range(5):
+        core.add_object(_box(x)) # IDs 3-7 above the paddles (1, 2)
+    return core
+
+
+def _order(core):
+    return [obj['id'] for obj in core.level_objects]
+
+
+def _check_links(core):
+    """Forward and backward walks of the draw order agree with each other and with the store."""
+    forward = _order(core)
+    assert [obj['id'] for obj in reversed(core.level_objects)] == forward[::-1]
+    assert len(core.level_objects) == len(forward) == core.get_object_count()
+    assert set(forward) == set(core._objects)
+    assert core.get_topmost_object_id() == (forward[-1] if forward else None)
+    for i, obj_id in enumerate(forward):
+        below = forward[i - 1] if i > 0 else None
+        above = forward[i + 1] if i + 1 < len(forward) else None
+        assert core.get_neighbor_ids(obj_id) == (below, above)
+
+
+def test_objects_are_kept_in_draw_order(core):
+    assert _order(core) == [1, 2, 3, 4, 5, 6, 7]
+    _check_links(core)
+
+
+def test_unlink_and_add_above_keep_links_consistent(core):
+    below = core._unlink(5)
+    assert below == 4
+    _check_links(core)
+    obj = {'id': 5, **_box()}
+    core._add_above(obj, below)
+    assert _order(core) == [1, 2, 3, 4, 5, 6, 7]
+    _check_links(core)
+
+    core._unlink(1) # Bottom
+    core._unlink(7) # Top
+    _check_links(core)
+    core._add_above({'id': 1, **_box()}, None)
+    core._add_above({'id': 7, **_box()}, core.get_topmost_object_id())
+    assert _order(core) == [1, 2, 3, 4, 5, 6, 7]
+    _check_links(core)
+
+
+def test_unlink_everything():
+    core = ArtemisCore(None)
+    core.new_level()
+    core._unlink(1)
+    core._unlink(2)
+    assert _order(core) == []
+    _check_links(core)
+    core._add_above({'id': 2, **_box()}, None)
+    assert _order(core) == [2]
+    _check_links(core)
+
+
+def test_undoing_deletes_restores_their_positions(core):
+    for obj_id in (4, 5, 1, 7):
+        core.delete_object(obj_id)
+    assert _order(core) == [2, 3, 6]
+    for _ in range(4):
+        core.undo()
+    assert _order(core) == [1, 2, 3, 4, 5, 6, 7]
+    _check_links(core)
+
+    for _ in range(4):
+        core.redo()
+    assert _order(core) == [2, 3, 6]
+    _check_links(core)
+
+
+def test_get_object_by_id_is_read_only(core):
+    view = core.get_object_by_id(3)
+    assert view['x'] == 0
+    with pytest.raises(TypeError):
+        view['x'] = 99
+    assert core.get_object_by_id(99) is None
+    assert core.get_object_by_id({'id': 3}) is None # Unhashable "ID"
+
+
+def test_views_and_snapshots_are_stable_after_updates(core):
+    view = core.get_object_by_id(3)
+    snapshot = core.snapshot()
+    snapshot_obj = next(obj for obj in snapshot['objects'] if obj['id'] == 3)
+
+    assert core.update_object_properties(3, {'x': 50, 'width': 20})
+    assert core.get_object_by_id(3)['x'] == 50
+    assert view['x'] == 0 # Copy-on-write: the old dict was replaced, not modified
+    assert snapshot_obj['x'] == 0 and snapshot_obj['width'] == 10
+    assert [obj['id'] for obj in snapshot['objects']] == [1, 2, 3, 4, 5, 6, 7]
+
+    core.delete_object(4)
+    assert [obj['id'] for obj in snapshot['objects']] == [1, 2, 3, 4, 5, 6, 7]
+
+
+def test_update_without_changes_and_id_is_ignored(core):
+    assert not core.update_object_properties(3, {'x': 0})
+    assert not core.update_object_properties(3, {'id': 42})
+    assert core.get_object_by_id(3)['id'] == 3
+    assert not core.update_object_properties(99, {'x': 1})
+
+
+def test_saved_data_is_a_deep_copy(core):
+    data = core.get_level_data_for_saving()
+    data['objects'][2]['x'] = 123
+    assert core.get_object_by_id(3)['x'] == 0
+
+
+def test_load_assigns_ids_to_missing_and_duplicates():
+    core = ArtemisCore(None)
+    core.load_level({'objects': [{'id': 5, **_box()}, {'id': 5, **_box()}, _box()]}, "x.pmf")
+    assert _order(core) == [5, 6, 7]
+    _check_links(core)
@@ -0,0 +1,57 @@
+"""Tests for comparing benchmark reports (Ping_Benchmark.compare_reports)."""
+
+from Ping.Modules.Core.Ping_Benchmark import compare_reports
+
+
+def _report(levels):
+    """Build a report: {level: {mode: {phase: (mean_ms, p95_ms)}}}."""
+    return {'levels': {
+        level: {mode: {phase: {'mean_ms': mean, 'p95_ms': p95} for phase, (mean, p95) in phases.items()}
+                for mode, phases in modes.items()}
+        for level, modes in levels.items()}}
+
+
+def test_rows_for_every_shared_stat():
+    baseline = _report({'A.pmf': {'no_shader': {'update': (1.0, 2.0), 'draw': (4.0, 5.0)}}})
+    current = _report({'A.pmf': {'no_shader': {'update': (1.0, 2.0), 'draw': (4.0, 5.0)}}})
+
+    rows = compare_reports(current, baseline)
+    assert [(row['phase'], row['stat']) for row in rows] == [
+        ('update', 'mean_ms'), ('update', 'p95_ms'), ('draw', 'mean_ms'), ('draw', 'p95_ms')]
+    assert all(row['change'] == 0.0 and not row['regression'] for row in rows)
+
+
+def test_regression_threshold():
+    baseline = _report({'A.pmf': {'no_shader': {'update': (1.0, 1.0), 'draw': (1.0, 1.0)}}})
+    current = _report({'A.pmf': {'no_shader': {'update': (1.125, 1.5), 'draw': (0.5, 1.25)}}})
+
+    rows = {(row['phase'], row['stat']): row for row in compare_reports(current, baseline, threshold=0.25)}
+    assert not rows[('update', 'mean_ms')]['regression'] # 12.5% slower
+    assert rows[('update', 'p95_ms')]['regression'] # 50% slower
+    assert rows[('update', 'p95_ms')]['change'] == 0.5
+    assert not rows[('draw', 'mean_ms')]['regression'] # Faster
+    assert rows[('draw', 'mean_ms')]['change'] == -0.5
+    assert not rows[('draw', 'p95_ms')]['regression'] # Exactly at the threshold
+
+
+def test_levels_and_modes_missing_from_the_baseline_are_skipped():
+    baseline = _report({'A.pmf': {'no_shader': {'update': (1.0, 1.0)}}})
+    current = _report({
+        'A.pmf': {'no_shader': {'update': (3.0, 3.0)}, 'shader': {'update': (3.0, 3.0)}},
+        'B.pmf': {'no_shader': {'update': (3.0, 3.0)}},
+    })
+
+    rows = compare_reports(current, baseline)
+    assert {(row['level'], row['mode']) for row in rows} == {('A.pmf', 'no_shader')}
+
+
+def test_missing_or_zero_baseline_values_are_skipped():
+    baseline = _report({'A.pmf': {'no_shader': {'update': (0.0, 2.0)}}})
+    current = _report({'A.pmf': {'no_shader': {'update': (1.0, 2.0), 'draw': (1.0, 1.0)}}})
+
+    rows = compare_reports(current, baseline)
+    assert [(row['phase'], row['stat']) for row in rows] == [('update', 'p95_ms')]
+
+
+def test_empty_reports():
+    assert compare_reports({}, {}) == []
@@ -0,0 +1,95 @@
+"""Tests for merging multi-object edits in the editor's undo history (artemis_history)."""
+
+from Artemis_Modules.artemis_history import (MERGE_WINDOW_SECONDS, UndoHistory, UpdateObjectCommand,
+                                             UpdateObjectsCommand)
+
+
+class _Core:
+    """Stand-in for the ArtemisCore primitive that update commands apply through."""
+
+    def __init__(self, objects):
+        self.objects = dict(objects)
+
+    def _replace_object(self, obj_id, obj):
+        self.objects[obj_id] = obj
+
+
+def _move(positions_before, positions_after, label="Move", at=0.0):
+    """An UpdateObjectsCommand moving objects {id: x} from one x to another."""
+    command = UpdateObjectsCommand(
+        {obj_id: ({'id': obj_id, 'x': positions_before[obj_id]}, {'id': obj_id, 'x': positions_after[obj_id]})
+         for obj_id in positions_before}, keys=['x'], label=label)
+    command.time = at
+    return command
+
+
+def test_merge_keeps_first_before_and_last_after():
+    first = _move({1: 0, 2: 10}, {1: 5, 2: 15})
+    second = _move({1: 5, 2: 15}, {1: 9, 2: 19}, at=0.5)
+
+    assert first.merge(second)
+    assert {obj_id: (before['x'], after['x']) for obj_id, (before, after) in first.changes.items()} == {
+        1: (0, 9), 2: (10, 19)}
+    assert first.time == 0.5
+
+
+def test_merge_window_slides_with_each_step():
+    command = _move({1: 0}, {1: 1})
+    for step in range(1, 5):
+        assert command.merge(_move({1: step}, {1: step + 1}, at=step * MERGE_WINDOW_SECONDS * 0.9))
+    assert command.changes[1][1]['x'] == 5
+
+
+def test_no_merge_outside_the_window():
+    first = _move({1: 0}, {1: 1})
+    assert not first.merge(_move({1: 1}, {1: 2}, at=MERGE_WINDOW_SECONDS + 0.01))
+
+
+def test_no_merge_with_other_objects_keys_or_labels():
+    first = _move({1: 0, 2: 0}, {1: 1, 2: 1})
+    assert not first.merge(_move({1: 1}, {1: 2}))
+    assert not first.merge(_move({1: 1, 3: 0}, {1: 2, 3: 1}))
+    assert not first.merge(_move({1: 1, 2: 1}, {1: 2, 2: 2}, label="Align"))
+    other_keys = _move({1: 1, 2: 1}, {1: 2, 2: 2})
+    other_keys.keys = frozenset(['x', 'y'])
+    assert not first.merge(other_keys)
+    single = UpdateObjectCommand(1, {'id': 1, 'x': 1}, {'id': 1, 'x': 2}, ['x'])
+    single.time = 0.0
+    assert not first.merge(single)
+    assert first.changes[1][1]['x'] == 1
+
+
+def test_label_defaults_from_keys():
+    assert UpdateObjectsCommand({}, ['x', 'y']).label == "Move"
+    assert UpdateObjectsCommand({}, ['width']).label == "Change Properties"
+    assert UpdateObjectsCommand({}, ['x'], label="Align").label == "Align"
+
+
+def test_history_merges_a_drag_into_one_undo_step():
+    core = _Core({1: {'id': 1, 'x': 0}, 2: {'id': 2, 'x': 10}})
+    history = UndoHistory()
+    positions = {1: 0, 2: 10}
+    for step in range(5):
+        after = {obj_id: x + 1 for obj_id, x in positions.items()}
+        command = _move(positions, after, at=step * 0.1)
+        command.redo(core)
+        history.push(command)
+        positions = after
+
+    assert history.get_stats()['undo_entries'] == 1
+    history.undo(core)
+    assert {obj_id: obj['x'] for obj_id, obj in core.objects.items()} == {1: 0, 2: 10}
+    history.redo(core)
+    assert {obj_id: obj['x'] for obj_id, obj in core.objects.items()} == {1: 5, 2: 15}
+
+
+def test_sealed_history_does_not_merge():
+    core = _Core({1: {'id': 1, 'x': 0}})
+    history = UndoHistory()
+    history.push(_move({1: 0}, {1: 1}))
+    history.seal()
+    history.push(_move({1: 1}, {1: 2}, at=0.1))
+
+    assert history.get_stats()['undo_entries'] == 2
+    history.undo(core)
+    assert core.objects[1]['x'] == 1
@@ -0,0 +1,74 @@
+"""Tests for journal snapshots in the campaign map state (Ping_MapState)."""
+
+import json
+
+import pytest
+
+from Ping.Modules.Core import Ping_Persistence
+from Ping.Modules.Core.Ping_MapState import MapStateManager
+
+
+@pytest.fixture
+def map_state(tmp_path):
+    state = MapStateManager(str(tmp_path))
+    state.initialize_new_run()
+    state.flush_saves()
+    return state
+
+
+def _fill_journal(state, events):
+    for _ in range(events):
+        state.award_currency(1)
+    state.flush_saves()
+
+
+def test_journal_is_compacted_into_a_snapshot(map_state):
+    _fill_journal(map_state, MapStateManager.JOURNAL_COMPACT_THRESHOLD)
+
+    assert len(map_state.journal) == 0
+    with open(map_state.player_stats_file) as f:
+        stats = json.load(f)
+    assert stats['currency'] == MapStateManager.JOURNAL_COMPACT_THRESHOLD
+    assert stats['journal_seq'] == map_state.journal.last_seq
+
+
+def test_failed_snapshot_write_is_retried(map_state, monkeypatch):
+    real_write = Ping_Persistence.atomic_write_text
+    failures = []
+    def failing_write(path, text):
+        if path == map_state.player_stats_file and not failures:
+            failures.append(path)
+            raise OSError("disk full")
+        real_write(path, text)
+    monkeypatch.setattr(Ping_Persistence, 'atomic_write_text', failing_write)
+
+    threshold = MapStateManager.JOURNAL_COMPACT_THRESHOLD
+    _fill_journal(map_state, threshold)
+    assert failures
+    assert not map_state._snapshot_pending
+    assert len(map_state.journal) == threshold # Nothing dropped without a complete snapshot
+
+    _fill_journal(map_state, 1) # The next event snapshots again
+    assert len(map_state.journal) == 0
+    with open(map_state.player_stats_file) as f:
+        assert json.load(f)['currency'] == threshold + 1
+
+
+def test_unserializable_snapshot_is_retried(map_state):
+    map_state.player_stats['bad'] = object()
+    threshold = MapStateManager.JOURNAL_COMPACT_THRESHOLD
+    _fill_journal(map_state, threshold)
+    assert not map_state._snapshot_pending
+    assert len(map_state.journal) == threshold
+
+    del map_state.player_stats['bad']
+    _fill_journal(map_state, 1)
+    assert len(map_state.journal) == 0
+
+
+def test_continue_replays_events_after_the_snapshot(map_state, tmp_path):
+    _fill_journal(map_state, 3)
+
+    restored = MapStateManager(str(tmp_path))
+    assert restored.continue_existing_run()
+    assert restored.get_player_currency() == 3
@@ -0,0 +1,85 @@
+"""Tests for map zone indexing and the layered zone generator (Ping_MapTree)."""
+
+from Ping.Modules.Core.Ping_MapState import MapStateManager
+from Ping.Modules.Core.Ping_MapTree import MapNode, MapTreeGenerator, MapZone, NodeType
+
+
+def _chain_zone():
+    """start -> a -> boss, and start -> b (a dead end)."""
+    zone = MapZone("Test", "test")
+    for node_id in ("start", "a", "b", "boss"):
+        zone.add_node(MapNode(node_id, NodeType.LEVEL, (0, 0)))
+    zone.get_node("start").add_connection("a")
+    zone.get_node("start").add_connection("b")
+    zone.get_node("a").add_connection("boss")
+    zone.get_node("start").is_accessible = True
+    zone.set_current_node("start")
+    return zone
+
+
+def test_reachability():
+    zone = _chain_zone()
+    assert zone.can_reach("start", "boss")
+    assert zone.can_reach("a", "a")
+    assert not zone.can_reach("b", "boss")
+    assert not zone.can_reach("boss", "start")
+    assert not zone.can_reach("start", "missing")
+
+
+def test_reachability_with_a_loop():
+    zone = _chain_zone()
+    zone.get_node("boss").add_connection("start")
+    assert zone.can_reach("boss", "b")
+
+
+def test_connection_added_after_indexing_is_picked_up():
+    zone = _chain_zone()
+    assert not zone.can_reach("b", "boss")
+    version = zone.index_version
+
+    zone.get_node("b").add_connection("boss")
+    assert zone.index_version > version
+    assert zone.can_reach("b", "boss")
+    zone.complete_node("b")
+    assert zone.is_node_available("boss")
+
+
+def test_complete_node_unlocks_connections():
+    zone = _chain_zone()
+    assert [node.id for node in zone.get_available_nodes()] == ["start"]
+    zone.complete_node("start")
+    assert [node.id for node in zone.get_available_nodes()] == ["a", "b"]
+    assert zone.get_completed_count() == 1
+    assert zone.get_accessible_count() == 3
+
+
+def test_generated_zone_is_deterministic_and_connected():
+    zone = MapTreeGenerator.generate_layered_zone("Z", "z", seed=42, layers=8)
+    again = MapTreeGenerator.generate_layered_zone("Z", "z", seed=42, layers=8)
+
+    assert zone.to_dict() == again.to_dict()
+    assert all(zone.can_reach("start", node_id) and zone.can_reach(node_id, "boss") for node_id in zone.nodes)
+
+
+def test_zone_round_trips_through_a_dict():
+    zone = MapTreeGenerator.generate_layered_zone("Z", "z", seed=7, layers=4)
+    zone.complete_node("start")
+    restored = MapZone.from_dict(zone.to_dict())
+
+    assert restored.to_dict() == zone.to_dict()
+    assert [node.id for node in restored.get_available_nodes()] == [node.id for node in zone.get_available_nodes()]
+
+
+def test_can_access_node_closes_branches_left_behind(tmp_path):
+    state = MapStateManager(str(tmp_path))
+    state.map_manager.add_zone(_chain_zone())
+    state.map_manager.set_current_zone("test")
+    zone = state.get_current_zone()
+    zone.complete_node("start")
+
+    assert state.can_access_node("a") and state.can_access_node("b")
+    zone.set_current_node("a")
+    assert not state.can_access_node("b")
+    assert not state.can_access_node("boss") # Not unlocked yet
+    zone.complete_node("a")
+    assert state.can_access_node("boss")
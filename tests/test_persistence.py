@@ -0,0 +1,131 @@
+"""Tests for crash-safe background saving (Ping_Persistence)."""
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from Ping.Modules.Core import Ping_Persistence
+from Ping.Modules.Core.Ping_Persistence import PersistenceWriter, atomic_write_json, atomic_write_text
+
+
+@pytest.fixture
+def writer():
+    writer = PersistenceWriter(debounce_seconds=0.2)
+    yield writer
+    writer.shutdown()
+
+
+def _read_json(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+# --- Atomic writes ---
+def test_atomic_write_replaces_the_file(tmp_path):
+    path = str(tmp_path / "save.json")
+    atomic_write_json(path, {'a': 1})
+    atomic_write_json(path, {'a': 2})
+
+    assert _read_json(path) == {'a': 2}
+    assert os.listdir(tmp_path) == ["save.json"]
+
+
+def test_failed_atomic_write_leaves_the_old_file_intact(tmp_path, monkeypatch):
+    path = str(tmp_path / "save.json")
+    atomic_write_json(path, {'a': 1})
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+    monkeypatch.setattr(os, 'replace', failing_replace)
+
+    with pytest.raises(OSError):
+        atomic_write_text(path, "truncated")
+    assert _read_json(path) == {'a': 1}
+    assert os.listdir(tmp_path) == ["save.json"] # Temporary file cleaned up
+
+
+# --- Background writer ---
+def test_saves_to_one_path_are_coalesced(writer, tmp_path):
+    path = str(tmp_path / "save.json")
+    other = str(tmp_path / "other.json")
+    for i in range(5):
+        writer.save(path, {'n': i})
+    writer.save(other, {'n': 'other'})
+    assert writer.has_pending(path)
+
+    assert writer.flush(timeout=5)
+    assert _read_json(path) == {'n': 4}
+    assert _read_json(other) == {'n': 'other'}
+    assert writer.saves_requested == 6
+    assert writer.writes_completed == 2
+    assert not writer.has_pending()
+
+
+def test_writes_wait_for_the_debounce(tmp_path):
+    writer = PersistenceWriter(debounce_seconds=60)
+    path = str(tmp_path / "save.json")
+    writer.save(path, {'n': 1})
+
+    time.sleep(0.1)
+    assert writer.has_pending(path)
+    assert not os.path.exists(path)
+    writer.save(path, {'n': 2})
+    writer.shutdown()
+    assert _read_json(path) == {'n': 2}
+    assert writer.writes_completed == 1
+
+
+def test_callbacks_of_superseded_saves_fire(writer, tmp_path):
+    path = str(tmp_path / "save.json")
+    results = []
+    writer.save(path, {'n': 1}, lambda ok: results.append(('first', ok)))
+    writer.save(path, {'n': 2}, lambda ok: results.append(('second', ok)))
+    writer.flush(timeout=5)
+
+    assert results == [('first', True), ('second', True)]
+    assert writer.writes_completed == 1
+
+
+def test_callbacks_report_failed_writes(writer, tmp_path, monkeypatch):
+    def failing_write(path, text):
+        raise OSError("disk full")
+    monkeypatch.setattr(Ping_Persistence, 'atomic_write_text', failing_write)
+    results = []
+    writer.save(str(tmp_path / "save.json"), {'n': 1}, results.append)
+    writer.flush(timeout=5)
+
+    assert results == [False]
+    assert writer.writes_failed == 1
+
+
+def test_unserializable_data_raises_before_queueing(writer, tmp_path):
+    with pytest.raises(TypeError):
+        writer.save(str(tmp_path / "save.json"), {'bad': object()})
+    assert not writer.has_pending()
+
+
+def test_flush_writes_on_the_caller_thread_when_the_writer_died(tmp_path):
+    class DeadWriter(PersistenceWriter):
+        def _run(self):
+            return # The writer thread exits straight away, as if it had crashed
+
+    writer = DeadWriter(debounce_seconds=60)
+    path = str(tmp_path / "save.json")
+    written_on = []
+    writer.save(path, {'n': 1}, lambda ok: written_on.append(threading.current_thread()))
+    writer._thread.join(timeout=5)
+
+    assert writer.flush(timeout=5)
+    assert _read_json(path) == {'n': 1}
+    assert written_on == [threading.current_thread()]
+
+
+def test_saves_after_shutdown_are_written_immediately(tmp_path):
+    writer = PersistenceWriter()
+    writer.shutdown()
+    path = str(tmp_path / "late.json")
+    writer.save(path, {'late': True})
+
+    assert _read_json(path) == {'late': True}
@@ -0,0 +1,150 @@
+"""Tests for PMF schema migration, validation and normalization (Ping_PMF)."""
+
+import glob
+import json
+import os
+
+import pytest
+
+from Ping.Modules.Core.Ping_PMF import (check_file, dumps_pmf, load_pmf_data, migrate_pmf,
+                                        normalize_pmf, validate_pmf)
+
+LEVELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "Ping", "Ping Assets", "Levels")
+
+
+def _level(objects=(), **properties):
+    props = {'name': "Test", 'width': 800, 'height': 450}
+    props.update(properties)
+    return {'properties': props, 'objects': list(objects)}
+
+
+# --- Migration ---
+def test_migrates_level_name_and_dimensions():
+    data = {'properties': {'level_name': "Old", 'dimensions': [640, 360]}, 'objects': []}
+    changes = migrate_pmf(data)
+
+    assert data['properties'] == {'name': "Old", 'width': 640, 'height': 360}
+    assert len(changes) == 2
+
+
+def test_level_name_does_not_override_name():
+    data = {'properties': {'name': "New", 'level_name': "Old"}}
+    changes = migrate_pmf(data)
+
+    assert data['properties'] == {'name': "New"}
+    assert changes == ["properties: dropped 'level_name' (superseded by 'name')"]
+
+
+def test_dimensions_do_not_override_width_and_height():
+    data = {'properties': {'width': 1000, 'dimensions': [640, 360]}}
+    migrate_pmf(data)
+
+    assert data['properties'] == {'width': 1000, 'height': 360}
+
+
+def test_migrates_renamed_paddle_types():
+    data = _level([{'id': 1, 'type': 'paddle_spawn_left'}, {'id': 2, 'type': 'paddle_spawn_right'}])
+    changes = migrate_pmf(data)
+
+    assert data['objects'] == [{'id': 1, 'type': 'paddle_spawn', 'is_left': True},
+                               {'id': 2, 'type': 'paddle_spawn', 'is_left': False}]
+    assert changes == ["objects[0]: type 'paddle_spawn_left' renamed to 'paddle_spawn'",
+                       "objects[1]: type 'paddle_spawn_right' renamed to 'paddle_spawn'"]
+
+
+def test_moves_nested_is_left_to_the_top_level():
+    data = _level([{'id': 1, 'type': 'paddle_spawn', 'properties': {'is_left': False, 'speed': 3}}])
+    migrate_pmf(data)
+
+    assert data['objects'][0] == {'id': 1, 'type': 'paddle_spawn', 'is_left': False, 'properties': {'speed': 3}}
+
+
+def test_current_data_is_unchanged():
+    data = _level([{'id': 1, 'type': 'obstacle', 'x': 1, 'y': 2, 'width': 3, 'height': 4}])
+    before = json.loads(json.dumps(data))
+
+    assert migrate_pmf(data) == []
+    assert data == before
+
+
+def test_migration_ignores_malformed_data():
+    assert migrate_pmf([]) == []
+    assert migrate_pmf({'properties': "x", 'objects': [None, 3]}) == []
+
+
+# --- Validation ---
+def test_valid_level():
+    data = _level([{'id': 1, 'type': 'obstacle', 'x': 1, 'y': 2, 'width': 3, 'height': 4}])
+    assert validate_pmf(data) == ([], [])
+
+
+def test_validation_errors():
+    data = _level([{'id': 1, 'type': 'obstacle', 'x': "1"}, {'id': 1, 'type': 'bumper'}, {'x': 5}],
+                  width=0, lighting_level=150)
+    errors, _ = validate_pmf(data)
+
+    assert "properties.width: must be positive, got 0" in errors
+    assert "properties.lighting_level: must be 0-100, got 150" in errors
+    assert "objects[0].x: expected int or float, got '1'" in errors
+    assert "objects[1]: duplicate id 1 (also objects[0])" in errors
+    assert "objects[2]: missing 'type'" in errors
+
+
+def test_validation_warnings():
+    data = _level([{'id': 1, 'type': 'portal', 'x': 1, 'y': 1, 'width': 1, 'height': 1, 'target_id': 9},
+                   {'id': 2, 'type': 'laser'}], shiny=True)
+    errors, warnings = validate_pmf(data)
+
+    assert errors == []
+    assert "properties: unknown field 'shiny'" in warnings
+    assert "objects[0]: portal target_id 9 doesn't match any object" in warnings
+    assert "objects[1]: unknown type 'laser' (ignored by the game)" in warnings
+
+
+def test_validation_of_wrong_root_and_sections():
+    assert validate_pmf([])[0] == ["root must be an object, not list"]
+    errors, _ = validate_pmf({'properties': [], 'objects': {}})
+    assert errors == ["'properties' must be an object", "'objects' must be a list"]
+
+
+# --- Normalization and loading ---
+def test_normalize_orders_fields_and_rounds_floats():
+    data = {'objects': [{'y': 1.23456, 'x': 2, 'type': 'obstacle', 'id': 1, 'properties': {'b': 1, 'a': 2}}],
+            'properties': {'height': 450, 'name': "T", 'width': 800}}
+    normalized = normalize_pmf(data)
+
+    assert list(normalized) == ['properties', 'objects']
+    assert list(normalized['properties']) == ['name', 'width', 'height']
+    assert list(normalized['objects'][0]) == ['id', 'type', 'x', 'y', 'properties']
+    assert normalized['objects'][0]['y'] == 1.235
+    assert list(normalized['objects'][0]['properties']) == ['a', 'b']
+
+
+def test_load_migrates_and_rejects_invalid_files(tmp_path):
+    old = tmp_path / "old.pmf"
+    old.write_text(json.dumps({'properties': {'level_name': "Old", 'dimensions': [640, 360]}, 'objects': []}))
+    data, changes, warnings = load_pmf_data(str(old))
+    assert data['properties']['name'] == "Old"
+    assert len(changes) == 2
+    assert warnings == []
+
+    bad = tmp_path / "bad.pmf"
+    bad.write_text(json.dumps(_level(width=-1)))
+    with pytest.raises(ValueError):
+        load_pmf_data(str(bad))
+
+
+def test_check_file_rewrites_to_the_normalized_layout(tmp_path):
+    path = tmp_path / "level.pmf"
+    path.write_text(json.dumps({'objects': [], 'properties': {'dimensions': [640, 360], 'name': "L"}}))
+
+    row = check_file(str(path), write=True)
+    assert row['rewritten'] and not row['errors']
+    assert check_file(str(path))['normalized']
+    assert path.read_text() == dumps_pmf(normalize_pmf(json.loads(path.read_text())))
+
+
+@pytest.mark.parametrize('path', sorted(glob.glob(os.path.join(LEVELS_DIR, "*.pmf"))), ids=os.path.basename)
+def test_shipped_levels_are_valid(path):
+    assert check_file(path)['errors'] == []
@@ -0,0 +1,83 @@
+"""Tests for the FrameProfiler summary (Ping_Profiler)."""
+
+from Ping.Modules.Core.Ping_Profiler import FrameProfiler
+
+MS = 1_000_000
+
+
+def _run_frames(profiler, frames):
+    """Record one frame per {scope: ms} dict."""
+    profiler.begin_frame()
+    for scopes in frames:
+        for name, ms in scopes.items():
+            profiler.add(name, ms * MS)
+        profiler.begin_frame()
+
+
+def test_percentiles_of_a_scope():
+    profiler = FrameProfiler(history=20)
+    _run_frames(profiler, [{'physics': ms} for ms in range(1, 11)])
+
+    stats = profiler.percentiles('physics')
+    assert stats['mean'] == 5.5
+    assert stats['p50'] == 5.0
+    assert stats['p95'] == 10.0
+    assert stats['p99'] == 10.0
+
+
+def test_percentiles_of_an_unknown_scope():
+    profiler = FrameProfiler()
+    assert profiler.percentiles('physics') is None
+
+
+def test_summary_order():
+    profiler = FrameProfiler()
+    _run_frames(profiler, [{'zzz_custom': 1, 'shader': 1, 'ai': 1, 'physics': 1}] * 3)
+
+    assert list(profiler.get_summary()) == ['frame', 'ai', 'physics', 'shader', 'zzz_custom', 'other']
+
+
+def test_scope_missing_from_a_frame_records_zero():
+    profiler = FrameProfiler()
+    _run_frames(profiler, [{'physics': 4}, {}])
+
+    assert list(profiler.samples['physics']) == [4 * MS, 0]
+    assert profiler.get_summary()['physics']['mean'] == 2.0
+
+
+def test_repeated_scope_adds_up_within_a_frame():
+    profiler = FrameProfiler()
+    profiler.begin_frame()
+    profiler.add('physics', 2 * MS)
+    profiler.add('physics', 3 * MS)
+    profiler.begin_frame()
+
+    assert list(profiler.samples['physics']) == [5 * MS]
+
+
+def test_history_is_bounded():
+    profiler = FrameProfiler(history=4)
+    _run_frames(profiler, [{'physics': ms} for ms in range(1, 11)])
+
+    assert list(profiler.samples['physics']) == [7 * MS, 8 * MS, 9 * MS, 10 * MS]
+    assert len(profiler.samples['frame']) == 4
+
+
+def test_other_is_never_negative():
+    profiler = FrameProfiler()
+    _run_frames(profiler, [{'physics': 10_000}]) # Far more than the real frame time
+
+    assert list(profiler.samples['other']) == [0]
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = FrameProfiler()
+    profiler.enabled = False
+    profiler.begin_frame()
+    with profiler.scope('physics'):
+        pass
+    profiler.start('ai')
+    profiler.stop('ai')
+    profiler.begin_frame()
+
+    assert profiler.get_summary() == {}
@@ -0,0 +1,93 @@
+"""Tests for the append-only campaign run journal (Ping_RunJournal)."""
+
+from Ping.Modules.Core.Ping_RunJournal import RunJournal
+
+
+def _journal_with_events(path, count):
+    journal = RunJournal(str(path))
+    for i in range(count):
+        journal.append("reward", amount=i)
+    return journal
+
+
+def test_events_are_replayed_in_order(tmp_path):
+    path = tmp_path / "run_journal.jsonl"
+    _journal_with_events(path, 3)
+
+    journal = RunJournal(str(path))
+    events = journal.load()
+    assert [(event['seq'], event['amount']) for event in events] == [(1, 0), (2, 1), (3, 2)]
+    assert journal.last_seq == 3
+    assert journal.append("move", node_id="a") == 4
+
+
+def test_missing_file_is_an_empty_journal(tmp_path):
+    journal = RunJournal(str(tmp_path / "none.jsonl"))
+    assert journal.load() == []
+    assert len(journal) == 0
+    assert journal.last_seq == 0
+
+
+def test_compaction_drops_covered_events(tmp_path):
+    path = tmp_path / "run_journal.jsonl"
+    journal = _journal_with_events(path, 5)
+    journal.compact_to(3)
+
+    assert [event['seq'] for event in journal.load()] == [4, 5]
+    lines = path.read_text().splitlines()
+    assert lines[0] == '{"seq":3,"type":"base"}'
+    assert len(lines) == 3
+
+
+def test_numbering_continues_after_full_compaction(tmp_path):
+    path = tmp_path / "run_journal.jsonl"
+    journal = _journal_with_events(path, 4)
+    journal.compact_to(4)
+    assert len(journal) == 0
+
+    reopened = RunJournal(str(path))
+    assert reopened.last_seq == 4
+    assert reopened.append("reward", amount=9) == 5
+
+
+def test_compacting_twice_is_a_no_op(tmp_path):
+    path = tmp_path / "run_journal.jsonl"
+    journal = _journal_with_events(path, 3)
+    journal.compact_to(2)
+    before = path.read_text()
+    journal.compact_to(2)
+    journal.compact_to(1)
+
+    assert path.read_text() == before
+
+
+def test_torn_last_line_is_skipped_and_appends_still_parse(tmp_path):
+    path = tmp_path / "run_journal.jsonl"
+    _journal_with_events(path, 2)
+    with open(path, 'a') as f:
+        f.write('{"seq":3,"type":"rew') # Crash mid-write
+
+    journal = RunJournal(str(path))
+    assert [event['seq'] for event in journal.load()] == [1, 2]
+    assert journal.append("reward", amount=7) == 3
+
+    reopened = RunJournal(str(path))
+    assert [(event['seq'], event.get('amount')) for event in reopened.load()] == [(1, 0), (2, 1), (3, 7)]
+
+
+def test_compaction_removes_a_torn_line(tmp_path):
+    path = tmp_path / "run_journal.jsonl"
+    journal = _journal_with_events(path, 3)
+    with open(path, 'a') as f:
+        f.write('{"seq":4,')
+    journal = RunJournal(str(path))
+    journal.compact_to(1)
+
+    assert path.read_text().splitlines()[1:] == [
+        '{"seq":2,"type":"reward","amount":1}', '{"seq":3,"type":"reward","amount":2}']
+
+
+def test_ensure_seq_after_skips_numbers_used_by_a_snapshot(tmp_path):
+    journal = RunJournal(str(tmp_path / "run_journal.jsonl"))
+    journal.ensure_seq_after(10)
+    assert journal.append("reward", amount=1) == 11
@@ -0,0 +1,164 @@
+"""Tests for the editor's SpatialIndex, driven by a small stand-in for ArtemisCore."""
+
+from Artemis_Modules.artemis_spatial_index import SpatialIndex, get_object_rect
+
+
+class _Signal:
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot):
+        self._slots.append(slot)
+
+    def emit(self, *args):
+        for slot in self._slots:
+            slot(*args)
+
+
+class _Core:
+    """The parts of ArtemisCore that SpatialIndex uses, with the draw order kept as a list."""
+
+    def __init__(self):
+        self.levelLoaded = _Signal()
+        self.objectAdded = _Signal()
+        self.objectUpdated = _Signal()
+        self.objectDeleted = _Signal()
+        self._order = []
+        self._objects = {}
+
+    @property
+    def level_objects(self):
+        return [self._objects[obj_id] for obj_id in self._order]
+
+    def get_object_by_id(self, obj_id):
+        return self._objects.get(obj_id)
+
+    def get_topmost_object_id(self):
+        return self._order[-1] if self._order else None
+
+    def get_neighbor_ids(self, obj_id):
+        i = self._order.index(obj_id)
+        return (self._order[i - 1] if i > 0 else None,
+                self._order[i + 1] if i + 1 < len(self._order) else None)
+
+    def add(self, obj, index=None):
+        self._objects[obj['id']] = obj
+        self._order.insert(len(self._order) if index is None else index, obj['id'])
+        self.objectAdded.emit(obj['id'])
+
+    def update(self, obj_id, **changes):
+        self._objects[obj_id] = dict(self._objects[obj_id], **changes)
+        self.objectUpdated.emit(obj_id)
+
+    def delete(self, obj_id):
+        index = self._order.index(obj_id)
+        self._order.remove(obj_id)
+        obj = self._objects.pop(obj_id)
+        self.objectDeleted.emit(obj_id)
+        return obj, index
+
+
+def _box(obj_id, x, y, size=20):
+    return {'id': obj_id, 'type': 'obstacle', 'x': x, 'y': y, 'width': size, 'height': size}
+
+
+def test_object_rect():
+    assert get_object_rect({'x': 50, 'y': 40, 'width': 20, 'height': 10}) == (40, 35, 20, 10)
+    assert get_object_rect({'x': 50, 'y': 40, 'size': 8}) == (46, 36, 8, 8)
+    assert get_object_rect({'x': 50, 'y': 40}) == (45, 35, 10, 10)
+    assert get_object_rect({'type': 'sprite'}) is None
+
+
+def test_pick_returns_topmost_object():
+    core = _Core()
+    index = SpatialIndex(core, cell_size=16)
+    core.add(_box(1, 50, 50))
+    core.add(_box(2, 55, 55))
+
+    assert index.pick(52, 52) == 2
+    assert index.pick(42, 42) == 1
+    assert index.pick(200, 200) is None
+
+
+def test_query_rect_in_draw_order():
+    core = _Core()
+    index = SpatialIndex(core, cell_size=16)
+    for obj_id in (3, 1, 2):
+        core.add(_box(obj_id, 50 + obj_id, 50))
+    core.add(_box(4, 300, 300))
+
+    assert index.query_rect(0, 0, 100, 100) == [3, 1, 2]
+    assert index.query_rect(290, 290, 5, 5) == [4]
+
+
+def test_update_moves_object_and_keeps_its_rank():
+    core = _Core()
+    index = SpatialIndex(core, cell_size=16)
+    core.add(_box(1, 50, 50))
+    core.add(_box(2, 200, 200))
+    core.update(2, x=50, y=50)
+    core.update(1, x=52)
+
+    assert index.pick(50, 50) == 2
+    assert index.query_rect(190, 190, 20, 20) == []
+
+
+def test_delete_and_restore_below_keep_draw_order():
+    core = _Core()
+    index = SpatialIndex(core, cell_size=16)
+    for obj_id in range(1, 6):
+        core.add(_box(obj_id, 50, 50))
+
+    removed = [core.delete(2), core.delete(3)]
+    assert index.query_rect(40, 40, 20, 20) == [1, 4, 5]
+    for obj, position in reversed(removed): # Restore in reverse, like undo
+        core.add(obj, position)
+
+    assert index.query_rect(40, 40, 20, 20) == [1, 2, 3, 4, 5]
+    assert index.pick(50, 50) == 5
+
+
+def test_restore_at_the_bottom():
+    core = _Core()
+    index = SpatialIndex(core, cell_size=16)
+    for obj_id in range(1, 4):
+        core.add(_box(obj_id, 50, 50))
+    obj, position = core.delete(1)
+    core.add(obj, position)
+
+    assert index.query_rect(40, 40, 20, 20) == [1, 2, 3]
+    assert index.pick(50, 50) == 3
+
+
+def test_ranks_are_renumbered_when_restores_run_out_of_gaps():
+    core = _Core()
+    index = SpatialIndex(core, cell_size=16)
+    for obj_id in range(1, 101):
+        core.add(_box(obj_id, 50, 50))
+    removed = [core.delete(obj_id) for obj_id in range(10, 90)]
+    for obj, position in reversed(removed): # Each restore halves the gap above object 9
+        core.add(obj, position)
+
+    assert index.query_rect(40, 40, 20, 20) == list(range(1, 101))
+    assert index.pick(50, 50) == 100
+
+
+def test_rebuild_on_level_load():
+    core = _Core()
+    index = SpatialIndex(core, cell_size=16)
+    core._objects = {7: _box(7, 10, 10)}
+    core._order = [7]
+    core.levelLoaded.emit()
+
+    assert index.pick(10, 10) == 7
+    assert index.get_stats()['objects'] == 1
+
+
+def test_snap_offset_lines_up_nearest_edges():
+    core = _Core()
+    index = SpatialIndex(core, cell_size=16)
+    core.add(_box(1, 100, 100)) # Covers 90..110
+
+    # A 20x20 rect at 113..133 snaps its left edge onto the box's right edge
+    assert index.get_snap_offset(113, 91, 20, 20, threshold=5) == (-3, -1)
+    assert index.get_snap_offset(113, 91, 20, 20, threshold=5, exclude_ids=[1]) == (0, 0)